@@ -20,9 +20,12 @@ from pytrek.engine.devices.DeviceType import DeviceType
 from pytrek.engine.devices.DeviceManager import DeviceManager
 
 from pytrek.engine.GameEngine import GameEngine
+from pytrek.engine.GameSnapshot import GameSnapshot
 from pytrek.engine.futures.EventEngine import EventEngine
 from pytrek.engine.futures.FutureEventType import FutureEventType
 
+from pytrek.exceptions.InvalidSnapshotException import InvalidSnapshotException
+
 from pytrek.mediators.EnterpriseMediator import EnterpriseMediator
 from pytrek.mediators.GalaxyMediator import GalaxyMediator
 from pytrek.mediators.QuadrantMediator import QuadrantMediator
@@ -52,6 +55,7 @@ class CommandHandler:
         self._galaxy:             Galaxy             = Galaxy()
         self._deviceManager:      DeviceManager      = DeviceManager()
         self._eventEngine:        EventEngine        = EventEngine()
+        self._gameSnapshot:       GameSnapshot       = GameSnapshot()
 
         self._enterpriseMediator: EnterpriseMediator = cast(EnterpriseMediator, None)
 
@@ -96,6 +100,8 @@ class CommandHandler:
                 self._triggerEvent(parsedCommand.eventToTrigger)
             case CommandType.Save:
                 self._saveGame()
+            case CommandType.Load:
+                self._loadGame()
             case _:
                 self.logger.error(f'Invalid command: {commandStr}')
                 raise InvalidCommandException(message=f'Invalid command: {commandStr}')
@@ -138,9 +144,22 @@ class CommandHandler:
         self._view.window.show_view(helpView)
 
     def _saveGame(self):
-        self._gameState.saveState()
+        self._gameSnapshot.saveGame()
         self._view.messageConsoleSection.displayMessage('Game saved !!')
 
+    def _loadGame(self):
+
+        try:
+            self._gameSnapshot.loadGame()
+        except FileNotFoundError:
+            self._view.messageConsoleSection.displayMessage('There is no saved game')
+        except InvalidSnapshotException as e:
+            self.logger.error(f'{e}')
+            self._view.messageConsoleSection.displayMessage('Unable to load the saved game')
+        else:
+            self._view.quadrantSection.gameRestored()
+            self._view.messageConsoleSection.displayMessage('Game loaded !!')
+
     def _triggerEvent(self, eventToTrigger: FutureEventType):
         self._eventEngine.debugFireEvent(eventType=eventToTrigger)
 
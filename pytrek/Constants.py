@@ -22,11 +22,11 @@ QUADRANT_Y_ADJUSTMENT: int = CONSOLE_SECTION_HEIGHT + COMMAND_SECTION_HEIGHT
 QUADRANT_ROWS:    int = 10
 QUADRANT_COLUMNS: int = 10
 
-GALAXY_ROWS:    int = 10
-GALAXY_COLUMNS: int = 10
+GALAXY_ROWS:    int = 10     # The default galaxy size;  The galaxyRows and
+GALAXY_COLUMNS: int = 10     # galaxyColumns settings determine the actual size
 
-MINIMUM_COORDINATE: int = 0     # These should match the galaxy/quadrant size
-MAXIMUM_COORDINATE: int = 9     # Currently, assumed that are the same size
+GALAXY_VIEW_ROWS:    int = 10   # The galaxy view shows this many quadrants around the Enterprise
+GALAXY_VIEW_COLUMNS: int = 10
 
 STANDARD_SPRITE_WIDTH:  int = 32
 STANDARD_SPRITE_HEIGHT: int = 32
@@ -38,6 +38,7 @@ APPLICATION_NAME:        str = 'pytrek'
 THE_GREAT_MAC_PLATFORM:  str = 'darwin'
 GAME_SETTINGS_FILE_NAME: str = f'{APPLICATION_NAME}.ini'
 BACKUP_SUFFIX:           str = '.bak'
+TEMPORARY_SUFFIX:        str = '.tmp'
 
 MIN_SECTOR_X_COORDINATE: int = 0
 MAX_SECTOR_X_COORDINATE: int = QUADRANT_COLUMNS - 1
@@ -45,7 +46,7 @@ MIN_SECTOR_Y_COORDINATE: int = 0
 MAX_SECTOR_Y_COORDINATE: int = QUADRANT_ROWS - 1
 
 MIN_QUADRANT_X_COORDINATE: int = 0
-MAX_QUADRANT_X_COORDINATE: int = GALAXY_COLUMNS - 1
+MAX_QUADRANT_X_COORDINATE: int = GALAXY_COLUMNS - 1     # For the default galaxy size
 MIN_QUADRANT_Y_COORDINATE: int = 0
 MAX_QUADRANT_Y_COORDINATE: int = GALAXY_ROWS - 1
 
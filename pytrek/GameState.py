@@ -1,4 +1,8 @@
 
+from typing import Callable
+from typing import List
+from typing import NewType
+from typing import Tuple
 from typing import cast
 
 from logging import Logger
@@ -13,6 +17,7 @@ from codeallybasic.ConfigurationLocator import ConfigurationLocator
 from codeallybasic.SingletonV3 import SingletonV3
 
 from pytrek.Constants import APPLICATION_NAME
+from pytrek.GameStateField import GameStateField
 from pytrek.engine.Intelligence import Intelligence
 from pytrek.gui.gamepieces.Enterprise import Enterprise
 from pytrek.model.Coordinates import Coordinates
@@ -27,19 +32,33 @@ GAME_STATE_FILE_NAME: str = 'GameState.json'
 
 SINGLE_SUPER_COMMANDER_COUNT: int = 1
 
+GameStateListener     = Callable[[GameStateField], None]
+GameStateSubscription = Tuple[GameStateField, GameStateListener]
+GameStateSubscribers  = NewType('GameStateSubscribers', List[GameStateSubscription])
+
 
 class GameState(metaclass=SingletonV3):
     """
     Keeps track of the game state
+
+    Every setter that actually changes a value marks its field dirty.  Consumers either
+    subscribe for the fields they show, or peek at the dirty fields.  The changes made during a
+    frame are published together by `publishChanges`;  So a value that changes many times in a
+    frame costs its subscribers a single notification
     """
     def __init__(self):
 
         self.logger:  Logger       = getLogger(__name__)
+
+        self._dirtyFields: GameStateField       = GameStateField.NONE
+        self._subscribers: GameStateSubscribers = GameStateSubscribers([])
+
         gameSettings: GameSettings = GameSettings()
         intelligence: Intelligence = Intelligence()
         playerType:   PlayerType   = gameSettings.playerType
         gameType:     GameType     = gameSettings.gameType
 
+        self._gameSeed:     int        = intelligence.seed
         self._playerType:   PlayerType = playerType
         self._gameType:     GameType   = gameType
         self._energy:       float      = gameSettings.initialEnergyLevel
@@ -79,13 +98,56 @@ class GameState(metaclass=SingletonV3):
 
         self.logger.info(f'Game State singleton initialized')
 
+    @property
+    def dirtyFields(self) -> GameStateField:
+        """
+        Returns:  The fields changed since the last time the changes were published
+        """
+        return self._dirtyFields
+
+    def subscribe(self, fields: GameStateField, listener: GameStateListener):
+        """
+        Args:
+            fields:     The fields the listener cares about
+            listener:   Called with the changed fields it cares about;  At most once per publish
+        """
+        self._subscribers.append((fields, listener))
+
+    def unsubscribe(self, listener: GameStateListener):
+
+        self._subscribers = GameStateSubscribers([subscription for subscription in self._subscribers if subscription[1] != listener])
+
+    def publishChanges(self) -> GameStateField:
+        """
+        Tell the subscribers about the changes since the last publish and clear the dirty fields.
+        Called once per frame
+
+        Returns:  The fields that changed
+        """
+        changedFields: GameStateField = self._dirtyFields
+        if changedFields == GameStateField.NONE:
+            return changedFields
+
+        self._dirtyFields = GameStateField.NONE
+        for fields, listener in list(self._subscribers):
+            subscribedChanges: GameStateField = fields & changedFields
+            if subscribedChanges != GameStateField.NONE:
+                listener(subscribedChanges)
+
+        return changedFields
+
+    def _markDirty(self, field: GameStateField):
+        self._dirtyFields |= field
+
     @property
     def warpFactor(self) -> int:
         return self._warpFactor
 
     @warpFactor.setter
     def warpFactor(self, newValue: int):
-        self._warpFactor = newValue
+        if newValue != self._warpFactor:
+            self._warpFactor = newValue
+            self._markDirty(GameStateField.WARP_FACTOR)
 
     @property
     def enterprise(self) -> Enterprise:
@@ -97,7 +159,9 @@ class GameState(metaclass=SingletonV3):
 
     @energy.setter
     def energy(self, theNewValue: float):
-        self._energy = theNewValue
+        if theNewValue != self._energy:
+            self._energy = theNewValue
+            self._markDirty(GameStateField.ENERGY)
 
     @property
     def shieldEnergy(self) -> float:
@@ -105,7 +169,9 @@ class GameState(metaclass=SingletonV3):
 
     @shieldEnergy.setter
     def shieldEnergy(self, theNewValue: float):
-        self._shieldEnergy = theNewValue
+        if theNewValue != self._shieldEnergy:
+            self._shieldEnergy = theNewValue
+            self._markDirty(GameStateField.SHIELD_ENERGY)
 
     @property
     def opTime(self) -> float:
@@ -116,7 +182,9 @@ class GameState(metaclass=SingletonV3):
 
     @opTime.setter
     def opTime(self, theNewValue: float):
-        self._opTime = theNewValue
+        if theNewValue != self._opTime:
+            self._opTime = theNewValue
+            self._markDirty(GameStateField.OP_TIME)
 
     @property
     def starDate(self) -> float:
@@ -124,7 +192,9 @@ class GameState(metaclass=SingletonV3):
 
     @starDate.setter
     def starDate(self, theNewValue: float):
-        self._starDate = theNewValue
+        if theNewValue != self._starDate:
+            self._starDate = theNewValue
+            self._markDirty(GameStateField.STAR_DATE)
 
     @property
     def remainingGameTime(self) -> float:
@@ -132,7 +202,9 @@ class GameState(metaclass=SingletonV3):
 
     @remainingGameTime.setter
     def remainingGameTime(self, theNewValue: float):
-        self._remainingGameTime = theNewValue
+        if theNewValue != self._remainingGameTime:
+            self._remainingGameTime = theNewValue
+            self._markDirty(GameStateField.REMAINING_GAME_TIME)
 
     @property
     def remainingKlingons(self):
@@ -140,7 +212,9 @@ class GameState(metaclass=SingletonV3):
 
     @remainingKlingons.setter
     def remainingKlingons(self, theNewValue: int):
-        self._remainingKlingons = theNewValue
+        if theNewValue != self._remainingKlingons:
+            self._remainingKlingons = theNewValue
+            self._markDirty(GameStateField.REMAINING_KLINGONS)
 
     @property
     def remainingCommanders(self) -> int:
@@ -148,7 +222,9 @@ class GameState(metaclass=SingletonV3):
 
     @remainingCommanders.setter
     def remainingCommanders(self, theNewValue: int):
-        self._remainingCommanders = theNewValue
+        if theNewValue != self._remainingCommanders:
+            self._remainingCommanders = theNewValue
+            self._markDirty(GameStateField.REMAINING_COMMANDERS)
 
     @property
     def remainingSuperCommanders(self) -> int:
@@ -156,7 +232,9 @@ class GameState(metaclass=SingletonV3):
 
     @remainingSuperCommanders.setter
     def remainingSuperCommanders(self, theNewValue: int):
-        self._remainingSuperCommanders = theNewValue
+        if theNewValue != self._remainingSuperCommanders:
+            self._remainingSuperCommanders = theNewValue
+            self._markDirty(GameStateField.REMAINING_SUPER_COMMANDERS)
 
     @property
     def torpedoCount(self) -> int:
@@ -164,7 +242,9 @@ class GameState(metaclass=SingletonV3):
 
     @torpedoCount.setter
     def torpedoCount(self, theNewValue: int):
-        self._torpedoCount = theNewValue
+        if theNewValue != self._torpedoCount:
+            self._torpedoCount = theNewValue
+            self._markDirty(GameStateField.TORPEDO_COUNT)
 
     @property
     def shipCondition(self) -> ShipCondition:
@@ -172,7 +252,9 @@ class GameState(metaclass=SingletonV3):
 
     @shipCondition.setter
     def shipCondition(self, theNewValue: ShipCondition):
-        self._shipCondition = theNewValue
+        if theNewValue != self._shipCondition:
+            self._shipCondition = theNewValue
+            self._markDirty(GameStateField.SHIP_CONDITION)
 
     @property
     def baseAttackUnderway(self) -> bool:
@@ -180,7 +262,20 @@ class GameState(metaclass=SingletonV3):
 
     @baseAttackUnderway.setter
     def baseAttackUnderway(self, newValue: bool):
-        self._baseAttackUnderway = newValue
+        if newValue != self._baseAttackUnderway:
+            self._baseAttackUnderway = newValue
+            self._markDirty(GameStateField.BASE_ATTACK_UNDERWAY)
+
+    @property
+    def gameSeed(self) -> int:
+        """
+        Returns:  The seed of this game's random streams;  Replay the game by setting it as `gameSeed` in the game settings
+        """
+        return self._gameSeed
+
+    @gameSeed.setter
+    def gameSeed(self, theNewValue: int):
+        self._gameSeed = theNewValue
 
     @property
     def playerType(self) -> PlayerType:
@@ -188,7 +283,9 @@ class GameState(metaclass=SingletonV3):
 
     @playerType.setter
     def playerType(self, theNewValue: PlayerType):
-        self._playerType = theNewValue
+        if theNewValue != self._playerType:
+            self._playerType = theNewValue
+            self._markDirty(GameStateField.PLAYER_TYPE)
 
     @property
     def gameType(self) -> GameType:
@@ -196,7 +293,9 @@ class GameState(metaclass=SingletonV3):
 
     @gameType.setter
     def gameType(self, theNewValue: GameType):
-        self._gameType = theNewValue
+        if theNewValue != self._gameType:
+            self._gameType = theNewValue
+            self._markDirty(GameStateField.GAME_TYPE)
 
     @property
     def currentQuadrantCoordinates(self) -> Coordinates:
@@ -204,7 +303,9 @@ class GameState(metaclass=SingletonV3):
 
     @currentQuadrantCoordinates.setter
     def currentQuadrantCoordinates(self, theNewValue: Coordinates):
-        self._currentQuadrantCoordinates = theNewValue
+        if theNewValue != self._currentQuadrantCoordinates:
+            self._currentQuadrantCoordinates = theNewValue
+            self._markDirty(GameStateField.CURRENT_QUADRANT_COORDINATES)
 
     @property
     def currentSectorCoordinates(self) -> Coordinates:
@@ -212,7 +313,9 @@ class GameState(metaclass=SingletonV3):
 
     @currentSectorCoordinates.setter
     def currentSectorCoordinates(self, theNewValue: Coordinates):
-        self._currentSectorCoordinates = theNewValue
+        if theNewValue != self._currentSectorCoordinates:
+            self._currentSectorCoordinates = theNewValue
+            self._markDirty(GameStateField.CURRENT_SECTOR_COORDINATES)
 
     @property
     def starBaseCount(self) -> int:
@@ -220,7 +323,9 @@ class GameState(metaclass=SingletonV3):
 
     @starBaseCount.setter
     def starBaseCount(self, newValue: int):
-        self._starBaseCount = newValue
+        if newValue != self._starBaseCount:
+            self._starBaseCount = newValue
+            self._markDirty(GameStateField.STAR_BASE_COUNT)
 
     @property
     def planetCount(self) -> int:
@@ -228,7 +333,9 @@ class GameState(metaclass=SingletonV3):
 
     @planetCount.setter
     def planetCount(self, newValue: int):
-        self._planetCount = newValue
+        if newValue != self._planetCount:
+            self._planetCount = newValue
+            self._markDirty(GameStateField.PLANET_COUNT)
 
     @property
     def gameStateFileName(self) -> Path:
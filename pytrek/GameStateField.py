@@ -0,0 +1,32 @@
+
+from enum import Flag
+from enum import auto
+
+
+class GameStateField(Flag):
+    """
+    One bit per GameState property;  Combine them to describe a set of changes
+    """
+    NONE                         = 0
+    ENERGY                       = auto()
+    SHIELD_ENERGY                = auto()
+    OP_TIME                      = auto()
+    STAR_DATE                    = auto()
+    REMAINING_GAME_TIME          = auto()
+    REMAINING_KLINGONS           = auto()
+    REMAINING_COMMANDERS         = auto()
+    REMAINING_SUPER_COMMANDERS   = auto()
+    TORPEDO_COUNT                = auto()
+    SHIP_CONDITION               = auto()
+    BASE_ATTACK_UNDERWAY         = auto()
+    PLAYER_TYPE                  = auto()
+    GAME_TYPE                    = auto()
+    WARP_FACTOR                  = auto()
+    CURRENT_QUADRANT_COORDINATES = auto()
+    CURRENT_SECTOR_COORDINATES   = auto()
+    STAR_BASE_COUNT              = auto()
+    PLANET_COUNT                 = auto()
+
+    ALL = ENERGY | SHIELD_ENERGY | OP_TIME | STAR_DATE | REMAINING_GAME_TIME | REMAINING_KLINGONS | REMAINING_COMMANDERS | \
+        REMAINING_SUPER_COMMANDERS | TORPEDO_COUNT | SHIP_CONDITION | BASE_ATTACK_UNDERWAY | PLAYER_TYPE | GAME_TYPE | WARP_FACTOR | \
+        CURRENT_QUADRANT_COORDINATES | CURRENT_SECTOR_COORDINATES | STAR_BASE_COUNT | PLANET_COUNT
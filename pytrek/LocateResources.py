@@ -1,12 +1,26 @@
 
+from typing import Dict
+from typing import List
+
 from os import sep as osSep
 
+from atexit import register as atExitRegister
+
+from queue import SimpleQueue
+
 from codeallybasic.ResourceManager import ResourceManager
 
 from json import load as jsonLoad
 
 import logging.config
 
+from logging import Handler
+from logging import Logger
+from logging import getLogger
+
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+
 
 class LocateResources:
 
@@ -29,6 +43,10 @@ class LocateResources:
 
     JSON_LOGGING_CONFIG_FILENAME: str = "loggingConfiguration.json"
 
+    logListeners:    List[QueueListener]         = []
+    _queuedHandlers: Dict[Logger, List[Handler]] = {}
+    _stopRegistered: bool                        = False
+
     PACKAGE_TO_PATH_MAP: dict = {RESOURCES_PACKAGE_NAME:       RESOURCES_PATH,
                                  FONT_RESOURCES_PACKAGE_NAME:  FONT_RESOURCES_PATH,
                                  IMAGE_RESOURCES_PACKAGE_NAME: IMAGE_RESOURCES_PATH,
@@ -48,6 +66,49 @@ class LocateResources:
         logging.logProcesses = False
         logging.logThreads   = False
 
+        cls._queueLogging()
+        if cls._stopRegistered is False:
+            atExitRegister(cls.stopSystemLogging)
+            cls._stopRegistered = True
+
+    @classmethod
+    def stopSystemLogging(cls):
+        """
+        Write out any queued log records, stop the background logging threads and give the
+        loggers back their own handlers
+        """
+        for logListener in cls.logListeners:
+            logListener.stop()
+        for logger, handlers in cls._queuedHandlers.items():
+            logger.handlers = handlers
+        cls.logListeners    = []
+        cls._queuedHandlers = {}
+
+    @classmethod
+    def _queueLogging(cls):
+        """
+        Put each configured handler behind a queue so that the game loop does not wait on the
+        console or file writes;  A background listener thread does them.  The queue handler still
+        formats the message on the logging thread.  Every logger keeps the same routing since
+        each handler is swapped for its own queue handler
+        """
+        cls.stopSystemLogging()
+
+        loggers:       List[Logger]                = [getLogger()] + [logger for logger in Logger.manager.loggerDict.values() if isinstance(logger, Logger)]
+        queueHandlers: Dict[Handler, QueueHandler] = {}
+        for logger in loggers:
+            for handler in logger.handlers:
+                if handler not in queueHandlers:
+                    logQueue: SimpleQueue = SimpleQueue()
+                    queueHandlers[handler] = QueueHandler(logQueue)
+                    cls.logListeners.append(QueueListener(logQueue, handler, respect_handler_level=True))
+            if len(logger.handlers) > 0:
+                cls._queuedHandlers[logger] = logger.handlers
+                logger.handlers = [queueHandlers[handler] for handler in logger.handlers]
+
+        for logListener in cls.logListeners:
+            logListener.start()
+
     @classmethod
     def getResourcesPath(cls, bareFileName: str, resourcePath: str, packageName: str) -> str:
 
@@ -4,6 +4,8 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
+from atexit import register as atExitRegister
+
 # noinspection PyPackageRequirements
 from PIL import ImageFont
 
@@ -31,18 +33,22 @@ from pytrek.Constants import STATUS_VIEW_WIDTH
 from pytrek.commandparser.InvalidCommandException import InvalidCommandException
 from pytrek.commandparser.InvalidCommandValueException import InvalidCommandValueException
 
+from pytrek.engine.AutoSave import AutoSave
 from pytrek.engine.Computer import Computer
+from pytrek.engine.FrameProfiler import FrameProfiler
 from pytrek.engine.GameEngine import GameEngine
 from pytrek.engine.Intelligence import Intelligence
 
 from pytrek.gui.ConsoleMessageType import ConsoleMessageType
 from pytrek.gui.DeviceStatusSection import DeviceStatusSection
+from pytrek.gui.FrameProfileSection import FrameProfileSection
 from pytrek.gui.GalaxySection import GalaxySection
 from pytrek.gui.LongRangeSensorScanSection import LongRangeSensorScanSection
 from pytrek.gui.MessageConsoleProxy import MessageConsoleProxy
 from pytrek.gui.MessageConsoleSection import MessageConsoleSection
 from pytrek.gui.QuadrantSection import QuadrantSection
 from pytrek.gui.StatusConsoleSection import StatusConsoleSection
+from pytrek.gui.TextureRegistry import TextureRegistry
 from pytrek.gui.VatoLocoTextSection import VatoLocoTextSection
 from pytrek.gui.WarpEffectSection import WarpEffectSection
 from pytrek.gui.gamepieces.Enterprise import Enterprise
@@ -85,7 +91,7 @@ class PyTrekV2(View):
         self.messageConsoleSection:      MessageConsoleSection      = cast(MessageConsoleSection, None)
         self._messageConsoleProxy:       MessageConsoleProxy        = cast(MessageConsoleProxy, None)
         self._statusConsole:             StatusConsoleSection       = cast(StatusConsoleSection, None)
-        self._quadrantSection:           QuadrantSection            = cast(QuadrantSection, None)
+        self.quadrantSection:            QuadrantSection            = cast(QuadrantSection, None)
         self._commandInputSection:       VatoLocoTextSection        = cast(VatoLocoTextSection, None)
         self.galaxySection:              GalaxySection              = cast(GalaxySection, None)
         self.longRangeSensorScanSection: LongRangeSensorScanSection = cast(LongRangeSensorScanSection, None)
@@ -98,6 +104,8 @@ class PyTrekV2(View):
         self._commandHandler:     CommandHandler = CommandHandler(view=self)
         self._commandHandler.enterpriseMediator  = self._enterpriseMediator
 
+        self._autoSave: AutoSave = AutoSave()   # After the sections;  They start the event engine
+
     def on_draw(self):
         start_render()
 
@@ -141,11 +149,11 @@ class PyTrekV2(View):
 
         self._enterpriseMediator = EnterpriseMediator()
 
-        self._quadrantSection = QuadrantSection(left=0, bottom=SCREEN_HEIGHT - QUADRANT_GRID_HEIGHT,
+        self.quadrantSection = QuadrantSection(left=0, bottom=SCREEN_HEIGHT - QUADRANT_GRID_HEIGHT,
                                                 height=QUADRANT_GRID_HEIGHT, width=QUADRANT_GRID_WIDTH,
                                                 accept_keyboard_events=False)
 
-        self._quadrantSection.enterpriseMediator = self._enterpriseMediator
+        self.quadrantSection.enterpriseMediator = self._enterpriseMediator
 
         self._commandInputSection = VatoLocoTextSection(left=0, bottom=0, callback=self._handleCommands, accept_keyboard_events=True)
         #
@@ -163,10 +171,16 @@ class PyTrekV2(View):
 
         self.warpEffectSection:   WarpEffectSection   = WarpEffectSection(width=viewWidth, height=viewHeight)
         self.deviceStatusSection: DeviceStatusSection = DeviceStatusSection(enabled=False)
+        self._frameProfileSection: FrameProfileSection = FrameProfileSection(left=0, bottom=SCREEN_HEIGHT - QUADRANT_GRID_HEIGHT,
+                                                                             width=QUADRANT_GRID_WIDTH, height=QUADRANT_GRID_HEIGHT)
+        #
+        # The mediators and sections have loaded their textures by now
+        #
+        TextureRegistry().populateAtlas(atlas=viewWindow.ctx.default_atlas)
         #
         # Make the sections available
         #
-        self.section_manager.add_section(self._quadrantSection)
+        self.section_manager.add_section(self.quadrantSection)
         self.section_manager.add_section(self._statusConsole)
         self.section_manager.add_section(self.messageConsoleSection)
         self.section_manager.add_section(self.galaxySection)
@@ -174,6 +188,16 @@ class PyTrekV2(View):
         self.section_manager.add_section(self.warpEffectSection)
         self.section_manager.add_section(self._commandInputSection)
         self.section_manager.add_section(self.deviceStatusSection)
+        self.section_manager.add_section(self._frameProfileSection)      # Last;  So it draws on top and never gets the mouse
+        #
+        # Time every section and the whole frame
+        #
+        frameProfiler: FrameProfiler = FrameProfiler()
+        for section in self.section_manager.sections:
+            frameProfiler.instrument(target=section, methodNames=['on_draw', 'on_update'])
+        frameProfiler.instrument(target=self.section_manager, methodNames=['on_draw', 'on_update'], prefix='Frame')
+        if frameProfiler.enabled is True:
+            atExitRegister(frameProfiler.exportTrace)
 
     def _handleCommands(self, commandStr: str):
         try:
@@ -1,108 +1,86 @@
-
 from typing import Dict
 from typing import NewType
+from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
-from enum import Enum
+from threading import Lock
+from threading import Thread
+
+from time import monotonic
 
 from codeallybasic.SingletonV3 import SingletonV3
 
 from arcade import Sound
 
 from pytrek.LocateResources import LocateResources
+from pytrek.SoundPriority import SoundPriority
+from pytrek.SoundType import SoundType
+from pytrek.VoiceManager import Voice
+from pytrek.VoiceManager import VoiceManager
 
 from pytrek.settings.GameSettings import GameSettings
 
 
-class SoundType(Enum):
-    UnableToComply      = 'UnableToComply.wav'
-    Docked              = 'Docked.wav'
-    PhaserFired         = 'PhaserFired.wav'
-    PleaseRepeatRequest = 'PleaseRepeatRequest.wav'
-    Impulse             = 'Impulse.wav'
-    EnterpriseBlocked   = 'EnterpriseBlocked.wav'
-    PhotonTorpedoFired  = 'PhotonTorpedoFired.wav'
-    PhotonTorpedoExploded = 'PhotonTorpedoExploded.wav'
-    PhotonTorpedoMisfire  = 'PhotonTorpedoMisfire.wav'
-    PhotonTorpedoMiss     = 'PhotonTorpedoMiss.wav'
-    Inaccurate            = 'Inaccurate.wav'
-    KlingonMove           = 'KlingonMove.wav'
-    KlingonTorpedo        = 'KlingonTorpedo.wav'
-    KlingonCannotFire     = 'KlingonCannotFire.wav'
-    CommanderMove         = 'CommanderMove.wav'
-    CommanderTorpedo      = 'CommanderTorpedo.wav'
-    CommanderCannotFire   = 'CommanderCannotFire.wav'
-    SuperCommanderMove       = 'SuperCommanderMove.wav'
-    SuperCommanderTorpedo    = 'SuperCommanderTorpedo.wav'
-    SuperCommanderCannotFire = 'SuperCommanderCannotFire.wav'
-    Warp                  = 'Warp.wav'
-    ShieldHit             = 'ShieldHit.wav'
-
-
 SoundDictionary = NewType('SoundDictionary', Dict[SoundType, Sound])
+SoundPriorities = NewType('SoundPriorities', Dict[SoundType, SoundPriority])
+
+SOUND_PRIORITIES: SoundPriorities = SoundPriorities(
+    {
+        SoundType.UnableToComply:           SoundPriority.High,
+        SoundType.Docked:                   SoundPriority.High,
+        SoundType.PleaseRepeatRequest:      SoundPriority.High,
+        SoundType.EnterpriseBlocked:        SoundPriority.High,
+        SoundType.Inaccurate:               SoundPriority.High,
+        SoundType.Warp:                     SoundPriority.High,
+        SoundType.ShieldHit:                SoundPriority.High,
+        SoundType.PhaserFired:              SoundPriority.Medium,
+        SoundType.Impulse:                  SoundPriority.Medium,
+        SoundType.PhotonTorpedoFired:       SoundPriority.Medium,
+        SoundType.PhotonTorpedoExploded:    SoundPriority.Medium,
+        SoundType.PhotonTorpedoMisfire:     SoundPriority.Medium,
+        SoundType.PhotonTorpedoMiss:        SoundPriority.Medium,
+        SoundType.KlingonTorpedo:           SoundPriority.Medium,
+        SoundType.CommanderTorpedo:         SoundPriority.Medium,
+        SoundType.SuperCommanderTorpedo:    SoundPriority.Medium,
+        SoundType.KlingonMove:              SoundPriority.Low,
+        SoundType.KlingonCannotFire:        SoundPriority.Low,
+        SoundType.CommanderMove:            SoundPriority.Low,
+        SoundType.CommanderCannotFire:      SoundPriority.Low,
+        SoundType.SuperCommanderMove:       SoundPriority.Low,
+        SoundType.SuperCommanderCannotFire: SoundPriority.Low,
+    }
+)
 
 
 class SoundMachine(metaclass=SingletonV3):
-
+    """
+    Sounds are decoded the first time they are played.  Unless the `preloadSounds` setting is off
+    a background thread decodes the rest of them ahead of time;  So start up does not wait for them.
+    The VoiceManager limits how many sounds overlap
+    """
     def __init__(self, *args, **kwargs):
 
         self.logger: Logger = getLogger(__name__)
 
         self._gameSettings: GameSettings = GameSettings()
 
-        self._unableToComply:        Sound = self.loadSound(bareFileName=SoundType.UnableToComply.value)
-        self._docked:                Sound = self.loadSound(bareFileName=SoundType.Docked.value)
-        self._phaserFired:           Sound = self.loadSound(bareFileName=SoundType.PhaserFired.value)
-        self._pleaseRepeatRequest:   Sound = self.loadSound(bareFileName=SoundType.PleaseRepeatRequest.value)
-        self._impulse:               Sound = self.loadSound(bareFileName=SoundType.Impulse.value)
-        self._enterpriseBlocked:     Sound = self.loadSound(bareFileName=SoundType.EnterpriseBlocked.value)
-        self._photonTorpedoFired:    Sound = self.loadSound(bareFileName=SoundType.PhotonTorpedoFired.value)
-        self._photonTorpedoExploded: Sound = self.loadSound(bareFileName=SoundType.PhotonTorpedoExploded.value)
-        self._photonTorpedoMisfire:  Sound = self.loadSound(bareFileName=SoundType.PhotonTorpedoMisfire.value)
-        self._photonTorpedoMiss:     Sound = self.loadSound(bareFileName=SoundType.PhotonTorpedoMiss.value)
-        self._inaccurate:            Sound = self.loadSound(bareFileName=SoundType.Inaccurate.value)
-        self._klingonMove:           Sound = self.loadSound(bareFileName=SoundType.KlingonMove.value)
-        self._klingonTorpedo:        Sound = self.loadSound(bareFileName=SoundType.KlingonTorpedo.value)
-        self._klingonCannotFire:     Sound = self.loadSound(bareFileName=SoundType.KlingonCannotFire.value)
-        self._commanderMove:         Sound = self.loadSound(bareFileName=SoundType.CommanderMove.value)
-        self._commanderTorpedo:      Sound = self.loadSound(bareFileName=SoundType.CommanderTorpedo.value)
-        self._commanderCannotFire:   Sound = self.loadSound(bareFileName=SoundType.CommanderCannotFire.value)
-        self._superCommanderMove:    Sound = self.loadSound(bareFileName=SoundType.SuperCommanderMove.value)
-        self._superCommanderTorpedo:    Sound = self.loadSound(bareFileName=SoundType.SuperCommanderTorpedo.value)
-        self._superCommanderCannotFire: Sound = self.loadSound(bareFileName=SoundType.SuperCommanderCannotFire.value)
-
-        self._warp:                  Sound = self.loadSound(bareFileName=SoundType.Warp.value)
-        self._shieldHit:             Sound = self.loadSound(bareFileName=SoundType.ShieldHit.value)
-
-        self._sounds: SoundDictionary = SoundDictionary(
-            {
-                SoundType.UnableToComply:        self._unableToComply,
-                SoundType.Docked:                self._docked,
-                SoundType.PhaserFired:           self._phaserFired,
-                SoundType.PleaseRepeatRequest:   self._pleaseRepeatRequest,
-                SoundType.Impulse:               self._impulse,
-                SoundType.EnterpriseBlocked:     self._enterpriseBlocked,
-                SoundType.PhotonTorpedoFired:    self._photonTorpedoFired,
-                SoundType.PhotonTorpedoExploded: self._photonTorpedoExploded,
-                SoundType.PhotonTorpedoMisfire:  self._photonTorpedoMisfire,
-                SoundType.PhotonTorpedoMiss:     self._photonTorpedoMiss,
-                SoundType.Inaccurate:            self._inaccurate,
-                SoundType.KlingonMove:           self._klingonMove,
-                SoundType.KlingonTorpedo:        self._klingonTorpedo,
-                SoundType.KlingonCannotFire:     self._klingonCannotFire,
-                SoundType.CommanderMove:         self._commanderMove,
-                SoundType.CommanderTorpedo:      self._commanderTorpedo,
-                SoundType.CommanderCannotFire:   self._commanderCannotFire,
-                SoundType.SuperCommanderMove:       self._superCommanderMove,
-                SoundType.SuperCommanderTorpedo:    self._superCommanderTorpedo,
-                SoundType.SuperCommanderCannotFire: self._superCommanderCannotFire,
-
-                SoundType.Warp:                  self._warp,
-                SoundType.ShieldHit:             self._shieldHit
-             }
-        )
+        self._sounds:       SoundDictionary = SoundDictionary({})
+        self._soundsLock:   Lock            = Lock()
+        self._preloader:    Thread          = cast(Thread, None)
+        self._voiceManager: VoiceManager    = VoiceManager(maxVoices=self._gameSettings.maxVoices, cooldown=self._gameSettings.soundCooldown)
+
+        if self._gameSettings.preloadSounds is True:
+            self.preload()
+
+    def preload(self):
+        """
+        Start decoding the sounds that have not been played yet on a background thread
+        """
+        if self._preloader is None:
+            self._preloader = Thread(target=self._preloadSounds, name='SoundPreloader', daemon=True)
+            self._preloader.start()
 
     def loadSound(self, bareFileName: str) -> Sound:
         """
@@ -123,6 +101,43 @@ class SoundMachine(metaclass=SingletonV3):
         Args:
             soundType:  What we want to here
         """
-        soundToPlay: Sound = self._sounds[soundType]
+        currentTime: float         = monotonic()
+        priority:    SoundPriority = SOUND_PRIORITIES[soundType]
+
+        if self._voiceManager.requestVoice(soundType=soundType, priority=priority, currentTime=currentTime) is False:
+            return
+
+        soundToPlay: Sound = self._sound(soundType=soundType)
+
+        player = soundToPlay.play(self._gameSettings.soundVolume.value)
+
+        self._voiceManager.addVoice(Voice(soundType=soundType, priority=priority, sound=soundToPlay, player=player, startTime=currentTime))
+
+    def _sound(self, soundType: SoundType) -> Sound:
+        """
+        The sound is decoded outside the lock;  So playing a sound never waits for the
+        preloader to finish decoding a different one
+
+        Args:
+            soundType:  The sound we want
+
+        Returns:  The decoded sound
+        """
+        sound: Sound = self._sounds.get(soundType, cast(Sound, None))
+        if sound is None:
+            sound = self.loadSound(bareFileName=soundType.value)
+            with self._soundsLock:
+                sound = self._sounds.setdefault(soundType, sound)
+
+        return sound
+
+    def _preloadSounds(self):
+
+        for soundType in SoundType:
+            if soundType not in self._sounds:
+                try:
+                    self._sound(soundType=soundType)
+                except Exception as e:      # pyglet reports decoding errors with its own exceptions
+                    self.logger.error(f'Unable to preload {soundType.value}: {e}')
 
-        soundToPlay.play(self._gameSettings.soundVolume.value)
+        self.logger.info(f'Preloaded {len(self._sounds)} sounds')
@@ -0,0 +1,12 @@
+
+from enum import Enum
+
+
+class SoundPriority(Enum):
+    """
+    When all the voices are busy a sound may take over a voice playing a sound
+    with the same or a lower priority
+    """
+    Low    = 1
+    Medium = 2
+    High   = 3
@@ -0,0 +1,27 @@
+
+from enum import Enum
+
+
+class SoundType(Enum):
+    UnableToComply      = 'UnableToComply.wav'
+    Docked              = 'Docked.wav'
+    PhaserFired         = 'PhaserFired.wav'
+    PleaseRepeatRequest = 'PleaseRepeatRequest.wav'
+    Impulse             = 'Impulse.wav'
+    EnterpriseBlocked   = 'EnterpriseBlocked.wav'
+    PhotonTorpedoFired  = 'PhotonTorpedoFired.wav'
+    PhotonTorpedoExploded = 'PhotonTorpedoExploded.wav'
+    PhotonTorpedoMisfire  = 'PhotonTorpedoMisfire.wav'
+    PhotonTorpedoMiss     = 'PhotonTorpedoMiss.wav'
+    Inaccurate            = 'Inaccurate.wav'
+    KlingonMove           = 'KlingonMove.wav'
+    KlingonTorpedo        = 'KlingonTorpedo.wav'
+    KlingonCannotFire     = 'KlingonCannotFire.wav'
+    CommanderMove         = 'CommanderMove.wav'
+    CommanderTorpedo      = 'CommanderTorpedo.wav'
+    CommanderCannotFire   = 'CommanderCannotFire.wav'
+    SuperCommanderMove       = 'SuperCommanderMove.wav'
+    SuperCommanderTorpedo    = 'SuperCommanderTorpedo.wav'
+    SuperCommanderCannotFire = 'SuperCommanderCannotFire.wav'
+    Warp                  = 'Warp.wav'
+    ShieldHit             = 'ShieldHit.wav'
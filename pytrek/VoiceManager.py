@@ -0,0 +1,97 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from pytrek.SoundPriority import SoundPriority
+from pytrek.SoundType import SoundType
+
+LastStartTimes = Dict[SoundType, float]
+
+
+@dataclass
+class Voice:
+    """
+    A sound that is playing;  `sound` is an arcade Sound and `player` the pyglet
+    media player its `play` returned
+    """
+    soundType: SoundType     = cast(SoundType, None)
+    priority:  SoundPriority = SoundPriority.Medium
+    sound:     Any           = None
+    player:    Any           = None
+    startTime: float         = 0.0
+
+
+Voices = List[Voice]
+
+
+class VoiceManager:
+    """
+    Decides whether a sound may play.  A sound type that started playing less than `cooldown`
+    seconds ago is not started again;  So the several enemies that fire in the same frame make
+    one sound.  At most `maxVoices` sounds play at once;  When they are all busy the new sound
+    takes over the oldest voice with the lowest priority, provided that priority is not higher
+    than its own.  Otherwise, the new sound is dropped
+    """
+    def __init__(self, maxVoices: int, cooldown: float):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._maxVoices: int   = maxVoices
+        self._cooldown:  float = cooldown
+
+        self._voices:         Voices         = []
+        self._lastStartTimes: LastStartTimes = {}
+
+    @property
+    def voiceCount(self) -> int:
+        """
+        The number of voices that were playing the last time we looked
+        """
+        return len(self._voices)
+
+    def requestVoice(self, soundType: SoundType, priority: SoundPriority, currentTime: float) -> bool:
+        """
+        Frees a voice for the sound if it may play
+
+        Args:
+            soundType:      The sound we want to play
+            priority:       Its priority
+            currentTime:    Now, in seconds
+
+        Returns:  `True` if the sound may play
+        """
+        lastStartTime: float = self._lastStartTimes.get(soundType, cast(float, None))
+        if lastStartTime is not None and currentTime - lastStartTime < self._cooldown:
+            return False
+
+        self._voices = [voice for voice in self._voices if voice.sound.is_playing(voice.player) is True]
+        if len(self._voices) < self._maxVoices:
+            return True
+
+        victim: Voice = min(self._voices, key=lambda voice: (voice.priority.value, voice.startTime))
+        if victim.priority.value > priority.value:
+            self.logger.debug(f'No voice for {soundType.name}')
+            return False
+
+        self.logger.debug(f'{soundType.name} takes the voice of {victim.soundType.name}')
+        victim.sound.stop(victim.player)
+        self._voices.remove(victim)
+
+        return True
+
+    def addVoice(self, voice: Voice):
+        """
+        Track a sound that we started
+
+        Args:
+            voice:  The sound and its player
+        """
+        self._voices.append(voice)
+        self._lastStartTimes[voice.soundType] = voice.startTime
@@ -10,8 +10,8 @@ from logging import getLogger
 from re import Match as regExMatch
 from re import search as regExSearch
 
-from pytrek.Constants import MAXIMUM_COORDINATE
-from pytrek.Constants import MINIMUM_COORDINATE
+from pytrek.Constants import MAX_SECTOR_X_COORDINATE
+from pytrek.Constants import MAX_SECTOR_Y_COORDINATE
 
 from pytrek.commandparser.CommandType import CommandType
 from pytrek.commandparser.ManualMoveData import ManualMoveData
@@ -56,6 +56,7 @@ PatternToCommandType: Dict[CommandPattern, CommandType] = {
     PHOTONS_CMD: CommandType.Photons,
     WARP_CMD:    CommandType.Warp,
     MOVE_CMD:    CommandType.Move,
+    LOAD_CMD:    CommandType.Load,      # Before the long range scan;  Both start with an 'l'
     LRSCAN_CMD:  CommandType.LongRangeScan,
     DAMAGES_CMD: CommandType.Damages,
     CHART_CMD:   CommandType.Chart,
@@ -115,6 +116,8 @@ class CommandParser:
                 pass            # nothing else to do
             case CommandType.Save:
                 pass            # nothing else to do
+            case CommandType.Load:
+                pass            # nothing else to do
             case CommandType.Event:
                 if self._gameSettings.debugEvents is True:
                     self._parseEventCommand(parsedCommand=parsedCommand)
@@ -147,7 +150,9 @@ class CommandParser:
             else:
 
                 if len(splitCmd) == 6:      # full auto command
-                    parsedCommand.automaticMoveData.quadrantCoordinates = self._parseCoordinates(potentialX=splitCmd[2], potentialY=splitCmd[3])
+                    parsedCommand.automaticMoveData.quadrantCoordinates = self._parseCoordinates(potentialX=splitCmd[2], potentialY=splitCmd[3],
+                                                                                                 maxX=self._gameSettings.galaxyColumns - 1,
+                                                                                                 maxY=self._gameSettings.galaxyRows - 1)
                     parsedCommand.automaticMoveData.sectorCoordinates   = self._parseCoordinates(potentialX=splitCmd[4], potentialY=splitCmd[5])
                     parsedCommand.automaticMoveData.sectorMove = False
                 elif len(splitCmd) == 4:    # sector coordinates only
@@ -277,32 +282,35 @@ class CommandParser:
 
         return manualMoveData
 
-    def _parseCoordinates(self, potentialX: str, potentialY: str) -> Coordinates:
+    def _parseCoordinates(self, potentialX: str, potentialY: str, maxX: int = MAX_SECTOR_X_COORDINATE, maxY: int = MAX_SECTOR_Y_COORDINATE) -> Coordinates:
         """
 
         Args:
             potentialX:
             potentialY:
+            maxX:       The largest valid x coordinate;  Defaults to sector coordinates
+            maxY:       The largest valid y coordinate
 
         Returns: Valid coordinates or passes through an exception from validation
         """
 
         xCoordinate: int = -1
         yCoordinate: int = -1
-        if (self._validCoordinate(coordinate=potentialX, errorMsg='Invalid X Coordinate') is True and
-                self._validCoordinate(coordinate=potentialY, errorMsg='Invalid Y Coordinate') is True):
+        if (self._validCoordinate(coordinate=potentialX, maxCoordinate=maxX, errorMsg='Invalid X Coordinate') is True and
+                self._validCoordinate(coordinate=potentialY, maxCoordinate=maxY, errorMsg='Invalid Y Coordinate') is True):
             xCoordinate = int(potentialX)
             yCoordinate = int(potentialY)
 
         return Coordinates(x=xCoordinate, y=yCoordinate)
 
-    def _validCoordinate(self, coordinate: str, errorMsg: str):
+    def _validCoordinate(self, coordinate: str, maxCoordinate: int, errorMsg: str):
         """
         TODO:  This is duplicated in the EnterpriseMediator
 
         Args:
-            coordinate:  String coordinate
-            errorMsg:    Error message to put in exception if not valid
+            coordinate:     String coordinate
+            maxCoordinate:  The largest valid value
+            errorMsg:       Error message to put in exception if not valid
 
         Returns:  True if coordinate is value;  Else raises exception
         """
@@ -310,8 +318,8 @@ class CommandParser:
 
         try:
             intCoordinate: int = int(coordinate)
-            if intCoordinate < MINIMUM_COORDINATE or intCoordinate > MAXIMUM_COORDINATE:
-                raise InvalidCommandValueException(message=f'{errorMsg} bad coordinate {intCoordinate} {MINIMUM_COORDINATE=} {MAXIMUM_COORDINATE=}')
+            if intCoordinate < 0 or intCoordinate > maxCoordinate:
+                raise InvalidCommandValueException(message=f'{errorMsg} bad coordinate {intCoordinate} {maxCoordinate=}')
 
         except ValueError as e:
             self.logger.error(f'{e}')
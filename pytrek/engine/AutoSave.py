@@ -0,0 +1,78 @@
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from time import monotonic
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+from pytrek.GameState import GameState
+from pytrek.GameStateField import GameStateField
+
+from pytrek.engine.GameSnapshot import GameSnapshot
+
+from pytrek.settings.GameSettings import GameSettings
+
+AUTO_SAVE_FILE_NAME: str = 'PyTrek.autosave'
+
+
+class AutoSave(metaclass=SingletonV3):
+    """
+    Saves the game on its own, to a file separate from the player's save.  It listens to the
+    game state changes;  A warp (new quadrant), a change in ship condition (e.g. docking) or a
+    kill saves right away.  Otherwise, the game is saved once enough frames have changed the game
+    state and the auto save interval has passed
+
+    Taking the snapshot is quick;  The SaveFileWriter writes it in the background
+    """
+    NOTABLE_FIELDS: GameStateField = (
+        GameStateField.CURRENT_QUADRANT_COORDINATES |
+        GameStateField.SHIP_CONDITION |
+        GameStateField.REMAINING_KLINGONS |
+        GameStateField.REMAINING_COMMANDERS |
+        GameStateField.REMAINING_SUPER_COMMANDERS
+    )
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        gameSettings: GameSettings = GameSettings()
+
+        self._gameState:    GameState    = GameState()
+        self._gameSnapshot: GameSnapshot = GameSnapshot()
+
+        self._interval:        float = gameSettings.autoSaveInterval
+        self._changeThreshold: int   = gameSettings.autoSaveChangeThreshold
+
+        self._changeCount:  int   = 0
+        self._lastSaveTime: float = monotonic()
+
+        if gameSettings.autoSave is True:
+            self._gameState.subscribe(fields=GameStateField.ALL, listener=self._gameStateChanged)
+
+    @property
+    def autoSaveFileName(self) -> Path:
+        snapshotFileName: Path = self._gameSnapshot.snapshotFileName
+
+        return snapshotFileName.with_name(AUTO_SAVE_FILE_NAME)
+
+    def saveNow(self):
+
+        self._gameSnapshot.saveGame(fileName=self.autoSaveFileName)
+
+        self._changeCount  = 0
+        self._lastSaveTime = monotonic()
+
+    def _gameStateChanged(self, changedFields: GameStateField):
+        """
+        Called at most once per frame with everything that changed during the frame
+        """
+        self._changeCount += 1
+
+        if changedFields & AutoSave.NOTABLE_FIELDS != GameStateField.NONE:
+            self.saveNow()
+        elif self._changeCount >= self._changeThreshold and monotonic() - self._lastSaveTime >= self._interval:
+            self.saveNow()
@@ -1,17 +1,16 @@
 
+from typing import cast
+
 from logging import Logger
 from logging import getLogger
 
 from math import cos
-from math import pi
 from math import sin
 from math import atan2
 from math import degrees
 from math import floor
 from math import sqrt
 
-from dataclasses import dataclass
-
 from codeallybasic.SingletonV3 import SingletonV3
 
 from pytrek.Constants import COMMAND_SECTION_HEIGHT
@@ -20,20 +19,16 @@ from pytrek.Constants import HALF_QUADRANT_PIXEL_HEIGHT
 from pytrek.Constants import HALF_QUADRANT_PIXEL_WIDTH
 from pytrek.Constants import QUADRANT_PIXEL_HEIGHT
 from pytrek.Constants import QUADRANT_PIXEL_WIDTH
+from pytrek.Constants import QUADRANT_COLUMNS
 from pytrek.Constants import QUADRANT_ROWS
 
 from pytrek.engine.ArcadePoint import ArcadePoint
+from pytrek.engine.DeltaTables import DeltaTables
 from pytrek.engine.Intelligence import Intelligence
 
 from pytrek.model.Coordinates import Coordinates
 
 
-@dataclass
-class Deltas:
-    deltaX: int = 0
-    deltaY: int = 0
-
-
 class Computer(metaclass=SingletonV3):
     """
     Make a computer a singleton, so we don't have to pass it around
@@ -53,6 +48,21 @@ class Computer(metaclass=SingletonV3):
         self.logger:        Logger       = getLogger(__name__)
         self._intelligence: Intelligence = Intelligence()
 
+        self._deltaTables: DeltaTables = cast(DeltaTables, None)
+
+    @property
+    def deltaTables(self) -> DeltaTables:
+        """
+        The distance and course tables for the sectors of a quadrant;  A galaxy can be much bigger
+        than a quadrant, so galactic deltas are computed
+
+        Returns:  The tables, built on first use
+        """
+        if self._deltaTables is None:
+            self._deltaTables = DeltaTables.forGrid(columns=QUADRANT_COLUMNS, rows=QUADRANT_ROWS)
+
+        return self._deltaTables
+
     @classmethod
     def gamePositionToScreenPoint(cls, gameCoordinates: Coordinates) -> ArcadePoint:
         """
@@ -134,13 +144,25 @@ class Computer(metaclass=SingletonV3):
         return self._computeDistance(startSector, endSector, Computer.QUADRANT_TRAVEL_FACTOR)
 
     def computeGalacticDistance(self, startQuadrantCoordinates: Coordinates, endQuadrantCoordinates: Coordinates) -> float:
-        """"""
-        return self._computeDistance(startQuadrantCoordinates, endQuadrantCoordinates, Computer.GALACTIC_TRAVEL_FACTOR)
+        """
+        Galaxies are too big to tabulate;  So compute the distance
+
+        Args:
+            startQuadrantCoordinates:
+            endQuadrantCoordinates:
+
+        Returns:    The game distance between the above
+        """
+        deltaX: int = endQuadrantCoordinates.x - startQuadrantCoordinates.x
+        deltaY: int = endQuadrantCoordinates.y - startQuadrantCoordinates.y
+
+        return Computer.GALACTIC_TRAVEL_FACTOR * sqrt((deltaX * deltaX) + (deltaY * deltaY))
 
     def computeGameTravelDirection(self, startCoordinates: Coordinates, endCoordinates: Coordinates) -> float:
         # noinspection SpellCheckingInspection
         """
-        Can be used for both quadrant and sector directions
+        Can be used for both quadrant and sector directions;  Quadrant deltas past the sector
+        tables are computed
 
         direc = atan2(deltax, deltay)*1.90985932;
             if (direc < 0.0) direc += 12.0;
@@ -151,15 +173,23 @@ class Computer(metaclass=SingletonV3):
 
         Returns:  Then angel in radians
         """
-        deltas: Deltas = self._computeDeltaXDeltaY(startCoordinates=startCoordinates, endCoordinates=endCoordinates)
-        deltaX: int = deltas.deltaX
-        deltaY: int = deltas.deltaY
+        deltaX: int = endCoordinates.x - startCoordinates.x
+        deltaY: int = endCoordinates.y - startCoordinates.y
 
-        pi6: float = 6 / pi
+        return self.deltaTables.direction(deltaX, deltaY)
 
-        direction: float = atan2(deltaX, deltaY) * pi6
+    def computeCourse(self, startCoordinates: Coordinates, endCoordinates: Coordinates) -> float:
+        """
+        Args:
+            startCoordinates:   Start coordinates
+            endCoordinates:     Target coordinates
 
-        return direction
+        Returns:  The course in radians from the positive x-axis
+        """
+        deltaX: int = endCoordinates.x - startCoordinates.x
+        deltaY: int = endCoordinates.y - startCoordinates.y
+
+        return self.deltaTables.course(deltaX, deltaY)
 
     def createValueString(self, klingonCount: int, commanderCount: int, hasStarBase: bool) -> str:
         """
@@ -195,12 +225,10 @@ class Computer(metaclass=SingletonV3):
 
         Returns:  Destination coordinates
         """
-        destinationCoordinates: Coordinates = Coordinates()
-
-        destinationCoordinates.x = round(startCoordinates.x + (distance * cos(angle)))
-        destinationCoordinates.y = round(startCoordinates.y + (distance * sin(angle)))
+        destinationX: int = round(startCoordinates.x + (distance * cos(angle)))
+        destinationY: int = round(startCoordinates.y + (distance * sin(angle)))
 
-        return destinationCoordinates
+        return Coordinates(x=destinationX, y=destinationY)
 
     def computeAngleToTarget(self, shooter: ArcadePoint, deadMeat: ArcadePoint) -> float:
         """
@@ -246,27 +274,7 @@ class Computer(metaclass=SingletonV3):
         Returns:    The game distance between the above
         """
 
-        deltas: Deltas = self._computeDeltaXDeltaY(startCoordinates=startCoordinates, endCoordinates=endCoordinates)
-        deltaX: int = deltas.deltaX
-        deltaY: int = deltas.deltaY
-
-        distance: float = travelFactor * sqrt((deltaX * deltaX) + (deltaY * deltaY))
-
-        self.logger.debug(f"{distance=}")
-
-        return distance
-
-    def _computeDeltaXDeltaY(self, startCoordinates: Coordinates, endCoordinates: Coordinates) -> Deltas:
-
-        x1: int = startCoordinates.x
-        y1: int = startCoordinates.y
-        x2: int = endCoordinates.x
-        y2: int = endCoordinates.y
-
-        self.logger.debug(f"{x1=} {y1=} {x2=} {y2=}")
-
-        deltaX: int = x2 - x1
-        deltaY: int = y2 - y1
-        self.logger.debug(f"{deltaX=} {deltaY=}")
+        deltaX: int = endCoordinates.x - startCoordinates.x
+        deltaY: int = endCoordinates.y - startCoordinates.y
 
-        return Deltas(deltaX=deltaX, deltaY=deltaY)
+        return travelFactor * self.deltaTables.distance(deltaX, deltaY)
@@ -0,0 +1,101 @@
+
+from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from math import atan2
+from math import pi
+from math import sqrt
+
+GridSize = Tuple[int, int]
+
+GAME_DIRECTION_FACTOR: float = 6 / pi       # Radians to the game's 12 hour clock
+
+
+class DeltaTables:
+    """
+    Distances and angles between any two points of a grid only depend on the deltas between
+    them;  So we compute them once for every (deltaX, deltaY) the grid allows and look them
+    up after that.  Deltas from outside the grid are computed on the spot.
+
+    Use `forGrid`;  The tables for a grid size are built the first time that size is asked for
+    """
+    _tables: ClassVar[Dict[GridSize, 'DeltaTables']] = {}
+
+    def __init__(self, columns: int, rows: int):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._maxDeltaX: int = columns - 1
+        self._maxDeltaY: int = rows - 1
+        self._height:    int = 2 * rows - 1
+
+        self._distances:  List[float] = []
+        self._courses:    List[float] = []
+        self._directions: List[float] = []
+
+        for deltaX in range(-self._maxDeltaX, self._maxDeltaX + 1):
+            for deltaY in range(-self._maxDeltaY, self._maxDeltaY + 1):
+                self._distances.append(sqrt((deltaX * deltaX) + (deltaY * deltaY)))
+                self._courses.append(atan2(deltaY, deltaX))
+                self._directions.append(atan2(deltaX, deltaY) * GAME_DIRECTION_FACTOR)
+
+        self.logger.info(f'Built delta tables for a {columns}x{rows} grid')
+
+    @classmethod
+    def forGrid(cls, columns: int, rows: int) -> 'DeltaTables':
+        """
+        Args:
+            columns:    The grid width
+            rows:       The grid height
+
+        Returns:  The shared tables for this grid size
+        """
+        gridSize: GridSize = (columns, rows)
+        if gridSize not in cls._tables:
+            cls._tables[gridSize] = DeltaTables(columns=columns, rows=rows)
+
+        return cls._tables[gridSize]
+
+    def distance(self, deltaX: int, deltaY: int) -> float:
+        """
+        Returns:  sqrt(deltaX² + deltaY²)
+        """
+        index: int = self._index(deltaX, deltaY)
+        if index < 0:
+            return sqrt((deltaX * deltaX) + (deltaY * deltaY))
+
+        return self._distances[index]
+
+    def course(self, deltaX: int, deltaY: int) -> float:
+        """
+        Returns:  atan2(deltaY, deltaX);  The angle in radians from the positive x-axis
+        """
+        index: int = self._index(deltaX, deltaY)
+        if index < 0:
+            return atan2(deltaY, deltaX)
+
+        return self._courses[index]
+
+    def direction(self, deltaX: int, deltaY: int) -> float:
+        """
+        Returns:  atan2(deltaX, deltaY) converted to the game's 12 hour clock
+        """
+        index: int = self._index(deltaX, deltaY)
+        if index < 0:
+            return atan2(deltaX, deltaY) * GAME_DIRECTION_FACTOR
+
+        return self._directions[index]
+
+    def _index(self, deltaX: int, deltaY: int) -> int:
+        """
+        Returns:  Where the deltas are in the tables;  -1 if they are not
+        """
+        if -self._maxDeltaX <= deltaX <= self._maxDeltaX and -self._maxDeltaY <= deltaY <= self._maxDeltaY:
+            return (deltaX + self._maxDeltaX) * self._height + deltaY + self._maxDeltaY
+
+        return -1
@@ -0,0 +1,88 @@
+
+from typing import Callable
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+
+from pytrek.gui.gamepieces.GamePieceTypes import Enemies
+from pytrek.gui.gamepieces.GamePieceTypes import Enemy
+
+DueTime       = Callable[[Enemy], float]
+ScheduleEntry = Tuple[float, int, Enemy]
+
+
+class EnemyScheduler:
+    """
+    Wakes enemies only when the game clock passes the time their next action is due.  The
+    enemies wait on a heap ordered by due time so a frame where nothing is due costs a single
+    peek.
+
+    The due time is computed from the enemy's own attributes (e.g. `lastTimeCheck + firingInterval`);
+    So the intervals still come from Intelligence.  The enemies returned by `dueEnemies` go back
+    on the heap at the start of the next call;  By then the caller has updated their attributes.
+    When the enemy list changes (a new list or a different length) the heap is rebuilt
+    """
+    def __init__(self, dueTime: DueTime):
+        """
+
+        Args:
+            dueTime:  Computes when an enemy next wants to act
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._dueTime: DueTime = dueTime
+
+        self._enemies:    Enemies             = cast(Enemies, None)
+        self._enemyCount: int                 = 0
+        self._schedule:   List[ScheduleEntry] = []
+        self._awake:      List[Enemy]         = []
+        self._sequence:   int                 = 0
+
+    def dueEnemies(self, enemies: Enemies, currentTime: float) -> List[Enemy]:
+        """
+        Args:
+            enemies:        The enemies to schedule;  Usually one of the quadrant's enemy lists
+            currentTime:    The game clock
+
+        Returns:  The enemies whose due time is before the current time
+        """
+        if enemies is not self._enemies or len(enemies) != self._enemyCount:
+            self._rebuild(enemies=enemies)
+        else:
+            for awakeEnemy in self._awake:
+                self._push(awakeEnemy)
+        self._awake = []
+
+        schedule: List[ScheduleEntry] = self._schedule
+        while len(schedule) > 0 and schedule[0][0] < currentTime:
+            enemy: Enemy = heappop(schedule)[2]
+            # The caller may have pushed the due time back since we scheduled it
+            if self._dueTime(enemy) < currentTime:
+                self._awake.append(enemy)
+            else:
+                self._push(enemy)
+
+        return self._awake
+
+    def _rebuild(self, enemies: Enemies):
+
+        self._enemies    = enemies
+        self._enemyCount = len(enemies)
+        self._schedule   = []
+        for enemy in enemies:
+            self._sequence += 1
+            self._schedule.append((self._dueTime(enemy), self._sequence, enemy))
+
+        heapify(self._schedule)
+
+    def _push(self, enemy: Enemy):
+
+        self._sequence += 1
+        heappush(self._schedule, (self._dueTime(enemy), self._sequence, enemy))
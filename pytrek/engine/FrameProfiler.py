@@ -0,0 +1,238 @@
+
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from collections import deque
+
+from contextlib import contextmanager
+
+from dataclasses import dataclass
+
+from functools import wraps
+
+from json import dump as jsonDump
+
+from os import getpid
+
+from pathlib import Path
+
+from threading import get_ident
+
+from time import perf_counter_ns
+
+from codeallybasic.ConfigurationLocator import ConfigurationLocator
+from codeallybasic.SingletonV3 import SingletonV3
+
+from pytrek.Constants import APPLICATION_NAME
+
+from pytrek.settings.GameSettings import GameSettings
+
+TRACE_FILE_NAME: str = 'PyTrek.trace.json'
+
+PROFILED_NAME_ATTRIBUTE: str = '_profiledName'
+
+NANOSECONDS_PER_MICROSECOND: int   = 1000
+NANOSECONDS_PER_MILLISECOND: float = 1_000_000.0
+
+ProfileName = NewType('ProfileName', str)
+Durations   = NewType('Durations', Dict[ProfileName, Deque[int]])
+
+
+@dataclass
+class TraceEvent:
+    """
+    A Chrome trace 'complete' event;  Times are in nanoseconds
+    """
+    name:     ProfileName = ProfileName('')
+    start:    int         = 0
+    duration: int         = 0
+    threadId: int         = 0
+
+
+@dataclass
+class Percentiles:
+    """
+    Times are in milliseconds
+    """
+    name:        ProfileName = ProfileName('')
+    p50:         float       = 0.0
+    p95:         float       = 0.0
+    p99:         float       = 0.0
+    sampleCount: int         = 0
+
+
+TraceEvents     = NewType('TraceEvents', Deque[TraceEvent])
+PercentilesList = NewType('PercentilesList', List[Percentiles])
+
+
+class FrameProfiler(metaclass=SingletonV3):
+    """
+    Times the sections' and the mediators' per frame work.  It keeps the last `frameProfileWindow`
+    durations of each profiled method for the rolling percentiles and the most recent
+    `frameTraceEvents` timings for the Chrome trace (load it in chrome://tracing or Perfetto).
+
+    Nothing is wrapped unless the `profileFrames` setting is on;  So profiling costs nothing
+    otherwise
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        gameSettings: GameSettings = GameSettings()
+
+        self._enabled:    bool = gameSettings.profileFrames
+        self._windowSize: int  = gameSettings.frameProfileWindow
+
+        self._durations:   Durations   = Durations({})
+        self._traceEvents: TraceEvents = TraceEvents(deque(maxlen=gameSettings.frameTraceEvents))
+        self._origin:      int         = perf_counter_ns()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def traceFileName(self) -> Path:
+        """
+        Returns:  The fully qualified file name for the exported trace
+        """
+        return ConfigurationLocator().applicationPath(applicationName=APPLICATION_NAME) / TRACE_FILE_NAME
+
+    def instrument(self, target: Any, methodNames: List[str], prefix: str = ''):
+        """
+        Replace the target's methods with timed versions;  Does nothing unless profiling is on.
+        Methods that are already timed are left alone
+
+        Args:
+            target:         A section or a mediator
+            methodNames:    The methods to time, e.g. ['on_draw', 'on_update']
+            prefix:         Names the timings;  Defaults to the target's class name
+        """
+        if self._enabled is False:
+            return
+
+        if prefix == '':
+            prefix = target.__class__.__name__
+
+        for methodName in methodNames:
+            method: Callable = getattr(target, methodName)
+            if hasattr(method, PROFILED_NAME_ATTRIBUTE) is False:
+                setattr(target, methodName, self._timed(name=ProfileName(f'{prefix}.{methodName}'), method=method))
+
+    @contextmanager
+    def measure(self, name: ProfileName) -> Iterator[None]:
+        """
+        Time a block of code
+
+        Args:
+            name:  Names the timing
+        """
+        start: int = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name=name, start=start, end=perf_counter_ns())
+
+    def record(self, name: ProfileName, start: int, end: int):
+        """
+        Args:
+            name:   Names the timing
+            start:  perf_counter_ns() when the work started
+            end:    perf_counter_ns() when the work ended
+        """
+        durations: Deque[int] = self._durations.get(name, cast(Deque[int], None))
+        if durations is None:
+            durations = deque(maxlen=self._windowSize)
+            self._durations[name] = durations
+
+        durations.append(end - start)
+        self._traceEvents.append(TraceEvent(name=name, start=start - self._origin, duration=end - start, threadId=get_ident()))
+
+    def percentiles(self) -> PercentilesList:
+        """
+        Returns:  The rolling percentiles of every timing, slowest median first
+        """
+        percentilesList: PercentilesList = PercentilesList([])
+        for name, durations in self._durations.items():
+            samples: List[int] = sorted(durations)
+            percentilesList.append(
+                Percentiles(
+                    name=name,
+                    p50=self._percentile(samples, 0.50),
+                    p95=self._percentile(samples, 0.95),
+                    p99=self._percentile(samples, 0.99),
+                    sampleCount=len(samples)
+                )
+            )
+
+        return PercentilesList(sorted(percentilesList, key=lambda percentiles: percentiles.p50, reverse=True))
+
+    def exportTrace(self, fileName: Path = cast(Path, None)):
+        """
+        Write the recent timings in the Chrome trace event format
+
+        Args:
+            fileName:  Defaults to the trace file in the application directory
+        """
+        if fileName is None:
+            fileName = self.traceFileName
+
+        processId: int = getpid()
+        traceEvents: List[Dict[str, Any]] = [
+            {
+                'name': traceEvent.name,
+                'cat':  'frame',
+                'ph':   'X',
+                'ts':   traceEvent.start / NANOSECONDS_PER_MICROSECOND,
+                'dur':  traceEvent.duration / NANOSECONDS_PER_MICROSECOND,
+                'pid':  processId,
+                'tid':  traceEvent.threadId,
+            }
+            for traceEvent in list(self._traceEvents)
+        ]
+        try:
+            with fileName.open(mode='w') as fd:
+                jsonDump({'traceEvents': traceEvents, 'displayTimeUnit': 'ms'}, fd)
+            self.logger.info(f'Wrote {len(traceEvents)} trace events to {fileName}')
+        except OSError as e:
+            self.logger.error(f'Unable to write the frame trace {fileName}: {e}')
+
+    def _timed(self, name: ProfileName, method: Callable) -> Callable:
+
+        @wraps(method)
+        def timedMethod(*args, **kwargs):
+            start: int = perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.record(name=name, start=start, end=perf_counter_ns())
+
+        setattr(timedMethod, PROFILED_NAME_ATTRIBUTE, name)
+
+        return timedMethod
+
+    def _percentile(self, samples: List[int], fraction: float) -> float:
+        """
+        Nearest rank percentile
+
+        Args:
+            samples:    Sorted durations in nanoseconds
+            fraction:   0.5 is the median
+
+        Returns:  The percentile in milliseconds
+        """
+        if len(samples) == 0:
+            return 0.0
+
+        rank: int = min(len(samples) - 1, int(fraction * len(samples)))
+
+        return samples[rank] / NANOSECONDS_PER_MILLISECOND
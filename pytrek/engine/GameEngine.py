@@ -1,13 +1,27 @@
 
+from typing import TYPE_CHECKING
+from typing import List
+from typing import cast
+
 from logging import Logger
 from logging import getLogger
-
-from math import atan2
-from math import sin
-from math import fabs
-from math import sqrt
-
-from random import choice
+from logging import DEBUG
+
+from numpy import absolute
+from numpy import arctan2
+from numpy import array
+from numpy import asarray
+from numpy import bool_
+from numpy import count_nonzero
+from numpy import float64
+from numpy import hypot
+from numpy import int64
+from numpy import minimum
+from numpy import sin
+from numpy import where
+from numpy import zeros
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
 
 from codeallybasic.SingletonV3 import SingletonV3
 
@@ -33,6 +47,12 @@ from pytrek.settings.GameSettings import GameSettings
 
 from pytrek.GameState import GameState
 
+if TYPE_CHECKING:
+    from pytrek.engine.futures.EventEngine import EventEngine
+
+CombatValues    = NDArray[float64]
+SectorPositions = NDArray[int64]        # One (x, y) row per game piece
+
 
 class GameEngine(metaclass=SingletonV3):
 
@@ -52,8 +72,11 @@ class GameEngine(metaclass=SingletonV3):
         self._computer:      Computer      = Computer()
         self._deviceManager: DeviceManager = DeviceManager()
 
-        self._accumulatedDelta: float = 0.0
-        self._gameClock:        float = 0.0
+        self._accumulatedDelta: float         = 0.0
+        self._gameClock:        float         = 0.0
+        self._eventEngine:      'EventEngine' = cast('EventEngine', None)
+        self._moveStarDate:     float         = cast(float, None)     # The star date the current move started at
+        self._firingDueEvents:  bool          = False
 
         self.logger.info(f'GameEngine initialized')
 
@@ -66,6 +89,31 @@ class GameEngine(metaclass=SingletonV3):
         """
         return self._gameClock
 
+    def restoreGameClock(self, gameClock: float):
+        """
+        Only for restoring a saved game
+
+        Args:
+            gameClock:  The saved game clock (milliseconds)
+        """
+        self._gameClock        = gameClock
+        self._accumulatedDelta = 0.0
+
+    @property
+    def eventEngine(self) -> 'EventEngine':
+        return self._eventEngine
+
+    @eventEngine.setter
+    def eventEngine(self, newValue: 'EventEngine'):
+        """
+        Once set, `fireDueEvents` fast-forwards through the events that a move jumped past as
+        soon as the move is complete rather than leaving them to the next periodic check
+
+        Args:
+            newValue:  The event engine
+        """
+        self._eventEngine = newValue
+
     def resetOperationTime(self):
         self._gameState.opTime = 0.0
 
@@ -93,6 +141,8 @@ class GameEngine(metaclass=SingletonV3):
         self._gameState.energy = self._gameState.energy - neededEnergyForImpulseMove
         self._gameState.opTime = travelDistance / 0.095
 
+        self.fireDueEvents()
+
     def updateTimeAfterImpulseTravel(self, travelDistance: float):
         """
         Time = dist/0.095;
@@ -130,12 +180,59 @@ class GameEngine(metaclass=SingletonV3):
         oldTime      = self.stats.remainingGameTime
         oldStarDate  = self.stats.starDate
 
+        Only moves the clock and remembers where the move started;  The callers are in the middle
+        of moving the Enterprise, so an event handler that moves it too (the tractor beam) would
+        be undone.  Call `fireDueEvents` once the move is complete
+
         Args:
             elapsedTime:
         """
+        if self._moveStarDate is None:
+            self._moveStarDate = self._gameState.starDate
+
         self._gameState.starDate          = self._gameState.starDate + elapsedTime
         self._gameState.remainingGameTime = self._gameState.remainingGameTime - elapsedTime
 
+    def fireDueEvents(self):
+        """
+        Fire the events that came due while the Enterprise moved.  The clock goes back to where
+        the move started and the event engine fast-forwards it again;  So each event fires at the
+        star date it was due and recurring events that come due again within the move fire too.
+        A move made by an event handler (the tractor beam) is fast-forwarded after the one that
+        fired it.  Does nothing until an event engine registers itself
+        """
+        if self._eventEngine is None:
+            self._moveStarDate = cast(float, None)
+            return
+        if self._firingDueEvents is True:
+            return
+
+        self._firingDueEvents = True
+        try:
+            while self._moveStarDate is not None:
+                moveStarDate: float = self._moveStarDate
+                elapsedTime:  float = self._gameState.starDate - moveStarDate
+
+                self._moveStarDate = cast(float, None)
+                self._gameState.starDate          = moveStarDate
+                self._gameState.remainingGameTime = self._gameState.remainingGameTime + elapsedTime
+
+                self._eventEngine.fastForward(elapsedTime=elapsedTime)
+        finally:
+            self._firingDueEvents = False
+
+    def advanceStarDate(self, starDate: float):
+        """
+        Move the game clock forward to the given star date;  The clock never runs backwards
+
+        Args:
+            starDate:  The new star date
+        """
+        elapsedTime: float = starDate - self._gameState.starDate
+        if elapsedTime > 0:
+            self._gameState.starDate          = starDate
+            self._gameState.remainingGameTime = self._gameState.remainingGameTime - elapsedTime
+
     def computeEnergyForQuadrantTravel(self, travelDistance: float) -> float:
         """
         power = 20.0 + 100.0*dist;
@@ -244,42 +341,45 @@ class GameEngine(metaclass=SingletonV3):
         Returns:
 
         """
-        r: float = (self._intelligence.rand() + self._intelligence.rand()) * 0.5 - 0.5
-
-        r += 0.002 * klingonPower * r
-        self.logger.debug(f"{r=}")
-
-        jx = shooterPosition.x
-        jy = shooterPosition.y
+        hits: CombatValues = self.computeHitBatch(shooterPositions=self.sectorPositions([shooterPosition]),
+                                                  targetPositions=self.sectorPositions([targetPosition]),
+                                                  klingonPowers=[klingonPower])
+        return float(hits[0])
 
-        sectx = targetPosition.x
-        secty = targetPosition.y
+    def computeHitBatch(self, shooterPositions: SectorPositions, targetPositions: SectorPositions, klingonPowers: ArrayLike) -> CombatValues:
+        """
+        `computeHit` for a whole volley of shots at once
 
-        rads = atan2(secty-jy, jx-sectx)
-        self.logger.debug(f" (jx,jy): ({jx}, {jy}), (sectx,secty): ({sectx},{secty}) - rads: {rads}")
+        Args:
+            shooterPositions:   The sector position of each shooter
+            targetPositions:    The sector position of each target;  A single row targets everything at the same position
+            klingonPowers:      The power of each shooter
 
-        course: float = (1.90985 * rads) + (0.25 * r)
-        self.logger.debug(f"{course=}")
+        Returns:  The hit value of each shot
+        """
+        powers: CombatValues = asarray(klingonPowers, dtype=float64)
+        count:  int          = len(powers)
 
-        ac: float = course + 0.25 * r
+        r: CombatValues = (self._intelligence.randomArray(count) + self._intelligence.randomArray(count)) * 0.5 - 0.5
+        r += 0.002 * powers * r
 
-        angle:    float = (15.0-ac) * 0.5235988
-        bullseye: float = (15.0 - course)*0.5235988
+        jx = shooterPositions[:, 0]
+        jy = shooterPositions[:, 1]
+        sectX = targetPositions[:, 0]
+        sectY = targetPositions[:, 1]
 
-        self.logger.debug(f"{angle=} {bullseye=}")
+        rads:   CombatValues = arctan2(sectY - jy, jx - sectX)
+        course: CombatValues = (1.90985 * rads) + (0.25 * r)
 
-        inx = targetPosition.x
-        iny = targetPosition.y
-        ix  = shooterPosition.x
-        iy  = shooterPosition.y
+        ac: CombatValues = course + 0.25 * r
 
-        def square(num) -> float:
-            return num * num
+        angle:    CombatValues = (15.0 - ac) * 0.5235988
+        bullsEye: CombatValues = (15.0 - course) * 0.5235988
 
-        hit = 700.0 + (100.0 * self._intelligence.rand()) - \
-            (1000.0 * sqrt(square(ix-inx) + square(iy-iny))) * fabs(sin(bullseye-angle))
+        hits: CombatValues = 700.0 + (100.0 * self._intelligence.randomArray(count)) - \
+            (1000.0 * hypot(jx - sectX, jy - sectY)) * absolute(sin(bullsEye - angle))
 
-        return hit
+        return hits
 
     def computeHitValueOnKlingon(self, enterprisePosition: Coordinates, klingonPosition: Coordinates, klingonPower: float) -> float:
         # noinspection SpellCheckingInspection
@@ -302,26 +402,41 @@ class GameEngine(metaclass=SingletonV3):
 
         Returns  A computed answer based on the old SST `C` code
         """
-        inx: int = enterprisePosition.x
-        iny: int = enterprisePosition.y
-        ix: int  = klingonPosition.x
-        iy: int  = klingonPosition.y
+        hits: CombatValues = self.computeHitValueOnKlingonBatch(enterprisePosition=enterprisePosition,
+                                                                klingonPositions=self.sectorPositions([klingonPosition]),
+                                                                klingonPowers=[klingonPower])
+        return float(hits[0])
+
+    def computeHitValueOnKlingonBatch(self, enterprisePosition: Coordinates, klingonPositions: SectorPositions, klingonPowers: ArrayLike) -> CombatValues:
+        """
+        `computeHitValueOnKlingon` for many Klingons at once
+
+        Args:
+            enterprisePosition: Where the Enterprise is
+            klingonPositions:   The sector position of each Klingon
+            klingonPowers:      The power of each Klingon
+
+        Returns:  The hit value on each Klingon
+        """
+        powers: CombatValues = asarray(klingonPowers, dtype=float64)
+        count:  int          = len(powers)
 
-        squaredX: float = self._intelligence.square(ix-inx)
-        squaredY: float = self._intelligence.square(iy-iny)
-        distance: float = sqrt(squaredX + squaredY)
+        deltaX: NDArray[int64] = klingonPositions[:, 0] - enterprisePosition.x
+        deltaY: NDArray[int64] = klingonPositions[:, 1] - enterprisePosition.y
 
-        course:   float = self._computeCourse(start=enterprisePosition, end=klingonPosition)
-        bullsEye: float = (15.0 - course) * 0.5235988
-        r:        float = self._intelligence.rand() * self._intelligence.rand() * 0.5 - 0.5
-        r = r + 0.002 * klingonPower * r
+        distances: CombatValues = hypot(deltaX, deltaY)
 
-        ac:    float = course + 0.25 * r
-        angle: float = (15.0 - ac) * 0.5235988
+        courses:  CombatValues = arctan2(deltaY, deltaX)
+        bullsEye: CombatValues = (15.0 - courses) * 0.5235988
+        r:        CombatValues = self._intelligence.randomArray(count) * self._intelligence.randomArray(count) * 0.5 - 0.5
+        r = r + 0.002 * powers * r
 
-        h1: float = 700.0 + 100.0 * self._intelligence.rand() - 1000.0 * distance * fabs(sin(bullsEye - angle))
+        ac:    CombatValues = courses + 0.25 * r
+        angle: CombatValues = (15.0 - ac) * 0.5235988
 
-        return fabs(h1)
+        h1: CombatValues = 700.0 + 100.0 * self._intelligence.randomArray(count) - 1000.0 * distances * absolute(sin(bullsEye - angle))
+
+        return absolute(h1)
 
     def degradeEnergyLevel(self, degradedTorpedoValue: float):
         """
@@ -333,7 +448,8 @@ class GameEngine(metaclass=SingletonV3):
             the hit on the shield
         """
         self._gameState.energy -= degradedTorpedoValue
-        self.logger.debug(f"Degraded energy level: {self._gameState.energy:.4f}")
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f"Degraded energy level: {self._gameState.energy:.4f}")
         if self._gameState.energy < 0:
             self._gameState.energy = 0
 
@@ -358,7 +474,8 @@ class GameEngine(metaclass=SingletonV3):
         if self._accumulatedDelta > GameEngine.REAL_TIME_CLOCK_TICK:
             self._gameClock += self._accumulatedDelta
             self._accumulatedDelta = 0.0
-            self.logger.debug(f'Game Clock: {self._gameClock:.3f}')
+            if self.logger.isEnabledFor(DEBUG):
+                self.logger.debug(f'Game Clock: {self._gameClock:.3f}')
 
     def computeCloseCoordinates(self, targetCoordinates: Coordinates) -> DirectionData:
         """
@@ -407,7 +524,7 @@ class GameEngine(metaclass=SingletonV3):
 
     def randomDirection(self) -> Direction:
         """"""
-        return choice(list(Direction))
+        return self._intelligence.randomDirection()
 
     def doPhasers(self, distance: float, enemyPower: float, powerAmount: float):
         # noinspection SpellCheckingInspection
@@ -434,26 +551,41 @@ class GameEngine(metaclass=SingletonV3):
             powerAmount:    The amount of power to expend
         Returns:
         """
-        phaserBurstToTerminate: float = self._gameSettings.phaserBurstToTerminate
+        hits: CombatValues = self.doPhasersBatch(distances=[distance], enemyPowers=[enemyPower], powerAmount=powerAmount)
 
-        rPow:   float = powerAmount
-        powRem: float = rPow
+        return float(hits[0])
 
-        if enemyPower <= phaserBurstToTerminate:
-            hit: float = phaserBurstToTerminate
-        else:
-            phaserFactor: float = self._gameSettings.phaserFactor
+    def doPhasersBatch(self, distances: ArrayLike, enemyPowers: ArrayLike, powerAmount: float) -> CombatValues:
+        """
+        `doPhasers` for every enemy in a phaser volley at once
 
-            hit = fabs(enemyPower / phaserFactor * pow(0.90, distance))
-            over: float = (0.01 + 0.05 * self._intelligence.rand()) * hit
+        Args:
+            distances:      The sector distance to each enemy
+            enemyPowers:    Each enemy's power reserve
+            powerAmount:    The amount of power to expend on each enemy
+
+        Returns:  The phaser hit on each enemy
+        """
+        phaserBurstToTerminate: float = self._gameSettings.phaserBurstToTerminate
+        phaserFactor:           float = self._gameSettings.phaserFactor
 
-            temp: float = powRem
+        enemyDistances: CombatValues = asarray(distances,   dtype=float64)
+        powers:         CombatValues = asarray(enemyPowers, dtype=float64)
 
-            powRem = hit + over
-            if powRem <= 0 and temp < hit:
-                hit = temp
+        burstTerminated: NDArray[bool_] = powers <= phaserBurstToTerminate
+        #
+        # Like the single hit version only draw a random number for the enemies the burst does not terminate
+        #
+        randoms: CombatValues = zeros(len(powers), dtype=float64)
+        randoms[~burstTerminated] = self._intelligence.randomArray(int(count_nonzero(~burstTerminated)))
 
-        return hit
+        hits: CombatValues = absolute(powers / phaserFactor * 0.90 ** enemyDistances)
+        over: CombatValues = (0.01 + 0.05 * randoms) * hits
+
+        powRem: CombatValues = hits + over
+        hits = where((powRem <= 0) & (powerAmount < hits), powerAmount, hits)
+
+        return where(burstTerminated, phaserBurstToTerminate, hits)
 
     def hitThem(self, distance: float, hit: float, enemyPower: float) -> float:
         # noinspection SpellCheckingInspection
@@ -477,19 +609,30 @@ class GameEngine(metaclass=SingletonV3):
         Returns:  The power drain to apply to the enemy
         """
 
-        phaserFactor: float = self._gameSettings.phaserFactor
+        drains: CombatValues = self.hitThemBatch(distances=[distance], hits=[hit], enemyPowers=[enemyPower])
+
+        return float(drains[0])
+
+    def hitThemBatch(self, distances: ArrayLike, hits: ArrayLike, enemyPowers: ArrayLike) -> CombatValues:
+        """
+        `hitThem` for every enemy in a phaser volley at once
+
+        Args:
+            distances:      The sector distance to each enemy
+            hits:           The phaser hit on each enemy
+            enemyPowers:    Each enemy's current power
 
-        wham:       float = hit
-        dustFactor: float = 0.8 + 0.01 * self._intelligence.rand()
+        Returns:  The power drain to apply to each enemy
+        """
+        phaserFactor: float = self._gameSettings.phaserFactor
 
-        damage: float = wham * pow(dustFactor, distance)
+        enemyDistances: CombatValues = asarray(distances, dtype=float64)
+        whams:          CombatValues = asarray(hits,      dtype=float64)
 
-        kpInit: float = enemyPower
-        kp:     float = fabs(kpInit)
-        if phaserFactor * damage < kp:
-            kp = phaserFactor * damage
+        dustFactors: CombatValues = 0.8 + 0.01 * self._intelligence.randomArray(len(whams))
+        damages:     CombatValues = whams * dustFactors ** enemyDistances
 
-        return kp
+        return minimum(absolute(asarray(enemyPowers, dtype=float64)), phaserFactor * damages)
 
     def decrementEnemyCount(self, enemy: Enemy):
         """
@@ -532,6 +675,16 @@ class GameEngine(metaclass=SingletonV3):
         # TODO
         # self._gameState.lifeSupportReserves = self._gameSettings.initialLifeSupportReserves
 
+    @classmethod
+    def sectorPositions(cls, coordinates: List[Coordinates]) -> SectorPositions:
+        """
+        Args:
+            coordinates:  Game piece sector coordinates
+
+        Returns:  The coordinates in the form the batch computations use
+        """
+        return array([(c.x, c.y) for c in coordinates], dtype=int64).reshape(-1, 2)
+
     def _computeCourse(self, start: Coordinates, end: Coordinates) -> float:
         # noinspection SpellCheckingInspection
         """
@@ -548,8 +701,4 @@ class GameEngine(metaclass=SingletonV3):
         Returns:  A game course in radians
         """
 
-        deltaX: int = end.x - start.x
-        deltaY: int = end.y - start.y
-        course: float = atan2(deltaY, deltaX)
-
-        return course
+        return self._computer.computeCourse(startCoordinates=start, endCoordinates=end)
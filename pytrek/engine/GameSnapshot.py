@@ -0,0 +1,595 @@
+
+from typing import List
+from typing import Sized
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from struct import Struct
+
+from codeallybasic.ConfigurationLocator import ConfigurationLocator
+from codeallybasic.SingletonV3 import SingletonV3
+
+from pytrek.Constants import APPLICATION_NAME
+
+from pytrek.GameState import GameState
+
+from pytrek.engine.GameEngine import GameEngine
+from pytrek.engine.GameType import GameType
+from pytrek.engine.Intelligence import Intelligence
+from pytrek.engine.PlayerType import PlayerType
+from pytrek.engine.SaveFileWriter import SaveFileWriter
+from pytrek.engine.ShipCondition import ShipCondition
+
+from pytrek.engine.devices.Device import Device
+from pytrek.engine.devices.DeviceManager import DeviceManager
+from pytrek.engine.devices.DeviceStatus import DeviceStatus
+from pytrek.engine.devices.DeviceType import DeviceType
+
+from pytrek.engine.futures.EventEngine import EventEngine
+from pytrek.engine.futures.EventEngine import SchedulableMap
+from pytrek.engine.futures.FutureEvent import FutureEvent
+from pytrek.engine.futures.FutureEventType import FutureEventType
+
+from pytrek.exceptions.InvalidSnapshotException import InvalidSnapshotException
+
+from pytrek.gui.gamepieces.GamePieceTypes import Enemy
+from pytrek.gui.gamepieces.Planet import Planet
+from pytrek.gui.gamepieces.PlanetType import PlanetType
+from pytrek.gui.gamepieces.StarBase import StarBase
+from pytrek.gui.gamepieces.commander.Commander import Commander
+from pytrek.gui.gamepieces.klingon.Klingon import Klingon
+from pytrek.gui.gamepieces.supercommander.SuperCommander import SuperCommander
+
+from pytrek.model.Coordinates import Coordinates
+from pytrek.model.Galaxy import Galaxy
+from pytrek.model.Quadrant import PlacedPieces
+from pytrek.model.Quadrant import Quadrant
+from pytrek.model.SectorStore import SectorStore
+from pytrek.model.SectorType import SectorType
+
+SNAPSHOT_FILE_NAME: str = 'PyTrek.snapshot'
+
+SNAPSHOT_MAGIC:   bytes = b'PTRK'
+SNAPSHOT_VERSION: int   = 3
+
+NO_COORDINATE: int = -1
+NO_PLANET:     int = 255
+#
+# Quadrant coordinates are stored as signed shorts;  Sector coordinates as signed bytes
+#
+MAXIMUM_GALAXY_SIZE: int = 32767
+#
+# Enumerations are stored as their position in these lists
+#
+SHIP_CONDITIONS: List[ShipCondition]   = list(ShipCondition)
+PLAYER_TYPES:    List[PlayerType]      = list(PlayerType)
+GAME_TYPES:      List[GameType]        = list(GameType)
+DEVICE_TYPES:    List[DeviceType]      = list(DeviceType)
+DEVICE_STATUSES: List[DeviceStatus]    = list(DeviceStatus)
+EVENT_TYPES:     List[FutureEventType] = list(FutureEventType)
+PLANET_TYPES:    List[PlanetType]      = list(PlanetType)
+ENEMY_TYPES:     List[SectorType]      = [SectorType.KLINGON, SectorType.COMMANDER, SectorType.SUPER_COMMANDER]
+#
+# Quadrant flags
+#
+QUADRANT_CREATED:      int = 0x01
+QUADRANT_STARBASE:     int = 0x02
+QUADRANT_PLANET:       int = 0x04
+QUADRANT_SUPER_NOVA:   int = 0x08
+QUADRANT_SCANNED:      int = 0x10
+QUADRANT_MATERIALIZED: int = 0x20
+#
+# Record layouts;  All little endian
+#
+HEADER:              Struct = Struct('<4sH')
+GAME_STATE:          Struct = Struct('<5d7i4B2h2b')   # 5 floats, 7 counts, 4 enumerations/flags, quadrant and sector coordinates
+GAME_CLOCK:          Struct = Struct('<d')
+GAME_SEED:           Struct = Struct('<q')
+COUNT:               Struct = Struct('<H')
+DEVICE:              Struct = Struct('<BBd')
+SCHEDULABLE:         Struct = Struct('<I')
+EVENT:               Struct = Struct('<Bd2h')
+GALAXY:              Struct = Struct('<qHH2h')
+QUADRANT:            Struct = Struct('<B3H')
+MATERIALIZED:        Struct = Struct('<I2bB2bH')      # index, StarBase sector, planet type, planet sector, enemy count
+ENEMY:               Struct = Struct('<B2bd3id')
+
+Record = Tuple
+
+
+@dataclass
+class MaterializedRecords:
+    """
+    A materialized quadrant's contents and enemies as read
+    """
+    contents: Record       = ()
+    enemies:  List[Record] = field(default_factory=list)
+
+
+@dataclass
+class SnapshotRecords:
+    """
+    A snapshot that has been read and checked but not applied to the game
+    """
+    gameState:     Record                    = ()
+    gameClock:     float                     = 0.0
+    gameSeed:      int                       = 0
+    devices:       List[Record]              = field(default_factory=list)
+    schedulable:   SchedulableMap            = field(default_factory=lambda: SchedulableMap({}))
+    pendingEvents: List[FutureEvent]         = field(default_factory=list)
+    galaxy:        Record                    = ()
+    quadrants:     List[Record]              = field(default_factory=list)
+    materialized:  List[MaterializedRecords] = field(default_factory=list)
+
+
+class SnapshotReader:
+    """
+    Walks through a snapshot one record at a time
+    """
+    def __init__(self, snapshot: bytes):
+
+        self._snapshot: memoryview = memoryview(snapshot)
+        self._offset:   int        = 0
+
+    def read(self, record: Struct) -> Record:
+
+        if self._offset + record.size > len(self._snapshot):
+            raise InvalidSnapshotException(message='Snapshot is truncated')
+
+        values: Record = record.unpack_from(self._snapshot, self._offset)
+        self._offset += record.size
+
+        return values
+
+
+class GameSnapshot(metaclass=SingletonV3):
+    """
+    A compact binary image of the whole simulation;  The game state, the game clock, the device
+    damage, the pending events and the galaxy.  Quadrants the Enterprise has not visited are
+    saved as their summary counts;  Restoring regenerates them from the galaxy seed.  Only the
+    materialized quadrants save their game pieces.  A snapshot is a few kilobytes at most;  So
+    many can be kept for replay and rollback
+
+    The snapshot starts with a magic number and a format version.  Restoring refuses snapshots
+    it does not understand
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._gameState:     GameState     = GameState()
+        self._gameEngine:    GameEngine    = GameEngine()
+        self._intelligence:  Intelligence  = Intelligence()
+        self._deviceManager: DeviceManager = DeviceManager()
+        self._galaxy:        Galaxy        = Galaxy()
+
+        self._saveFileWriter:       SaveFileWriter       = SaveFileWriter()
+        self._configurationLocator: ConfigurationLocator = ConfigurationLocator()
+
+    @property
+    def snapshotFileName(self) -> Path:
+        """
+        Returns:  The fully qualified file name for the saved game
+        """
+        configPath: Path = self._configurationLocator.applicationPath(applicationName=APPLICATION_NAME)
+
+        return configPath / SNAPSHOT_FILE_NAME
+
+    def saveGame(self, fileName: Path = cast(Path, None)):
+        """
+        The snapshot is taken now;  The file is written in the background
+
+        Args:
+            fileName:  Where to save;  Defaults to the snapshot file in the application directory
+        """
+        if fileName is None:
+            fileName = self.snapshotFileName
+
+        self._saveFileWriter.write(fileName=fileName, saveBytes=self.takeSnapshot())
+
+    def loadGame(self, fileName: Path = cast(Path, None)):
+        """
+        Args:
+            fileName:  The saved game;  Defaults to the snapshot file in the application directory
+        """
+        if fileName is None:
+            fileName = self.snapshotFileName
+
+        self._saveFileWriter.flush()
+        self.restoreSnapshot(snapshot=fileName.read_bytes())
+
+    def takeSnapshot(self) -> bytes:
+        """
+        Returns:  The current simulation
+        """
+        galaxy: Galaxy = self._galaxy
+        if galaxy.rows > MAXIMUM_GALAXY_SIZE or galaxy.columns > MAXIMUM_GALAXY_SIZE:
+            raise InvalidSnapshotException(message=f'A {galaxy.rows}x{galaxy.columns} galaxy is larger than a snapshot holds')
+
+        records: List[bytes] = [HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION)]
+
+        self._packGameState(records)
+        records.append(GAME_CLOCK.pack(self._gameEngine.gameClock))
+        records.append(GAME_SEED.pack(self._intelligence.seed))
+        self._packDevices(records)
+        self._packEvents(records)
+        self._packGalaxy(records)
+
+        return b''.join(records)
+
+    def restoreSnapshot(self, snapshot: bytes):
+        """
+        Replace the current simulation with the snapshot's.  The whole snapshot is read and
+        checked before anything is replaced;  So a bad snapshot leaves the current game alone.
+        The caller puts the Enterprise back in the current quadrant
+
+        Args:
+            snapshot:  Created by `takeSnapshot`
+
+        Raises: InvalidSnapshotException if the snapshot is not one we understand or is damaged
+        """
+        snapshotRecords: SnapshotRecords = self._readSnapshot(snapshot=snapshot)
+
+        self._applyGameState(snapshotRecords.gameState)
+        self._gameEngine.restoreGameClock(gameClock=snapshotRecords.gameClock)
+        self._applyGameSeed(snapshotRecords.gameSeed)
+        self._applyDevices(snapshotRecords.devices)
+        EventEngine().restoreEvents(schedulable=snapshotRecords.schedulable, pendingEvents=snapshotRecords.pendingEvents)
+        self._applyGalaxy(snapshotRecords)
+
+    def _readSnapshot(self, snapshot: bytes) -> SnapshotRecords:
+
+        reader: SnapshotReader = SnapshotReader(snapshot)
+
+        magic, version = reader.read(HEADER)
+        if magic != SNAPSHOT_MAGIC:
+            raise InvalidSnapshotException(message='Not a PyTrek snapshot')
+        if version != SNAPSHOT_VERSION:
+            raise InvalidSnapshotException(message=f'Unsupported snapshot version: {version}')
+
+        snapshotRecords: SnapshotRecords = SnapshotRecords()
+
+        snapshotRecords.gameState = self._readGameState(reader)
+        snapshotRecords.gameClock = reader.read(GAME_CLOCK)[0]
+        snapshotRecords.gameSeed  = reader.read(GAME_SEED)[0]
+        snapshotRecords.devices   = self._readDevices(reader)
+
+        self._readEvents(reader, snapshotRecords)
+        self._readGalaxy(reader, snapshotRecords)
+
+        return snapshotRecords
+
+    def _packGameState(self, records: List[bytes]):
+
+        gameState:           GameState   = self._gameState
+        quadrantCoordinates: Coordinates = gameState.currentQuadrantCoordinates
+        sectorCoordinates:   Coordinates = gameState.currentSectorCoordinates
+
+        records.append(GAME_STATE.pack(
+            gameState.energy, gameState.shieldEnergy, gameState.opTime, gameState.starDate, gameState.remainingGameTime,
+            gameState.remainingKlingons, gameState.remainingCommanders, gameState.remainingSuperCommanders, gameState.torpedoCount,
+            gameState.warpFactor, gameState.starBaseCount, gameState.planetCount,
+            SHIP_CONDITIONS.index(gameState.shipCondition), PLAYER_TYPES.index(gameState.playerType), GAME_TYPES.index(gameState.gameType),
+            int(gameState.baseAttackUnderway),
+            *self._packCoordinates(quadrantCoordinates), *self._packCoordinates(sectorCoordinates)
+        ))
+
+    def _readGameState(self, reader: SnapshotReader) -> Record:
+
+        gameState: Record = reader.read(GAME_STATE)
+        shipCondition, playerType, gameType = gameState[12:15]
+        quadrantX, quadrantY, sectorX, sectorY = gameState[16:20]
+
+        self._checkIndex(shipCondition, SHIP_CONDITIONS, 'ship condition')
+        self._checkIndex(playerType,    PLAYER_TYPES,    'player type')
+        self._checkIndex(gameType,      GAME_TYPES,      'game type')
+        self._checkQuadrantCoordinates(quadrantX, quadrantY)
+        self._checkSectorCoordinates(sectorX, sectorY)
+
+        return gameState
+
+    def _applyGameState(self, gameStateRecord: Record):
+
+        (energy, shieldEnergy, opTime, starDate, remainingGameTime,
+         remainingKlingons, remainingCommanders, remainingSuperCommanders, torpedoCount,
+         warpFactor, starBaseCount, planetCount,
+         shipCondition, playerType, gameType, baseAttackUnderway,
+         quadrantX, quadrantY, sectorX, sectorY) = gameStateRecord
+
+        gameState: GameState = self._gameState
+
+        gameState.energy                   = energy
+        gameState.shieldEnergy             = shieldEnergy
+        gameState.opTime                   = opTime
+        gameState.starDate                 = starDate
+        gameState.remainingGameTime        = remainingGameTime
+        gameState.remainingKlingons        = remainingKlingons
+        gameState.remainingCommanders      = remainingCommanders
+        gameState.remainingSuperCommanders = remainingSuperCommanders
+        gameState.torpedoCount             = torpedoCount
+        gameState.warpFactor               = warpFactor
+        gameState.starBaseCount            = starBaseCount
+        gameState.planetCount              = planetCount
+        gameState.shipCondition            = SHIP_CONDITIONS[shipCondition]
+        gameState.playerType               = PLAYER_TYPES[playerType]
+        gameState.gameType                 = GAME_TYPES[gameType]
+        gameState.baseAttackUnderway       = bool(baseAttackUnderway)
+
+        gameState.currentQuadrantCoordinates = self._unpackCoordinates(quadrantX, quadrantY)
+        gameState.currentSectorCoordinates   = self._unpackCoordinates(sectorX, sectorY)
+
+    def _applyGameSeed(self, gameSeed: int):
+
+        self._intelligence.resumeStreams(seed=gameSeed, gameClock=self._gameEngine.gameClock)
+        self._gameState.gameSeed = gameSeed
+
+    def _packDevices(self, records: List[bytes]):
+
+        records.append(COUNT.pack(len(DEVICE_TYPES)))
+        for deviceType in DEVICE_TYPES:
+            device: Device = self._deviceManager.getDevice(deviceType)
+            records.append(DEVICE.pack(DEVICE_TYPES.index(deviceType), DEVICE_STATUSES.index(device.deviceStatus), device.damage))
+
+    def _readDevices(self, reader: SnapshotReader) -> List[Record]:
+
+        devices:     List[Record] = []
+        deviceCount: int          = reader.read(COUNT)[0]
+        for x in range(deviceCount):
+            device: Record = reader.read(DEVICE)
+            self._checkIndex(device[0], DEVICE_TYPES,    'device type')
+            self._checkIndex(device[1], DEVICE_STATUSES, 'device status')
+            devices.append(device)
+
+        return devices
+
+    def _applyDevices(self, devices: List[Record]):
+
+        for deviceType, deviceStatus, damage in devices:
+            device: Device = self._deviceManager.getDevice(DEVICE_TYPES[deviceType])
+            device.deviceStatus = DEVICE_STATUSES[deviceStatus]
+            device.damage       = damage
+
+    def _packEvents(self, records: List[bytes]):
+
+        eventEngine: EventEngine = EventEngine()
+
+        schedulable: int = 0
+        for bit, eventType in enumerate(EVENT_TYPES):
+            if eventType != FutureEventType.SPY and eventEngine.isSchedulable(eventType) is True:
+                schedulable |= 1 << bit
+        records.append(SCHEDULABLE.pack(schedulable))
+
+        pendingEvents: List[FutureEvent] = eventEngine.allPendingEvents()
+        records.append(COUNT.pack(len(pendingEvents)))
+        for futureEvent in pendingEvents:
+            records.append(EVENT.pack(EVENT_TYPES.index(futureEvent.type), futureEvent.starDate, *self._packCoordinates(futureEvent.quadrantCoordinates)))
+
+    def _readEvents(self, reader: SnapshotReader, snapshotRecords: SnapshotRecords):
+
+        schedulableBits: int = reader.read(SCHEDULABLE)[0]
+        for bit, eventType in enumerate(EVENT_TYPES):
+            if eventType != FutureEventType.SPY:
+                snapshotRecords.schedulable[eventType] = schedulableBits & (1 << bit) != 0
+
+        eventCount: int = reader.read(COUNT)[0]
+        for x in range(eventCount):
+            eventTypeIndex, starDate, quadrantX, quadrantY = reader.read(EVENT)
+            self._checkIndex(eventTypeIndex, EVENT_TYPES, 'event type')
+            self._checkQuadrantCoordinates(quadrantX, quadrantY)
+
+            futureEvent: FutureEvent = FutureEvent(type=EVENT_TYPES[eventTypeIndex], starDate=starDate, quadrantCoordinates=self._unpackCoordinates(quadrantX, quadrantY))
+            snapshotRecords.pendingEvents.append(futureEvent)
+
+    def _packGalaxy(self, records: List[bytes]):
+
+        galaxy:       Galaxy      = self._galaxy
+        sectorStore:  SectorStore = galaxy.sectorStore
+        materialized: List[int]   = []
+
+        records.append(GALAXY.pack(galaxy.galaxySeed, galaxy.rows, galaxy.columns, *self._packCoordinates(galaxy.currentQuadrant.coordinates)))
+
+        for quadrantIndex, quadrant in enumerate(galaxy.quadrants):
+            flags: int = 0
+            if quadrant is not None:
+                flags = self._quadrantFlags(quadrant)
+                if quadrant.materialized is True:
+                    materialized.append(quadrantIndex)
+
+            records.append(QUADRANT.pack(flags,
+                                         sectorStore.getEnemyCount(quadrantIndex, SectorType.KLINGON),
+                                         sectorStore.getEnemyCount(quadrantIndex, SectorType.COMMANDER),
+                                         sectorStore.getEnemyCount(quadrantIndex, SectorType.SUPER_COMMANDER)))
+
+        records.append(COUNT.pack(len(materialized)))
+        for quadrantIndex in materialized:
+            self._packQuadrantContents(records, quadrantIndex=quadrantIndex, quadrant=galaxy.quadrants[quadrantIndex])
+
+    def _readGalaxy(self, reader: SnapshotReader, snapshotRecords: SnapshotRecords):
+
+        galaxy: Galaxy = self._galaxy
+
+        snapshotRecords.galaxy = reader.read(GALAXY)
+
+        galaxySeed, rows, columns, currentX, currentY = snapshotRecords.galaxy
+        if rows != galaxy.rows or columns != galaxy.columns:
+            raise InvalidSnapshotException(message=f'Snapshot galaxy is {rows}x{columns};  This galaxy is {galaxy.rows}x{galaxy.columns}')
+        self._checkQuadrantCoordinates(currentX, currentY)
+
+        quadrantCount: int = rows * columns
+        for quadrantIndex in range(quadrantCount):
+            snapshotRecords.quadrants.append(reader.read(QUADRANT))
+
+        materializedCount: int = reader.read(COUNT)[0]
+        for x in range(materializedCount):
+            snapshotRecords.materialized.append(self._readQuadrantContents(reader, quadrantCount=quadrantCount))
+
+    def _applyGalaxy(self, snapshotRecords: SnapshotRecords):
+
+        galaxy: Galaxy = self._galaxy
+
+        galaxySeed, rows, columns, currentX, currentY = snapshotRecords.galaxy
+
+        galaxy.resetGalaxy(galaxySeed=galaxySeed)
+        sectorStore: SectorStore = galaxy.sectorStore
+
+        for quadrantIndex, quadrantRecord in enumerate(snapshotRecords.quadrants):
+            flags, klingonCount, commanderCount, superCommanderCount = quadrantRecord
+
+            sectorStore.setEnemyCount(quadrantIndex, SectorType.KLINGON,         klingonCount)
+            sectorStore.setEnemyCount(quadrantIndex, SectorType.COMMANDER,       commanderCount)
+            sectorStore.setEnemyCount(quadrantIndex, SectorType.SUPER_COMMANDER, superCommanderCount)
+
+            if flags & QUADRANT_CREATED:
+                quadrant: Quadrant = galaxy.getQuadrant(quadrantCoordinates=Coordinates(x=quadrantIndex % columns, y=quadrantIndex // columns))
+                quadrant.hasStarBase = flags & QUADRANT_STARBASE != 0
+                quadrant.hasPlanet   = flags & QUADRANT_PLANET != 0
+                quadrant.scanned     = flags & QUADRANT_SCANNED != 0
+                if flags & QUADRANT_SUPER_NOVA:
+                    quadrant.hasSuperNova = True
+
+        for materializedRecords in snapshotRecords.materialized:
+            self._applyQuadrantContents(materializedRecords, columns=columns)
+
+        galaxy.currentQuadrant = galaxy.getQuadrant(quadrantCoordinates=Coordinates(x=currentX, y=currentY))
+
+    def _packQuadrantContents(self, records: List[bytes], quadrantIndex: int, quadrant: Quadrant):
+
+        starBaseCoordinates: Tuple[int, int] = (NO_COORDINATE, NO_COORDINATE)
+        if quadrant.starBase is not None:
+            starBaseCoordinates = self._packCoordinates(quadrant.starBase.gameCoordinates)
+
+        planetType:        int             = NO_PLANET
+        planetCoordinates: Tuple[int, int] = (NO_COORDINATE, NO_COORDINATE)
+        if quadrant.planet is not None:
+            planetType        = PLANET_TYPES.index(quadrant.planet.planetType)
+            planetCoordinates = self._packCoordinates(quadrant.planet.gameCoordinates)
+
+        enemies: List[Tuple[SectorType, Enemy]] = (
+            [(SectorType.KLINGON,         enemy) for enemy in quadrant.klingons] +
+            [(SectorType.COMMANDER,       enemy) for enemy in quadrant.commanders] +
+            [(SectorType.SUPER_COMMANDER, enemy) for enemy in quadrant.superCommanders]
+        )
+        records.append(MATERIALIZED.pack(quadrantIndex, *starBaseCoordinates, planetType, *planetCoordinates, len(enemies)))
+
+        for sectorType, enemy in enemies:
+            records.append(ENEMY.pack(ENEMY_TYPES.index(sectorType), *self._packCoordinates(enemy.gameCoordinates),
+                                      enemy.power, enemy.moveInterval, enemy.firingInterval, enemy.lastTimeCheck, enemy.timeSinceMovement))
+
+    def _readQuadrantContents(self, reader: SnapshotReader, quadrantCount: int) -> MaterializedRecords:
+
+        contents: Record = reader.read(MATERIALIZED)
+        quadrantIndex, starBaseX, starBaseY, planetType, planetX, planetY, enemyCount = contents
+
+        if not 0 <= quadrantIndex < quadrantCount:
+            raise InvalidSnapshotException(message=f'Bad quadrant index: {quadrantIndex}')
+        self._checkSectorCoordinates(starBaseX, starBaseY)
+        if planetType != NO_PLANET:
+            self._checkIndex(planetType, PLANET_TYPES, 'planet type')
+            self._checkSectorCoordinates(planetX, planetY, required=True)
+
+        materializedRecords: MaterializedRecords = MaterializedRecords(contents=contents)
+        for x in range(enemyCount):
+            enemy: Record = reader.read(ENEMY)
+            self._checkIndex(enemy[0], ENEMY_TYPES, 'enemy type')
+            self._checkSectorCoordinates(enemy[1], enemy[2], required=True)
+            materializedRecords.enemies.append(enemy)
+
+        return materializedRecords
+
+    def _applyQuadrantContents(self, materializedRecords: MaterializedRecords, columns: int):
+
+        quadrantIndex, starBaseX, starBaseY, planetType, planetX, planetY, enemyCount = materializedRecords.contents
+
+        quadrant:     Quadrant     = self._galaxy.getQuadrant(quadrantCoordinates=Coordinates(x=quadrantIndex % columns, y=quadrantIndex // columns))
+        placedPieces: PlacedPieces = PlacedPieces([])
+
+        if starBaseX != NO_COORDINATE:
+            placedPieces.append((SectorType.STARBASE, StarBase(sectorCoordinates=Coordinates(x=starBaseX, y=starBaseY))))
+        if planetType != NO_PLANET:
+            placedPieces.append((SectorType.PLANET, Planet(planetType=PLANET_TYPES[planetType], sectorCoordinates=Coordinates(x=planetX, y=planetY))))
+
+        for enemyType, enemyX, enemyY, power, moveInterval, firingInterval, lastTimeCheck, timeSinceMovement in materializedRecords.enemies:
+
+            sectorType:  SectorType  = ENEMY_TYPES[enemyType]
+            coordinates: Coordinates = Coordinates(x=enemyX, y=enemyY)
+            enemy:       Enemy       = self._createEnemy(sectorType=sectorType, coordinates=coordinates, moveInterval=moveInterval)
+
+            enemy.power             = power
+            enemy.firingInterval    = firingInterval
+            enemy.lastTimeCheck     = lastTimeCheck
+            enemy.timeSinceMovement = timeSinceMovement
+
+            placedPieces.append((sectorType, enemy))
+
+        quadrant.restoreContents(placedPieces=placedPieces)
+
+    def _createEnemy(self, sectorType: SectorType, coordinates: Coordinates, moveInterval: int) -> Enemy:
+
+        match sectorType:
+            case SectorType.KLINGON:
+                return cast(Enemy, Klingon(coordinates=coordinates, moveInterval=moveInterval))
+            case SectorType.COMMANDER:
+                return cast(Enemy, Commander(coordinates=coordinates, moveInterval=moveInterval))
+            case _:
+                return cast(Enemy, SuperCommander(coordinates=coordinates, moveInterval=moveInterval))
+
+    def _quadrantFlags(self, quadrant: Quadrant) -> int:
+
+        flags: int = QUADRANT_CREATED
+        if quadrant.hasStarBase is True:
+            flags |= QUADRANT_STARBASE
+        if quadrant.hasPlanet is True:
+            flags |= QUADRANT_PLANET
+        if quadrant.hasSuperNova is True:
+            flags |= QUADRANT_SUPER_NOVA
+        if quadrant.scanned is True:
+            flags |= QUADRANT_SCANNED
+        if quadrant.materialized is True:
+            flags |= QUADRANT_MATERIALIZED
+
+        return flags
+
+    def _packCoordinates(self, coordinates: Coordinates) -> Tuple[int, int]:
+
+        if coordinates is None:
+            return NO_COORDINATE, NO_COORDINATE
+
+        return coordinates.x, coordinates.y
+
+    def _unpackCoordinates(self, x: int, y: int) -> Coordinates:
+
+        if x == NO_COORDINATE:
+            return cast(Coordinates, None)
+
+        return Coordinates(x=x, y=y)
+
+    def _checkIndex(self, index: int, choices: Sized, name: str):
+        """
+        Raises: InvalidSnapshotException if the index is not one of the choices
+        """
+        if not 0 <= index < len(choices):
+            raise InvalidSnapshotException(message=f'Bad {name}: {index}')
+
+    def _checkQuadrantCoordinates(self, x: int, y: int):
+        """
+        Raises: InvalidSnapshotException if the coordinates are set but not in the galaxy
+        """
+        if x != NO_COORDINATE and Coordinates(x=x, y=y).valid(columns=self._galaxy.columns, rows=self._galaxy.rows) is False:
+            raise InvalidSnapshotException(message=f'Bad quadrant coordinates: ({x},{y})')
+
+    def _checkSectorCoordinates(self, x: int, y: int, required: bool = False):
+        """
+        Raises: InvalidSnapshotException if the coordinates are not in a quadrant;  Or are not set but `required`
+        """
+        if x == NO_COORDINATE and required is False:
+            return
+        if Coordinates(x=x, y=y).valid() is False:
+            raise InvalidSnapshotException(message=f'Bad sector coordinates: ({x},{y})')
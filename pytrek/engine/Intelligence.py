@@ -1,5 +1,8 @@
 
+from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import NewType
 
 from logging import Logger
 from logging import getLogger
@@ -7,17 +10,20 @@ from logging import DEBUG
 
 from collections import namedtuple
 
-from random import randint
-from random import randrange
-from random import random
-from random import choice
+from contextlib import contextmanager
+
+from random import Random
+from random import SystemRandom
 
 from math import log
 
+from numpy import float64
+from numpy.random import Generator
+from numpy.random import default_rng
+from numpy.typing import NDArray
+
 from codeallybasic.SingletonV3 import SingletonV3
 
-from pytrek.Constants import GALAXY_COLUMNS
-from pytrek.Constants import GALAXY_ROWS
 from pytrek.Constants import MINIMUM_SAFE_WARP_FACTOR
 from pytrek.Constants import QUADRANT_COLUMNS
 from pytrek.Constants import QUADRANT_ROWS
@@ -26,6 +32,7 @@ from pytrek.engine.Direction import Direction
 from pytrek.engine.GameType import GameType
 from pytrek.engine.LRScanCoordinates import LRScanCoordinates
 from pytrek.engine.PlayerType import PlayerType
+from pytrek.engine.RandomStream import RandomStream
 from pytrek.engine.devices.DeviceStatus import DeviceStatus
 from pytrek.engine.devices.DeviceType import DeviceType
 from pytrek.engine.devices.DeviceManager import DeviceManager
@@ -40,12 +47,21 @@ from pytrek.settings.TorpedoSpeeds import TorpedoSpeeds
 
 TractorBeamComputation = namedtuple('TractorBeamComputation', 'warpFactor, distance, wSquared')
 
+RandomStreams = NewType('RandomStreams', Dict[RandomStream, Random])
+ArrayStreams  = NewType('ArrayStreams',  Dict[RandomStream, Generator])
+RandomArray   = NDArray[float64]
+
 
 class Intelligence(metaclass=SingletonV3):
     """
     This is a smart piece of code;  It is essentially the game 'computer';  Keeps me
     from repeating computation code from all over the code;  Also contains Python versions
     of some the original 'C' code's built-in math functions
+
+    All the game's randomness comes from here.  Each subsystem (see RandomStream) has its own
+    generator;  They are all derived from a single game seed.  So, a game replayed with the
+    same seed and the same player input is identical.  Each subsystem also has a NumPy
+    generator for the batch computations that want many random numbers at once
     """
     ADJACENT_DIRECTIONS: List[Direction] = [
         Direction.North, Direction.NorthEast, Direction.East
@@ -58,6 +74,50 @@ class Intelligence(metaclass=SingletonV3):
         self._gameSettings: GameSettings  = GameSettings()
         self._devices:      DeviceManager = DeviceManager()
 
+        self._galaxyRows:    int = self._gameSettings.galaxyRows
+        self._galaxyColumns: int = self._gameSettings.galaxyColumns
+
+        self._seed:         int           = 0
+        self._streams:      RandomStreams = RandomStreams({})
+        self._arrayStreams: ArrayStreams  = ArrayStreams({})
+
+        gameSeed: int = self._gameSettings.gameSeed
+        if gameSeed == 0:
+            gameSeed = SystemRandom().getrandbits(32)
+        self.reseed(seed=gameSeed)
+
+    @property
+    def seed(self) -> int:
+        """
+        Returns:  The seed all the random streams are derived from
+        """
+        return self._seed
+
+    def reseed(self, seed: int):
+        """
+        Start all the random streams over
+
+        Args:
+            seed:  The game seed
+        """
+        self._seed = seed
+        self._seedStreams(seed=seed)
+
+        self.logger.info(f'Game seed: {seed}')
+
+    def resumeStreams(self, seed: int, gameClock: float):
+        """
+        Restart the random streams of a restored game.  Saving each stream's position would
+        make a saved game several times bigger;  So the streams restart from the game seed and
+        the time the game was saved.  Every restore of a saved game then plays out the same
+
+        Args:
+            seed:       The game seed
+            gameClock:  When the game was saved
+        """
+        self._seed = seed
+        self._seedStreams(seed=hash((seed, gameClock)))
+
     def getTorpedoSpeeds(self, playerType: PlayerType) -> TorpedoSpeeds:
         """
         Get the TorpedoSpeeds based on the player type
@@ -83,24 +143,63 @@ class Intelligence(metaclass=SingletonV3):
 
         return retSpeed
 
-    def generateSectorCoordinates(self) -> Coordinates:
+    def generateSectorCoordinates(self, stream: RandomStream = RandomStream.Galaxy) -> Coordinates:
         """
         Generate a random set of sector coordinates
+
+        Args:
+            stream:  The random stream to draw from
         """
-        x = randrange(QUADRANT_COLUMNS)
-        y = randrange(QUADRANT_ROWS)
+        generator: Random = self._streams[stream]
+
+        x = generator.randrange(QUADRANT_COLUMNS)
+        y = generator.randrange(QUADRANT_ROWS)
 
         return Coordinates(x=x, y=y)
 
-    def generateQuadrantCoordinates(self) -> Coordinates:
+    def generateQuadrantCoordinates(self, stream: RandomStream = RandomStream.Galaxy) -> Coordinates:
         """
         Generate a random set of quadrant coordinates
+
+        Args:
+            stream:  The random stream to draw from
         """
-        x = randrange(GALAXY_COLUMNS)
-        y = randrange(GALAXY_ROWS)
+        generator: Random = self._streams[stream]
+
+        x = generator.randrange(self._galaxyColumns)
+        y = generator.randrange(self._galaxyRows)
 
         return Coordinates(x, y)
 
+    def generateSeed(self) -> int:
+        """
+        Generate a seed for a repeatable sub-sequence of random numbers;  For
+        example, the contents of a quadrant
+
+        Returns:  A 32 bit seed
+        """
+        return self._streams[RandomStream.Galaxy].getrandbits(32)
+
+    @contextmanager
+    def seededRandomness(self, seed: int) -> Iterator[None]:
+        """
+        Temporarily replace the random streams with ones derived from `seed`.  The game's own
+        streams are put back on exit;  So code run in this context does not change what the
+        rest of the game generates
+
+        Args:
+            seed:  The seed for the code run in this context
+        """
+        savedStreams:      RandomStreams = self._streams
+        savedArrayStreams: ArrayStreams  = self._arrayStreams
+
+        self._seedStreams(seed=seed)
+        try:
+            yield
+        finally:
+            self._streams      = savedStreams
+            self._arrayStreams = savedArrayStreams
+
     def generateInitialGameTime(self) -> float:
         """"""
         if self.logger.level == DEBUG:
@@ -147,7 +246,7 @@ class Intelligence(metaclass=SingletonV3):
         skill:   int   = playerType.value
         remTime: float = 7.0 * gameType.value
 
-        remainingKlingons: float = 2.0 * remTime * (skill + 1 - rFactor * self.rand()) * skill * 0.1 + mOffset
+        remainingKlingons: float = 2.0 * remTime * (skill + 1 - rFactor * self.rand(RandomStream.Galaxy)) * skill * 0.1 + mOffset
 
         remainingKlingons = round(remainingKlingons)
 
@@ -168,7 +267,7 @@ class Intelligence(metaclass=SingletonV3):
 
         Returns:  Klingon Commander Count
         """
-        commanderCount = playerType.value * 0.0625 * generatedKlingons * self.rand()
+        commanderCount = playerType.value * 0.0625 * generatedKlingons * self.rand(RandomStream.Galaxy)
         commanderCount = round(commanderCount)
 
         if commanderCount == 0:
@@ -184,7 +283,7 @@ class Intelligence(metaclass=SingletonV3):
         Returns:  A start star date
         """
 
-        starDate: int = int(100.0 * (31.0 * random()) * 20.0)
+        starDate: int = int(100.0 * (31.0 * self.randomFloat(RandomStream.Galaxy)) * 20.0)
         return starDate
 
     def generateInitialStarBaseCount(self) -> int:
@@ -202,7 +301,7 @@ class Intelligence(metaclass=SingletonV3):
         multiplier: float = self._gameSettings.starBaseMultiplier
         extender:   float = self._gameSettings.starBaseExtender
         # double rb = (3.0 * ourGPRandomGenerator.nextDouble()) + 2.0;
-        nextDouble = random()
+        nextDouble = self.randomFloat(RandomStream.Galaxy)
         self.logger.debug("nextDouble: %s", str(nextDouble))
 
         retBaseCount: float = (multiplier * nextDouble) + extender
@@ -229,7 +328,7 @@ class Intelligence(metaclass=SingletonV3):
         for direction in Direction:
             self.logger.debug(f'{direction}')
             newCoordinates: Coordinates = centerCoordinates.newCoordinates(direction)
-            if newCoordinates.valid() is True:
+            if newCoordinates.valid(columns=self._galaxyColumns, rows=self._galaxyRows) is True:
 
                 lrScanCoordinates: LRScanCoordinates = LRScanCoordinates()
                 lrScanCoordinates.coordinates = newCoordinates
@@ -248,7 +347,7 @@ class Intelligence(metaclass=SingletonV3):
         Returns:
 
         """
-        kPower: float = (self.rand() * 150.0) + 300.0 + (25.0 * self._gameSettings.playerType.value)
+        kPower: float = (self.rand(RandomStream.Galaxy) * 150.0) + 300.0 + (25.0 * self._gameSettings.playerType.value)
         return kPower
 
     # noinspection SpellCheckingInspection
@@ -261,7 +360,7 @@ class Intelligence(metaclass=SingletonV3):
         Returns:
 
         """
-        cPower: float = 950.0 + (400.0 * self.rand()) + (50.0 * playerType.value)
+        cPower: float = 950.0 + (400.0 * self.rand(RandomStream.Galaxy)) + (50.0 * playerType.value)
         return cPower
 
     # noinspection SpellCheckingInspection
@@ -273,7 +372,7 @@ class Intelligence(metaclass=SingletonV3):
 
         Returns:
         """
-        scPower: float = 1175.0 + (400.0 * self.rand()) + (50.0 * playerType.value)
+        scPower: float = 1175.0 + (400.0 * self.rand(RandomStream.Galaxy)) + (50.0 * playerType.value)
         return scPower
 
     def computeKlingonFiringInterval(self) -> int:
@@ -286,37 +385,37 @@ class Intelligence(metaclass=SingletonV3):
         minFiringInterval: int = self._gameSettings.minKlingonFiringInterval
         maxFiringInterval: int = self._gameSettings.maxKlingonFiringInterval
 
-        return randint(minFiringInterval, maxFiringInterval)
+        return self._streams[RandomStream.Movement].randint(minFiringInterval, maxFiringInterval)
 
     def computeCommanderFiringInterval(self) -> int:
         minFiringInterval: int = self._gameSettings.minCommanderFiringInterval
         maxFiringInterval: int = self._gameSettings.maxCommanderFiringInterval
 
-        return randint(minFiringInterval, maxFiringInterval)
+        return self._streams[RandomStream.Movement].randint(minFiringInterval, maxFiringInterval)
 
     def computeSuperCommanderFiringInterval(self) -> int:
         minFiringInterval: int = self._gameSettings.minSuperCommanderFiringInterval
         maxFiringInterval: int = self._gameSettings.maxSuperCommanderFiringInterval
 
-        return randint(minFiringInterval, maxFiringInterval)
+        return self._streams[RandomStream.Movement].randint(minFiringInterval, maxFiringInterval)
 
     def computeSuperCommanderMoveInterval(self) -> int:
         minMoveInterval: int = self._gameSettings.minSuperCommanderMoveInterval
         maxMoveInterval: int = self._gameSettings.maxSuperCommanderMoveInterval
 
-        return randint(minMoveInterval, maxMoveInterval)
+        return self._streams[RandomStream.Movement].randint(minMoveInterval, maxMoveInterval)
 
     def computeCommanderMoveInterval(self) -> int:
         minMoveInterval: int = self._gameSettings.minCommanderMoveInterval
         maxMoveInterval: int = self._gameSettings.maxCommanderMoveInterval
 
-        return randint(minMoveInterval, maxMoveInterval)
+        return self._streams[RandomStream.Movement].randint(minMoveInterval, maxMoveInterval)
 
     def computeKlingonMoveInterval(self) -> int:
         minMoveInterval: int = self._gameSettings.minKlingonMoveInterval
         maxMoveInterval: int = self._gameSettings.maxKlingonMoveInterval
 
-        return randint(minMoveInterval, maxMoveInterval)
+        return self._streams[RandomStream.Movement].randint(minMoveInterval, maxMoveInterval)
 
     def generateInitialPlanetCount(self) -> int:
         # noinspection SpellCheckingInspection
@@ -329,7 +428,7 @@ class Intelligence(metaclass=SingletonV3):
         """
         maxPlanets:  int = self._gameSettings.maximumPlanets
 
-        rb: float = (maxPlanets/2) + (maxPlanets/2 + 1) * self.randomFloat()
+        rb: float = (maxPlanets/2) + (maxPlanets/2 + 1) * self.randomFloat(RandomStream.Galaxy)
 
         planetCount: int = round(rb)
         if planetCount >= maxPlanets:
@@ -340,16 +439,16 @@ class Intelligence(metaclass=SingletonV3):
 
         planetTypeList = [name for name in dir(PlanetType) if not name.startswith('_')]
 
-        planetName: str = choice(planetTypeList)
+        planetName: str = self._streams[RandomStream.Galaxy].choice(planetTypeList)
 
         return PlanetType(planetName)
 
     def computeBaseAttackInterval(self, remainingGameTime: float) -> float:
-        interval: float = self.exponentialRandom(0.3 * remainingGameTime)
+        interval: float = self.exponentialRandom(0.3 * remainingGameTime, RandomStream.Events)
         return interval
 
     def computeBaseDestroyedInterval(self) -> float:
-        interval: float = 1.0 + 3.0 * self.rand()
+        interval: float = 1.0 + 3.0 * self.rand(RandomStream.Events)
         return interval
 
     # noinspection SpellCheckingInspection
@@ -370,7 +469,7 @@ class Intelligence(metaclass=SingletonV3):
 
         Returns:  The namedtuple TractorBeamComputation
         """
-        warpFactor: float = 6.0 + 2.0 * self.rand()
+        warpFactor: float = 6.0 + 2.0 * self.rand(RandomStream.Events)
         wSquared: float = warpFactor * warpFactor
         power: float = 0.75 * energy
         if self._devices.getDevice(DeviceType.Shields).deviceStatus == DeviceStatus.Up:
@@ -378,7 +477,7 @@ class Intelligence(metaclass=SingletonV3):
         else:
             shieldFactor = 0
         distance: float = power / wSquared * warpFactor * (shieldFactor + 1)
-        requiredDistance: float = 1.4142 * self.rand()
+        requiredDistance: float = 1.4142 * self.rand(RandomStream.Events)
         if requiredDistance < distance:
             distance = requiredDistance
 
@@ -407,27 +506,54 @@ class Intelligence(metaclass=SingletonV3):
 
         return damagedEngine
 
-    def rand(self) -> float:
+    def randomDirection(self, stream: RandomStream = RandomStream.Movement) -> Direction:
+        """
+        Args:
+            stream:  The random stream to draw from
+
+        Returns:  A random direction
+        """
+        return self._streams[stream].choice(list(Direction))
+
+    def rand(self, stream: RandomStream = RandomStream.Combat) -> float:
         """
 
         double Rand(void) {
             return rand()/(1.0 + (double)RAND_MAX);
         }
 
+        Args:
+            stream:  The random stream to draw from
+
         Returns: Random float in range 0.0 - 0.99999
 
         """
-        ans: float = random()
+        ans: float = self._streams[stream].random()
 
         return ans
 
-    def randomFloat(self) -> float:
+    def randomArray(self, count: int, stream: RandomStream = RandomStream.Combat) -> RandomArray:
         """
+        The batch version of `rand`
+
+        Args:
+            count:   How many random numbers
+            stream:  The random stream to draw from
+
+        Returns:  `count` random floats in the range 0.0 - 0.99999
+        """
+        return self._arrayStreams[stream].random(count)
+
+    def randomFloat(self, stream: RandomStream = RandomStream.Combat) -> float:
+        """
+
+        Args:
+            stream:  The random stream to draw from
 
         Returns:  0.0 .. 0.9999
 
         """
-        weeNumber: float = random()
+        weeNumber: float = self._streams[stream].random()
         return weeNumber
 
     def square(self, num: float):
@@ -443,7 +569,7 @@ class Intelligence(metaclass=SingletonV3):
         """
         return num * num
 
-    def exponentialRandom(self, average: float) -> float:
+    def exponentialRandom(self, average: float, stream: RandomStream = RandomStream.Events) -> float:
         # noinspection SpellCheckingInspection
         """
 
@@ -452,6 +578,20 @@ class Intelligence(metaclass=SingletonV3):
             return -avrage * log(1e-7 + Rand());
         }
 
+        Args:
+            average:  The average of the distribution
+            stream:   The random stream to draw from
+
         Returns:
         """
-        return -average * log(1e-7 + self.rand())
+        return -average * log(1e-7 + self.rand(stream))
+
+    def _seedStreams(self, seed: int):
+        """
+        Each stream's seed is drawn from a generator seeded with `seed`;  So the streams
+        are independent of each other but all follow from the one seed
+        """
+        seeder: Random = Random(seed)
+
+        self._streams      = RandomStreams({stream: Random(seeder.getrandbits(64)) for stream in RandomStream})
+        self._arrayStreams = ArrayStreams({stream: default_rng(seeder.getrandbits(64)) for stream in RandomStream})
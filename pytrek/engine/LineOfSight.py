@@ -0,0 +1,130 @@
+
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import NewType
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from collections import namedtuple
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+from pytrek.Constants import QUADRANT_COLUMNS
+
+from pytrek.model.Coordinates import Coordinates
+from pytrek.model.Quadrant import Quadrant
+from pytrek.model.SectorType import SectorType
+
+LineOfSightResponse = namedtuple('LineOfSightResponse', 'answer, obstacle')
+
+ObstacleTypes = FrozenSet[SectorType]
+
+MOVEMENT_OBSTACLES:           ObstacleTypes = frozenset([SectorType.PLANET, SectorType.KLINGON, SectorType.COMMANDER])
+ENTERPRISE_TORPEDO_OBSTACLES: ObstacleTypes = frozenset([SectorType.PLANET, SectorType.STARBASE])
+ENEMY_TORPEDO_OBSTACLES:      ObstacleTypes = frozenset([SectorType.PLANET, SectorType.STARBASE, SectorType.KLINGON])
+
+
+class Ray:
+    """
+    The sectors a straight line crosses on its way from one sector to another
+    """
+    __slots__ = ('mask', 'sectorBits')
+
+    def __init__(self, mask: int, sectorBits: List[int]):
+        """
+
+        Args:
+            mask:        A bit mask of the crossed sectors
+            sectorBits:  The crossed sectors in the order the line reaches them
+        """
+        self.mask:       int       = mask
+        self.sectorBits: List[int] = sectorBits
+
+
+Rays = NewType('Rays', Dict[Tuple[int, int, int, int], Ray])
+
+
+class LineOfSight(metaclass=SingletonV3):
+    """
+    Answers line of sight questions on the quadrant's sector grid.  A line is traced from
+    sector to sector (Bresenham) and is blocked by the first sector that holds an obstacle.
+
+    The sectors a line crosses never change, so the rays are computed once and kept.  The
+    obstacle masks come from the quadrant, which caches them until a sector changes.  A query
+    is then a single mask intersection
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._rays: Rays = Rays({})
+
+    def hasLineOfSight(self, quadrant: Quadrant, startSector: Coordinates, endSector: Coordinates, obstacleTypes: ObstacleTypes) -> LineOfSightResponse:
+        """
+        The starting sector never blocks;  The ending sector does
+
+        Args:
+            quadrant:       The quadrant to look across
+            startSector:    Where we are looking from
+            endSector:      Where we are looking to
+            obstacleTypes:  The sector types that block the line
+
+        Returns:  A LineOfSightResponse named tuple;  The obstacle is the game piece in the blocking sector
+        """
+        ray:     Ray = self._getRay(startSector.x, startSector.y, endSector.x, endSector.y)
+        blocked: int = ray.mask & quadrant.obstacleMask(obstacleTypes)
+        if blocked == 0:
+            return LineOfSightResponse(answer=True, obstacle=None)
+
+        for sectorBit in ray.sectorBits:
+            if blocked & (1 << sectorBit):
+                x: int = sectorBit % QUADRANT_COLUMNS
+                y: int = sectorBit // QUADRANT_COLUMNS
+                return LineOfSightResponse(answer=False, obstacle=quadrant.getSector(Coordinates(x=x, y=y)).sprite)
+
+        return LineOfSightResponse(answer=True, obstacle=None)     # Keep mypy happy;  Cannot get here
+
+    def _getRay(self, startX: int, startY: int, endX: int, endY: int) -> Ray:
+
+        key: Tuple[int, int, int, int] = (startX, startY, endX, endY)
+        ray: Ray                       = self._rays.get(key, None)      # type: ignore
+        if ray is None:
+            ray = self._computeRay(startX, startY, endX, endY)
+            self._rays[key] = ray
+
+        return ray
+
+    def _computeRay(self, startX: int, startY: int, endX: int, endY: int) -> Ray:
+        """
+        Bresenham's line from the start sector to the end sector
+
+        Returns:  The ray without the start sector
+        """
+        deltaX: int = abs(endX - startX)
+        deltaY: int = -abs(endY - startY)
+        stepX:  int = 1 if startX < endX else -1
+        stepY:  int = 1 if startY < endY else -1
+        error:  int = deltaX + deltaY
+
+        mask:       int       = 0
+        sectorBits: List[int] = []
+
+        x: int = startX
+        y: int = startY
+        while x != endX or y != endY:
+            doubleError: int = 2 * error
+            if doubleError >= deltaY:
+                error += deltaY
+                x     += stepX
+            if doubleError <= deltaX:
+                error += deltaX
+                y     += stepY
+
+            sectorBit: int = y * QUADRANT_COLUMNS + x
+            mask |= 1 << sectorBit
+            sectorBits.append(sectorBit)
+
+        return Ray(mask=mask, sectorBits=sectorBits)
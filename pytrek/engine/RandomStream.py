@@ -0,0 +1,14 @@
+
+from enum import Enum
+
+
+class RandomStream(Enum):
+    """
+    The independent random number sequences owned by Intelligence.  Each subsystem draws
+    from its own stream;  So, for example, an extra combat roll does not change where the
+    next enemy moves
+    """
+    Galaxy   = 'Galaxy'
+    Combat   = 'Combat'
+    Movement = 'Movement'
+    Events   = 'Events'
@@ -0,0 +1,132 @@
+
+from typing import Dict
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import fsync
+from os import replace as osReplace
+
+from pathlib import Path
+
+from shutil import copy2
+
+from threading import Condition
+from threading import Thread
+
+from atexit import register as atExitRegister
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+from pytrek.Constants import BACKUP_SUFFIX
+from pytrek.Constants import TEMPORARY_SUFFIX
+
+from pytrek.settings.GameSettings import GameSettings
+
+PendingSaves = Dict[Path, bytes]
+
+
+class SaveFileWriter(metaclass=SingletonV3):
+    """
+    Writes save files on a background thread so that saving never stalls the arcade loop.
+    Callers hand over the bytes to save;  If a file has not been written before a newer save
+    arrives only the newest is written
+
+    A file is written to a temporary file next to it, flushed to disk and then moved over
+    the old one;  So a crash leaves either the old save or the new one, never half of one.
+    The previous saves are kept as numbered backups (`<name>.bak1` is the most recent)
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._backupCount: int = GameSettings().saveBackupCount
+
+        self._condition: Condition    = Condition()
+        self._pending:   PendingSaves = {}
+        self._writing:   bool         = False
+        self._thread:    Thread       = cast(Thread, None)
+
+    def write(self, fileName: Path, saveBytes: bytes):
+        """
+        Queue a save;  Returns immediately
+
+        Args:
+            fileName:   The save file
+            saveBytes:  What to write
+        """
+        with self._condition:
+            self._pending[fileName] = saveBytes
+            if self._thread is None:
+                self._thread = Thread(target=self._writeSaves, name='SaveFileWriter', daemon=True)
+                self._thread.start()
+                atExitRegister(self.flush)
+            self._condition.notify_all()
+
+    def flush(self, timeout: float = cast(float, None)) -> bool:
+        """
+        Wait for the queued saves to be written
+
+        Args:
+            timeout:  Seconds to wait;  `None` waits until they are done
+
+        Returns:  `True` if everything was written, `False` if we timed out
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self._pending) == 0 and self._writing is False, timeout=timeout)
+
+    def backupFileName(self, fileName: Path, generation: int) -> Path:
+        """
+        Args:
+            fileName:   The save file
+            generation: 1 is the most recent backup
+
+        Returns:  The backup's file name
+        """
+        return fileName.with_name(f'{fileName.name}{BACKUP_SUFFIX}{generation}')
+
+    def _writeSaves(self):
+
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: len(self._pending) > 0)
+                fileName, saveBytes = self._pending.popitem()
+                self._writing = True
+            try:
+                self._writeAtomically(fileName=fileName, saveBytes=saveBytes)
+            except OSError as e:
+                self.logger.error(f'Unable to save {fileName}: {e}')
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _writeAtomically(self, fileName: Path, saveBytes: bytes):
+
+        temporaryFileName: Path = fileName.with_name(f'{fileName.name}{TEMPORARY_SUFFIX}')
+        with temporaryFileName.open(mode='wb') as fd:
+            fd.write(saveBytes)
+            fd.flush()
+            fsync(fd.fileno())
+
+        if fileName.exists() is True:
+            self._rotateBackups(fileName=fileName)
+
+        osReplace(temporaryFileName, fileName)
+        self.logger.debug(f'Saved {len(saveBytes)} bytes to {fileName}')
+
+    def _rotateBackups(self, fileName: Path):
+        """
+        The save file is copied rather than moved to the first backup;  So there is always
+        a save file
+        """
+        if self._backupCount < 1:
+            return
+
+        for generation in range(self._backupCount - 1, 0, -1):
+            olderBackup: Path = self.backupFileName(fileName, generation)
+            if olderBackup.exists() is True:
+                osReplace(olderBackup, self.backupFileName(fileName, generation + 1))
+
+        copy2(fileName, self.backupFileName(fileName, 1))
@@ -1,10 +1,13 @@
 
+from typing import cast
+
 from logging import Logger
 from logging import getLogger
 
 from pytrek.GameState import GameState
 
 from pytrek.engine.Intelligence import Intelligence
+from pytrek.engine.RandomStream import RandomStream
 from pytrek.engine.futures.FutureEvent import EventCallback
 
 from pytrek.engine.futures.FutureEvent import FutureEvent
@@ -19,7 +22,7 @@ from pytrek.model.Galaxy import Galaxy
 
 class EventCreator:
 
-    def __init__(self, messageConsole: MessageConsoleProxy):
+    def __init__(self, messageConsole: MessageConsoleProxy, headless: bool = False):
 
         self.logger: Logger = getLogger(__name__)
 
@@ -27,7 +30,28 @@ class EventCreator:
         self._gameState:    GameState    = GameState()
         self._galaxy:       Galaxy       = Galaxy()
 
-        self._futureEventHandlers: FutureEventHandlers = FutureEventHandlers(messageConsole)
+        self._futureEventHandlers: FutureEventHandlers = FutureEventHandlers(messageConsole, headless=headless)
+
+    def eventCallback(self, eventType: FutureEventType) -> EventCallback:
+        """
+        Restored events need their handlers back
+
+        Args:
+            eventType:  The event type
+
+        Returns:  The handler for the event type;  `None` if the type has none
+        """
+        match eventType:
+            case FutureEventType.SUPER_NOVA:
+                return EventCallback(self._futureEventHandlers.superNovaEventHandler)
+            case FutureEventType.COMMANDER_ATTACKS_BASE:
+                return EventCallback(self._futureEventHandlers.commanderAttacksBaseEventHandler)
+            case FutureEventType.COMMANDER_DESTROYS_BASE:
+                return EventCallback(self._futureEventHandlers.commanderDestroysBaseEventHandler)
+            case FutureEventType.TRACTOR_BEAM:
+                return EventCallback(self._futureEventHandlers.tractorBeamEventHandler)
+            case _:
+                return cast(EventCallback, None)
 
     def createSuperNovaEvent(self) -> FutureEvent:
         # noinspection SpellCheckingInspection
@@ -37,9 +61,9 @@ class EventCreator:
         ```
         """
 
-        elapsedStarDates:    float       = self._intelligence.exponentialRandom(0.5 * self._gameState.remainingGameTime)
+        elapsedStarDates:    float       = self._intelligence.exponentialRandom(0.5 * self._remainingGameTime())
         eventStarDate:       float       = self._gameState.starDate + elapsedStarDates
-        quadrantCoordinates: Coordinates = self._intelligence.generateQuadrantCoordinates()
+        quadrantCoordinates: Coordinates = self._intelligence.generateQuadrantCoordinates(RandomStream.Events)
 
         futureEvent: FutureEvent = FutureEvent(type=FutureEventType.SUPER_NOVA, starDate=eventStarDate, quadrantCoordinates=quadrantCoordinates)
         futureEvent.callback = EventCallback(self._futureEventHandlers.superNovaEventHandler)
@@ -53,7 +77,7 @@ class EventCreator:
         ```
         """
         self.logger.info(f'{self._gameState.remainingGameTime=}')
-        elapsedStarDates: float       = self._intelligence.exponentialRandom(0.3 * self._gameState.remainingGameTime)
+        elapsedStarDates: float       = self._intelligence.exponentialRandom(0.3 * self._remainingGameTime())
         eventStarDate:    float       = self._gameState.starDate + elapsedStarDates
         coordinates:      Coordinates = self._galaxy.getStarBaseCoordinates()
 
@@ -77,7 +101,7 @@ class EventCreator:
         schedule(FTBEAM, tk.expran(1.5 * (game.intime / game.state.remcom)));
         ```
         """
-        inTime:              float       = self._gameState.remainingGameTime
+        inTime:              float       = self._remainingGameTime()
         remainingCommanders: int         = self._gameState.remainingCommanders
 
         if remainingCommanders == 0:
@@ -93,3 +117,12 @@ class EventCreator:
             futureEvent.callback = EventCallback(self._futureEventHandlers.tractorBeamEventHandler)
 
         return futureEvent
+
+    def _remainingGameTime(self) -> float:
+        """
+        A jump past the end of the game makes the remaining time negative;  Recurring events
+        are never scheduled into the past
+
+        Returns:  The remaining game time but never less than zero
+        """
+        return max(0.0, self._gameState.remainingGameTime)
@@ -1,21 +1,28 @@
 
 from typing import cast
 from typing import Dict
+from typing import List
 from typing import NewType
+from typing import Tuple
 
 from logging import getLogger
 from logging import Logger
+from logging import DEBUG
+
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
 
 from arcade import schedule as arcadeSchedule
 
 from codeallybasic.SingletonV3 import SingletonV3
 
+from pytrek.engine.GameEngine import GameEngine
 from pytrek.engine.Intelligence import Intelligence
 
 from pytrek.engine.devices.DeviceManager import DeviceManager
 
 from pytrek.engine.futures.EventCreator import EventCreator
-from pytrek.engine.futures.FutureEvent import EventCallback
 from pytrek.engine.futures.FutureEvent import FutureEvent
 from pytrek.engine.futures.FutureEventType import FutureEventType
 
@@ -27,13 +34,25 @@ from pytrek.model.Coordinates import Coordinates
 
 from pytrek.settings.GameSettings import GameSettings
 
-EventMap = NewType('EventMap', Dict[FutureEventType, FutureEvent])
+EventToken     = NewType('EventToken',     int)
+TimelineEntry  = Tuple[float, EventToken, FutureEvent]
+Timeline       = NewType('Timeline',       List[TimelineEntry])
+PendingEvents  = NewType('PendingEvents',  Dict[EventToken, FutureEvent])
+SchedulableMap = NewType('SchedulableMap', Dict[FutureEventType, bool])
 
 
 class EventEngine(metaclass=SingletonV3):
     """
-    This event engine is tied to the arcade schedule and unschedule methods
+    This event engine is tied to the arcade schedule and unschedule methods;  When
+    created in headless mode the owner is responsible for periodically calling `checkEvents`
+
+    Pending events live on a timeline ordered by star date (a min heap).  There may be any
+    number of pending events of a type.  Scheduling returns a token that cancels the event.
+    The engine registers with the GameEngine so that star date jumps fast forward through the
+    events they pass
     """
+    NO_EVENT:             EventToken = EventToken(0)
+    COMPACTION_THRESHOLD: int        = 64
 
     NONZERO_OPERATION_TIME_THRESHOLD: float = 0.0001
     EVENT_CHECK_INTERVAL:             float = 5.0
@@ -42,11 +61,12 @@ class EventEngine(metaclass=SingletonV3):
     a check for events. It exists so the check for zero does not have to be exact.
     
     """
-    def __init__(self, *args):
+    def __init__(self, *args, **kwargs):
         """
 
         Args:
             *args:  Arg 0 is the message console
+            **kwargs:  `headless` if `True` do not hook into the arcade scheduler
 
         Returns:
         """
@@ -57,54 +77,158 @@ class EventEngine(metaclass=SingletonV3):
         self._gameState:    GameState     = GameState()
         self._gameSettings: GameSettings  = GameSettings()
         self._devices:      DeviceManager = DeviceManager()
+        self._gameEngine:   GameEngine    = GameEngine()
 
-        self._eventMap:     EventMap = cast(EventMap, None)
-        self._setupEventMap()
+        self._schedulable: SchedulableMap = SchedulableMap({eventType: True for eventType in FutureEventType if eventType != FutureEventType.SPY})
+        self._timeline:    Timeline       = Timeline([])
+        self._pending:     PendingEvents  = PendingEvents({})
+        self._lastToken:   int            = 0
 
         self._messageConsole: MessageConsoleProxy = args[0]
-        self._eventCreator:   EventCreator        = EventCreator(self._messageConsole)
+        self._headless:       bool                = kwargs.get('headless', False)
+        self._eventCreator:   EventCreator        = EventCreator(self._messageConsole, headless=self._headless)
 
-        self.logger.debug(f"{self._gameState.remainingGameTime=} eventMap: {self.__repr__()}")
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f"{self._gameState.remainingGameTime=} eventMap: {self.__repr__()}")
 
         # TODO Put in debug option that allows selectively scheduling these
         self._scheduleRecurringEvents(eventType=FutureEventType.COMMANDER_ATTACKS_BASE)
         self._scheduleRecurringEvents(eventType=FutureEventType.TRACTOR_BEAM)
         self._scheduleRecurringEvents(eventType=FutureEventType.SUPER_NOVA)
 
-        # I do not know what a Number is; Tell mypy so
-        arcadeSchedule(function_pointer=self._doEventChecking, interval=EventEngine.EVENT_CHECK_INTERVAL)  # type: ignore
+        self._gameEngine.eventEngine = self
+
+        if self._headless is False:
+            # I do not know what a Number is; Tell mypy so
+            arcadeSchedule(function_pointer=self._doEventChecking, interval=EventEngine.EVENT_CHECK_INTERVAL)  # type: ignore
+
+    @property
+    def headless(self) -> bool:
+        return self._headless
 
     def getEvent(self, eventType: FutureEventType) -> FutureEvent:
-        return self._eventMap[eventType]
+        """
+        Args:
+            eventType:  The event type to look up
+
+        Returns:  The earliest pending event of this type;  If none is pending an unscheduled
+        event that reports whether the type can still be scheduled
+        """
+        nextEvent: FutureEvent = cast(FutureEvent, None)
+        for futureEvent in self._pending.values():
+            if futureEvent.type == eventType and (nextEvent is None or futureEvent.starDate < nextEvent.starDate):
+                nextEvent = futureEvent
 
-    def scheduleEvent(self, futureEvent: FutureEvent):
+        if nextEvent is None:
+            nextEvent = FutureEvent(type=eventType, schedulable=self._schedulable[eventType])
 
-        eventType: FutureEventType = futureEvent.type
+        return nextEvent
+
+    def pendingEvents(self, eventType: FutureEventType) -> List[FutureEvent]:
+        """
+        Args:
+            eventType:  The event type to look up
+
+        Returns:  All the pending events of this type in star date order
+        """
+        return sorted((futureEvent for futureEvent in self._pending.values() if futureEvent.type == eventType), key=lambda futureEvent: futureEvent.starDate)
+
+    def scheduleEvent(self, futureEvent: FutureEvent) -> EventToken:
+        """
+        Add an event to the timeline.  Other pending events of the same type are left alone
+
+        Args:
+            futureEvent:  The event to schedule
+
+        Returns:  A token that cancels this event;  `NO_EVENT` if the event cannot be scheduled
+        """
+        if self._isSchedulable(futureEvent.type) is False:
+            return EventEngine.NO_EVENT
 
         futureEvent = self._debugTurnOffEvent(futureEvent=futureEvent)
-        self._eventMap[eventType] = futureEvent
+        if futureEvent.schedulable is False:
+            self.makeUnSchedulable(futureEvent.type)
+            return EventEngine.NO_EVENT
 
-    def unScheduleEvent(self, eventType: FutureEventType):
-        #
-        # Is it already unscheduled?
-        #
-        futureEvent: FutureEvent = self._eventMap[eventType]
-        if futureEvent.schedulable is True:
+        self._lastToken += 1
+        token: EventToken = EventToken(self._lastToken)
 
-            futureEvent.type                = eventType
-            futureEvent.quadrantCoordinates = cast(Coordinates, None)
-            futureEvent.starDate            = 0
-            futureEvent.callback            = cast(EventCallback, None)
+        self._pending[token] = futureEvent
+        heappush(self._timeline, (futureEvent.starDate, token, futureEvent))
 
-            self._eventMap[eventType] = futureEvent
+        return token
 
-    def makeUnSchedulable(self, eventType: FutureEventType):
+    def allPendingEvents(self) -> List[FutureEvent]:
+        """
+        Returns:  Every pending event in the order they will fire
+        """
+        return [futureEvent for starDate, token, futureEvent in sorted(self._timeline) if token in self._pending]
+
+    def isSchedulable(self, eventType: FutureEventType) -> bool:
+        return self._isSchedulable(eventType)
+
+    def restoreEvents(self, schedulable: SchedulableMap, pendingEvents: List[FutureEvent]):
+        """
+        Replace the timeline with the one from a saved game.  The events get their handlers back
+
+        Args:
+            schedulable:    Which event types may still be scheduled
+            pendingEvents:  The saved pending events
+        """
+        self._schedulable = schedulable
+        self._timeline    = Timeline([])
+        self._pending     = PendingEvents({})
+
+        for futureEvent in pendingEvents:
+            futureEvent.callback = self._eventCreator.eventCallback(futureEvent.type)
+
+            self._lastToken += 1
+            token: EventToken = EventToken(self._lastToken)
+
+            self._pending[token] = futureEvent
+            self._timeline.append((futureEvent.starDate, token, futureEvent))
+
+        heapify(self._timeline)
+
+    def cancelEvent(self, token: EventToken) -> bool:
+        """
+        The cancelled event stays in the timeline until it would have fired;  It is then
+        discarded
+
+        Args:
+            token:  The token returned when the event was scheduled
 
-        futureEvent: FutureEvent = self._eventMap[eventType]
+        Returns:  `True` if the event was still pending
+        """
+        futureEvent: FutureEvent = self._pending.pop(token, cast(FutureEvent, None))
+        if futureEvent is None:
+            return False
+
+        if len(self._timeline) > EventEngine.COMPACTION_THRESHOLD and len(self._timeline) > 2 * len(self._pending):
+            self._compactTimeline()
+
+        return True
+
+    def unScheduleEvent(self, eventType: FutureEventType):
+        """
+        Cancel all the pending events of this type
 
-        futureEvent.schedulable = False
+        Args:
+            eventType:  The event type to cancel
+        """
+        tokens: List[EventToken] = [token for token, futureEvent in self._pending.items() if futureEvent.type == eventType]
+        for token in tokens:
+            self.cancelEvent(token)
 
-        self._eventMap[eventType] = futureEvent
+    def makeUnSchedulable(self, eventType: FutureEventType):
+        """
+        Cancel the pending events of this type and refuse any new ones
+
+        Args:
+            eventType:  The event type to turn off
+        """
+        self.unScheduleEvent(eventType)
+        self._schedulable[eventType] = False
 
     def debugFireEvent(self, eventType: FutureEventType):
         """
@@ -119,6 +243,34 @@ class EventEngine(metaclass=SingletonV3):
         eventToFire: FutureEvent = self.getEvent(eventType=eventType)
         self._fireEvent(eventToFire=eventToFire)
 
+    def checkEvents(self):
+        """
+        Fire any events that are due as of the current star date.  Headless drivers call
+        this instead of relying on the arcade scheduler
+        """
+        currentStarDate: float = self._gameState.starDate
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f'Event engine running - currentStarDate: {currentStarDate:0.3f}')
+        self._checkEvents(currentStarDate=currentStarDate)
+
+    def fastForward(self, elapsedTime: float) -> int:
+        """
+        Advance the star date by an arbitrary amount.  The game clock stops at each due event
+        in star date order so that the event and any rescheduled recurring event see the star
+        date the event was due.  Recurring events that come due again within the jump also fire
+
+        Args:
+            elapsedTime:  Star dates to advance
+
+        Returns:  The number of events that fired
+        """
+        targetStarDate: float = self._gameState.starDate + elapsedTime
+        firedCount:     int   = self._fireDueEvents(throughStarDate=targetStarDate, advanceClock=True)
+
+        self._gameEngine.advanceStarDate(starDate=targetStarDate)
+
+        return firedCount
+
     def _doEventChecking(self, deltaTime: float):
         """
         This is the periodic method that periodically fires
@@ -126,11 +278,10 @@ class EventEngine(metaclass=SingletonV3):
             deltaTime:
         """
 
-        self.logger.debug(f'{deltaTime:0.3f}')
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f'{deltaTime:0.3f}')
 
-        currentStarDate: float = self._gameState.starDate
-        self.logger.info(f'Event engine running - currentStarDate: {currentStarDate:0.3f}')
-        self._checkEvents(currentStarDate=currentStarDate)
+        self.checkEvents()
 
     def _checkEvents(self, currentStarDate: float):
         """
@@ -140,18 +291,40 @@ class EventEngine(metaclass=SingletonV3):
             currentStarDate:  The current star date;
 
         """
-        for fsEventType in FutureEventType:
-            if fsEventType != FutureEventType.SPY:
+        self._fireDueEvents(throughStarDate=currentStarDate, advanceClock=False)
 
-                futureEvent: FutureEvent = self._eventMap[fsEventType]
-                # Might be unscheduled
-                if futureEvent.schedulable is False:
-                    pass
-                else:
-                    eventStartDate: float = futureEvent.starDate
-                    if eventStartDate != 0 and currentStarDate >= eventStartDate:
-                        self._fireEvent(eventToFire=futureEvent)
-                        self._scheduleRecurringEvents(eventType=futureEvent.type)
+    def _fireDueEvents(self, throughStarDate: float, advanceClock: bool) -> int:
+        """
+        Fire the events that are due in star date order.  Only the due events are looked at
+
+        Args:
+            throughStarDate:  Fire the events due on or before this star date
+            advanceClock:     If `True` move the game clock to each event's star date before firing it
+
+        Returns:  The number of events that fired
+        """
+        firedCount:    int                 = 0
+        firstNewToken: int                 = self._lastToken + 1
+        deferred:      List[TimelineEntry] = []
+        while len(self._timeline) > 0 and self._timeline[0][0] <= throughStarDate:
+            entry: TimelineEntry = heappop(self._timeline)
+            starDate, token, futureEvent = entry
+            if token >= firstNewToken and starDate <= self._gameState.starDate:
+                # Scheduled by this pass for a star date already reached;  Wait for the next check
+                deferred.append(entry)
+                continue
+            # Might have been cancelled
+            if self._pending.pop(token, None) is not None:
+                if advanceClock is True:
+                    self._gameEngine.advanceStarDate(starDate=starDate)
+                self._fireEvent(eventToFire=futureEvent)
+                self._scheduleRecurringEvents(eventType=futureEvent.type)
+                firedCount += 1
+
+        for entry in deferred:
+            heappush(self._timeline, entry)
+
+        return firedCount
 
     def _fireEvent(self, eventToFire: FutureEvent):
 
@@ -177,22 +350,21 @@ class EventEngine(metaclass=SingletonV3):
                 case FutureEventType.TRACTOR_BEAM:
                     tractorBeamEvent: FutureEvent = self._eventCreator.createTractorBeamEvent()
                     self.scheduleEvent(tractorBeamEvent)
+                case FutureEventType.COMMANDER_DESTROYS_BASE:
+                    pass    # One shot event scheduled by the commander attacks base handler
                 case _:
                     self.logger.warning(f'Unhandled event: {eventType}')
 
-    def _setupEventMap(self):
-
-        eventMap: EventMap = EventMap({})
-
-        for fsEventType in FutureEventType:
-            if fsEventType != FutureEventType.SPY:
-                eventMap[fsEventType] = FutureEvent(fsEventType)
-
-        self._eventMap = eventMap
+    def _compactTimeline(self):
+        """
+        Drop the cancelled events from the timeline
+        """
+        self._timeline = Timeline([entry for entry in self._timeline if entry[1] in self._pending])
+        heapify(self._timeline)
 
     def _isSchedulable(self, eventType: FutureEventType) -> bool:
 
-        ans: bool = self._eventMap[eventType].schedulable
+        ans: bool = self._schedulable[eventType]
         return ans
 
     def _debugTurnOffEvent(self, futureEvent: FutureEvent) -> FutureEvent:
@@ -226,9 +398,10 @@ class EventEngine(metaclass=SingletonV3):
     def __repr__(self):
 
         myRep = "\n"
-        for dictKey, fsEvent in self._eventMap.items():
-            devRep = (
-                f"fsEvent: {fsEvent}\n"
-            )
-            myRep += devRep
+        for starDate, token, fsEvent in sorted(self._timeline):
+            if token in self._pending:
+                devRep = (
+                    f"fsEvent: {fsEvent}\n"
+                )
+                myRep += devRep
         return myRep
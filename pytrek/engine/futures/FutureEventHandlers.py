@@ -1,4 +1,6 @@
 
+from typing import cast
+
 from logging import Logger
 from logging import getLogger
 
@@ -12,7 +14,6 @@ from pytrek.engine.futures.FutureEvent import FutureEvent
 from pytrek.engine.futures.FutureEventType import FutureEventType
 
 from pytrek.gui.ConsoleMessageType import ConsoleMessageType
-from pytrek.gui.gamepieces.GamePieceTypes import Enemies
 
 from pytrek.gui.MessageConsoleProxy import MessageConsoleProxy
 
@@ -28,14 +29,25 @@ class FutureEventHandlers:
     """
 
     """
-    def __init__(self, messageConsole: MessageConsoleProxy):
+    def __init__(self, messageConsole: MessageConsoleProxy, headless: bool = False):
+        """
+
+        Args:
+            messageConsole: Where to report the events
+            headless:       If `True` do not create the UI mediators;  The model is updated directly
+        """
 
         self.logger:            Logger           = getLogger(__name__)
         self._gameState:        GameState        = GameState()
         self._galaxy:           Galaxy           = Galaxy()
         self._intelligence:     Intelligence     = Intelligence()
         self._galaxyMediator:   GalaxyMediator   = GalaxyMediator()
-        self._quadrantMediator: QuadrantMediator = QuadrantMediator()
+        self._headless:         bool             = headless
+
+        if headless is True:
+            self._quadrantMediator: QuadrantMediator = cast(QuadrantMediator, None)
+        else:
+            self._quadrantMediator = QuadrantMediator()
 
         self._messageConsole: MessageConsoleProxy = messageConsole
 
@@ -82,6 +94,9 @@ class FutureEventHandlers:
             # Pick a random commander
             #
             cmdrCoordinates: Coordinates = self._galaxy.getCommanderCoordinates()
+            if cmdrCoordinates is None:
+                self.logger.warning(f'Could not locate a commander to tractor beam the Enterprise')
+                return
             self._messageConsole.displayMessage(f'Enterprise yanked to quadrant: {cmdrCoordinates}', messageType=ConsoleMessageType.Warning)
             #
             # Yank the Enterprise to the commander quadrant
@@ -93,7 +108,13 @@ class FutureEventHandlers:
             self._galaxyMediator.doWarp(currentCoordinates=currentQuadrant.coordinates, destinationCoordinates=cmdrCoordinates)
 
             cmdrQuadrant: Quadrant = self._galaxy.getQuadrant(quadrantCoordinates=cmdrCoordinates)
-            self._quadrantMediator.enterQuadrant(quadrant=cmdrQuadrant, enterprise=self._gameState.enterprise)
+            if self._headless is True:
+                sectorCoordinates: Coordinates = cmdrQuadrant.getRandomEmptySector().coordinates
+
+                self._gameState.currentSectorCoordinates = sectorCoordinates
+                cmdrQuadrant.placeEnterprise(enterprise=self._gameState.enterprise, coordinates=sectorCoordinates)
+            else:
+                self._quadrantMediator.enterQuadrant(quadrant=cmdrQuadrant, enterprise=self._gameState.enterprise)
 
         else:
             from pytrek.engine.futures.EventEngine import EventEngine
@@ -131,22 +152,22 @@ class FutureEventHandlers:
             eventEngine.makeUnSchedulable(FutureEventType.COMMANDER_ATTACKS_BASE)
 
     def commanderDestroysBaseEventHandler(self, futureEvent: FutureEvent):
-        from pytrek.engine.futures.EventEngine import EventEngine
 
         self._messageConsole.displayMessage(f'Commander destroyed StarBase in {futureEvent.quadrantCoordinates}',
                                             messageType=ConsoleMessageType.Warning)
 
         quadrant: Quadrant = self._galaxy.getQuadrant(futureEvent.quadrantCoordinates)
-
-        assert quadrant.hasStarBase is True, 'Whoa!!  We do not have a quadrant'
-
         #
-        # Dispose of the starbase
+        # A super nova may have beaten the commander to it
         #
-        quadrant.hasStarBase = False
-        self._gameState.starBaseCount -= 1
-        eventEngine: EventEngine = EventEngine()
-        eventEngine.unScheduleEvent(FutureEventType.COMMANDER_DESTROYS_BASE)
+        if quadrant.hasStarBase is True:
+            #
+            # Dispose of the starbase
+            #
+            quadrant.hasStarBase = False
+            self._gameState.starBaseCount -= 1
+        else:
+            self.logger.info(f'StarBase in {futureEvent.quadrantCoordinates} already destroyed')
 
     def _decrementEnemyCount(self, quadrant: Quadrant, enemyName: str):
         """
@@ -159,23 +180,25 @@ class FutureEventHandlers:
         I normally don't like to write dynamically generated codes like this.  However,
         I could not in good conscience duplicate this code three times;  I know it is
         very 'Pythonic', but very high maintenance
+
+        Uses the quadrant's counts rather than its sprites;  The quadrant may not
+        have been materialized
         """
         gsPropertyName: str = f'remaining{enemyName}s'
-        qPropertyName:  str = f'{enemyName[0].lower()}{enemyName[1:]}s'
+        qPropertyName:  str = f'{enemyName[0].lower()}{enemyName[1:]}Count'
 
-        enemies: Enemies = getattr(quadrant, qPropertyName)
-        for enemy in enemies:
-            quadrant.decrementEnemyCount(enemy)
+        enemyCount: int = getattr(quadrant, qPropertyName)
+        if enemyCount > 0:
+            setattr(quadrant, qPropertyName, 0)
             remainingEnemyCount: int = getattr(self._gameState, gsPropertyName)
-            remainingEnemyCount -= 1
+            remainingEnemyCount -= enemyCount
             assert remainingEnemyCount >= 0, f'{enemyName=}  Logic error;  Fix it !'
             setattr(self._gameState, gsPropertyName, remainingEnemyCount)
 
-        enemyCount: int = len(enemies)
         if enemyCount > 1:
-            message: str = f'{len(enemies)} {enemyName}s destroyed'
+            message: str = f'{enemyCount} {enemyName}s destroyed'
         else:
-            message = f'{len(enemies)} {enemyName} destroyed'
+            message = f'{enemyCount} {enemyName} destroyed'
 
         if enemyCount > 0:
             self.logger.debug(f'{message}')
@@ -0,0 +1,4 @@
+
+class InvalidSnapshotException(ValueError):
+    def __init__(self, message: str = ''):
+        super().__init__(message)
@@ -0,0 +1,85 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from arcade.color import LIGHT_GREEN
+
+from pytrek.engine.FrameProfiler import FrameProfiler
+from pytrek.engine.FrameProfiler import Percentiles
+from pytrek.engine.FrameProfiler import PercentilesList
+
+from pytrek.gui.BaseSection import BaseSection
+from pytrek.gui.TextLayer import TextLayer
+from pytrek.gui.TextLayer import TextName
+
+from pytrek.settings.GameSettings import GameSettings
+
+OVERLAY_LINES:    int = 12
+OVERLAY_FONT:     int = 9
+LINE_HEIGHT:      int = 14
+OVERLAY_MARGIN_X: int = 6
+OVERLAY_MARGIN_Y: int = 16
+
+REFRESH_FRAMES: int = 30
+"""
+The overlay text is laid out again at most this often
+"""
+NAME_WIDTH: int = 44
+
+
+class FrameProfileSection(BaseSection):
+    """
+    Shows the frame profiler's rolling percentiles over the top left of the quadrant;  Turn it
+    on with the `drawFrameProfile` setting.  It needs the `profileFrames` setting to have
+    anything to show
+    """
+    def __init__(self, left: int, bottom: int, width: int, height: int):
+
+        super().__init__(left=left, bottom=bottom, width=width, height=height, accept_keyboard_events=False)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._gameSettings:  GameSettings   = GameSettings()
+        self._frameProfiler: FrameProfiler  = FrameProfiler()
+        self._textLayer:     TextLayer      = TextLayer()
+        self._lineNames:     List[TextName] = []
+        self._frameCount:    int            = 0
+
+        self._buildTextLayer()
+
+    def on_draw(self):
+
+        if self._gameSettings.drawFrameProfile is False:
+            return
+
+        if self._frameCount % REFRESH_FRAMES == 0:
+            self._updateLines()
+        self._frameCount += 1
+
+        self._textLayer.draw()
+
+    def _buildTextLayer(self):
+
+        x: int = self.left + OVERLAY_MARGIN_X
+        y: int = self.top - OVERLAY_MARGIN_Y
+
+        for lineNumber in range(OVERLAY_LINES + 1):
+            lineName: TextName = TextName(f'profileLine{lineNumber}')
+            self._textLayer.addText(name=lineName, value='', x=x, y=y - (lineNumber * LINE_HEIGHT), color=LIGHT_GREEN, fontSize=OVERLAY_FONT)
+            self._lineNames.append(lineName)
+
+        self._textLayer.setText(name=self._lineNames[0], value=f'{"ms":<{NAME_WIDTH}} {"p50":>7} {"p95":>7} {"p99":>7}')
+
+    def _updateLines(self):
+
+        percentilesList: PercentilesList = self._frameProfiler.percentiles()
+
+        for lineNumber, lineName in enumerate(self._lineNames[1:]):
+            if lineNumber < len(percentilesList):
+                percentiles: Percentiles = percentilesList[lineNumber]
+                value: str = f'{percentiles.name:<{NAME_WIDTH}} {percentiles.p50:7.2f} {percentiles.p95:7.2f} {percentiles.p99:7.2f}'
+            else:
+                value = ''
+            self._textLayer.setText(name=lineName, value=value)
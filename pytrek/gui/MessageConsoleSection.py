@@ -2,6 +2,7 @@
 from typing import List
 from typing import NewType
 from typing import Tuple
+from typing import cast
 
 from logging import Logger
 from logging import getLogger
@@ -11,7 +12,7 @@ from dataclasses import dataclass
 from arcade.color import RED
 from arcade.color import WHITE
 
-from arcade import draw_text
+from arcade import Text
 
 from pytrek.Constants import COMMAND_SECTION_HEIGHT
 from pytrek.Constants import CONSOLE_SECTION_HEIGHT
@@ -23,8 +24,9 @@ from pytrek.gui.BaseSection import BaseSection
 
 @dataclass
 class MessageLine:
-    message: str = ''
+    message:   str                  = ''
     textColor: Tuple[int, int, int] = WHITE
+    text:      Text                 = cast(Text, None)     # Laid out on first draw;  Then only moved
 
 
 MessageLines = NewType('MessageLines', List[MessageLine])
@@ -50,6 +52,7 @@ class MessageConsoleSection(BaseSection):
         super().__init__(left=left, bottom=bottom, width=width, height=height, **kwargs)
 
         self._statusLines: MessageLines = MessageLines([])
+        self._linesMoved:  bool         = False
 
     def displayMessage(self, message: str, messageType: ConsoleMessageType = ConsoleMessageType.Normal):
         """
@@ -66,16 +69,31 @@ class MessageConsoleSection(BaseSection):
             msgLine.textColor = RED
 
         self._statusLines.append(msgLine)
+        self._linesMoved = True
 
     def on_draw(self):
+        """
+        Each line keeps its arcade Text;  A new message only lays out its own glyphs and
+        moves the lines already on the console
+        """
+        if self._linesMoved is True:
+            self._placeLines()
+            self._linesMoved = False
+
+        for msg in self._statusLines:
+            msg.text.draw()
+
+        self.drawDebug()
+
+    def _placeLines(self):
 
-        # super().on_draw()
         runningY: int = MessageConsoleSection.FIRST_LINE_Y
         for msg in self._statusLines:
-            draw_text(msg.message, MessageConsoleSection.X_FIXED, runningY,
-                      color=msg.textColor,
-                      font_size=MessageConsoleSection.CONSOLE_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
+            if msg.text is None:
+                msg.text = Text(msg.message, MessageConsoleSection.X_FIXED, runningY,
+                                color=msg.textColor,
+                                font_size=MessageConsoleSection.CONSOLE_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
+            else:
+                msg.text.y = runningY
 
             runningY -= MessageConsoleSection.Y_DECREMENT
-
-        self.drawDebug()
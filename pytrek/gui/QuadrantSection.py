@@ -114,6 +114,8 @@ class QuadrantSection(BaseSection):
 
         self._gameEngine.updateRealTimeClock(deltaTime=delta_time)
 
+        self._gameState.publishChanges()
+
     def on_mouse_press(self, x: float, y: float, button: int, key_modifiers: int):
         """
         Called when the user presses a mouse button.
@@ -125,6 +127,13 @@ class QuadrantSection(BaseSection):
             if x < QUADRANT_GRID_WIDTH and y >= CONSOLE_SECTION_HEIGHT:
                 self._enterpriseMediator.doDeveloperImpulseMove(quadrant=self._quadrant, arcadePoint=arcadePoint)
 
+    def gameRestored(self):
+        """
+        A saved game replaced the galaxy;  Put the Enterprise back where it was saved
+        """
+        self._quadrant = self._galaxy.currentQuadrant
+        self._quadrantMediator.enterQuadrant(quadrant=self._quadrant, enterprise=self._enterprise, sectorCoordinates=self._gameState.currentSectorCoordinates)
+
     def _enterpriseHasWarped(self, quadrantCoordinates: Coordinates, sectorCoordinates: Coordinates):
         """
 
@@ -138,3 +147,8 @@ class QuadrantSection(BaseSection):
         self._galaxyMediator.doWarp(currentCoordinates=currentCoordinates, destinationCoordinates=quadrantCoordinates)
         self._quadrant = self._galaxy.getQuadrant(quadrantCoordinates=quadrantCoordinates)
         self._quadrantMediator.enterQuadrant(quadrant=self._quadrant, enterprise=self._enterprise, sectorCoordinates=sectorCoordinates)
+        #
+        # Now that we have arrived;  A tractor beam that came due on the way moves us again
+        #
+        self._gameEngine.fireDueEvents()
+        self._quadrant = self._galaxy.currentQuadrant
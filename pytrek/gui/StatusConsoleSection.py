@@ -1,15 +1,15 @@
 
+from typing import Dict
 from typing import Union
 from typing import List
 from typing import NewType
+from typing import Tuple
 
 from logging import Logger
 from logging import getLogger
 
 from enum import Enum
 
-
-from arcade import draw_text
 from arcade.color import BLUE
 from arcade.color import GREEN
 from arcade.color import RED
@@ -19,10 +19,10 @@ from arcade.color import YELLOW
 
 from pytrek.Constants import COMMAND_SECTION_HEIGHT
 from pytrek.Constants import CONSOLE_SECTION_HEIGHT
-from pytrek.Constants import FIXED_WIDTH_FONT_NAME
 from pytrek.Constants import QUADRANT_GRID_HEIGHT
 from pytrek.Constants import QUADRANT_GRID_WIDTH
 from pytrek.GameState import GameState
+from pytrek.GameStateField import GameStateField
 
 from pytrek.engine.ShipCondition import ShipCondition
 
@@ -32,6 +32,8 @@ from pytrek.engine.futures.FutureEventType import FutureEventType
 
 from pytrek.gui.BaseSection import BaseSection
 from pytrek.gui.MessageConsoleProxy import MessageConsoleProxy
+from pytrek.gui.TextLayer import TextLayer
+from pytrek.gui.TextLayer import TextName
 
 from pytrek.model.Coordinates import Coordinates
 
@@ -52,6 +54,19 @@ STATUS_VALUE_X_OFFSET: int = 100
 
 PropertyName  = NewType('PropertyName', str)
 PropertyNames = NewType('PropertyNames', List[PropertyName])
+StatusFields  = NewType('StatusFields', Dict[PropertyName, GameStateField])
+
+OP_TIME_VALUE:           TextName = TextName('opTime')
+TRACTOR_BEAM_VALUE:      TextName = TextName('tractorBeam')
+SUPER_NOVA_VALUE:        TextName = TextName('superNova')
+COMMANDER_ATTACKS_VALUE: TextName = TextName('commanderAttacksBase')
+
+INTERNAL_LABELS: List[Tuple[str, TextName]] = [
+    ('OpTime:',  OP_TIME_VALUE),
+    ('T Beam:',  TRACTOR_BEAM_VALUE),
+    ('SNova:',   SUPER_NOVA_VALUE),
+    ('CAttack:', COMMANDER_ATTACKS_VALUE),
+]
 
 
 class StatusConsoleSection(BaseSection):
@@ -80,60 +95,89 @@ class StatusConsoleSection(BaseSection):
         assert MessageConsoleProxy().initialized is True, 'The console proxy should have set up at game startup'
         self._eventEngine:  EventEngine  = EventEngine(MessageConsoleProxy())
 
-        self._statusProperties: PropertyNames = PropertyNames([])
-
-        self._statusProperties.append(PropertyName('shipCondition'))
-        self._statusProperties.append(PropertyName('starDate'))
-        self._statusProperties.append(PropertyName('currentQuadrantCoordinates'))
-        self._statusProperties.append(PropertyName('currentSectorCoordinates'))
-        self._statusProperties.append(PropertyName('energy'))
-        self._statusProperties.append(PropertyName('shieldEnergy'))
-        self._statusProperties.append(PropertyName('remainingGameTime'))
-        self._statusProperties.append(PropertyName('remainingKlingons'))
-        self._statusProperties.append(PropertyName('remainingCommanders'))
-        self._statusProperties.append(PropertyName('torpedoCount'))
+        self._statusFields: StatusFields = StatusFields({
+            PropertyName('shipCondition'):              GameStateField.SHIP_CONDITION,
+            PropertyName('starDate'):                   GameStateField.STAR_DATE,
+            PropertyName('currentQuadrantCoordinates'): GameStateField.CURRENT_QUADRANT_COORDINATES,
+            PropertyName('currentSectorCoordinates'):   GameStateField.CURRENT_SECTOR_COORDINATES,
+            PropertyName('energy'):                     GameStateField.ENERGY,
+            PropertyName('shieldEnergy'):               GameStateField.SHIELD_ENERGY,
+            PropertyName('remainingGameTime'):          GameStateField.REMAINING_GAME_TIME,
+            PropertyName('remainingKlingons'):          GameStateField.REMAINING_KLINGONS,
+            PropertyName('remainingCommanders'):        GameStateField.REMAINING_COMMANDERS,
+            PropertyName('torpedoCount'):               GameStateField.TORPEDO_COUNT,
+        })
+        self._statusProperties: PropertyNames = PropertyNames(list(self._statusFields.keys()))
+
+        self._changedFields:  GameStateField = GameStateField.ALL       # Nothing is shown yet
+        self._textLayer:      TextLayer      = TextLayer()
+        self._internalsLayer: TextLayer      = TextLayer()
+
+        subscribedFields: GameStateField = GameStateField.NONE
+        for field in self._statusFields.values():
+            subscribedFields |= field
+        self._gameState.subscribe(fields=subscribedFields, listener=self._gameStateChanged)
+
+        self._buildTextLayers()
 
     def on_draw(self):
         """
-        Remember arcade's 0,0 origin is lower left corner
+        Remember arcade's 0,0 origin is lower left corner.  The labels never change;  The values
+        are only laid out again when the game state they show changes
         """
+        self._updateStatusValues()
+        self._textLayer.draw()
 
-        statusConsoleLabelX = self.left + TITLE_MARGIN_X
-        statusConsoleLabelY = (QUADRANT_GRID_HEIGHT + CONSOLE_SECTION_HEIGHT + COMMAND_SECTION_HEIGHT) - TITLE_FONT_OFFSET_Y - TITLE_MARGIN_Y
+        if self._gameSettings.consoleShowInternals is True:
+            self._updateInternalValues()
+            self._internalsLayer.draw()
 
-        draw_text("Status Console", statusConsoleLabelX, statusConsoleLabelY, color=STATUS_TEXT_COLOR,
-                  font_size=SECTION_LABEL_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
+        self.drawDebug()
+
+    def _buildTextLayers(self):
+
+        statusConsoleLabelX: int = self.left + TITLE_MARGIN_X
+        statusConsoleLabelY: int = (QUADRANT_GRID_HEIGHT + CONSOLE_SECTION_HEIGHT + COMMAND_SECTION_HEIGHT) - TITLE_FONT_OFFSET_Y - TITLE_MARGIN_Y
+
+        self._textLayer.addText(TextName('title'), 'Status Console', statusConsoleLabelX, statusConsoleLabelY, color=STATUS_TEXT_COLOR, fontSize=SECTION_LABEL_FONT_SIZE)
 
         labelX:   int = statusConsoleLabelX
+        statusX:  int = labelX + STATUS_VALUE_X_OFFSET
         runningY: int = statusConsoleLabelY + START_STATUS_OFFSET
 
-        self.drawStatusLabels(labelX, runningY)
+        for label, propertyName in zip(StatusConsoleSection.statusLabels, self._statusProperties):
+            self._textLayer.addText(TextName(label), label, labelX, runningY, color=STATUS_TEXT_COLOR, fontSize=STATUS_LABEL_FONT_SIZE)
+            self._textLayer.addText(TextName(propertyName), '', statusX, runningY, color=STATUS_TEXT_COLOR, fontSize=STATUS_LABEL_FONT_SIZE)
+            runningY = runningY + INLINE_STATUS_OFFSET
 
-        runningY = statusConsoleLabelY + START_STATUS_OFFSET    # reset it
-        statusX: int = labelX + STATUS_VALUE_X_OFFSET
+        self._buildInternalsLayer(runningY=runningY, statusX=statusX)
 
-        self.drawStatusValues(statusX=statusX, runningY=runningY)
+    def _buildInternalsLayer(self, runningY: int, statusX: int):
 
-        self.drawDebug()
+        labelX:      int = QUADRANT_GRID_WIDTH + TITLE_MARGIN_X
+        compressedX: int = statusX - 16
+        currentY:    int = runningY
 
-    def drawStatusLabels(self, labelX: int, runningY: int):
-        """
+        for label, valueName in INTERNAL_LABELS:
+            currentY = currentY + INLINE_STATUS_OFFSET
+            self._internalsLayer.addText(TextName(label), label, labelX, currentY, color=RED, fontSize=STATUS_LABEL_FONT_SIZE)
+            self._internalsLayer.addText(valueName, '', compressedX, currentY, color=RED, fontSize=STATUS_LABEL_FONT_SIZE)
 
-        Args:
-            labelX:   The fixed X location for all the labels
-            runningY: The y position for the labels that we update as we move down the label list
-        """
-        for label in StatusConsoleSection.statusLabels:
-            draw_text(label, labelX, runningY, color=STATUS_TEXT_COLOR, font_size=STATUS_LABEL_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
-            runningY = runningY + INLINE_STATUS_OFFSET
+    def _gameStateChanged(self, changedFields: GameStateField):
+        self._changedFields |= changedFields
 
-    def drawStatusValues(self, statusX: int, runningY: int):
+    def _updateStatusValues(self):
 
-        statusProperties: PropertyNames = self._statusProperties
+        if self._changedFields == GameStateField.NONE:
+            return
 
-        for propertyName in statusProperties:
+        for propertyName in self._statusProperties:
+
+            if self._statusFields[propertyName] & self._changedFields == GameStateField.NONE:
+                continue
 
             propertyValue: Union[Enum, float, int, str] = getattr(self._gameState, propertyName)
+
             propertyStr: str = ''
 
             baseTextColor = STATUS_TEXT_COLOR
@@ -147,12 +191,16 @@ class StatusConsoleSection(BaseSection):
             elif isinstance(propertyValue, Coordinates):
                 propertyStr = self._formatCoordinates(coordinates=propertyValue)
 
-            draw_text(propertyStr, statusX, runningY, color=baseTextColor,
-                      font_size=STATUS_LABEL_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
+            self._textLayer.setText(TextName(propertyName), propertyStr, color=baseTextColor)
 
-            runningY = runningY + INLINE_STATUS_OFFSET
+        self._changedFields = GameStateField.NONE
+
+    def _updateInternalValues(self):
 
-        self._showInternalValues(runningY, statusX)
+        self._internalsLayer.setText(OP_TIME_VALUE, f'{self._gameState.opTime:.2f}')
+        self._internalsLayer.setText(TRACTOR_BEAM_VALUE, self.__getTimeString(FutureEventType.TRACTOR_BEAM))
+        self._internalsLayer.setText(SUPER_NOVA_VALUE, self.__getTimeString(FutureEventType.SUPER_NOVA))
+        self._internalsLayer.setText(COMMANDER_ATTACKS_VALUE, self.__getTimeString(FutureEventType.COMMANDER_ATTACKS_BASE))
 
     def _getStatusColor(self, shipCondition: ShipCondition):
 
@@ -177,47 +225,6 @@ class StatusConsoleSection(BaseSection):
         """
         return f'({coordinates.x},{coordinates.y})'
 
-    def _showInternalValues(self, runningY: int, statusX: int):
-
-        labelX:      int = QUADRANT_GRID_WIDTH + TITLE_MARGIN_X
-        compressedX: int = statusX - 16
-        currentY:    int = runningY
-
-        currentY = currentY + INLINE_STATUS_OFFSET
-
-        if self._gameSettings.consoleShowInternals is True:
-
-            draw_text('OpTime:', labelX, currentY, color=RED,
-                      font_size=STATUS_LABEL_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
-
-            opTimeStr: str = f'{self._gameState.opTime:.2f}'
-            draw_text(opTimeStr, compressedX, currentY, color=RED,
-                      font_size=STATUS_LABEL_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
-            #
-            currentY = currentY + INLINE_STATUS_OFFSET
-            draw_text('T Beam:', labelX, currentY, color=RED,
-                      font_size=STATUS_LABEL_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
-
-            evtStr: str = self.__getTimeString(FutureEventType.TRACTOR_BEAM)
-            draw_text(evtStr, compressedX, currentY, color=RED,
-                      font_size=STATUS_LABEL_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
-
-            currentY = currentY + INLINE_STATUS_OFFSET
-            draw_text('SNova:', labelX, currentY, color=RED,
-                      font_size=STATUS_LABEL_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
-
-            evtStr = self.__getTimeString(FutureEventType.SUPER_NOVA)
-            draw_text(evtStr, compressedX, currentY, color=RED,
-                      font_size=STATUS_LABEL_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
-
-            currentY = currentY + INLINE_STATUS_OFFSET
-            draw_text('CAttack:', labelX, currentY, color=RED,
-                      font_size=STATUS_LABEL_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
-
-            evtStr = self.__getTimeString(FutureEventType.COMMANDER_ATTACKS_BASE)
-            draw_text(evtStr, compressedX, currentY, color=RED,
-                      font_size=STATUS_LABEL_FONT_SIZE, font_name=FIXED_WIDTH_FONT_NAME)
-
     def __getTimeString(self, eventType: FutureEventType):
 
         fEvent: FutureEvent = self._eventEngine.getEvent(eventType)
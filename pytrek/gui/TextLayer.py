@@ -0,0 +1,96 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from arcade import Text
+
+from arcade.color import WHITE
+
+from pytrek.Constants import FIXED_WIDTH_FONT_NAME
+
+TextColor = Tuple[int, int, int]
+TextName  = NewType('TextName', str)
+
+
+@dataclass
+class TextEntry:
+    """
+    What a piece of text looks like and where it goes;  The arcade Text is built on first draw
+    """
+    value:    str       = ''
+    x:        float     = 0.0
+    y:        float     = 0.0
+    color:    TextColor = WHITE
+    fontSize: int       = 11
+    text:     Text      = cast(Text, None)
+
+
+TextEntries = NewType('TextEntries', Dict[TextName, TextEntry])
+
+
+class TextLayer:
+    """
+    Retained mode text.  Each named piece of text keeps its arcade Text (a pyglet label) so its
+    glyphs are laid out once;  They are laid out again only when the value or color changes.
+
+    The arcade Text objects need an OpenGL context;  So they are created on the first draw rather
+    than when the text is added
+    """
+    def __init__(self, fontName: str = FIXED_WIDTH_FONT_NAME):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._fontName: str            = fontName
+        self._entries:  TextEntries    = TextEntries({})
+        self._order:    List[TextName] = []
+
+    def addText(self, name: TextName, value: str, x: float, y: float, color: TextColor = WHITE, fontSize: int = 11):
+        """
+        Args:
+            name:       How to refer to this text later
+            value:      The initial text
+            x:          Arcade x position
+            y:          Arcade y position;  The text's baseline
+            color:      The text color
+            fontSize:   The font size in points
+        """
+        self._entries[name] = TextEntry(value=value, x=x, y=y, color=color, fontSize=fontSize)
+        self._order.append(name)
+
+    def setText(self, name: TextName, value: str, color: TextColor = cast(TextColor, None)):
+        """
+        Only touches the arcade Text if the value or color actually changed
+
+        Args:
+            name:   The text to change
+            value:  The new text
+            color:  The new color;  `None` keeps the current one
+        """
+        entry: TextEntry = self._entries[name]
+        if value != entry.value:
+            entry.value = value
+            if entry.text is not None:
+                entry.text.value = value
+        if color is not None and color != entry.color:
+            entry.color = color
+            if entry.text is not None:
+                entry.text.color = color
+
+    def getText(self, name: TextName) -> str:
+        return self._entries[name].value
+
+    def draw(self):
+
+        for name in self._order:
+            entry: TextEntry = self._entries[name]
+            if entry.text is None:
+                entry.text = Text(entry.value, entry.x, entry.y, color=entry.color, font_size=entry.fontSize, font_name=self._fontName)
+            entry.text.draw()
@@ -0,0 +1,109 @@
+
+from typing import Dict
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from arcade import Texture
+from arcade import TextureAtlas
+from arcade import load_spritesheet
+from arcade import load_texture
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+from pytrek.LocateResources import LocateResources
+
+from pytrek.gui.UITypes import TextureList
+
+ImagePaths   = NewType('ImagePaths',   Dict[str, str])
+Textures     = NewType('Textures',     Dict[str, Texture])
+SpriteSheets = NewType('SpriteSheets', Dict[str, TextureList])
+
+
+class TextureRegistry(metaclass=SingletonV3):
+    """
+    The one place game pieces and effects get their textures from.  Each image path is resolved once
+    and each image or sprite sheet is loaded once;  Every sprite made from it shares the same Texture.
+
+    arcade draws all the sprite lists from the window's default texture atlas;  `populateAtlas` packs
+    everything loaded so far into it at start up instead of one texture at a time during play
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._imagePaths:   ImagePaths   = ImagePaths({})
+        self._textures:     Textures     = Textures({})
+        self._spriteSheets: SpriteSheets = SpriteSheets({})
+
+    def imagePath(self, bareFileName: str) -> str:
+        """
+        Args:
+            bareFileName:   An image file name without its path
+
+        Returns:  The fully qualified image file name
+        """
+        fqFileName: str = self._imagePaths.get(bareFileName, cast(str, None))
+        if fqFileName is None:
+            fqFileName = LocateResources.getImagePath(bareFileName=bareFileName)
+            self._imagePaths[bareFileName] = fqFileName
+
+        return fqFileName
+
+    def texture(self, bareFileName: str) -> Texture:
+        """
+        Args:
+            bareFileName:   An image file name without its path
+
+        Returns:  The shared texture for the image
+        """
+        texture: Texture = self._textures.get(bareFileName, cast(Texture, None))
+        if texture is None:
+            texture = load_texture(self.imagePath(bareFileName=bareFileName))
+            self._textures[bareFileName] = texture
+
+        return texture
+
+    def spriteSheet(self, bareFileName: str, spriteWidth: int, spriteHeight: int, nColumns: int, tileCount: int) -> TextureList:
+        """
+        Args:
+            bareFileName:   The sprite sheet file name without its path
+            spriteWidth:    The width of a tile
+            spriteHeight:   The height of a tile
+            nColumns:       The number of tiles in a row
+            tileCount:      The number of tiles in the sheet
+
+        Returns:  The shared textures cut from the sheet
+        """
+        textureList: TextureList = self._spriteSheets.get(bareFileName, cast(TextureList, None))
+        if textureList is None:
+            fqFileName: str = self.imagePath(bareFileName=bareFileName)
+            textureList = cast(TextureList, load_spritesheet(fqFileName, spriteWidth, spriteHeight, nColumns, tileCount))
+            self._spriteSheets[bareFileName] = textureList
+
+        return textureList
+
+    def populateAtlas(self, atlas: TextureAtlas):
+        """
+        Pack the textures loaded so far into the atlas;  Textures already in it are skipped
+
+        Args:
+            atlas:  Usually the window context's default atlas
+        """
+        textureCount: int = 0
+        for texture in self._allTextures():
+            if atlas.has_texture(texture) is False:
+                atlas.add(texture)
+                textureCount += 1
+
+        self.logger.info(f'Packed {textureCount} textures into the texture atlas')
+
+    def _allTextures(self) -> TextureList:
+
+        textureList: TextureList = TextureList(list(self._textures.values()))
+        for sheetTextures in self._spriteSheets.values():
+            textureList.extend(sheetTextures)
+
+        return textureList
@@ -16,12 +16,11 @@ from arcade import LifetimeParticle
 
 from arcade import color
 from arcade import draw_text
-from arcade import load_spritesheet
 from arcade import rand_on_circle
 from arcade import set_background_color
 from arcade import start_render
 
-from pytrek.LocateResources import LocateResources
+from pytrek.gui.TextureRegistry import TextureRegistry
 
 from pytrek.SoundMachine import SoundMachine
 from pytrek.SoundMachine import SoundType
@@ -114,8 +113,7 @@ class WarpEffectSection(BaseSection):
         spriteWidth:  int = 32
         spriteHeight: int = 32
         bareFileName: str = f'WarpEffectSpriteSheet.png'
-        fqFileName:   str = LocateResources.getImagePath(bareFileName=bareFileName)
 
-        textureList: TextureList = cast(TextureList, load_spritesheet(fqFileName, spriteWidth, spriteHeight, nColumns, tileCount))
+        textureList: TextureList = TextureRegistry().spriteSheet(bareFileName, spriteWidth, spriteHeight, nColumns, tileCount)
 
         return textureList
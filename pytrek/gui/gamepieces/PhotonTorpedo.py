@@ -9,9 +9,10 @@ from pytrek.gui.gamepieces.GamePiece import GamePiece
 from pytrek.gui.gamepieces.GamePieceTypes import PhotonTorpedoId
 from pytrek.gui.gamepieces.SmoothMotion import SmoothMotion
 from pytrek.gui.gamepieces.SmoothMotion import RadianInfo
+from pytrek.gui.gamepieces.base.PooledSprite import PooledSprite
 
 
-class PhotonTorpedo(GamePiece, SmoothMotion):
+class PhotonTorpedo(PooledSprite, GamePiece, SmoothMotion):
 
     FILENAME: str = 'PhotonTorpedo.png'
     nextId: int = 0
@@ -20,14 +21,21 @@ class PhotonTorpedo(GamePiece, SmoothMotion):
 
         GamePiece.__init__(self, filename=PhotonTorpedo.FILENAME, speed=speed)
         SmoothMotion.__init__(self, imageRotation=0)
+        PooledSprite.__init__(self)
 
         self.logger: Logger = getLogger(__name__)
 
-        self._id:      PhotonTorpedoId = PhotonTorpedoId(f'Torpedo-{PhotonTorpedo.nextId}')
+        self._id:      PhotonTorpedoId = PhotonTorpedo.nextTorpedoId()
         self._firedAt: EnemyId         = cast(EnemyId, None)
 
+    @classmethod
+    def nextTorpedoId(cls) -> PhotonTorpedoId:
+
+        torpedoId: PhotonTorpedoId = PhotonTorpedoId(f'Torpedo-{PhotonTorpedo.nextId}')
         PhotonTorpedo.nextId += 1
 
+        return torpedoId
+
     @property
     def id(self) -> PhotonTorpedoId:
         return self._id
@@ -40,6 +48,21 @@ class PhotonTorpedo(GamePiece, SmoothMotion):
     def firedAt(self, klingonId: EnemyId):
         self._firedAt = klingonId
 
+    def reset(self, speed: float):
+        """
+        Make a pooled torpedo ready to fire again with a new ID
+
+        Args:
+            speed:  The torpedo speed
+        """
+        self._id      = PhotonTorpedo.nextTorpedoId()
+        self._firedAt = cast(EnemyId, None)
+        self.speed    = speed
+        self.angle    = 0
+        self.change_x = 0
+        self.change_y = 0
+        self.resetMotion()
+
     def update(self):
 
         if self.inMotion is True:
@@ -36,6 +36,10 @@ class Planet(BaseGamePiece):
     def id(self) -> str:
         return self._id
 
+    @property
+    def planetType(self) -> PlanetType:
+        return self._type
+
     def __str__(self) -> str:
         return self.id
 
@@ -80,6 +80,14 @@ class SmoothMotion:
     def imageRotation(self, newValue: int):
         self._imageRotation = newValue
 
+    def resetMotion(self):
+        """
+        Stop and forget the destination;  Used when a pooled game piece is handed out again
+        """
+        self._inMotion            = False
+        self._destinationPoint    = cast(ArcadePoint, None)
+        self._smoothMotionCounter = 0
+
     def doMotion(self, gamePiece: GamePiece, destinationPoint: ArcadePoint, angleDiffRadians: float, actualAngleRadians: float):
 
         destinationX: float = destinationPoint.x
@@ -19,6 +19,14 @@ class BaseAnimator(Sprite):
         # Prime the pump
         self.texture          = self._textures[0]
 
+    def reset(self):
+        """
+        Start the animation over
+        """
+        self._textureIdx   = 0
+        self._delayCounter = 0
+        self.texture       = self._textures[0]
+
     def update(self):
 
         # Update to the next frame of the animation. If we are at the end
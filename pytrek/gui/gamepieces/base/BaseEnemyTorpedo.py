@@ -10,6 +10,10 @@ from pytrek.engine.ArcadePoint import ArcadePoint
 from pytrek.engine.Computer import Computer
 
 from pytrek.gui.gamepieces.base.BaseEnemy import EnemyId
+from pytrek.gui.gamepieces.base.BaseTorpedoFollower import BaseTorpedoFollower
+from pytrek.gui.gamepieces.base.BaseTorpedoFollower import TorpedoFollowers
+from pytrek.gui.gamepieces.base.PooledSprite import PooledSprite
+from pytrek.gui.gamepieces.base.SpritePool import SpritePool
 from pytrek.gui.gamepieces.GamePiece import GamePiece
 from pytrek.gui.gamepieces.GamePieceTypes import EnemyTorpedoId
 from pytrek.gui.gamepieces.SmoothMotion import SmoothMotion
@@ -18,21 +22,24 @@ from pytrek.gui.gamepieces.SmoothMotion import RadianInfo
 from pytrek.model.Coordinates import Coordinates
 
 
-class BaseEnemyTorpedo(GamePiece, SmoothMotion):
+class BaseEnemyTorpedo(PooledSprite, GamePiece, SmoothMotion):
 
     def __init__(self, filename: str, torpedoId: EnemyTorpedoId, speed: float = 3, scale: float = 1.0):
 
         GamePiece.__init__(self, filename=filename, speed=speed, scale=scale)
         SmoothMotion.__init__(self)
+        PooledSprite.__init__(self)
 
         self._baseEnemyTorpedoLogger: Logger = getLogger(__name__)
 
         self._id: EnemyTorpedoId = torpedoId
 
-        self._firedBy:           EnemyId     = cast(EnemyId, None)
-        self._firedFromPosition: Coordinates = cast(Coordinates, None)
-        self._currentPosition:   Coordinates = cast(Coordinates, None)
-        self._followers:         SpriteList  = cast(SpriteList, None)
+        self._firedBy:           EnemyId          = cast(EnemyId, None)
+        self._firedFromPosition: Coordinates      = cast(Coordinates, None)
+        self._currentPosition:   Coordinates      = cast(Coordinates, None)
+        self._followers:         SpriteList       = cast(SpriteList, None)
+        self._followerPool:      SpritePool       = cast(SpritePool, None)
+        self._ownFollowers:      TorpedoFollowers = TorpedoFollowers([])
 
         self._computer:                      Computer     = Computer()
         self._baseEnemyTorpedoDebugInterval: int          = 0
@@ -75,6 +82,64 @@ class BaseEnemyTorpedo(GamePiece, SmoothMotion):
         """
         self._followers = newValues
 
+    @property
+    def ownFollowers(self) -> TorpedoFollowers:
+        return self._ownFollowers
+
+    @ownFollowers.setter
+    def ownFollowers(self, newValues: TorpedoFollowers):
+        """
+        The followers this torpedo placed;  The mediator indexes this by our ID
+
+        Args:
+            newValues:
+        """
+        self._ownFollowers = newValues
+
+    @property
+    def followerPool(self) -> SpritePool:
+        return self._followerPool
+
+    @followerPool.setter
+    def followerPool(self, newValue: SpritePool):
+        """
+        Where our followers come from
+
+        Args:
+            newValue:
+        """
+        self._followerPool = newValue
+
+    @classmethod
+    def nextTorpedoId(cls) -> EnemyTorpedoId:
+        """
+        Must be implemented by subclass to name its torpedoes
+
+        Returns:  A new torpedo ID
+        """
+        return cast(EnemyTorpedoId, None)
+
+    def reset(self, speed: float):
+        """
+        Make a pooled torpedo ready to fire again;  It gets a new ID so that it is not mistaken
+        for its previous shot
+
+        Args:
+            speed:  The torpedo speed
+        """
+        self._id      = self.nextTorpedoId()
+        self.speed    = speed
+        self.angle    = 0
+        self.change_x = 0
+        self.change_y = 0
+        self.resetMotion()
+
+        self._firedBy           = cast(EnemyId, None)
+        self._firedFromPosition = cast(Coordinates, None)
+        self._currentPosition   = cast(Coordinates, None)
+
+        self._baseEnemyTorpedoDebugInterval = 0
+
     def update(self):
 
         if self.inMotion is True:
@@ -104,13 +169,21 @@ class BaseEnemyTorpedo(GamePiece, SmoothMotion):
 
     def _placeTorpedoFollower(self, x: float, y: float):
         """
-        Must be implemented by subclass to create correct follower
+        Our follower pool hands out the correct kind of follower
 
         Args:
             x:  Arcade x
             y:  Arcade y
         """
-        pass
+        torpedoFollower: BaseTorpedoFollower = cast(BaseTorpedoFollower, self._followerPool.acquire())
+        torpedoFollower.reset()
+
+        torpedoFollower.center_x  = x
+        torpedoFollower.center_y  = y
+        torpedoFollower.following = self._id
+
+        self._followers.append(torpedoFollower)
+        self._ownFollowers.append(torpedoFollower)
 
     def _baseEnemyTorpedoDebugOutput(self, msg: str):
 
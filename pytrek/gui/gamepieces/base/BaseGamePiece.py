@@ -3,7 +3,7 @@ from typing import cast
 
 from arcade import Sprite
 
-from pytrek.LocateResources import LocateResources
+from pytrek.gui.TextureRegistry import TextureRegistry
 
 from pytrek.model.Coordinates import Coordinates
 
@@ -12,9 +12,7 @@ class BaseGamePiece(Sprite):
 
     def __init__(self, filename: str = '', scale: float = 1.0):
 
-        fqFileName: str = LocateResources.getImagePath(bareFileName=filename)
-
-        super().__init__(filename=fqFileName, scale=scale)
+        super().__init__(texture=TextureRegistry().texture(bareFileName=filename), scale=scale)
 
         self._gameCoordinates: Coordinates = cast(Coordinates, None)
 
@@ -1,16 +1,22 @@
 
+from typing import cast
+
 from logging import Logger
 from logging import getLogger
 
 
 from pytrek.gui.gamepieces.base.BaseGamePiece import BaseGamePiece
+from pytrek.gui.gamepieces.base.PooledSprite import PooledSprite
+
+from pytrek.model.Coordinates import Coordinates
 
 
-class BaseMiss(BaseGamePiece):
+class BaseMiss(PooledSprite, BaseGamePiece):
 
     def __init__(self, fileName: str, placedTime: float, scale: float = 1.0):
 
-        super().__init__(filename=fileName, scale=scale)
+        BaseGamePiece.__init__(self, filename=fileName, scale=scale)
+        PooledSprite.__init__(self)
 
         self.logger:     Logger = getLogger(__name__)
         self._placedTime: float = placedTime
@@ -23,3 +29,11 @@ class BaseMiss(BaseGamePiece):
 
         """
         return self._placedTime
+
+    def reset(self, placedTime: float):
+        """
+        Args:
+            placedTime:  When the sprite is placed on the board again
+        """
+        self._placedTime     = placedTime
+        self.gameCoordinates = cast(Coordinates, None)
@@ -2,10 +2,12 @@
 
 from pytrek.gui.gamepieces.base.BaseAnimator import BaseAnimator
 from pytrek.gui.gamepieces.base.BaseAnimator import TextureList
+from pytrek.gui.gamepieces.base.PooledSprite import PooledSprite
 
 
-class BaseTorpedoExplosion(BaseAnimator):
+class BaseTorpedoExplosion(PooledSprite, BaseAnimator):
 
     def __init__(self, textureList: TextureList, delayFrames: int, scale: float = 1.0):
 
-        super().__init__(textureList=textureList, delayFrames=delayFrames, scale=scale)
+        BaseAnimator.__init__(self, textureList=textureList, delayFrames=delayFrames, scale=scale)
+        PooledSprite.__init__(self)
@@ -1,14 +1,19 @@
 
+from typing import List
+from typing import NewType
+
 from pytrek.gui.gamepieces.GamePiece import GamePiece
 from pytrek.gui.gamepieces.GamePieceTypes import EnemyFollowerId
 from pytrek.gui.gamepieces.GamePieceTypes import EnemyTorpedoId
+from pytrek.gui.gamepieces.base.PooledSprite import PooledSprite
 
 
-class BaseTorpedoFollower(GamePiece):
+class BaseTorpedoFollower(PooledSprite, GamePiece):
 
     def __init__(self, filename: str, followerId: EnemyFollowerId, scale: float = 1.0):
 
-        super().__init__(filename=filename, scale=scale)
+        GamePiece.__init__(self, filename=filename, scale=scale)
+        PooledSprite.__init__(self)
 
         self._id:        EnemyFollowerId = followerId
         self._following: EnemyTorpedoId  = EnemyTorpedoId('')
@@ -30,3 +35,12 @@ class BaseTorpedoFollower(GamePiece):
             newValue:
         """
         self._following = newValue
+
+    def reset(self):
+        """
+        Forget the torpedo we followed
+        """
+        self._following = EnemyTorpedoId('')
+
+
+TorpedoFollowers = NewType('TorpedoFollowers', List[BaseTorpedoFollower])
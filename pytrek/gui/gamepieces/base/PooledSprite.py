@@ -0,0 +1,36 @@
+
+from typing import TYPE_CHECKING
+from typing import cast
+
+if TYPE_CHECKING:
+    from pytrek.gui.gamepieces.base.SpritePool import SpritePool
+
+
+class PooledSprite:
+    """
+    A mix-in for sprites that a SpritePool hands out;  Removing the sprite from its sprite lists
+    gives it back to the pool.  Mix it in ahead of the arcade Sprite so that it sees the removal
+    """
+    def __init__(self):
+
+        self._pool: 'SpritePool' = cast('SpritePool', None)
+
+    @property
+    def pool(self) -> 'SpritePool':
+        """
+        Returns:  The pool that handed us out;  `None` when we are free or were not pooled
+        """
+        return self._pool
+
+    @pool.setter
+    def pool(self, newValue: 'SpritePool'):
+        self._pool = newValue
+
+    def remove_from_sprite_lists(self):
+
+        super().remove_from_sprite_lists()
+
+        pool: 'SpritePool' = self._pool
+        if pool is not None:
+            self._pool = cast('SpritePool', None)
+            pool.release(self)
@@ -0,0 +1,66 @@
+
+from typing import Callable
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from pytrek.gui.gamepieces.base.PooledSprite import PooledSprite
+
+SpriteFactory = Callable[[], PooledSprite]
+
+
+class SpritePool:
+    """
+    Keeps the sprites of one kind that have left the board so that they can be handed out again
+    instead of being constructed.  The caller resets what it acquires;  Removing an acquired sprite
+    from its sprite lists releases it.  The pool keeps at most `maximumSize` free sprites
+    """
+    DEFAULT_MAXIMUM_SIZE: int = 128
+
+    def __init__(self, factory: SpriteFactory, maximumSize: int = DEFAULT_MAXIMUM_SIZE):
+        """
+
+        Args:
+            factory:        Makes a new sprite when none are free
+            maximumSize:    The most free sprites to keep
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._factory:     SpriteFactory      = factory
+        self._maximumSize: int                = maximumSize
+        self._free:        List[PooledSprite] = []
+        self._created:     int                = 0
+
+    @property
+    def freeCount(self) -> int:
+        return len(self._free)
+
+    @property
+    def createdCount(self) -> int:
+        """
+        Returns:  How many sprites the factory has made
+        """
+        return self._created
+
+    def acquire(self) -> PooledSprite:
+        """
+        Returns:  A free sprite or a new one
+        """
+        if len(self._free) > 0:
+            sprite: PooledSprite = self._free.pop()
+        else:
+            sprite = self._factory()
+            self._created += 1
+
+        sprite.pool = self
+
+        return sprite
+
+    def release(self, sprite: PooledSprite):
+        """
+        Args:
+            sprite:  A sprite that is no longer on the board
+        """
+        if len(self._free) < self._maximumSize:
+            self._free.append(sprite)
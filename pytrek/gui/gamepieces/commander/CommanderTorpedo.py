@@ -6,8 +6,6 @@ from pytrek.gui.gamepieces.GamePieceTypes import EnemyTorpedoId
 
 from pytrek.gui.gamepieces.base.BaseEnemyTorpedo import BaseEnemyTorpedo
 
-from pytrek.gui.gamepieces.commander.CommanderTorpedoFollower import CommanderTorpedoFollower
-
 
 class CommanderTorpedo(BaseEnemyTorpedo):
     FILENAME: str = 'CommanderTorpedo.png'
@@ -16,24 +14,17 @@ class CommanderTorpedo(BaseEnemyTorpedo):
 
     def __init__(self, speed: float = 3.0):
 
-        torpedoId: EnemyTorpedoId = EnemyTorpedoId(f'CommanderTorpedo-{CommanderTorpedo.nextId}')
-        CommanderTorpedo.nextId += 1
-
-        super().__init__(filename=CommanderTorpedo.FILENAME, speed=speed, torpedoId=torpedoId, scale=0.4)
+        super().__init__(filename=CommanderTorpedo.FILENAME, speed=speed, torpedoId=CommanderTorpedo.nextTorpedoId(), scale=0.4)
         self.logger: Logger = getLogger(__name__)
 
-    def _placeTorpedoFollower(self, x: float, y: float):
+    @classmethod
+    def nextTorpedoId(cls) -> EnemyTorpedoId:
         """
         We implement the empty base class method
 
-        Args:
-            x:  Arcade x
-            y:  Arcade y
+        Returns:  A new torpedo ID
         """
-        commanderTorpedoFollower: CommanderTorpedoFollower = CommanderTorpedoFollower()
-
-        commanderTorpedoFollower.center_x  = x
-        commanderTorpedoFollower.center_y  = y
-        commanderTorpedoFollower.following = self._id
+        torpedoId: EnemyTorpedoId = EnemyTorpedoId(f'CommanderTorpedo-{CommanderTorpedo.nextId}')
+        CommanderTorpedo.nextId += 1
 
-        self._followers.append(commanderTorpedoFollower)
+        return torpedoId
@@ -4,7 +4,6 @@ from logging import getLogger
 
 from pytrek.gui.gamepieces.base.BaseEnemyTorpedo import BaseEnemyTorpedo
 from pytrek.gui.gamepieces.GamePieceTypes import EnemyTorpedoId
-from pytrek.gui.gamepieces.klingon.KlingonTorpedoFollower import KlingonTorpedoFollower
 
 
 class KlingonTorpedo(BaseEnemyTorpedo):
@@ -14,25 +13,17 @@ class KlingonTorpedo(BaseEnemyTorpedo):
 
     def __init__(self, speed: float = 3.0):
 
-        torpedoId: EnemyTorpedoId = EnemyTorpedoId(f'KlingonTorpedo-{KlingonTorpedo.nextId}')
-        KlingonTorpedo.nextId += 1
-
-        super().__init__(filename=KlingonTorpedo.FILENAME, torpedoId=torpedoId, speed=speed)
+        super().__init__(filename=KlingonTorpedo.FILENAME, torpedoId=KlingonTorpedo.nextTorpedoId(), speed=speed)
         self.logger: Logger = getLogger(__name__)
 
-    def _placeTorpedoFollower(self, x: float, y: float):
+    @classmethod
+    def nextTorpedoId(cls) -> EnemyTorpedoId:
         """
         We implement the empty base class method
 
-        Args:
-            x:  Arcade x
-            y:  Arcade y
+        Returns:  A new torpedo ID
         """
+        torpedoId: EnemyTorpedoId = EnemyTorpedoId(f'KlingonTorpedo-{KlingonTorpedo.nextId}')
+        KlingonTorpedo.nextId += 1
 
-        klingonTorpedoFollower: KlingonTorpedoFollower = KlingonTorpedoFollower()
-
-        klingonTorpedoFollower.center_x  = x
-        klingonTorpedoFollower.center_y  = y
-        klingonTorpedoFollower.following = self._id
-
-        self._followers.append(klingonTorpedoFollower)
+        return torpedoId
@@ -4,7 +4,6 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
-from arcade import load_spritesheet
 
 from pytrek.SoundMachine import SoundMachine
 from pytrek.SoundMachine import SoundType
@@ -13,11 +12,13 @@ from pytrek.engine.ArcadePoint import ArcadePoint
 from pytrek.gui.gamepieces.base.BaseEnemyTorpedo import BaseEnemyTorpedo
 from pytrek.gui.gamepieces.base.BaseMiss import BaseMiss
 from pytrek.gui.gamepieces.base.BaseTorpedoExplosion import BaseTorpedoExplosion
+from pytrek.gui.gamepieces.base.BaseTorpedoFollower import BaseTorpedoFollower
 from pytrek.gui.gamepieces.base.BaseAnimator import TextureList
 from pytrek.gui.gamepieces.commander.Commander import Commander
 
 from pytrek.gui.gamepieces.commander.CommanderTorpedo import CommanderTorpedo
 from pytrek.gui.gamepieces.commander.CommanderTorpedoExplosion import CommanderTorpedoExplosion
+from pytrek.gui.gamepieces.commander.CommanderTorpedoFollower import CommanderTorpedoFollower
 from pytrek.gui.gamepieces.commander.CommanderTorpedoMiss import CommanderTorpedoMiss
 
 from pytrek.gui.gamepieces.Enterprise import Enterprise
@@ -28,7 +29,7 @@ from pytrek.mediators.base.BaseTorpedoMediator import BaseTorpedoMediator
 
 from pytrek.model.Quadrant import Quadrant
 
-from pytrek.LocateResources import LocateResources
+from pytrek.gui.TextureRegistry import TextureRegistry
 
 from pytrek.settings.TorpedoSpeeds import TorpedoSpeeds
 
@@ -72,6 +73,22 @@ class CommanderTorpedoMediator(BaseTorpedoMediator):
         self._handleTorpedoMisses(quadrant, enemies=quadrant.commanders)
         self._handleMissRemoval(quadrant, cast(Misses, self._misses))
 
+    def _createTorpedo(self) -> BaseEnemyTorpedo:
+        """
+        Implement empty base class method
+
+        Returns:  A new torpedo of the correct type
+        """
+        return CommanderTorpedo()
+
+    def _createTorpedoFollower(self) -> BaseTorpedoFollower:
+        """
+        Implement empty base class method
+
+        Returns:  A new torpedo follower of the correct type
+        """
+        return CommanderTorpedoFollower()
+
     def _getTorpedoToFire(self, enemy: Enemy, enterprise: Enterprise) -> BaseEnemyTorpedo:
         """
         Must be implemented by subclass to create correct type of torpedo
@@ -87,7 +104,7 @@ class CommanderTorpedoMediator(BaseTorpedoMediator):
 
         speeds: TorpedoSpeeds = self._intelligence.getTorpedoSpeeds(playerType=self._gameState.playerType)
 
-        commanderTorpedo: CommanderTorpedo = CommanderTorpedo(speed=speeds.commander)
+        commanderTorpedo: CommanderTorpedo = cast(CommanderTorpedo, self._acquireTorpedo(speed=speeds.commander))
 
         commanderTorpedo.center_x = klingonPoint.x
         commanderTorpedo.center_y = klingonPoint.y
@@ -95,24 +112,22 @@ class CommanderTorpedoMediator(BaseTorpedoMediator):
         commanderTorpedo.destinationPoint  = enterprisePoint
         commanderTorpedo.firedFromPosition = enemy.gameCoordinates
         commanderTorpedo.firedBy   = enemy.id
-        commanderTorpedo.followers = self.torpedoFollowers
 
         return commanderTorpedo
 
-    def _getTorpedoExplosion(self) -> BaseTorpedoExplosion:
+    def _createTorpedoExplosion(self) -> BaseTorpedoExplosion:
         """
-        Must be implemented by subclass to create correct type of torpedo explosion
-
-        Returns: An explosion of the correct type
+        Implement empty base class method
 
+        Returns: A new explosion of the correct type
         """
         return CommanderTorpedoExplosion(textureList=self._explosionTextures)
 
-    def _getTorpedoMiss(self) -> BaseMiss:
+    def _createTorpedoMiss(self) -> BaseMiss:
         """
         Implement empty base class method
 
-        Returns:  An appropriate 'miss' sprite
+        Returns:  A new 'miss' sprite of the correct type
         """
         return CommanderTorpedoMiss(placedTime=self._gameEngine.gameClock)
 
@@ -141,8 +156,7 @@ class CommanderTorpedoMediator(BaseTorpedoMediator):
         spriteWidth:  int = 64
         spriteHeight: int = 64
         bareFileName: str = f'CommanderTorpedoExplosionSpriteSheet.png'
-        fqFileName:   str = LocateResources.getImagePath(bareFileName=bareFileName)
 
-        textureList: TextureList = cast(TextureList, load_spritesheet(fqFileName, spriteWidth, spriteHeight, nColumns, tileCount))
+        textureList: TextureList = TextureRegistry().spriteSheet(bareFileName, spriteWidth, spriteHeight, nColumns, tileCount)
 
         return textureList
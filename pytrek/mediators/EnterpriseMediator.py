@@ -3,14 +3,11 @@ from typing import cast
 
 from logging import Logger
 from logging import getLogger
-
-from arcade import SpriteList
+from logging import DEBUG
 
 from arcade import schedule
 from arcade import unschedule
 
-from pytrek.Constants import MAX_QUADRANT_X_COORDINATE
-from pytrek.Constants import MAX_QUADRANT_Y_COORDINATE
 from pytrek.Constants import MAX_SECTOR_X_COORDINATE
 from pytrek.Constants import MAX_SECTOR_Y_COORDINATE
 from pytrek.Constants import MIN_QUADRANT_X_COORDINATE
@@ -25,6 +22,7 @@ from pytrek.commandparser.InvalidCommandValueException import InvalidCommandValu
 
 from pytrek.engine.ArcadePoint import ArcadePoint
 from pytrek.engine.DirectionData import DirectionData
+from pytrek.engine.LineOfSight import MOVEMENT_OBSTACLES
 from pytrek.engine.ShipCondition import ShipCondition
 
 from pytrek.gui.UITypes import WarpTravelCallbackV2
@@ -88,7 +86,8 @@ class EnterpriseMediator(MissesMediator):
         arcadeY:     float       = arcadePoint.y
         if enterprise.inMotion is True:
 
-            self.logger.debug(f'Enterprise arcade position: ({arcadeX},{arcadeY})')
+            if self.logger.isEnabledFor(DEBUG):
+                self.logger.debug(f'Enterprise arcade position: ({arcadeX},{arcadeY})')
             enterprise.destinationPoint = ArcadePoint(x=arcadeX, y=arcadeY)
             enterprise.update()
         else:
@@ -112,10 +111,7 @@ class EnterpriseMediator(MissesMediator):
             self._messageConsole.displayMessage("WTF.  You are already here!")
             self._soundMachine.playSound(SoundType.UnableToComply)
         else:
-            startingPoint: ArcadePoint = GamePiece.gamePositionToScreenPosition(enterpriseCoordinates)
-            endPoint:      ArcadePoint = arcadePoint
-
-            results: LineOfSightResponse = self._doWeHaveLineOfSight(quadrant=quadrant, startingPoint=startingPoint, endPoint=endPoint)
+            results: LineOfSightResponse = self._doWeHaveLineOfSight(quadrant=quadrant, startSector=enterpriseCoordinates, endSector=targetCoordinates)
             if results.answer is True:
                 self._doImpulseMove(quadrant=quadrant, enterpriseCoordinates=enterpriseCoordinates, targetCoordinates=targetCoordinates)
             else:
@@ -149,9 +145,8 @@ class EnterpriseMediator(MissesMediator):
     def _doManualImpulseMove(self, deltaX, deltaY, quadrant):
 
         enterpriseSectorCoordinates: Coordinates = self._gameState.currentSectorCoordinates
-        targetSector: Coordinates = Coordinates()
-        targetSector.x = enterpriseSectorCoordinates.x + int(deltaX * 10)
-        targetSector.y = enterpriseSectorCoordinates.y + int(deltaY * 10)
+        targetSector: Coordinates = Coordinates(x=enterpriseSectorCoordinates.x + int(deltaX * 10),
+                                                y=enterpriseSectorCoordinates.y + int(deltaY * 10))
         self._validateCoordinates(coordinate=targetSector,
                                   minX=MIN_SECTOR_X_COORDINATE,
                                   maxX=MAX_SECTOR_X_COORDINATE,
@@ -161,11 +156,7 @@ class EnterpriseMediator(MissesMediator):
             self._messageConsole.displayMessage("WTF.  You are already here!")
             self._soundMachine.playSound(SoundType.UnableToComply)
         else:
-            arcadePoint: ArcadePoint = GamePiece.gamePositionToScreenPosition(gameCoordinates=targetSector)
-            startingPoint: ArcadePoint = GamePiece.gamePositionToScreenPosition(enterpriseSectorCoordinates)
-            endPoint: ArcadePoint = arcadePoint
-
-            results: LineOfSightResponse = self._doWeHaveLineOfSight(quadrant=quadrant, startingPoint=startingPoint, endPoint=endPoint)
+            results: LineOfSightResponse = self._doWeHaveLineOfSight(quadrant=quadrant, startSector=enterpriseSectorCoordinates, endSector=targetSector)
             if results.answer is True:
                 self._doImpulseMove(quadrant=quadrant, enterpriseCoordinates=enterpriseSectorCoordinates, targetCoordinates=targetSector)
             else:
@@ -174,15 +165,14 @@ class EnterpriseMediator(MissesMediator):
     def _doManualWarpMove(self, deltaX: int, deltaY: int):
 
         enterpriseQuadrantCoordinates: Coordinates = self._gameState.currentQuadrantCoordinates
-        targetQuadrantCoordinates:   Coordinates = Coordinates()
-        targetQuadrantCoordinates.x = enterpriseQuadrantCoordinates.x + deltaX
-        targetQuadrantCoordinates.y = enterpriseQuadrantCoordinates.y + deltaY
+        targetQuadrantCoordinates:   Coordinates = Coordinates(x=enterpriseQuadrantCoordinates.x + deltaX,
+                                                               y=enterpriseQuadrantCoordinates.y + deltaY)
 
         self._validateCoordinates(coordinate=targetQuadrantCoordinates,
                                   minX=MIN_QUADRANT_X_COORDINATE,
-                                  maxX=MAX_QUADRANT_X_COORDINATE,
+                                  maxX=self._gameSettings.galaxyColumns - 1,
                                   minY=MIN_QUADRANT_Y_COORDINATE,
-                                  maxY=MAX_QUADRANT_Y_COORDINATE)
+                                  maxY=self._gameSettings.galaxyRows - 1)
 
         self._destinationQuadrantsCoordinates = targetQuadrantCoordinates
         self._warpEffectSection.setup()
@@ -239,22 +229,19 @@ class EnterpriseMediator(MissesMediator):
         self._gameEngine.impulse(newCoordinates=directionData.coordinates, quadrant=quadrant, enterprise=quadrant.enterprise)
         self._soundMachine.playSound(SoundType.EnterpriseBlocked)
 
-    def _doWeHaveLineOfSight(self, quadrant: Quadrant, startingPoint: ArcadePoint, endPoint: ArcadePoint) -> LineOfSightResponse:
+    def _doWeHaveLineOfSight(self, quadrant: Quadrant, startSector: Coordinates, endSector: Coordinates) -> LineOfSightResponse:
         """
         Check to see if planets, stars, other Klingons, Commanders, or StarBases prevent
         the Enterprise from traveling to the selected sector
 
         Args:
-            startingPoint:
+            quadrant:       The current quadrant
+            startSector:    The Enterprise's sector
+            endSector:      The destination sector
 
         Returns:  `True` if no obstructions, else `False`
         """
-        obstacles: SpriteList = SpriteList()
-        if quadrant.hasPlanet is True:
-            obstacles.append(quadrant.planet)
-        obstacles.extend(quadrant.klingons)
-        obstacles.extend(quadrant.commanders)
-        results: LineOfSightResponse = self._hasLineOfSight(startingPoint=startingPoint, endPoint=endPoint, obstacles=obstacles)
+        results: LineOfSightResponse = self._hasLineOfSight(quadrant=quadrant, startSector=startSector, endSector=endSector, obstacleTypes=MOVEMENT_OBSTACLES)
 
         self.logger.info(f'{results=}')
         return results
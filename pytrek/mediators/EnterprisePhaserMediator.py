@@ -1,4 +1,5 @@
 
+from typing import List
 from typing import cast
 
 from logging import Logger
@@ -6,14 +7,14 @@ from logging import getLogger
 
 from arcade import Sprite
 from arcade import SpriteList
-from arcade import load_spritesheet
 
 from pytrek.GameState import GameState
 
-from pytrek.LocateResources import LocateResources
+from pytrek.gui.TextureRegistry import TextureRegistry
 from pytrek.SoundMachine import SoundMachine
 from pytrek.SoundMachine import SoundType
 from pytrek.engine.ArcadePoint import ArcadePoint
+from pytrek.engine.GameEngine import CombatValues
 from pytrek.engine.GameEngine import GameEngine
 
 # from pytrek.gui.MessageConsole import MessageConsole
@@ -85,8 +86,9 @@ class EnterprisePhaserMediator(BaseMediator):
             enterpriseCoordinates: Coordinates = quadrant.enterpriseCoordinates
 
             self._gameState.energy -= phaserPower
-            for enemy in enemies:
-                self._damageEnemy(enemy, enterpriseCoordinates, phaserPower)
+            enemyDrains: CombatValues = self._computeEnemyDrains(enemies, enterpriseCoordinates, phaserPower)
+            for enemy, enemyDrain in zip(enemies, enemyDrains):
+                self._damageEnemy(enemy, float(enemyDrain))
 
                 self._placePhaserBolt(enterprise=quadrant.enterprise, enemy=enemy)
                 self._soundMachine.playSound(soundType=SoundType.PhaserFired)
@@ -115,27 +117,37 @@ class EnterprisePhaserMediator(BaseMediator):
         spriteWidth:  int = 231
         spriteHeight: int = 134
         bareFileName: str = f'PhaserSpriteSheet.png'
-        fqFileName:   str = LocateResources.getImagePath(bareFileName=bareFileName)
 
-        textureList: TextureList = cast(TextureList, load_spritesheet(fqFileName, spriteWidth, spriteHeight, nColumns, tileCount))
+        textureList: TextureList = TextureRegistry().spriteSheet(bareFileName, spriteWidth, spriteHeight, nColumns, tileCount)
 
         return textureList
 
-    def _damageEnemy(self, enemy: Enemy, enterpriseCoordinates: Coordinates, phaserPower: float):
+    def _computeEnemyDrains(self, enemies: Enemies, enterpriseCoordinates: Coordinates, phaserPower: float) -> CombatValues:
         """
-        Appropriately apply phaser damage to this agitator
+        Resolve the whole phaser volley at once
         Args:
-            enemy:      The subversive who is trying to demolish us
+            enemies:                The subversives who are trying to demolish us
             enterpriseCoordinates:  Where the patriot is in the quadrant
-            phaserPower:    How much to "jack" up the insurgent
-        """
+            phaserPower:            How much to "jack" up each insurgent
 
+        Returns:  The power drain on each enemy
+        """
         gameEngine: GameEngine = self._gameEngine
 
-        distance:   float = self._computer.computeQuadrantDistance(startSector=enterpriseCoordinates, endSector=enemy.gameCoordinates)
-        hit:        float = gameEngine.doPhasers(distance=distance, enemyPower=enemy.power, powerAmount=phaserPower)
-        enemyDrain: float = gameEngine.hitThem(distance=distance, hit=hit, enemyPower=enemy.power)
+        distances:   List[float] = [self._computer.computeQuadrantDistance(startSector=enterpriseCoordinates, endSector=enemy.gameCoordinates) for enemy in enemies]
+        enemyPowers: List[float] = [enemy.power for enemy in enemies]
+
+        hits: CombatValues = gameEngine.doPhasersBatch(distances=distances, enemyPowers=enemyPowers, powerAmount=phaserPower)
+
+        return gameEngine.hitThemBatch(distances=distances, hits=hits, enemyPowers=enemyPowers)
 
+    def _damageEnemy(self, enemy: Enemy, enemyDrain: float):
+        """
+        Appropriately apply phaser damage to this agitator
+        Args:
+            enemy:      The subversive who is trying to demolish us
+            enemyDrain: How much to "jack" up the insurgent
+        """
         enemy.power -= enemyDrain
 
         msg: str = f'Unit hit {enemyDrain:.2f} on {enemy.gameCoordinates} available: {enemy.power:.2f}'
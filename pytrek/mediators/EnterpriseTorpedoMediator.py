@@ -9,7 +9,6 @@ from arcade import Sprite
 from arcade import SpriteList
 from arcade import check_for_collision_with_list
 
-from arcade import load_spritesheet
 
 from pytrek.SoundMachine import SoundMachine
 from pytrek.SoundMachine import SoundType
@@ -17,6 +16,7 @@ from pytrek.SoundMachine import SoundType
 from pytrek.gui.gamepieces.base.BaseTorpedoExplosion import TextureList
 
 from pytrek.gui.gamepieces.base.BaseEnemyTorpedo import BaseEnemyTorpedo
+from pytrek.gui.gamepieces.base.SpritePool import SpritePool
 from pytrek.gui.gamepieces.Enterprise import Enterprise
 from pytrek.gui.gamepieces.PhotonTorpedoExplosion import PhotonTorpedoExplosion
 from pytrek.gui.gamepieces.GamePieceTypes import Enemies
@@ -29,10 +29,12 @@ from pytrek.mediators.base.MissesMediator import MissesMediator
 from pytrek.mediators.base.MissesMediator import Misses
 from pytrek.mediators.base.MissesMediator import Torpedoes
 
-from pytrek.LocateResources import LocateResources
+from pytrek.gui.TextureRegistry import TextureRegistry
 
 from pytrek.engine.ArcadePoint import ArcadePoint
+from pytrek.engine.LineOfSight import ENTERPRISE_TORPEDO_OBSTACLES
 
+from pytrek.model.Coordinates import Coordinates
 from pytrek.model.Quadrant import Quadrant
 
 from pytrek.settings.TorpedoSpeeds import TorpedoSpeeds
@@ -51,6 +53,12 @@ class EnterpriseTorpedoMediator(MissesMediator):
         self._explosions: SpriteList = SpriteList()
 
         self._torpedoExplosionTextures: TextureList = self._loadPhotonTorpedoExplosions()
+        #
+        # Torpedoes, explosions and misses come back to these when they leave the board
+        #
+        self._torpedoPool:   SpritePool = SpritePool(factory=PhotonTorpedo)
+        self._explosionPool: SpritePool = SpritePool(factory=lambda: PhotonTorpedoExplosion(textureList=self._torpedoExplosionTextures))
+        self._missPool:      SpritePool = SpritePool(factory=lambda: PhotonTorpedoMiss(placedTime=self._gameEngine.gameClock))
 
     @property
     def torpedoExplosionTextures(self) -> TextureList:
@@ -90,15 +98,13 @@ class EnterpriseTorpedoMediator(MissesMediator):
             self._messageConsole.displayMessage("Don't waste torpedoes.  Nothing to fire at")
             self._soundMachine.playSound(SoundType.Inaccurate)
         else:
-            startingPoint: ArcadePoint = ArcadePoint(x=enterprise.center_x, y=enterprise.center_y)
+            startSector: Coordinates = self._gameState.currentSectorCoordinates
             #
             #  Only fire as many torpedoes as we have available
             #  TODO:  Fire only 'N' torpedoes at randomly selected enemies
             #
             for enemy in enemies:
-                endPoint: ArcadePoint = ArcadePoint(x=enemy.center_x, y=enemy.center_y)
-
-                clearLineOfSight: LineOfSightResponse = self._doWeHaveLineOfSight(quadrant, startingPoint, endPoint)
+                clearLineOfSight: LineOfSightResponse = self._doWeHaveLineOfSight(quadrant, startSector, enemy.gameCoordinates)
                 if clearLineOfSight.answer is True:
                     self._pointAtEnemy(enterprise=enterprise, enemy=enemy)
                     if self._intelligence.rand() <= self._gameSettings.photonTorpedoMisfireRate:
@@ -151,7 +157,8 @@ class EnterpriseTorpedoMediator(MissesMediator):
             torpedoDud: PhotonTorpedo = cast(PhotonTorpedo, baseTorpedo)
             self._messageConsole.displayMessage(f'{torpedoDud.id} missed {torpedoDud.firedAt} !!!!')
 
-            miss: PhotonTorpedoMiss = PhotonTorpedoMiss(placedTime=self._gameEngine.gameClock)
+            miss: PhotonTorpedoMiss = cast(PhotonTorpedoMiss, self._missPool.acquire())
+            miss.reset(placedTime=self._gameEngine.gameClock)
             self._placeMiss(quadrant=quadrant, torpedoDud=torpedoDud, miss=miss)
             self._soundMachine.playSound(SoundType.PhotonTorpedoMisfire)
             self._misses.append(miss)
@@ -169,7 +176,9 @@ class EnterpriseTorpedoMediator(MissesMediator):
         klingonPoint:    ArcadePoint = ArcadePoint(x=enemy.center_x, y=enemy.center_y)
 
         speeds: TorpedoSpeeds      = self._intelligence.getTorpedoSpeeds(playerType=self._gameState.playerType)
-        torpedo: PhotonTorpedo = PhotonTorpedo(speed=speeds.enterprise)
+        torpedo: PhotonTorpedo = cast(PhotonTorpedo, self._torpedoPool.acquire())
+
+        torpedo.reset(speed=speeds.enterprise)
 
         torpedo.center_x = enterprisePoint.x
         torpedo.center_y = enterprisePoint.y
@@ -191,36 +200,33 @@ class EnterpriseTorpedoMediator(MissesMediator):
         spriteWidth:  int = 128
         spriteHeight: int = 128
         bareFileName: str = f'PhotonTorpedoExplosionSpriteSheet.png'
-        fqFileName:   str = LocateResources.getImagePath(bareFileName=bareFileName)
 
-        explosions: TextureList = cast(TextureList, load_spritesheet(fqFileName, spriteWidth, spriteHeight, nColumns, tileCount))
+        explosions: TextureList = TextureRegistry().spriteSheet(bareFileName, spriteWidth, spriteHeight, nColumns, tileCount)
 
         return explosions
 
-    def _doWeHaveLineOfSight(self, quadrant: Quadrant, startingPoint: ArcadePoint, endPoint: ArcadePoint) -> LineOfSightResponse:
+    def _doWeHaveLineOfSight(self, quadrant: Quadrant, startSector: Coordinates, endSector: Coordinates) -> LineOfSightResponse:
         """
         Check to see if a planet or a StarBase prevents
         the Enterprise from shooting at the enemy
 
         Args:
-            startingPoint:
+            quadrant:       The current quadrant
+            startSector:    The Enterprise's sector
+            endSector:      The enemy's sector
 
         Returns:  `True` if no obstructions, else `False`
         """
-        obstacles: SpriteList = SpriteList()
-        if quadrant.hasPlanet is True:
-            obstacles.append(quadrant.planet)
-        if quadrant.hasStarBase is True:
-            obstacles.append(quadrant.starBase)
-
-        results: LineOfSightResponse = self._hasLineOfSight(startingPoint=startingPoint, endPoint=endPoint, obstacles=obstacles)
+        results: LineOfSightResponse = self._hasLineOfSight(quadrant=quadrant, startSector=startSector, endSector=endSector,
+                                                            obstacleTypes=ENTERPRISE_TORPEDO_OBSTACLES)
 
         self.logger.info(f'{results=}')
         return results
 
     def __doExplosion(self, killerTorpedo: PhotonTorpedo):
 
-        explosion: PhotonTorpedoExplosion = PhotonTorpedoExplosion(textureList=self._torpedoExplosionTextures)
+        explosion: PhotonTorpedoExplosion = cast(PhotonTorpedoExplosion, self._explosionPool.acquire())
+        explosion.reset()
         explosion.center_x = killerTorpedo.center_x
         explosion.center_y = killerTorpedo.center_y
 
@@ -7,8 +7,8 @@ from arcade import draw_text
 
 from codeallybasic.SingletonV3 import SingletonV3
 
-from pytrek.Constants import GALAXY_COLUMNS
-from pytrek.Constants import GALAXY_ROWS
+from pytrek.Constants import GALAXY_VIEW_COLUMNS
+from pytrek.Constants import GALAXY_VIEW_ROWS
 from pytrek.Constants import SUPER_NOVA_INDICATOR
 
 from pytrek.engine.ArcadePoint import ArcadePoint
@@ -31,16 +31,26 @@ class GalaxyViewMediator(metaclass=SingletonV3):
         self._galaxy:   Galaxy   = Galaxy()
 
     def draw(self, centerCoordinates: Coordinates):
-
-        for y in range(GALAXY_ROWS):
-            for x in range(GALAXY_COLUMNS):
-                coordinates: Coordinates = Coordinates(x=x, y=y)
+        """
+        Draws the part of the galaxy around the Enterprise that fits in the view;  That is,
+        the whole galaxy unless it is bigger than the view.  So the drawing cost does not
+        depend on the galaxy size
+
+        Args:
+            centerCoordinates:  The Enterprise's quadrant coordinates
+        """
+        viewOrigin: Coordinates = self.computeViewOrigin(centerCoordinates=centerCoordinates)
+
+        for y in range(min(GALAXY_VIEW_ROWS, self._galaxy.rows)):
+            for x in range(min(GALAXY_VIEW_COLUMNS, self._galaxy.columns)):
+                coordinates:     Coordinates = Coordinates(x=viewOrigin.x + x, y=viewOrigin.y + y)
+                viewCoordinates: Coordinates = Coordinates(x=x, y=y)
                 quadrant: Quadrant = self._galaxy.getQuadrant(quadrantCoordinates=coordinates)
 
                 if quadrant.scanned is True:
                     if centerCoordinates == coordinates:
                         contents: str = 'E'
-                        arcadePoint: ArcadePoint = Computer.gamePositionToScreenPoint(coordinates)
+                        arcadePoint: ArcadePoint = Computer.gamePositionToScreenPoint(viewCoordinates)
                         arcadeX: float = arcadePoint.x + 2
                         arcadeY: float = arcadePoint.y + 2
                     else:
@@ -51,7 +61,7 @@ class GalaxyViewMediator(metaclass=SingletonV3):
                                                                         commanderCount=quadrant.commanderCount,
                                                                         hasStarBase=quadrant.hasStarBase)
 
-                        arcadePoint = Computer.gamePositionToScreenPoint(coordinates)
+                        arcadePoint = Computer.gamePositionToScreenPoint(viewCoordinates)
                         arcadeX = arcadePoint.x
                         arcadeY = arcadePoint.y
 
@@ -59,3 +69,20 @@ class GalaxyViewMediator(metaclass=SingletonV3):
                             arcadeX -= SUPER_NOVA_X_ADJUSTMENT
 
                     draw_text(contents, arcadeX, arcadeY, color.WHITE, 14)
+
+    def computeViewOrigin(self, centerCoordinates: Coordinates) -> Coordinates:
+        """
+        Centers the view on the Enterprise but keeps it inside the galaxy
+
+        Args:
+            centerCoordinates:  The Enterprise's quadrant coordinates
+
+        Returns:  The galaxy coordinates of the view's top left quadrant
+        """
+        maxX: int = max(0, self._galaxy.columns - GALAXY_VIEW_COLUMNS)
+        maxY: int = max(0, self._galaxy.rows    - GALAXY_VIEW_ROWS)
+
+        x: int = min(max(0, centerCoordinates.x - GALAXY_VIEW_COLUMNS // 2), maxX)
+        y: int = min(max(0, centerCoordinates.y - GALAXY_VIEW_ROWS // 2),    maxY)
+
+        return Coordinates(x=x, y=y)
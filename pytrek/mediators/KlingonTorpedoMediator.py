@@ -4,11 +4,12 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
-from arcade import load_texture
+from arcade import Texture
 
 from pytrek.gui.gamepieces.base.BaseEnemyTorpedo import BaseEnemyTorpedo
 from pytrek.gui.gamepieces.base.BaseMiss import BaseMiss
 from pytrek.gui.gamepieces.base.BaseTorpedoExplosion import BaseTorpedoExplosion
+from pytrek.gui.gamepieces.base.BaseTorpedoFollower import BaseTorpedoFollower
 from pytrek.gui.gamepieces.base.BaseAnimator import TextureList
 
 from pytrek.gui.gamepieces.Enterprise import Enterprise
@@ -17,6 +18,7 @@ from pytrek.gui.gamepieces.klingon.Klingon import Klingon
 
 from pytrek.gui.gamepieces.klingon.KlingonTorpedo import KlingonTorpedo
 from pytrek.gui.gamepieces.klingon.KlingonTorpedoExplosion import KlingonTorpedoExplosion
+from pytrek.gui.gamepieces.klingon.KlingonTorpedoFollower import KlingonTorpedoFollower
 from pytrek.gui.gamepieces.klingon.KlingonTorpedoExplosionColor import KlingonTorpedoExplosionColor
 from pytrek.gui.gamepieces.klingon.KlingonTorpedoMiss import KlingonTorpedoMiss
 
@@ -26,7 +28,7 @@ from pytrek.mediators.base.BaseTorpedoMediator import BaseTorpedoMediator
 from pytrek.SoundMachine import SoundMachine
 from pytrek.SoundMachine import SoundType
 
-from pytrek.LocateResources import LocateResources
+from pytrek.gui.TextureRegistry import TextureRegistry
 
 from pytrek.engine.ArcadePoint import ArcadePoint
 
@@ -92,14 +94,28 @@ class KlingonTorpedoMediator(BaseTorpedoMediator):
         for explosionColor in KlingonTorpedoExplosionColor:
 
             bareFileName: str = f'KlingonTorpedoExplosion{explosionColor.value}.png'
-            fqFileName: str = LocateResources.getImagePath(bareFileName=bareFileName)
-
-            texture = load_texture(fqFileName)
+            texture: Texture = TextureRegistry().texture(bareFileName=bareFileName)
 
             textureList.append(texture)
 
         return textureList
 
+    def _createTorpedo(self) -> BaseEnemyTorpedo:
+        """
+        Implement empty base class method
+
+        Returns:  A new torpedo of the correct type
+        """
+        return KlingonTorpedo()
+
+    def _createTorpedoFollower(self) -> BaseTorpedoFollower:
+        """
+        Implement empty base class method
+
+        Returns:  A new torpedo follower of the correct type
+        """
+        return KlingonTorpedoFollower()
+
     def _getTorpedoToFire(self, enemy: Enemy, enterprise: Enterprise) -> BaseEnemyTorpedo:
         """
 
@@ -118,7 +134,7 @@ class KlingonTorpedoMediator(BaseTorpedoMediator):
 
         speeds: TorpedoSpeeds = self._intelligence.getTorpedoSpeeds(playerType=self._gameState.playerType)
 
-        klingonTorpedo: KlingonTorpedo = KlingonTorpedo(speed=speeds.klingon)
+        klingonTorpedo: KlingonTorpedo = cast(KlingonTorpedo, self._acquireTorpedo(speed=speeds.klingon))
 
         klingonTorpedo.center_x = klingonPoint.x
         klingonTorpedo.center_y = klingonPoint.y
@@ -126,23 +142,21 @@ class KlingonTorpedoMediator(BaseTorpedoMediator):
         klingonTorpedo.destinationPoint = enterprisePoint
         klingonTorpedo.firedFromPosition = enemy.gameCoordinates
         klingonTorpedo.firedBy = enemy.id
-        klingonTorpedo.followers = self.torpedoFollowers
 
         return klingonTorpedo
 
-    def _getTorpedoExplosion(self) -> BaseTorpedoExplosion:
+    def _createTorpedoExplosion(self) -> BaseTorpedoExplosion:
         """
-        Must be implemented by subclass to create correct type of torpedo explosion
-
-        Returns: An explosion of the correct type
+        Implement empty base class method
 
+        Returns: A new explosion of the correct type
         """
         return KlingonTorpedoExplosion(textureList=self._explosionTextures)
 
-    def _getTorpedoMiss(self) -> BaseMiss:
+    def _createTorpedoMiss(self) -> BaseMiss:
         """
         Implement empty base class method
 
-        Returns:  An appropriate 'miss' sprite
+        Returns:  A new 'miss' sprite of the correct type
         """
         return KlingonTorpedoMiss(placedTime=self._gameEngine.gameClock)
@@ -3,6 +3,7 @@ from typing import cast
 
 from logging import Logger
 from logging import getLogger
+from logging import DEBUG
 
 from codeallybasic.SingletonV3 import SingletonV3
 
@@ -69,7 +70,8 @@ class LongRangeSensorScanMediator(metaclass=SingletonV3):
         draw_text("E", graphicCenterX - 4, graphicCenterY - 8, color.YELLOW, LR_SCAN_FONT_SIZE)    # Adjust for font size
 
         for scanCoordinates in coordinatesList:
-            self.logger.debug(f'{scanCoordinates=}')
+            if self.logger.isEnabledFor(DEBUG):
+                self.logger.debug(f'{scanCoordinates=}')
             self._drawQuadrantContents(scanCoordinates=scanCoordinates, centerX=graphicCenterX, centerY=graphicCenterY)
 
     def _setKeywordParameters(self, **kwargs):
@@ -1,6 +1,4 @@
 
-from typing import cast
-
 from logging import Logger
 from logging import getLogger
 from logging import DEBUG
@@ -9,21 +7,17 @@ from arcade import SpriteList
 
 from codeallybasic.SingletonV3 import SingletonV3
 
-from pytrek.Constants import QUADRANT_COLUMNS
-from pytrek.Constants import QUADRANT_ROWS
-
 from pytrek.GameState import GameState
 from pytrek.SoundMachine import SoundMachine
 from pytrek.SoundMachine import SoundType
 
 from pytrek.engine.Computer import Computer
+from pytrek.engine.FrameProfiler import FrameProfiler
 from pytrek.engine.ArcadePoint import ArcadePoint
 from pytrek.engine.GameEngine import GameEngine
 from pytrek.engine.Intelligence import Intelligence
 from pytrek.engine.ShipCondition import ShipCondition
 
-from pytrek.gui.gamepieces.base.BaseGamePiece import BaseGamePiece
-
 from pytrek.gui.gamepieces.commander.Commander import Commander
 
 from pytrek.gui.gamepieces.klingon.Klingon import Klingon
@@ -41,8 +35,6 @@ from pytrek.mediators.SuperCommanderTorpedoMediator import SuperCommanderTorpedo
 
 from pytrek.model.Coordinates import Coordinates
 from pytrek.model.Quadrant import Quadrant
-from pytrek.model.Sector import Sector
-from pytrek.model.SectorType import SectorType
 
 from pytrek.settings.GameSettings import GameSettings
 
@@ -82,6 +74,12 @@ class QuadrantMediator(metaclass=SingletonV3):
         self._commanderList:      SpriteList = SpriteList()
         self._superCommanderList: SpriteList = SpriteList()
 
+        frameProfiler: FrameProfiler = FrameProfiler()
+        for weaponMediator in (self._ktm, self._ctm, self._ptm, self._stm, self._epm):
+            frameProfiler.instrument(target=weaponMediator, methodNames=['update', 'draw'])
+        for enemyMediator in (self._km, self._cm, self._scm):
+            frameProfiler.instrument(target=enemyMediator, methodNames=['moveEnemies'])
+
     @property
     def playerList(self) -> SpriteList:
         return self._playerList
@@ -168,6 +166,8 @@ class QuadrantMediator(metaclass=SingletonV3):
         playerList: SpriteList = SpriteList()
         playerList.append(enterprise)
 
+        quadrant.materialize()
+
         self._gameState.currentSectorCoordinates = currentSectorCoordinates
         quadrant.placeEnterprise(enterprise, currentSectorCoordinates)
 
@@ -197,7 +197,7 @@ class QuadrantMediator(metaclass=SingletonV3):
 
     def update(self, quadrant: Quadrant):
 
-        if self.logger.getEffectiveLevel() == DEBUG:
+        if self.logger.isEnabledFor(DEBUG):
             self.logger.debug(f'{quadrant.enterpriseCoordinates=}')
             if quadrant.klingonCount > 0:
                 self.logger.debug(f'{quadrant.klingonCount=}')
@@ -213,44 +213,18 @@ class QuadrantMediator(metaclass=SingletonV3):
         if quadrant.klingonCount == 0 and quadrant.commanderCount == 0 and quadrant.commanderCount == 0:
             self._gameState.shipCondition = ShipCondition.Green
 
-    def _updateQuadrant(self, quadrant):
-        for y in range(QUADRANT_ROWS):
-            for x in range(QUADRANT_COLUMNS):
-
-                sector: Sector = quadrant.getSector(Coordinates(x, y))
-                self.logger.debug(f'{sector}')
-
-                gamePiece:  BaseGamePiece = sector.sprite
-                sectorType: SectorType    = sector.type
-
-                if sectorType != SectorType.EMPTY:
-                    if sectorType == SectorType.KLINGON:
-                        self._km.update(quadrant=quadrant, klingon=cast(Klingon, gamePiece))
-                    elif self._noUpdateSector(sectorType=sectorType) is True:
-                        pass
-                    elif sectorType == SectorType.COMMANDER:
-                        self._cm.update(quadrant=quadrant, commander=cast(Commander, gamePiece))
-                    elif sectorType == SectorType.SUPER_COMMANDER:
-                        self._scm.update(quadrant=quadrant, superCommander=cast(SuperCommander, gamePiece))
-                    else:
-                        assert False, 'Bad Game Piece'
-
-    def _noUpdateSector(self, sectorType: SectorType) -> bool:
+    def _updateQuadrant(self, quadrant: Quadrant):
         """
-        Some sector have sprites that do not move or are transient and handled by the mediators;
-        Args:
-            sectorType:
+        Only the enemies move on their own;  The quadrant keeps them in its enemy lists as they
+        are added and as they die, so the cost scales with the number of enemies rather than sectors.
+        The enemy mediators only wake the enemies that are due to move
 
-        Returns:   True for the mediator handled sectors or for static sprites
+        Args:
+            quadrant:  The current quadrant
         """
-        ans: bool = False
-
-        if sectorType == SectorType.PLANET or sectorType == SectorType.KLINGON_TORPEDO_MISS or \
-                sectorType == SectorType.ENTERPRISE_TORPEDO_MISS or sectorType == SectorType.STARBASE or \
-                sectorType == SectorType.ENTERPRISE:
-            ans = True
-
-        return ans
+        self._km.moveEnemies(quadrant=quadrant, enemies=quadrant.klingons)
+        self._cm.moveEnemies(quadrant=quadrant, enemies=quadrant.commanders)
+        self._scm.moveEnemies(quadrant=quadrant, enemies=quadrant.superCommanders)
 
     def _makeEnemySpriteLists(self, quadrant: Quadrant):
         """
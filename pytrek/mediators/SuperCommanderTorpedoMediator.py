@@ -4,7 +4,6 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
-from arcade import load_spritesheet
 
 from pytrek.SoundMachine import SoundMachine
 from pytrek.SoundMachine import SoundType
@@ -15,10 +14,12 @@ from pytrek.gui.gamepieces.base.BaseEnemyTorpedo import BaseEnemyTorpedo
 from pytrek.gui.gamepieces.base.BaseMiss import BaseMiss
 from pytrek.gui.gamepieces.base.BaseAnimator import TextureList
 from pytrek.gui.gamepieces.base.BaseTorpedoExplosion import BaseTorpedoExplosion
+from pytrek.gui.gamepieces.base.BaseTorpedoFollower import BaseTorpedoFollower
 
 from pytrek.gui.gamepieces.supercommander.SuperCommander import SuperCommander
 from pytrek.gui.gamepieces.supercommander.SuperCommanderTorpedo import SuperCommanderTorpedo
 from pytrek.gui.gamepieces.supercommander.SuperCommanderTorpedoExplosion import SuperCommanderTorpedoExplosion
+from pytrek.gui.gamepieces.supercommander.SuperCommanderTorpedoFollower import SuperCommanderTorpedoFollower
 from pytrek.gui.gamepieces.supercommander.SuperCommanderTorpedoMiss import SuperCommanderTorpedoMiss
 
 from pytrek.mediators.base.MissesMediator import Misses
@@ -30,7 +31,7 @@ from pytrek.settings.TorpedoSpeeds import TorpedoSpeeds
 
 from pytrek.engine.ArcadePoint import ArcadePoint
 
-from pytrek.LocateResources import LocateResources
+from pytrek.gui.TextureRegistry import TextureRegistry
 
 
 class SuperCommanderTorpedoMediator(BaseTorpedoMediator):
@@ -72,6 +73,22 @@ class SuperCommanderTorpedoMediator(BaseTorpedoMediator):
         self._handleTorpedoMisses(quadrant, enemies=quadrant.superCommanders)
         self._handleMissRemoval(quadrant, cast(Misses, self._misses))
 
+    def _createTorpedo(self) -> BaseEnemyTorpedo:
+        """
+        Implement empty base class method
+
+        Returns:  A new torpedo of the correct type
+        """
+        return SuperCommanderTorpedo()
+
+    def _createTorpedoFollower(self) -> BaseTorpedoFollower:
+        """
+        Implement empty base class method
+
+        Returns:  A new torpedo follower of the correct type
+        """
+        return SuperCommanderTorpedoFollower()
+
     def _getTorpedoToFire(self, enemy: Enemy, enterprise: Enterprise) -> BaseEnemyTorpedo:
         """
         Must be implemented by subclass to create correct type of torpedo
@@ -87,7 +104,7 @@ class SuperCommanderTorpedoMediator(BaseTorpedoMediator):
 
         speeds: TorpedoSpeeds = self._intelligence.getTorpedoSpeeds(playerType=self._gameState.playerType)
 
-        sCommanderTorpedo: SuperCommanderTorpedo = SuperCommanderTorpedo(speed=speeds.superCommander)
+        sCommanderTorpedo: SuperCommanderTorpedo = cast(SuperCommanderTorpedo, self._acquireTorpedo(speed=speeds.superCommander))
 
         sCommanderTorpedo.center_x = sCommanderPoint.x
         sCommanderTorpedo.center_y = sCommanderPoint.y
@@ -95,15 +112,14 @@ class SuperCommanderTorpedoMediator(BaseTorpedoMediator):
         sCommanderTorpedo.destinationPoint  = enterprisePoint
         sCommanderTorpedo.firedFromPosition = enemy.gameCoordinates
         sCommanderTorpedo.firedBy   = enemy.id
-        sCommanderTorpedo.followers = self.torpedoFollowers
 
         return sCommanderTorpedo
 
-    def _getTorpedoMiss(self) -> BaseMiss:
+    def _createTorpedoMiss(self) -> BaseMiss:
         """
         Implement empty base class method
 
-        Returns:  An appropriate 'miss' sprite
+        Returns:  A new 'miss' sprite of the correct type
         """
         return SuperCommanderTorpedoMiss(placedTime=self._gameEngine.gameClock)
 
@@ -125,12 +141,11 @@ class SuperCommanderTorpedoMediator(BaseTorpedoMediator):
         """
         pass
 
-    def _getTorpedoExplosion(self) -> BaseTorpedoExplosion:
+    def _createTorpedoExplosion(self) -> BaseTorpedoExplosion:
         """
-        We must implement this
-
-        Returns: An explosion of the correct type
+        Implement empty base class method
 
+        Returns: A new explosion of the correct type
         """
         return SuperCommanderTorpedoExplosion(textureList=self._explosionTextures)
 
@@ -141,8 +156,7 @@ class SuperCommanderTorpedoMediator(BaseTorpedoMediator):
         spriteWidth:  int = 32
         spriteHeight: int = 32
         bareFileName: str = f'SuperCommanderTorpedoExplosionSpriteSheet.png'
-        fqFileName:   str = LocateResources.getImagePath(bareFileName=bareFileName)
 
-        textureList: TextureList = cast(TextureList, load_spritesheet(fqFileName, spriteWidth, spriteHeight, nColumns, tileCount))
+        textureList: TextureList = TextureRegistry().spriteSheet(bareFileName, spriteWidth, spriteHeight, nColumns, tileCount)
 
         return textureList
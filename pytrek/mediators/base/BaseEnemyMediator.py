@@ -4,12 +4,12 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
-from random import choice as randomChoice
-
 from pytrek.engine.ArcadePoint import ArcadePoint
 from pytrek.engine.Direction import Direction
+from pytrek.engine.EnemyScheduler import EnemyScheduler
 
 from pytrek.gui.gamepieces.base.BaseEnemy import BaseEnemy
+from pytrek.gui.gamepieces.GamePieceTypes import Enemies
 from pytrek.gui.gamepieces.GamePiece import GamePiece
 
 from pytrek.model.Coordinates import Coordinates
@@ -22,17 +22,32 @@ from pytrek.mediators.base.MissesMediator import MissesMediator
 
 class BaseEnemyMediator(MissesMediator):
 
+    MAXIMUM_MOVE_ATTEMPTS: int = 24      # An enemy boxed in by its neighbors stays put
+
     def __init__(self):
 
         self._baseEnemyMediatorLogger: Logger = getLogger(__name__)
         super().__init__()
 
+        self._moveScheduler: EnemyScheduler = EnemyScheduler(dueTime=lambda enemy: enemy.timeSinceMovement + enemy.moveInterval)
+
     def _playMoveSound(self):
         """
         Must be implemented by subclass, or you will hear nada` if enemy moves
         """
         pass
 
+    def moveEnemies(self, quadrant: Quadrant, enemies: Enemies):
+        """
+        Move only the enemies whose move interval has elapsed
+
+        Args:
+            quadrant:   The quadrant the enemies are in
+            enemies:    The enemies this mediator moves
+        """
+        for enemy in self._moveScheduler.dueEnemies(enemies=enemies, currentTime=self._gameEngine.gameClock):
+            self.moveEnemy(quadrant=quadrant, enemy=enemy)
+
     def moveEnemy(self, quadrant: Quadrant, enemy: BaseEnemy):
 
         currentTime:    float = self._gameEngine.gameClock
@@ -41,6 +56,9 @@ class BaseEnemyMediator(MissesMediator):
 
             oldPosition: Coordinates = enemy.gameCoordinates
             newPosition: Coordinates = self._keepTryingToMoveUntilValid(quadrant, oldPosition)
+            if newPosition == oldPosition:
+                enemy.timeSinceMovement = currentTime
+                return
 
             self._baseEnemyMediatorLogger.info(f'Enemy {enemy} moves from {oldPosition} to {newPosition}')
             self._enemyMovedUpdateQuadrant(quadrant=quadrant, enemy=enemy, newSectorCoordinates=newPosition, oldSectorCoordinates=oldPosition)
@@ -61,26 +79,31 @@ class BaseEnemyMediator(MissesMediator):
             oldSectorCoordinates:    new sector coordinates
 
         """
-        oldSector: Sector = quadrant.getSector(sectorCoordinates=oldSectorCoordinates)
+        oldSector:  Sector     = quadrant.getSector(sectorCoordinates=oldSectorCoordinates)
+        sectorType: SectorType = oldSector.type
 
         oldSector.type   = SectorType.EMPTY
         oldSector.sprite = cast(GamePiece, None)
 
         newSector: Sector = quadrant.getSector(sectorCoordinates=newSectorCoordinates)
 
-        newSector.type   = SectorType.COMMANDER
+        newSector.type   = sectorType
         newSector.sprite = enemy
 
-    def _keepTryingToMoveUntilValid(self, quadrant: Quadrant, oldPosition: Coordinates):
-
-        newPosition: Coordinates = self._evade(currentLocation=oldPosition)
+    def _keepTryingToMoveUntilValid(self, quadrant: Quadrant, oldPosition: Coordinates) -> Coordinates:
+        """
+        Args:
+            quadrant:       The quadrant the enemy is in
+            oldPosition:    Where the enemy is
 
-        while True:
+        Returns:  An empty neighboring sector;  `oldPosition` if none turned up in `MAXIMUM_MOVE_ATTEMPTS` tries
+        """
+        for attempt in range(BaseEnemyMediator.MAXIMUM_MOVE_ATTEMPTS):
+            newPosition: Coordinates = self._evade(currentLocation=oldPosition)
             if self._checkEnemyMoveIsValid(quadrant=quadrant, targetCoordinates=newPosition):
-                break
-            else:
-                newPosition = self._evade(currentLocation=oldPosition)
-        return newPosition
+                return newPosition
+
+        return oldPosition
 
     def _checkEnemyMoveIsValid(self, quadrant: Quadrant, targetCoordinates: Coordinates) -> bool:
 
@@ -126,4 +149,4 @@ class BaseEnemyMediator(MissesMediator):
 
         Returns:  A random direction
         """
-        return randomChoice(list(Direction))
+        return self._intelligence.randomDirection()
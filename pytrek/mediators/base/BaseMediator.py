@@ -2,23 +2,17 @@
 from logging import Logger
 from logging import getLogger
 
-from collections import namedtuple
-
-from arcade import PointList
 from arcade import Sprite
-from arcade import SpriteList
-
-# noinspection PyPackageRequirements
-from shapely.geometry import LineString
-# noinspection PyPackageRequirements
-from shapely.geometry import Polygon
 
 from pytrek.GameState import GameState
 from pytrek.engine.ArcadePoint import ArcadePoint
 from pytrek.engine.Computer import Computer
+from pytrek.engine.LineOfSight import LineOfSight
+from pytrek.engine.LineOfSight import LineOfSightResponse
+from pytrek.engine.LineOfSight import ObstacleTypes
 from pytrek.gui.gamepieces.GamePiece import GamePiece
-
-LineOfSightResponse = namedtuple('LineOfSightResponse', 'answer, obstacle')
+from pytrek.model.Coordinates import Coordinates
+from pytrek.model.Quadrant import Quadrant
 
 
 class BaseMediator:
@@ -31,6 +25,8 @@ class BaseMediator:
         self._computer:           Computer  = Computer()
         self._gameState:          GameState = GameState()
 
+        self._lineOfSight: LineOfSight = LineOfSight()
+
     def _pointAtTarget(self, shooter: Sprite, target: GamePiece, rotationAngle: int = 125):
 
         currentPoint:     ArcadePoint = ArcadePoint(x=shooter.center_x, y=shooter.center_y)
@@ -41,26 +37,17 @@ class BaseMediator:
 
         self._baseMediatorLogger.info(f'{normalAngle=} -  {shooter.angle=}')
 
-    def _hasLineOfSight(self, startingPoint: ArcadePoint, endPoint: ArcadePoint, obstacles: SpriteList) -> LineOfSightResponse:
+    def _hasLineOfSight(self, quadrant: Quadrant, startSector: Coordinates, endSector: Coordinates, obstacleTypes: ObstacleTypes) -> LineOfSightResponse:
         """
         This is my replacement for Arcade's has_line_of_sight();  The function is only returning a boolean and not the sprite
         or sprite's that are obstacles
 
         Args:
-            startingPoint:
-            endPoint:
-            obstacles:
+            quadrant:       The quadrant we are in
+            startSector:    Where the line starts
+            endSector:      Where the line ends
+            obstacleTypes:  The sector types that block the line
 
         Returns:  A LineOfSightResponse named tuple
         """
-        lineOfSight: LineString = LineString([(startingPoint.x, startingPoint.y), (endPoint.x, endPoint.y)])
-
-        for obstacle in obstacles:
-
-            pointList: PointList = obstacle.get_adjusted_hit_box()
-            polygon:   Polygon   = Polygon(pointList)
-            ans: bool = polygon.crosses(lineOfSight)
-            if ans is True:
-                return LineOfSightResponse(answer=False, obstacle=obstacle)
-
-        return LineOfSightResponse(answer=True, obstacle=None)
+        return self._lineOfSight.hasLineOfSight(quadrant=quadrant, startSector=startSector, endSector=endSector, obstacleTypes=obstacleTypes)
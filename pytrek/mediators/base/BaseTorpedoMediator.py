@@ -1,5 +1,7 @@
 
+from typing import Dict
 from typing import List
+from typing import NewType
 from typing import cast
 
 from logging import Logger
@@ -16,8 +18,9 @@ from pytrek.GameState import GameState
 from pytrek.SoundMachine import SoundMachine
 from pytrek.SoundMachine import SoundType
 
-from pytrek.engine.ArcadePoint import ArcadePoint
+from pytrek.engine.EnemyScheduler import EnemyScheduler
 from pytrek.engine.ShieldHitData import ShieldHitData
+from pytrek.engine.LineOfSight import ENEMY_TORPEDO_OBSTACLES
 from pytrek.engine.ShipCondition import ShipCondition
 
 from pytrek.engine.devices.DeviceManager import DeviceManager
@@ -28,20 +31,26 @@ from pytrek.gui.gamepieces.base.BaseEnemyTorpedo import BaseEnemyTorpedo
 from pytrek.gui.gamepieces.base.BaseTorpedoExplosion import BaseTorpedoExplosion
 from pytrek.gui.gamepieces.base.BaseTorpedoExplosion import TextureList
 from pytrek.gui.gamepieces.base.BaseTorpedoFollower import BaseTorpedoFollower
+from pytrek.gui.gamepieces.base.BaseTorpedoFollower import TorpedoFollowers
 from pytrek.gui.gamepieces.base.BaseMiss import BaseMiss
+from pytrek.gui.gamepieces.base.SpritePool import SpritePool
 
 from pytrek.gui.gamepieces.Enterprise import Enterprise
 from pytrek.gui.gamepieces.GamePieceTypes import Enemies
 from pytrek.gui.gamepieces.GamePieceTypes import Enemy
+from pytrek.gui.gamepieces.GamePieceTypes import EnemyTorpedoId
 
 from pytrek.mediators.base.BaseMediator import LineOfSightResponse
 from pytrek.mediators.base.MissesMediator import MissesMediator
 from pytrek.mediators.base.MissesMediator import Torpedoes
 
+from pytrek.model.Coordinates import Coordinates
 from pytrek.model.Quadrant import Quadrant
 
 from pytrek.Constants import MILLISECONDS
 
+FollowersByTorpedo = NewType('FollowersByTorpedo', Dict[EnemyTorpedoId, TorpedoFollowers])
+
 
 class MyMetaBaseMediator(ABCMeta, type(MissesMediator)):        # type: ignore
     """
@@ -64,11 +73,22 @@ class BaseTorpedoMediator(MissesMediator):
 
         self._torpedoes:        SpriteList = SpriteList()
         self._explosions:       SpriteList = SpriteList()
-        self._torpedoFollowers: SpriteList = SpriteList(is_static=True)
+        self._torpedoFollowers: SpriteList = SpriteList(use_spatial_hash=False)    # Appended to as torpedoes fly;  Never collided with
         self._misses:           SpriteList = SpriteList()
 
+        self._followersByTorpedo: FollowersByTorpedo = FollowersByTorpedo({})
+        #
+        # Shots, their followers, explosions and misses come back to these when they leave the board
+        #
+        self._torpedoPool:   SpritePool = SpritePool(factory=self._createTorpedo)
+        self._followerPool:  SpritePool = SpritePool(factory=self._createTorpedoFollower)
+        self._explosionPool: SpritePool = SpritePool(factory=self._createTorpedoExplosion)
+        self._missPool:      SpritePool = SpritePool(factory=self._createTorpedoMiss)
+
         self._lastTimeCheck:  float = self._gameEngine.gameClock / MILLISECONDS
 
+        self._firingScheduler: EnemyScheduler = EnemyScheduler(dueTime=lambda enemy: enemy.lastTimeCheck + enemy.firingInterval)
+
         self._baseTorpedoMediatorLogger.info(f'{self._lastTimeCheck=}')
 
     @property
@@ -131,6 +151,56 @@ class BaseTorpedoMediator(MissesMediator):
         """
         return cast(BaseEnemyTorpedo, None)
 
+    def _createTorpedo(self) -> BaseEnemyTorpedo:
+        """
+        Must be implemented by subclass to construct the correct type of torpedo for the pool
+
+        Returns:  A new torpedo
+        """
+        return cast(BaseEnemyTorpedo, None)
+
+    def _createTorpedoFollower(self) -> BaseTorpedoFollower:
+        """
+        Must be implemented by subclass to construct the correct type of follower for the pool
+
+        Returns:  A new torpedo follower
+        """
+        return cast(BaseTorpedoFollower, None)
+
+    def _createTorpedoExplosion(self) -> BaseTorpedoExplosion:
+        """
+        Must be implemented by subclass to construct the correct type of explosion for the pool
+
+        Returns:  A new torpedo explosion
+        """
+        return cast(BaseTorpedoExplosion, None)
+
+    def _createTorpedoMiss(self) -> BaseMiss:
+        """
+        Must be implemented by subclass to construct the correct type of miss for the pool
+
+        Returns:  A new 'miss' sprite
+        """
+        return cast(BaseMiss, None)
+
+    def _acquireTorpedo(self, speed: float) -> BaseEnemyTorpedo:
+        """
+        Args:
+            speed:  The torpedo speed
+
+        Returns:  A pooled torpedo ready to aim;  Its followers come from our follower pool
+        """
+        enemyTorpedo: BaseEnemyTorpedo = cast(BaseEnemyTorpedo, self._torpedoPool.acquire())
+
+        enemyTorpedo.reset(speed=speed)
+        enemyTorpedo.followers    = self.torpedoFollowers
+        enemyTorpedo.followerPool = self._followerPool
+        enemyTorpedo.ownFollowers = TorpedoFollowers([])
+
+        self._followersByTorpedo[enemyTorpedo.id] = enemyTorpedo.ownFollowers
+
+        return enemyTorpedo
+
     def _loadTorpedoExplosionTextures(self) -> TextureList:
         """
         Subclasses must implement this method
@@ -141,20 +211,21 @@ class BaseTorpedoMediator(MissesMediator):
 
     def _getTorpedoExplosion(self) -> BaseTorpedoExplosion:
         """
-        Must be implemented by subclass to create correct type of torpedo explosion
-
-        Returns: An explosion of the correct type
-
+        Returns: A pooled explosion of the correct type
         """
-        return cast(BaseTorpedoExplosion, None)
+        explosion: BaseTorpedoExplosion = cast(BaseTorpedoExplosion, self._explosionPool.acquire())
+        explosion.reset()
+
+        return explosion
 
     def _getTorpedoMiss(self) -> BaseMiss:
         """
-        Implemented by subclass
-
-        Returns:  An appropriate 'miss' sprite
+        Returns:  A pooled 'miss' sprite of the correct type
         """
-        return cast(BaseMiss, None)
+        miss: BaseMiss = cast(BaseMiss, self._missPool.acquire())
+        miss.reset(placedTime=self._gameEngine.gameClock)
+
+        return miss
 
     def _playCannotFireSound(self):
         """
@@ -185,21 +256,19 @@ class BaseTorpedoMediator(MissesMediator):
 
         currentTime: float = self._gameEngine.gameClock
 
-        for enemy in enemies:
-            deltaClockTime: float = currentTime - enemy.lastTimeCheck
-            if deltaClockTime > enemy.firingInterval:
-                self._baseTorpedoMediatorLogger.debug(f'Time for {enemy} to fire torpedoes')
+        for enemy in self._firingScheduler.dueEnemies(enemies=enemies, currentTime=currentTime):
+            self._baseTorpedoMediatorLogger.debug(f'Time for {enemy} to fire torpedoes')
 
-                endPoint:            ArcadePoint         = ArcadePoint(x=quadrant.enterprise.center_x, y=quadrant.enterprise.center_y)
-                lineOfSightResponse: LineOfSightResponse = self._doWeHaveLineOfSight(quadrant, shooter=enemy, endPoint=endPoint)
-                if lineOfSightResponse.answer is True:
-                    self._pointAtEnterprise(enemy=enemy, enterprise=quadrant.enterprise, rotationAngle=rotationAngle)
-                    self._fireTorpedo(enemy=enemy, enterprise=quadrant.enterprise)
-                else:
-                    self._playCannotFireSound()
-                    self._messageConsole.displayMessage(f'{enemy.id} cannot shoot, blocked by {lineOfSightResponse.obstacle.id}')
+            endSector:           Coordinates         = self._gameState.currentSectorCoordinates
+            lineOfSightResponse: LineOfSightResponse = self._doWeHaveLineOfSight(quadrant, shooter=enemy, endSector=endSector)
+            if lineOfSightResponse.answer is True:
+                self._pointAtEnterprise(enemy=enemy, enterprise=quadrant.enterprise, rotationAngle=rotationAngle)
+                self._fireTorpedo(enemy=enemy, enterprise=quadrant.enterprise)
+            else:
+                self._playCannotFireSound()
+                self._messageConsole.displayMessage(f'{enemy.id} cannot shoot, blocked by {lineOfSightResponse.obstacle.id}')
 
-                enemy.lastTimeCheck = round(currentTime)
+            enemy.lastTimeCheck = round(currentTime)
 
     def _fireTorpedo(self, enemy: Enemy, enterprise: Enterprise):
         """
@@ -235,13 +304,13 @@ class BaseTorpedoMediator(MissesMediator):
             torpedoDud.remove_from_sprite_lists()
 
     def _removeTorpedoFollowers(self, enemyTorpedo: BaseEnemyTorpedo):
+        """
+        Only visits the followers of this torpedo
 
-        followersToRemove: List[BaseTorpedoFollower] = []
-        for sprite in self.torpedoFollowers:
-            follower: BaseTorpedoFollower = cast(BaseTorpedoFollower, sprite)
-            if follower.following == enemyTorpedo.id:
-                self._baseTorpedoMediatorLogger.debug(f'Removing follower: {follower.id}')
-                followersToRemove.append(follower)
+        Args:
+            enemyTorpedo:  The spent or missed torpedo
+        """
+        followersToRemove: TorpedoFollowers = self._followersByTorpedo.pop(enemyTorpedo.id, TorpedoFollowers([]))
 
         for followerToRemove in followersToRemove:
             followerToRemove.remove_from_sprite_lists()
@@ -253,21 +322,19 @@ class BaseTorpedoMediator(MissesMediator):
         self._placeMiss(quadrant=quadrant, torpedoDud=torpedoDud, miss=miss)
         self._misses.append(miss)
 
-    def _doWeHaveLineOfSight(self, quadrant: Quadrant, shooter: Enemy, endPoint: ArcadePoint) -> LineOfSightResponse:
-
-        startingPoint: ArcadePoint = ArcadePoint(x=shooter.center_x, y=shooter.center_y)
-        obstacles:     SpriteList  = SpriteList()
-
-        if quadrant.hasPlanet is True:
-            obstacles.append(quadrant.planet)
-        if quadrant.hasStarBase is True:
-            obstacles.append(quadrant.starBase)
-
-        otherEnemies: Enemies = self.__buildEligibleEnemyObstacles(shooter=shooter, enemies=quadrant.klingons)
+    def _doWeHaveLineOfSight(self, quadrant: Quadrant, shooter: Enemy, endSector: Coordinates) -> LineOfSightResponse:
+        """
+        Planets, StarBases and the other Klingons block the shot;  The shooter's own sector never does
 
-        obstacles.extend(otherEnemies)
+        Args:
+            quadrant:   The current quadrant
+            shooter:    The enemy that wants to fire
+            endSector:  The Enterprise's sector
 
-        results: LineOfSightResponse = self._hasLineOfSight(startingPoint=startingPoint, endPoint=endPoint, obstacles=obstacles)
+        Returns:  A LineOfSightResponse named tuple
+        """
+        results: LineOfSightResponse = self._hasLineOfSight(quadrant=quadrant, startSector=shooter.gameCoordinates, endSector=endSector,
+                                                            obstacleTypes=ENEMY_TORPEDO_OBSTACLES)
 
         self._baseTorpedoMediatorLogger.debug(f'{results=}')
         return results
@@ -362,17 +429,6 @@ class BaseTorpedoMediator(MissesMediator):
 
         self._pointAtTarget(shooter=enemy, target=enterprise, rotationAngle=rotationAngle)
 
-    def __buildEligibleEnemyObstacles(self, shooter: Enemy, enemies: Enemies) -> Enemies:
-        """
-
-        Returns:  A list of enemies excluding the shooter
-        """
-        obstacles: Enemies = Enemies([])
-        for enemy in enemies:
-            if enemy.id != shooter.id:
-                obstacles.append(enemy)
-        return obstacles
-
     def __doExplosion(self, expendedTorpedo: BaseEnemyTorpedo):
 
         self._playTorpedoExplodedSound()
@@ -1,30 +1,80 @@
 
+from typing import ClassVar
+from typing import Dict
 from typing import List
+from typing import Tuple
 
-from dataclasses import dataclass
+from pytrek.Constants import QUADRANT_COLUMNS
+from pytrek.Constants import QUADRANT_ROWS
 
-from pytrek.Constants import MAXIMUM_COORDINATE
-from pytrek.Constants import MINIMUM_COORDINATE
 from pytrek.engine.Direction import Direction
 
+DIRECTION_DELTAS: Dict[Direction, Tuple[int, int]] = {
+    Direction.North:     (0, -1),
+    Direction.South:     (0, 1),
+    Direction.East:      (1, 0),
+    Direction.West:      (-1, 0),
+    Direction.NorthEast: (1, -1),
+    Direction.NorthWest: (-1, -1),
+    Direction.SouthEast: (1, 1),
+    Direction.SouthWest: (-1, 1),
+}
+
 
-@dataclass
 class Coordinates:
     """
     Base class for sector and quadrant coordinates
+
+    Coordinates are immutable;  So the coordinates of every grid point are created once and
+    shared.  `Coordinates(x, y)` returns the shared instance for interned points and a new
+    one for anything else.  The sector grid and the ring just outside it are interned up
+    front;  Galaxies intern their own grid with `intern`.  Being immutable they are also
+    hashable and can be used as dictionary keys
     """
-    x: int = 0
-    y: int = 0
+    __slots__ = ('x', 'y')
+
+    x: int
+    y: int
+
+    _interned: ClassVar[Dict[Tuple[int, int], 'Coordinates']] = {}
 
-    def valid(self) -> bool:
+    def __new__(cls, x: int = 0, y: int = 0) -> 'Coordinates':
+
+        coordinates: Coordinates | None = cls._interned.get((x, y))
+        if coordinates is None:
+            coordinates = object.__new__(cls)
+            object.__setattr__(coordinates, 'x', x)
+            object.__setattr__(coordinates, 'y', y)
+
+        return coordinates
+
+    @classmethod
+    def intern(cls, columns: int, rows: int):
+        """
+        Share the coordinates of every point of a grid and of the ring just outside it;
+        Moving off the grid by one is a common probe
+
+        Args:
+            columns:    The grid width
+            rows:       The grid height
         """
-        Assumes that the Galaxy and quadrants are exactly sized
+        for x in range(-1, columns + 1):
+            for y in range(-1, rows + 1):
+                if (x, y) not in cls._interned:
+                    cls._interned[(x, y)] = Coordinates(x=x, y=y)
 
-        Returns:    The min/max values should match what is in Constants
+    def valid(self, columns: int = QUADRANT_COLUMNS, rows: int = QUADRANT_ROWS) -> bool:
+        """
+        The defaults check sector coordinates;  For quadrant coordinates pass in the galaxy size
+
+        Args:
+            columns:    The number of columns in the grid these coordinates are for
+            rows:       The number of rows in the grid these coordinates are for
+
+        Returns:    `True` if the coordinates are inside the grid, else `False`
         """
         ans: bool = False
-        # if self.x >= 0 and self.x <= 9 and self.y >=0 and self.y <= 9:
-        if MINIMUM_COORDINATE <= self.x <= MAXIMUM_COORDINATE and MINIMUM_COORDINATE <= self.y <= MAXIMUM_COORDINATE:
+        if 0 <= self.x < columns and 0 <= self.y < rows:
             ans = True
 
         return ans
@@ -41,32 +91,9 @@ class Coordinates:
         Returns:  New potentially invalid coordinates
 
         """
-        newCoordinates: Coordinates = Coordinates(self.x, self.y)
-
-        if newDirection == Direction.North:
-            newCoordinates.y -= 1
-        elif newDirection == Direction.South:
-            newCoordinates.y += 1
-        elif newDirection == Direction.East:
-            newCoordinates.x += 1
-        elif newDirection == Direction.West:
-            newCoordinates.x -= 1
-        elif newDirection == Direction.NorthEast:
-            newCoordinates.x += 1
-            newCoordinates.y -= 1
-        elif newDirection == Direction.NorthWest:
-            newCoordinates.x -= 1
-            newCoordinates.y -= 1
-        elif newDirection == Direction.SouthEast:
-            newCoordinates.x += 1
-            newCoordinates.y += 1
-        elif newDirection == Direction.SouthWest:
-            newCoordinates.x -= 1
-            newCoordinates.y += 1
-        else:
-            assert False
+        deltaX, deltaY = DIRECTION_DELTAS[newDirection]
 
-        return newCoordinates
+        return Coordinates(self.x + deltaX, self.y + deltaY)
 
     def toJson(self):
 
@@ -104,10 +131,30 @@ class Coordinates:
 
     def __eq__(self, other) -> bool:
         """"""
+        if self is other:
+            return True
         if isinstance(other, Coordinates):
-            if self.x == other.x and self.y == other.y:
-                return True
-            else:
-                return False
+            return self.x == other.x and self.y == other.y
         else:
             return False
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f'Coordinates are immutable;  Cannot set {name}')
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f'Coordinates are immutable;  Cannot delete {name}')
+
+    def __copy__(self) -> 'Coordinates':
+        return self
+
+    def __deepcopy__(self, memo) -> 'Coordinates':
+        return self
+
+    def __reduce__(self):
+        return Coordinates, (self.x, self.y)
+
+
+Coordinates.intern(columns=QUADRANT_COLUMNS, rows=QUADRANT_ROWS)
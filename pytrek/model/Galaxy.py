@@ -10,26 +10,31 @@ from logging import getLogger
 
 from codeallybasic.SingletonV3 import SingletonV3
 
-from pytrek.Constants import GALAXY_COLUMNS
-from pytrek.Constants import GALAXY_ROWS
-
 from pytrek.engine.GameEngine import GameEngine
 from pytrek.engine.Intelligence import Intelligence
 
 from pytrek.model.Coordinates import Coordinates
 from pytrek.model.Quadrant import Quadrant
+from pytrek.model.SectorStore import SectorStore
+from pytrek.model.SectorType import SectorType
 
 from pytrek.settings.GameSettings import GameSettings
 
 from pytrek.GameState import GameState
 
-QuadrantRow = NewType('QuadrantRow', List[Quadrant])
-GalaxyGrid  = NewType('GalaxyGrid',  List[QuadrantRow])
+Quadrants = NewType('Quadrants', List[Quadrant])
 
 
 class Galaxy(metaclass=SingletonV3):
     """
     The Galaxy model
+
+    Placing the enemies, StarBases, and planets only updates each quadrant's summary
+    counts;  A quadrant generates its sprites from its own seed when it is first entered
+
+    The galaxyRows and galaxyColumns settings determine the galaxy size.  The quadrant objects
+    are created on first use;  Until then, their counts live only in the sector store.  So
+    creating a large galaxy costs about the same as creating a small one
     """
     def __init__(self):
         """"""
@@ -40,8 +45,17 @@ class Galaxy(metaclass=SingletonV3):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._currentQuadrant: Quadrant   = cast(Quadrant, None)
-        self.quadrants:        GalaxyGrid = GalaxyGrid([])  # 2D array aka python list
+        self._rows:    int = self._gameSettings.galaxyRows
+        self._columns: int = self._gameSettings.galaxyColumns
+
+        Coordinates.intern(columns=self._columns, rows=self._rows)
+
+        self._announceQuadrantCreation: bool = self._gameSettings.announceQuadrantCreation
+
+        self._currentQuadrant: Quadrant    = cast(Quadrant, None)
+        self._quadrants:       Quadrants   = Quadrants([])   # Row major;  None until first used
+        self._sectorStore:     SectorStore = cast(SectorStore, None)
+        self._galaxySeed:      int         = 0
 
         self._createGalaxy()
 
@@ -80,6 +94,49 @@ class Galaxy(metaclass=SingletonV3):
     def updateGalaxy(self):
         """"""
 
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def columns(self) -> int:
+        return self._columns
+
+    @property
+    def galaxySeed(self) -> int:
+        """
+        Returns:  The seed the quadrant seeds derive from
+        """
+        return self._galaxySeed
+
+    @property
+    def sectorStore(self) -> SectorStore:
+        return self._sectorStore
+
+    @property
+    def quadrants(self) -> Quadrants:
+        """
+        Read only;  Row major and `None` for the quadrants not created yet
+
+        Returns:  The quadrants
+        """
+        return self._quadrants
+
+    def resetGalaxy(self, galaxySeed: int):
+        """
+        Empty the galaxy;  Used when restoring a saved game.  Nothing is placed;  The caller
+        puts back the counts and the quadrants
+
+        Args:
+            galaxySeed:  The seed of the saved galaxy
+        """
+        quadrantCount: int = self._rows * self._columns
+
+        self._quadrants       = Quadrants(cast(List[Quadrant], [None]) * quadrantCount)
+        self._sectorStore     = SectorStore(quadrantCount=quadrantCount)
+        self._galaxySeed      = galaxySeed
+        self._currentQuadrant = cast(Quadrant, None)
+
     @property
     def currentQuadrant(self) -> Quadrant:
         return self._currentQuadrant
@@ -121,46 +178,69 @@ class Galaxy(metaclass=SingletonV3):
 
         for x in count():
             if x > maxCommanderSearches:
-                self.logger.warning(f'There appear to be no live Commander`s in the galaxy')
-                break
+                linearSearchCoordinates: Coordinates = self._commanderLinearSearch()
+                if linearSearchCoordinates is None:
+                    self.logger.warning(f'There appear to be no live Commander`s in the galaxy')
+                return linearSearchCoordinates
+
             potentialCoordinates: Coordinates = self._intelligence.generateQuadrantCoordinates()
-            quadrant:             Quadrant    = self.getQuadrant(quadrantCoordinates=potentialCoordinates)
-            if quadrant.commanderCount > 0:
+            quadrantIndex:        int         = self._quadrantIndex(potentialCoordinates)
+            if self._sectorStore.getEnemyCount(quadrantIndex, SectorType.COMMANDER) > 0:
                 return potentialCoordinates
 
         return cast(Coordinates, None)
 
     def getQuadrant(self, quadrantCoordinates: Coordinates) -> Quadrant:
+        """
+        Creates the quadrant object the first time it is asked for
 
-        quadrantRow: QuadrantRow = self.quadrants[quadrantCoordinates.y]
-        quadrant:    Quadrant    = quadrantRow[quadrantCoordinates.x]
+        Args:
+            quadrantCoordinates:  Galaxy coordinates
+
+        Returns:  The quadrant at those coordinates
+        """
+        quadrantIndex: int      = self._quadrantIndex(quadrantCoordinates)
+        quadrant:      Quadrant = self._quadrants[quadrantIndex]
+        if quadrant is None:
+            coordinates: Coordinates = Coordinates(x=quadrantCoordinates.x, y=quadrantCoordinates.y)
+
+            quadrant = Quadrant(coordinates, sectorStore=self._sectorStore, quadrantIndex=quadrantIndex, seed=self._galaxySeed + quadrantIndex)
+            self._quadrants[quadrantIndex] = quadrant
+            if self._announceQuadrantCreation is True:
+                self.logger.debug(f"Created quadrant: {coordinates}")
 
         return quadrant
 
-    def _starBaseLinearSearch(self) -> Coordinates:
+    def _quadrantIndex(self, quadrantCoordinates: Coordinates) -> int:
+        return quadrantCoordinates.y * self._columns + quadrantCoordinates.x
 
+    def _starBaseLinearSearch(self) -> Coordinates:
+        """
+        StarBases are only placed in quadrants that have been created
+        """
         self.logger.info(f'Starbase linear search initialized')
-        for y in range(GALAXY_ROWS):
-            quadrantRow = self.quadrants[y]
-            for x in range(GALAXY_COLUMNS):
-                quadrant: Quadrant = quadrantRow[x]
-                if quadrant.hasStarBase is True:
-                    return quadrant.coordinates
+        for quadrant in self._quadrants:
+            if quadrant is not None and quadrant.hasStarBase is True:
+                return quadrant.coordinates
+
+        return cast(Coordinates, None)
+
+    def _commanderLinearSearch(self) -> Coordinates:
+
+        self.logger.info(f'Commander linear search initialized')
+        for quadrantIndex in range(self._rows * self._columns):
+            if self._sectorStore.getEnemyCount(quadrantIndex, SectorType.COMMANDER) > 0:
+                return Coordinates(x=quadrantIndex % self._columns, y=quadrantIndex // self._columns)
 
         return cast(Coordinates, None)
 
     def _createGalaxy(self):
 
-        self.quadrants = GalaxyGrid([])
-        for y in range(GALAXY_ROWS):
-            quadrantRow: QuadrantRow = QuadrantRow([])
-            for x in range(GALAXY_COLUMNS):
-                coordinates = Coordinates(x, y)
-                quadrant = Quadrant(coordinates)
-                quadrantRow.append(quadrant)
-                if self._gameSettings.announceQuadrantCreation is True:
-                    self.logger.debug(f"Created quadrant: ({x},{y})")
-            self.quadrants.append(quadrantRow)
+        quadrantCount: int = self._rows * self._columns
+
+        self._quadrants   = Quadrants(cast(List[Quadrant], [None]) * quadrantCount)
+        self._sectorStore = SectorStore(quadrantCount=quadrantCount)
+        self._galaxySeed  = self._intelligence.generateSeed()
 
     def _placePlanetsInGalaxy(self) -> int:
         # noinspection SpellCheckingInspection
@@ -189,7 +269,7 @@ class Galaxy(metaclass=SingletonV3):
                 quadrant            = self.getQuadrant(quadrantCoordinates)
                 self.logger.debug(f'Generated new quadrant for planet')
 
-            quadrant.addPlanet()
+            quadrant.hasPlanet = True
             self.logger.debug(f'Quadrant: {quadrantCoordinates} has a planet')
 
         return planetCount
@@ -209,7 +289,7 @@ class Galaxy(metaclass=SingletonV3):
                 quadrant            = self.getQuadrant(quadrantCoordinates)
 
                 self.logger.debug(f"StarBase at quadrant {quadrantCoordinates}")
-                quadrant.addStarBase()
+                quadrant.hasStarBase = True
                 starBaseCount -= 1
 
     def _setInitialQuadrant(self):
@@ -217,8 +297,7 @@ class Galaxy(metaclass=SingletonV3):
         coordinates: Coordinates = self._intelligence.generateQuadrantCoordinates()
         self.logger.debug(f'Current Quadrant set to: {coordinates}')
 
-        row: QuadrantRow = self.quadrants[coordinates.y]
-        self._currentQuadrant = row[coordinates.x]
+        self._currentQuadrant = self.getQuadrant(coordinates)
 
     def __placeKlingonsInGalaxy(self):
         """
@@ -234,7 +313,7 @@ class Galaxy(metaclass=SingletonV3):
 
             quadrant: Quadrant = self.getQuadrant(coordinates)
 
-            quadrant.addKlingon()
+            quadrant.klingonCount += 1
 
         if self._gameSettings.printKlingonPlacement is True:
             self.__debugPrintKlingonPlacement()
@@ -245,7 +324,7 @@ class Galaxy(metaclass=SingletonV3):
         for x in range(self._gameState.remainingCommanders):
             coordinates = self._intelligence.generateQuadrantCoordinates()
             quadrant    = self.getQuadrant(coordinates)
-            quadrant.addCommander()
+            quadrant.commanderCount += 1
 
     def __placeSuperCommandersInGalaxy(self):
         """
@@ -255,14 +334,12 @@ class Galaxy(metaclass=SingletonV3):
             # if self._gameSettings.debugCollectSuperCommanderQuadrantCoordinates is True:
             #     self._debugSuperCommanderQuadrants.append(coordinates)
             quadrant    = self.getQuadrant(coordinates)
-            quadrant.addSuperCommander()
+            quadrant.superCommanderCount += 1
 
     def __debugPrintKlingonPlacement(self):
         """
         """
-        for y in range(GALAXY_ROWS):
-            quadRow = self.quadrants[y]
-            for x in range(GALAXY_COLUMNS):
-                quadrant = cast(Quadrant, quadRow[x])
-                # quadrant: Quadrant = cast(Quadrant, quadrant)
-                self.logger.debug(f'Quadrant({x},{y}) Klingon Count: {quadrant.klingonCount}')
+        for y in range(self._rows):
+            for x in range(self._columns):
+                klingonCount: int = self._sectorStore.getEnemyCount(self._quadrantIndex(Coordinates(x, y)), SectorType.KLINGON)
+                self.logger.debug(f'Quadrant({x},{y}) Klingon Count: {klingonCount}')
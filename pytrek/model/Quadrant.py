@@ -1,18 +1,20 @@
 
+from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import NewType
+from typing import Tuple
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
-
-from pytrek.Constants import QUADRANT_COLUMNS
-from pytrek.Constants import QUADRANT_ROWS
+from logging import DEBUG
 
 from pytrek.gui.gamepieces.StarBase import StarBase
 from pytrek.gui.gamepieces.commander.Commander import Commander
 from pytrek.gui.gamepieces.Enterprise import Enterprise
 from pytrek.gui.gamepieces.GamePiece import GamePiece
+from pytrek.gui.gamepieces.base.BaseGamePiece import BaseGamePiece
 from pytrek.gui.gamepieces.GamePieceTypes import Enemies
 from pytrek.gui.gamepieces.GamePieceTypes import Enemy
 
@@ -23,38 +25,56 @@ from pytrek.gui.gamepieces.supercommander.SuperCommander import SuperCommander
 
 from pytrek.model.Coordinates import Coordinates
 from pytrek.model.Sector import Sector
+from pytrek.model.SectorStore import SectorStore
 from pytrek.model.SectorType import SectorType
 
 from pytrek.engine.Intelligence import Intelligence
 
 from pytrek.settings.GameSettings import GameSettings
 
-SectorRow    = NewType('SectorRow', List[Sector])
-QuadrantGrid = NewType('QuadrantGrid', List[SectorRow])
+ObstacleMasks = NewType('ObstacleMasks', Dict[FrozenSet[SectorType], int])
+PlacedPieces  = NewType('PlacedPieces',  List[Tuple[SectorType, BaseGamePiece]])
 
 
 class Quadrant:
 
     """
     Quadrant Management
+
+    The sectors and the enemy counts live in a SectorStore;  The Galaxy shares a single
+    store across all its quadrants.  A stand-alone quadrant gets a store of its own
+
+    A quadrant created with a seed only keeps the summary counts until it is materialized;
+    That is, when the Enterprise first visits it
     """
-    def __init__(self, coordinates: Coordinates):
+    def __init__(self, coordinates: Coordinates, sectorStore: SectorStore = cast(SectorStore, None), quadrantIndex: int = 0, seed: int = cast(int, None)):
         """
-            Initialize a quadrant
+        Initialize a quadrant
+
+        Args:
+            coordinates:    Our coordinates in the Galaxy
+            sectorStore:    Where our sectors live
+            quadrantIndex:  Our position in the sector store
+            seed:           Generates our contents when materialized;  If `None` we are materialized immediately
         """
         from pytrek.engine.GameEngine import GameEngine     # Avoid recursion
 
         self.logger:       Logger       = getLogger(__name__)
         self._coordinates: Coordinates  = coordinates
-        self._sectors:     QuadrantGrid = QuadrantGrid([])
+
+        if sectorStore is None:
+            sectorStore   = SectorStore(quadrantCount=1)
+            quadrantIndex = 0
+
+        self._sectorStore:   SectorStore = sectorStore
+        self._quadrantIndex: int         = quadrantIndex
+        self._seed:          int         = seed
+        self._materialized:  bool        = seed is None
 
         self._intelligence: Intelligence = Intelligence()
         self._gameEngine:   GameEngine   = GameEngine()
         self._gameSettings: GameSettings = GameSettings()
 
-        self._klingonCount:        int = 0
-        self._commanderCount:      int = 0
-        self._superCommanderCount: int = 0
         self._hasStarBase:    bool = False
         self._hasPlanet:      bool = False
         self._hasSuperNova:   bool = False
@@ -71,7 +91,8 @@ class Quadrant:
         self._enterpriseCoordinates: Coordinates = cast(Coordinates, None)
         self._starBaseCoordinates:   Coordinates = cast(Coordinates, None)
 
-        self._createQuadrant()
+        self._obstacleMasks:   ObstacleMasks = ObstacleMasks({})
+        self._obstacleVersion: int           = 0
 
     def placeEnterprise(self, enterprise: Enterprise, coordinates: Coordinates):
         """
@@ -85,18 +106,16 @@ class Quadrant:
         """
         if self._enterpriseCoordinates is not None:
 
-            oldEnterpriseRow = self._sectors[coordinates.y]
-            oldSector: Sector = oldEnterpriseRow[self._enterpriseCoordinates.x]
-            oldSector.type = SectorType.EMPTY
-            oldSector.sprite = cast(GamePiece, None)
+            oldSector: Sector = self.getSector(self._enterpriseCoordinates)
+            if oldSector.type == SectorType.ENTERPRISE:
+                oldSector.type   = SectorType.EMPTY
+                oldSector.sprite = cast(GamePiece, None)
 
         self.logger.debug(f"Placing enterprise @quadrant: {coordinates}")
 
-        sectorRow: SectorRow = self._sectors[coordinates.y]
-        sector: Sector = sectorRow[coordinates.x]
+        sector: Sector = self.getSector(coordinates)
 
         sector.type        = SectorType.ENTERPRISE
-        sector.coordinates = coordinates
         sector.sprite      = enterprise
 
         self.logger.info(f"Enterprise @sector: {coordinates}")
@@ -135,27 +154,38 @@ class Quadrant:
     @property
     def klingonCount(self) -> int:
         """"""
-        return self._klingonCount
+        return self._sectorStore.getEnemyCount(self._quadrantIndex, SectorType.KLINGON)
 
     @klingonCount.setter
     def klingonCount(self, newValue: int):
-        self._klingonCount = newValue
+        self._sectorStore.setEnemyCount(self._quadrantIndex, SectorType.KLINGON, newValue)
 
     @property
     def commanderCount(self) -> int:
-        return self._commanderCount
+        return self._sectorStore.getEnemyCount(self._quadrantIndex, SectorType.COMMANDER)
 
     @commanderCount.setter
     def commanderCount(self, newValue: int):
-        self._commanderCount = newValue
+        self._sectorStore.setEnemyCount(self._quadrantIndex, SectorType.COMMANDER, newValue)
 
     @property
     def superCommanderCount(self) -> int:
-        return self._superCommanderCount
+        return self._sectorStore.getEnemyCount(self._quadrantIndex, SectorType.SUPER_COMMANDER)
 
     @superCommanderCount.setter
     def superCommanderCount(self, newValue: int):
-        self._superCommanderCount = newValue
+        self._sectorStore.setEnemyCount(self._quadrantIndex, SectorType.SUPER_COMMANDER, newValue)
+
+    @property
+    def emptySectorCount(self) -> int:
+        return self._sectorStore.emptyCount(self._quadrantIndex)
+
+    @property
+    def materialized(self) -> bool:
+        """
+        Returns:  `True` if our sectors and sprites exist, `False` if we only have summary counts
+        """
+        return self._materialized
 
     @property
     def klingons(self) -> Enemies:
@@ -227,13 +257,33 @@ class Quadrant:
         Args:
             sectorCoordinates:
 
-        Returns:  The sector at x,y
+        Returns:  A view of the sector at x,y
+
+        """
+        sectorIndex: int = self._sectorStore.sectorIndex(self._quadrantIndex, sectorCoordinates.x, sectorCoordinates.y)
+
+        return Sector(sectorStore=self._sectorStore, sectorIndex=sectorIndex, coordinates=sectorCoordinates)
 
+    def obstacleMask(self, obstacleTypes: FrozenSet[SectorType]) -> int:
         """
-        sectorRow: SectorRow = self._sectors[sectorCoordinates.y]
-        sector:    Sector    = sectorRow[sectorCoordinates.x]
+        The masks are cached until one of our sector types changes
 
-        return sector
+        Args:
+            obstacleTypes:  The sector types that are obstacles
+
+        Returns:  A bit mask with bit `y * QUADRANT_COLUMNS + x` set for each obstacle sector
+        """
+        version: int = self._sectorStore.version(self._quadrantIndex)
+        if version != self._obstacleVersion:
+            self._obstacleMasks.clear()
+            self._obstacleVersion = version
+
+        mask: int = self._obstacleMasks.get(obstacleTypes, -1)
+        if mask == -1:
+            mask = self._sectorStore.sectorTypeMask(self._quadrantIndex, obstacleTypes)
+            self._obstacleMasks[obstacleTypes] = mask
+
+        return mask
 
     def addKlingon(self) -> Klingon:
         """
@@ -241,7 +291,8 @@ class Quadrant:
 
         Returns:  The 'added' Klingon
         """
-        self._klingonCount += 1
+        self.materialize()
+        self.klingonCount += 1
         klingon: Klingon = self._placeAKlingon()
         self._klingons.append(cast(Enemy, klingon))
 
@@ -253,7 +304,8 @@ class Quadrant:
 
         Returns:  The 'added' Commander
         """
-        self._commanderCount += 1
+        self.materialize()
+        self.commanderCount += 1
         commander: Commander = self._placeACommander()
 
         self._commanders.append(cast(Enemy, commander))
@@ -266,7 +318,8 @@ class Quadrant:
 
         Returns:  The 'added' SuperCommander
         """
-        self._superCommanderCount += 1
+        self.materialize()
+        self.superCommanderCount += 1
         superCommander: SuperCommander = self._placeASuperCommander()
         
         self._superCommanders.append(cast(Enemy, superCommander))
@@ -275,34 +328,87 @@ class Quadrant:
 
     def addPlanet(self):
 
+        self.materialize()
         self.hasPlanet = True
-
-        sector      = self.getRandomEmptySector()
-        sector.type = SectorType.PLANET
-
-        planetType: PlanetType = self._intelligence.computeRandomPlanetType()
-        self._planet = Planet(planetType=planetType, sectorCoordinates=sector.coordinates)
+        self._placeAPlanet()
 
     def addStarBase(self):
         """
         """
+        self.materialize()
         self.hasStarBase = True
         self.placeAStarBase()
 
+    def materialize(self):
+        """
+        Generate the sectors and sprites that our summary counts describe.  Since the
+        generation uses our seed the quadrant looks the same no matter when the
+        Enterprise first arrives;  Does nothing if we are already materialized
+        """
+        if self._materialized is True:
+            return
+        self._materialized = True
+
+        self.logger.debug(f'Materializing quadrant {self.coordinates}')
+        with self._intelligence.seededRandomness(seed=self._seed):
+            if self.hasStarBase is True:
+                self.placeAStarBase()
+            if self.hasPlanet is True:
+                self._placeAPlanet()
+            for x in range(self.klingonCount):
+                self._klingons.append(cast(Enemy, self._placeAKlingon()))
+            for x in range(self.commanderCount):
+                self._commanders.append(cast(Enemy, self._placeACommander()))
+            for x in range(self.superCommanderCount):
+                self._superCommanders.append(cast(Enemy, self._placeASuperCommander()))
+
+    def restoreContents(self, placedPieces: PlacedPieces):
+        """
+        Put back the game pieces of a saved quadrant;  We are then materialized so our seed
+        does not generate our contents again.  The summary counts are not changed
+
+        Args:
+            placedPieces:  The sector type and game piece of each piece;  The pieces know their sector coordinates
+        """
+        self._materialized = True
+        for sectorType, gamePiece in placedPieces:
+
+            sector: Sector = self.getSector(gamePiece.gameCoordinates)
+            sector.type   = sectorType
+            sector.sprite = gamePiece
+
+            match sectorType:
+                case SectorType.KLINGON:
+                    self._klingons.append(cast(Enemy, gamePiece))
+                case SectorType.COMMANDER:
+                    self._commanders.append(cast(Enemy, gamePiece))
+                case SectorType.SUPER_COMMANDER:
+                    self._superCommanders.append(cast(Enemy, gamePiece))
+                case SectorType.STARBASE:
+                    self._starBase            = cast(StarBase, gamePiece)
+                    self._starBaseCoordinates = gamePiece.gameCoordinates
+                case SectorType.PLANET:
+                    self._planet = cast(Planet, gamePiece)
+                case _:
+                    self.logger.warning(f'Cannot restore a {sectorType} game piece')
+
     def getRandomEmptySector(self) -> Sector:
         """
 
         Returns:  An empty sector
         """
+        self.materialize()
+        assert self.emptySectorCount > 0, f'Quadrant {self.coordinates} has no empty sectors'
 
-        randomSectorCoordinates = self._intelligence.generateSectorCoordinates()
-        sector                  = self.getSector(randomSectorCoordinates)
+        sectorStore:             SectorStore = self._sectorStore
+        randomSectorCoordinates: Coordinates = self._intelligence.generateSectorCoordinates()
+        sectorIndex:             int         = sectorStore.sectorIndex(self._quadrantIndex, randomSectorCoordinates.x, randomSectorCoordinates.y)
 
-        while sector.type != SectorType.EMPTY:
+        while sectorStore.isSectorEmpty(sectorIndex) is False:
             randomSectorCoordinates = self._intelligence.generateSectorCoordinates()
-            sector = self.getSector(randomSectorCoordinates)
+            sectorIndex = sectorStore.sectorIndex(self._quadrantIndex, randomSectorCoordinates.x, randomSectorCoordinates.y)
 
-        return sector
+        return Sector(sectorStore=sectorStore, sectorIndex=sectorIndex, coordinates=randomSectorCoordinates)
 
     def isSectorEmpty(self, sectorCoordinates: Coordinates) -> bool:
         """
@@ -312,12 +418,9 @@ class Quadrant:
 
         Returns: True if sector is unoccupied else False
         """
-        ans: bool = False
+        sectorIndex: int = self._sectorStore.sectorIndex(self._quadrantIndex, sectorCoordinates.x, sectorCoordinates.y)
 
-        checkSector: Sector = self.getSector(sectorCoordinates=sectorCoordinates)
-        if checkSector.type == SectorType.EMPTY:
-            ans = True
-        return ans
+        return self._sectorStore.isSectorEmpty(sectorIndex)
 
     def removeDeadEnemies(self):
 
@@ -349,11 +452,20 @@ class Quadrant:
             enemy:  The enemy we just whacked
         """
         if isinstance(enemy, Klingon) is True:
-            self._klingonCount -= 1
+            self.klingonCount -= 1
         elif isinstance(enemy, Commander) is True:
-            self._commanderCount -= 1
+            self.commanderCount -= 1
         elif isinstance(enemy, SuperCommander):
-            self._superCommanderCount -= 1
+            self.superCommanderCount -= 1
+
+    def _placeAPlanet(self):
+
+        sector      = self.getRandomEmptySector()
+        sector.type = SectorType.PLANET
+
+        planetType: PlanetType = self._intelligence.computeRandomPlanetType()
+        self._planet = Planet(planetType=planetType, sectorCoordinates=sector.coordinates)
+        sector.sprite = self._planet
 
     def _placeAKlingon(self) -> Klingon:
         """
@@ -375,7 +487,8 @@ class Quadrant:
         if sector.coordinates.x == 0 and sector.coordinates.y == 0:
             self.logger.debug(f'{self.coordinates} {klingon.id=} is at sector: {sector.coordinates}')
 
-        self.logger.debug(f"Placed enemy at quadrant: {self._coordinates} {klingon=}")
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f"Placed enemy at quadrant: {self._coordinates} {klingon=}")
         return klingon
 
     def _placeACommander(self) -> Commander:
@@ -397,7 +510,8 @@ class Quadrant:
 
         sector.sprite = commander
 
-        self.logger.debug(f'Placed commander at quadrant: {self.coordinates} {commander=}')
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f'Placed commander at quadrant: {self.coordinates} {commander=}')
         return commander
 
     def _placeASuperCommander(self) -> SuperCommander:
@@ -424,32 +538,22 @@ class Quadrant:
             enemy: Enemy = cast(Enemy, zombie)
             if enemy.power == 0:
                 self.logger.info(f'Found dead enemy: {enemy.id}')
-                self._klingonCount -= 1
+                self.klingonCount -= 1
                 sector: Sector = self.getSector(enemy.gameCoordinates)
-                sector.type = SectorType.EMPTY
+                sector.type   = SectorType.EMPTY
+                sector.sprite = cast(GamePiece, None)
             else:
                 liveKlingons.append(enemy)
 
         return liveKlingons
 
-    def _createQuadrant(self):
-        for y in range(QUADRANT_ROWS):
-            row: SectorRow = SectorRow([])
-            for x in range(QUADRANT_COLUMNS):
-
-                coordinates: Coordinates = Coordinates(x=x, y=y)
-                sector: Sector = Sector(sprite=cast(GamePiece, None), type=SectorType.EMPTY, coordinates=coordinates)
-                row.append(sector)
-                self.logger.debug(f'Created empty sector ({x},{y})')
-            self._sectors.append(row)
-
     def __str__(self) -> str:
 
         depiction: str = (
             f'coordinates={self.coordinates} '
             f'klingonCount={self.klingonCount} '
             f'commanderCount={self.commanderCount} '
-            f'superCommanderCount={self._superCommanderCount} '
+            f'superCommanderCount={self.superCommanderCount} '
             f'hasStarBase={self.hasStarBase}'
         )
 
@@ -1,19 +1,53 @@
 
-from typing import cast
-
-from dataclasses import dataclass
-
 from pytrek.gui.gamepieces.base.BaseGamePiece import BaseGamePiece
 from pytrek.model.Coordinates import Coordinates
+from pytrek.model.SectorStore import SectorStore
 from pytrek.model.SectorType import SectorType
 
 
-@dataclass
 class Sector:
+    """
+    A lightweight view of a single sector in the SectorStore.  Setting the type
+    or the sprite writes through to the store
+    """
+    __slots__ = ('_sectorStore', '_sectorIndex', '_coordinates')
+
+    def __init__(self, sectorStore: SectorStore, sectorIndex: int, coordinates: Coordinates):
+
+        self._sectorStore: SectorStore = sectorStore
+        self._sectorIndex: int         = sectorIndex
+        self._coordinates: Coordinates = coordinates
+
+    @property
+    def sprite(self) -> BaseGamePiece:
+        return self._sectorStore.getOccupant(self._sectorIndex)
 
-    sprite:      BaseGamePiece = cast(BaseGamePiece, None)
-    type:        SectorType    = SectorType.EMPTY
-    coordinates: Coordinates   = Coordinates(0, 0)
+    @sprite.setter
+    def sprite(self, newValue: BaseGamePiece):
+        self._sectorStore.setOccupant(self._sectorIndex, newValue)
+
+    @property
+    def type(self) -> SectorType:
+        return self._sectorStore.getSectorType(self._sectorIndex)
+
+    @type.setter
+    def type(self, newValue: SectorType):
+        self._sectorStore.setSectorType(self._sectorIndex, newValue)
+
+    @property
+    def coordinates(self) -> Coordinates:
+        """
+        Read only;  A sector does not move
+        """
+        return self._coordinates
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Sector) is False:
+            return False
+        return self._sectorStore is other._sectorStore and self._sectorIndex == other._sectorIndex
 
     def __str__(self) -> str:
         return f"SectorType: {str(self.type)}  Coordinates: {self.coordinates}"
+
+    def __repr__(self) -> str:
+        return self.__str__()
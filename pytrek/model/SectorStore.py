@@ -0,0 +1,224 @@
+
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from array import array
+
+from pytrek.Constants import GALAXY_COLUMNS
+from pytrek.Constants import GALAXY_ROWS
+from pytrek.Constants import QUADRANT_COLUMNS
+from pytrek.Constants import QUADRANT_ROWS
+
+from pytrek.gui.gamepieces.base.BaseGamePiece import BaseGamePiece
+
+from pytrek.model.SectorType import SectorType
+
+SECTOR_TYPES:        List[SectorType]      = list(SectorType)
+SECTOR_TYPE_CODES:   Dict[SectorType, int] = {sectorType: code for code, sectorType in enumerate(SECTOR_TYPES)}
+EMPTY_SECTOR_CODE:   int                   = SECTOR_TYPE_CODES[SectorType.EMPTY]
+
+COUNTED_SECTOR_TYPES: List[SectorType] = [SectorType.KLINGON, SectorType.COMMANDER, SectorType.SUPER_COMMANDER]
+
+
+class SectorStore:
+    """
+    Compact storage for every sector in the galaxy.  Rather than a Sector and a Coordinates
+    object per sector the store keeps
+
+        * a byte sized sector type code per sector
+        * an occupant index per sector that refers into a table of game pieces
+        * per quadrant counts of empty sectors and of each enemy type
+
+    Quadrants and Sectors are views over the store.  Sectors are numbered quadrant by
+    quadrant and within a quadrant row by row.  A quadrant's sectors are allocated the
+    first time they are indexed;  So the sector storage grows with the number of quadrants
+    in use rather than with the size of the galaxy
+    """
+    NO_OCCUPANT: int = -1
+    NO_SECTORS:  int = -1
+
+    def __init__(self, quadrantCount: int = GALAXY_ROWS * GALAXY_COLUMNS, quadrantRows: int = QUADRANT_ROWS, quadrantColumns: int = QUADRANT_COLUMNS):
+        """
+
+        Args:
+            quadrantCount:      The number of quadrants to store
+            quadrantRows:       Sector rows per quadrant
+            quadrantColumns:    Sector columns per quadrant
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._quadrantCount:      int = quadrantCount
+        self._quadrantRows:       int = quadrantRows
+        self._quadrantColumns:    int = quadrantColumns
+        self._sectorsPerQuadrant: int = quadrantRows * quadrantColumns
+
+        self._sectorBlocks: array = array('l', [SectorStore.NO_SECTORS]) * quadrantCount
+
+        self._sectorTypes: array = array('b')
+        self._occupants:   array = array('l')
+        self._emptyCounts: array = array('l')         # Per block
+        self._versions:    array = array('l')         # Per block;  Bumped whenever a sector type changes
+
+        self._enemyCounts: Dict[SectorType, array] = {}
+        for sectorType in COUNTED_SECTOR_TYPES:
+            self._enemyCounts[sectorType] = array('l', [0]) * quadrantCount
+
+        self._gamePieces: List[BaseGamePiece] = []
+        self._freeSlots:  List[int]           = []
+
+    @property
+    def quadrantCount(self) -> int:
+        return self._quadrantCount
+
+    @property
+    def sectorsPerQuadrant(self) -> int:
+        return self._sectorsPerQuadrant
+
+    def sectorIndex(self, quadrantIndex: int, x: int, y: int) -> int:
+        """
+        Args:
+            quadrantIndex:  The quadrant's position in the store
+            x:              Sector x coordinate
+            y:              Sector y coordinate
+
+        Returns:  The sector's position in the store
+        """
+        block: int = self._sectorBlocks[quadrantIndex]
+        if block == SectorStore.NO_SECTORS:
+            block = self._allocateSectors(quadrantIndex)
+
+        return block * self._sectorsPerQuadrant + y * self._quadrantColumns + x
+
+    def getSectorType(self, sectorIndex: int) -> SectorType:
+        return SECTOR_TYPES[self._sectorTypes[sectorIndex]]
+
+    def setSectorType(self, sectorIndex: int, sectorType: SectorType):
+        """
+        Keeps the per quadrant empty sector count and version up to date
+
+        Args:
+            sectorIndex:    The sector's position in the store
+            sectorType:     The new sector type
+        """
+        newCode: int = SECTOR_TYPE_CODES[sectorType]
+        oldCode: int = self._sectorTypes[sectorIndex]
+        if newCode != oldCode:
+            block: int = sectorIndex // self._sectorsPerQuadrant
+            if oldCode == EMPTY_SECTOR_CODE:
+                self._emptyCounts[block] -= 1
+            elif newCode == EMPTY_SECTOR_CODE:
+                self._emptyCounts[block] += 1
+            self._versions[block] += 1
+
+            self._sectorTypes[sectorIndex] = newCode
+
+    def isSectorEmpty(self, sectorIndex: int) -> bool:
+        return self._sectorTypes[sectorIndex] == EMPTY_SECTOR_CODE
+
+    def getOccupant(self, sectorIndex: int) -> BaseGamePiece:
+
+        slot: int = self._occupants[sectorIndex]
+        if slot == SectorStore.NO_OCCUPANT:
+            return cast(BaseGamePiece, None)
+
+        return self._gamePieces[slot]
+
+    def setOccupant(self, sectorIndex: int, gamePiece: BaseGamePiece):
+        """
+        Args:
+            sectorIndex:    The sector's position in the store
+            gamePiece:      The new occupant;  `None` vacates the sector
+        """
+        slot: int = self._occupants[sectorIndex]
+        if gamePiece is None:
+            if slot != SectorStore.NO_OCCUPANT:
+                self._gamePieces[slot] = cast(BaseGamePiece, None)
+                self._freeSlots.append(slot)
+                self._occupants[sectorIndex] = SectorStore.NO_OCCUPANT
+        elif slot != SectorStore.NO_OCCUPANT:
+            self._gamePieces[slot] = gamePiece
+        else:
+            if len(self._freeSlots) > 0:
+                slot = self._freeSlots.pop()
+                self._gamePieces[slot] = gamePiece
+            else:
+                slot = len(self._gamePieces)
+                self._gamePieces.append(gamePiece)
+            self._occupants[sectorIndex] = slot
+
+    def emptyCount(self, quadrantIndex: int) -> int:
+
+        block: int = self._sectorBlocks[quadrantIndex]
+        if block == SectorStore.NO_SECTORS:
+            return self._sectorsPerQuadrant
+
+        return self._emptyCounts[block]
+
+    def version(self, quadrantIndex: int) -> int:
+        """
+        Args:
+            quadrantIndex:  The quadrant's position in the store
+
+        Returns:  A number that changes whenever one of the quadrant's sector types changes
+        """
+        block: int = self._sectorBlocks[quadrantIndex]
+        if block == SectorStore.NO_SECTORS:
+            return 0
+
+        return self._versions[block]
+
+    def sectorTypeMask(self, quadrantIndex: int, sectorTypes: FrozenSet[SectorType]) -> int:
+        """
+        Args:
+            quadrantIndex:  The quadrant's position in the store
+            sectorTypes:    The sector types to look for
+
+        Returns:  A bit mask with bit `y * columns + x` set for each sector of one of the types
+        """
+        block: int = self._sectorBlocks[quadrantIndex]
+        if block == SectorStore.NO_SECTORS:
+            return 0
+
+        codes:       FrozenSet[int] = frozenset(SECTOR_TYPE_CODES[sectorType] for sectorType in sectorTypes)
+        firstSector: int            = block * self._sectorsPerQuadrant
+        mask:        int            = 0
+        for bit, code in enumerate(self._sectorTypes[firstSector:firstSector + self._sectorsPerQuadrant]):
+            if code in codes:
+                mask |= 1 << bit
+
+        return mask
+
+    def allocatedQuadrantCount(self) -> int:
+        """
+        Returns:  The number of quadrants whose sectors have been allocated
+        """
+        return len(self._emptyCounts)
+
+    def getEnemyCount(self, quadrantIndex: int, sectorType: SectorType) -> int:
+        return self._enemyCounts[sectorType][quadrantIndex]
+
+    def setEnemyCount(self, quadrantIndex: int, sectorType: SectorType, count: int):
+        self._enemyCounts[sectorType][quadrantIndex] = count
+
+    def _allocateSectors(self, quadrantIndex: int) -> int:
+        """
+        Args:
+            quadrantIndex:  The quadrant that needs sectors
+
+        Returns:  The new block of empty sectors
+        """
+        block: int = len(self._emptyCounts)
+
+        self._sectorTypes.extend(array('b', [EMPTY_SECTOR_CODE]) * self._sectorsPerQuadrant)
+        self._occupants.extend(array('l', [SectorStore.NO_OCCUPANT]) * self._sectorsPerQuadrant)
+        self._emptyCounts.append(self._sectorsPerQuadrant)
+        self._versions.append(0)
+
+        self._sectorBlocks[quadrantIndex] = block
+
+        return block
@@ -1,8 +1,11 @@
 
+from typing import Dict
+
 from logging import Logger
 from logging import getLogger
 
 from codeallybasic.DynamicConfiguration import KeyName
+from codeallybasic.DynamicConfiguration import LookupResult
 from codeallybasic.DynamicConfiguration import SectionName
 from codeallybasic.DynamicConfiguration import Sections
 from codeallybasic.DynamicConfiguration import ValueDescription
@@ -27,6 +30,8 @@ SECTION_LIMITS: ValueDescriptions = ValueDescriptions(
         KeyName('maximumStarBases'):   ValueDescription(defaultValue='5',    deserializer=SecureConversions.secureInteger),
         KeyName('maximumPlanets'):     ValueDescription(defaultValue='10',   deserializer=SecureConversions.secureInteger),
         KeyName('defaultFullShields'): ValueDescription(defaultValue='2500', deserializer=SecureConversions.secureInteger),
+        KeyName('galaxyRows'):         ValueDescription(defaultValue='10',   deserializer=SecureConversions.secureInteger),
+        KeyName('galaxyColumns'):      ValueDescription(defaultValue='10',   deserializer=SecureConversions.secureInteger),
     }
 )
 
@@ -74,6 +79,23 @@ SECTION_FACTORS: ValueDescriptions = ValueDescriptions(
     }
 )
 
+SECTION_SAVE: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('autoSave'):                ValueDescription(defaultValue='True', deserializer=SecureConversions.secureBoolean),
+        KeyName('autoSaveInterval'):        ValueDescription(defaultValue='30.0', deserializer=SecureConversions.secureFloat),
+        KeyName('autoSaveChangeThreshold'): ValueDescription(defaultValue='100',  deserializer=SecureConversions.secureInteger),
+        KeyName('saveBackupCount'):         ValueDescription(defaultValue='3',    deserializer=SecureConversions.secureInteger),
+    }
+)
+
+SECTION_SOUND: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('preloadSounds'): ValueDescription(defaultValue='True', deserializer=SecureConversions.secureBoolean),
+        KeyName('maxVoices'):     ValueDescription(defaultValue='8',    deserializer=SecureConversions.secureInteger),
+        KeyName('soundCooldown'): ValueDescription(defaultValue='0.1',  deserializer=SecureConversions.secureFloat),
+    }
+)
+
 NOVICE_PLAYER:   str = PlayerType.Novice.name.lower()
 FAIR_PLAYER:     str = PlayerType.Fair.name.lower()
 GOOD_PLAYER:     str = PlayerType.Good.name.lower()
@@ -131,6 +153,11 @@ SECTION_DEBUG: ValueDescriptions = ValueDescriptions(
         KeyName('debugSmoothMotionInterval'):                ValueDescription(defaultValue='5',     deserializer=SecureConversions.secureInteger),
         KeyName('drawSectionBoundaries'):                    ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
         KeyName('debugEvents'):                              ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('gameSeed'):                                 ValueDescription(defaultValue='0',     deserializer=SecureConversions.secureInteger),
+        KeyName('profileFrames'):                            ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('drawFrameProfile'):                         ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('frameProfileWindow'):                       ValueDescription(defaultValue='300',   deserializer=SecureConversions.secureInteger),
+        KeyName('frameTraceEvents'):                         ValueDescription(defaultValue='50000', deserializer=SecureConversions.secureInteger),
     }
 )
 GAME_SETTINGS_SECTIONS: Sections = Sections(
@@ -139,6 +166,8 @@ GAME_SETTINGS_SECTIONS: Sections = Sections(
         SectionName('Power'):         SECTION_POWER,
         SectionName('GameLevel'):     SECTION_GAME_LEVEL,
         SectionName('Factors'):       SECTION_FACTORS,
+        SectionName('Save'):          SECTION_SAVE,
+        SectionName('Sound'):         SECTION_SOUND,
         SectionName('TorpedoSpeeds'): SECTION_SPEED_SETTINGS,
         SectionName('Developer'):     SECTION_DEVELOPER,
         SectionName('Debug'):         SECTION_DEBUG,
@@ -152,3 +181,18 @@ class GameSettings(DynamicConfiguration, metaclass=SingletonV3):
         self._logger: Logger = getLogger(__name__)
 
         super().__init__(baseFileName=GAME_SETTINGS_FILE_NAME, moduleName=APPLICATION_NAME, sections=GAME_SETTINGS_SECTIONS)
+
+    def overrideValues(self, overrides: Dict[str, str]):
+        """
+        Change setting values in memory only.  Unlike setting the properties this does not write
+        through to the settings file;  So concurrent simulations can each use their own values
+
+        Args:
+            overrides:  Setting names mapped to their serialized values;  e.g. {'damageAdjuster': '0.75'}
+
+        Raises: UnDefinedValueDescription if a setting name is not defined
+        """
+        for keyName, valueStr in overrides.items():
+            result: LookupResult = self._lookupKey(searchKeyName=KeyName(keyName))
+            self._configParser.set(result.sectionName, keyName, valueStr)
+            self._logger.info(f'Overrode {keyName} with {valueStr}')
@@ -0,0 +1,105 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from pytrek.simulation.SimulationOutcome import SimulationOutcome
+from pytrek.simulation.SimulationResult import SimulationResult
+
+Column  = NewType('Column',  List[Any])
+Columns = NewType('Columns', Dict[str, Column])
+
+
+class BatchResults:
+    """
+    Per game outcomes of a batch run stored column by column, so that
+    analysis tools can load a single metric without walking every game.
+
+    Every settings override name becomes an additional column
+    """
+    SEED_COLUMN:    str       = 'seed'
+    WON_COLUMN:     str       = 'won'
+    RESULT_COLUMNS: List[str] = [
+        'outcome', 'starDate', 'remainingGameTime',
+        'remainingKlingons', 'remainingCommanders', 'remainingSuperCommanders',
+        'energy', 'ticks', 'energyCurve'
+    ]
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._gameCount: int     = 0
+        self._columns:   Columns = Columns({})
+
+        for columnName in [BatchResults.SEED_COLUMN, BatchResults.WON_COLUMN] + BatchResults.RESULT_COLUMNS:
+            self._columns[columnName] = Column([])
+
+    def __len__(self) -> int:
+        return self._gameCount
+
+    @property
+    def columnNames(self) -> List[str]:
+        return list(self._columns.keys())
+
+    def column(self, columnName: str) -> Column:
+        return self._columns[columnName]
+
+    def addResult(self, seed: int, settingsOverrides: Dict[str, str], result: SimulationResult):
+        """
+        Append a single game
+
+        Args:
+            seed:               The seed the game was played with
+            settingsOverrides:  The game settings that were changed for the game
+            result:             How the game turned out
+        """
+        self._columns[BatchResults.SEED_COLUMN].append(seed)
+        self._columns[BatchResults.WON_COLUMN].append(result.outcome == SimulationOutcome.Won)
+        for columnName in BatchResults.RESULT_COLUMNS:
+            value: Any = getattr(result, columnName)
+            if isinstance(value, SimulationOutcome):
+                value = value.name
+            elif isinstance(value, list):
+                value = list(value)
+            self._columns[columnName].append(value)
+
+        for settingName, valueStr in settingsOverrides.items():
+            if settingName not in self._columns:
+                # Games that ran before this setting showed up did not change it
+                self._columns[settingName] = Column([None] * self._gameCount)
+            self._columns[settingName].append(valueStr)
+
+        self._gameCount += 1
+        # Pad any setting column this game did not change
+        for column in self._columns.values():
+            if len(column) < self._gameCount:
+                column.append(None)
+
+    def toJson(self) -> str:
+        return jsonDumps({'gameCount': self._gameCount, 'columns': self._columns})
+
+    def save(self, fqFileName: Path):
+
+        fqFileName.write_text(self.toJson())
+        self.logger.info(f'Saved {self._gameCount} game results to {fqFileName}')
+
+    @classmethod
+    def load(cls, fqFileName: Path) -> 'BatchResults':
+
+        jsonDict: Dict[str, Any] = jsonLoads(fqFileName.read_text())
+
+        batchResults: BatchResults = BatchResults()
+        batchResults._gameCount = jsonDict['gameCount']
+        batchResults._columns   = Columns(jsonDict['columns'])
+
+        return batchResults
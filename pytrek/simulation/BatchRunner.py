@@ -0,0 +1,167 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import cpu_count
+
+from pathlib import Path
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from concurrent.futures import ProcessPoolExecutor
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pytrek.simulation.BatchResults import BatchResults
+from pytrek.simulation.HeadlessSimulation import HeadlessSimulation
+from pytrek.simulation.HeadlessSimulation import SettingsOverrides
+from pytrek.simulation.SimulationResult import SimulationResult
+
+
+def settingsOverridesFactory() -> SettingsOverrides:
+    return SettingsOverrides({})
+
+
+@dataclass
+class BatchGame:
+    """
+    A single unit of work for a batch worker
+    """
+    seed:              int               = 0
+    maxTicks:          int               = HeadlessSimulation.DEFAULT_MAX_TICKS
+    settingsOverrides: SettingsOverrides = field(default_factory=settingsOverridesFactory)
+
+
+GameOutcome = Tuple[BatchGame, SimulationResult]
+
+
+def playBatchGame(batchGame: BatchGame) -> GameOutcome:
+    """
+    Runs in the worker process.  Every worker process has its own set of game
+    singletons and each simulation resets them;  So games never share state
+
+    Args:
+        batchGame:  The game to play
+
+    Returns:  The game paired with how it turned out
+    """
+    simulation: HeadlessSimulation = HeadlessSimulation(maxTicks=batchGame.maxTicks, seed=batchGame.seed, settingsOverrides=batchGame.settingsOverrides)
+
+    return batchGame, simulation.run()
+
+
+class BatchRunner:
+    """
+    Runs independent, seeded headless games across a process pool.  Process isolation
+    is required because the game model is built from singletons.
+
+    Game n of a batch uses the seed `baseSeed + n`;  So any single game can be replayed
+    with a HeadlessSimulation
+    """
+    def __init__(self, workers: int = cast(int, None), maxTicks: int = HeadlessSimulation.DEFAULT_MAX_TICKS):
+        """
+
+        Args:
+            workers:    The number of worker processes;  Defaults to the number of cores
+            maxTicks:   Passed to each simulation
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if workers is None:
+            workers = cpu_count() or 1
+
+        self._workers:  int = workers
+        self._maxTicks: int = maxTicks
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def run(self, gameCount: int, baseSeed: int = 0, settingsOverrides: Dict[str, str] = cast(Dict[str, str], None)) -> BatchResults:
+        """
+        Args:
+            gameCount:          How many games to play
+            baseSeed:           The seed of the first game
+            settingsOverrides:  Game settings to change for every game in the batch
+
+        Returns:  The per game outcomes
+        """
+        if settingsOverrides is None:
+            settingsOverrides = {}
+
+        batchGames: List[BatchGame] = [
+            BatchGame(seed=baseSeed + x, maxTicks=self._maxTicks, settingsOverrides=SettingsOverrides(settingsOverrides))
+            for x in range(gameCount)
+        ]
+
+        return self._runGames(batchGames=batchGames)
+
+    def sweep(self, settingName: str, values: List[str], gamesPerValue: int, baseSeed: int = 0) -> BatchResults:
+        """
+        Play the same seeded games once for each value of a single setting.  For example,
+        sweep `photonTorpedoMisfireRate` or `damageAdjuster` from the Factors section
+
+        Args:
+            settingName:    The game setting to vary
+            values:         The serialized values to try
+            gamesPerValue:  How many games to play with each value
+            baseSeed:       The seed of the first game for each value
+
+        Returns:  The per game outcomes with a column for the swept setting
+        """
+        batchGames: List[BatchGame] = []
+        for value in values:
+            for x in range(gamesPerValue):
+                overrides: SettingsOverrides = SettingsOverrides({settingName: value})
+                batchGames.append(BatchGame(seed=baseSeed + x, maxTicks=self._maxTicks, settingsOverrides=overrides))
+
+        return self._runGames(batchGames=batchGames)
+
+    def _runGames(self, batchGames: List[BatchGame]) -> BatchResults:
+
+        batchResults: BatchResults = BatchResults()
+        chunkSize:    int          = max(1, len(batchGames) // (self._workers * 4))
+
+        self.logger.info(f'Playing {len(batchGames)} games with {self._workers} workers')
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            for batchGame, result in executor.map(playBatchGame, batchGames, chunksize=chunkSize):
+                batchResults.addResult(seed=batchGame.seed, settingsOverrides=batchGame.settingsOverrides, result=result)
+
+        return batchResults
+
+
+def main():
+    """
+    python -m pytrek.simulation.BatchRunner --games 1000 --output results.json
+    python -m pytrek.simulation.BatchRunner --games 250 --sweep damageAdjuster=0.25,0.5,1.0 --output sweep.json
+    """
+    parser: ArgumentParser = ArgumentParser(description='Run headless PyTrek games for game balance analysis')
+
+    parser.add_argument('--games',    type=int, default=100,  help='Number of games (per sweep value)')
+    parser.add_argument('--workers',  type=int, default=None, help='Worker processes; defaults to the number of cores')
+    parser.add_argument('--seed',     type=int, default=0,    help='Seed of the first game')
+    parser.add_argument('--maxTicks', type=int, default=HeadlessSimulation.DEFAULT_MAX_TICKS, help='Abort a game after this many ticks')
+    parser.add_argument('--sweep',    type=str, default=None, help='settingName=value1,value2,...')
+    parser.add_argument('--output',   type=Path, required=True, help='Columnar results file')
+
+    args:         Namespace    = parser.parse_args()
+    batchRunner:  BatchRunner  = BatchRunner(workers=args.workers, maxTicks=args.maxTicks)
+
+    if args.sweep is None:
+        batchResults: BatchResults = batchRunner.run(gameCount=args.games, baseSeed=args.seed)
+    else:
+        settingName, valuesStr = args.sweep.split('=')
+        batchResults = batchRunner.sweep(settingName=settingName, values=valuesStr.split(','), gamesPerValue=args.games, baseSeed=args.seed)
+
+    batchResults.save(fqFileName=args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,362 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import asdict
+from dataclasses import dataclass
+
+from datetime import datetime
+
+from json import dump as jsonDump
+from json import load as jsonLoad
+
+from pathlib import Path
+
+from platform import machine
+from platform import python_version
+
+from statistics import median
+
+from sys import exit as sysExit
+
+from timeit import Timer
+
+from pytrek.commandparser.CommandParser import CommandParser
+
+from pytrek.engine.Computer import Computer
+from pytrek.engine.GameEngine import GameEngine
+from pytrek.engine.LineOfSight import ENTERPRISE_TORPEDO_OBSTACLES
+
+from pytrek.mediators.EnterpriseTorpedoMediator import EnterpriseTorpedoMediator
+from pytrek.mediators.QuadrantMediator import QuadrantMediator
+
+from pytrek.model.Coordinates import Coordinates
+from pytrek.model.Galaxy import Galaxy
+from pytrek.model.Quadrant import Quadrant
+
+from pytrek.simulation.HeadlessSimulation import HeadlessSimulation
+
+BASELINE_VERSION: int = 1
+
+FRAME_TIME:        float     = 1.0 / 60.0       # Real time seconds per frame
+FRAMES_PER_CALL:   int       = 10
+ENEMY_COUNTS:      List[int] = [1, 10, 90]      # A quadrant only has 99 sectors besides the Enterprise's
+DEFAULT_THRESHOLD: float     = 0.10
+
+TimedCall      = Callable[[], Any]
+BenchmarkSetup = Callable[[], TimedCall]
+"""
+Sets up a fresh game and returns the call to time
+"""
+BenchmarkSetups = NewType('BenchmarkSetups', Dict[str, BenchmarkSetup])
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Times are in microseconds per call
+    """
+    name:    str   = ''
+    median:  float = 0.0
+    minimum: float = 0.0
+    loops:   int   = 0
+    repeats: int   = 0
+
+
+@dataclass
+class BenchmarkComparison:
+    """
+    `ratio` is the current median over the baseline median
+    """
+    name:           str   = ''
+    baselineMedian: float = 0.0
+    currentMedian:  float = 0.0
+    ratio:          float = 0.0
+    regressed:      bool  = False
+
+
+BenchmarkResults     = NewType('BenchmarkResults',     List[BenchmarkResult])
+BenchmarkComparisons = NewType('BenchmarkComparisons', List[BenchmarkComparison])
+
+
+class BenchmarkSuite:
+    """
+    Times the game's hot spots;  Model construction, the distance and combat computations, line of
+    sight, the event engine, the command parser and headless frames of the quadrant mediator.
+
+    Each benchmark plays a new seeded game;  So runs on the same machine are comparable.  Like
+    timeit, a benchmark runs enough loops to take `minimumTime` per repeat and reports the
+    median and the best repeat
+    """
+    DEFAULT_REPEATS:      int   = 5
+    DEFAULT_MINIMUM_TIME: float = 0.2       # seconds
+
+    def __init__(self, repeats: int = DEFAULT_REPEATS, minimumTime: float = DEFAULT_MINIMUM_TIME, seed: int = 0):
+        """
+
+        Args:
+            repeats:        How many times to time each benchmark
+            minimumTime:    Seconds each repeat should at least take
+            seed:           The game seed
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._repeats:     int   = repeats
+        self._minimumTime: float = minimumTime
+        self._seed:        int   = seed
+
+    def benchmarks(self) -> BenchmarkSetups:
+        """
+        Returns:  The benchmarks by name in the order they run
+        """
+        benchmarkSetups: BenchmarkSetups = BenchmarkSetups({
+            'Galaxy()':                         self._setupGalaxyConstruction,
+            'Quadrant()':                       self._setupQuadrantConstruction,
+            'Computer.computeQuadrantDistance': self._setupQuadrantDistance,
+            'Computer.computeCourse':           self._setupCourse,
+            'GameEngine.computeHit':            self._setupComputeHit,
+            'BaseMediator._hasLineOfSight':     self._setupLineOfSight,
+            'EventEngine._checkEvents':         self._setupCheckEvents,
+            'CommandParser.parseCommand':       self._setupParseCommand,
+        })
+        for enemyCount in ENEMY_COUNTS:
+            benchmarkSetups[f'QuadrantMediator.update[{enemyCount} enemies]'] = self._quadrantUpdateSetup(enemyCount=enemyCount)
+
+        return benchmarkSetups
+
+    def run(self, nameFilter: str = '') -> BenchmarkResults:
+        """
+        Args:
+            nameFilter:  Only run the benchmarks whose name contains this
+
+        Returns:  The timings
+        """
+        results: BenchmarkResults = BenchmarkResults([])
+        for name, benchmarkSetup in self.benchmarks().items():
+            if nameFilter in name:
+                results.append(self.timeBenchmark(name=name, benchmarkSetup=benchmarkSetup))
+
+        return results
+
+    def timeBenchmark(self, name: str, benchmarkSetup: BenchmarkSetup) -> BenchmarkResult:
+        """
+        Args:
+            name:           Names the result
+            benchmarkSetup: Returns the call to time
+
+        Returns:  The timing
+        """
+        timer: Timer = Timer(stmt=benchmarkSetup())
+
+        loops, loopsTime = timer.autorange()
+        if loopsTime < self._minimumTime:
+            loops = max(loops, int(loops * self._minimumTime / max(loopsTime, 1e-9)))
+
+        repeatTimes: List[float] = timer.repeat(repeat=self._repeats, number=loops)
+        callTimes:   List[float] = [(repeatTime / loops) * 1000000.0 for repeatTime in repeatTimes]
+
+        result: BenchmarkResult = BenchmarkResult(name=name, median=median(callTimes), minimum=min(callTimes), loops=loops, repeats=self._repeats)
+        self.logger.info(f'{result}')
+
+        return result
+
+    @classmethod
+    def saveBaseline(cls, results: BenchmarkResults, fileName: Path):
+        """
+        Args:
+            results:    The timings to keep
+            fileName:   The baseline JSON file
+        """
+        baseline: Dict[str, Any] = {
+            'version': BASELINE_VERSION,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python':  python_version(),
+            'machine': machine(),
+            'results': [asdict(result) for result in results],
+        }
+        with fileName.open(mode='w') as fd:
+            jsonDump(baseline, fd, indent=2)
+
+    @classmethod
+    def loadBaseline(cls, fileName: Path) -> BenchmarkResults:
+        """
+        Args:
+            fileName:   A baseline JSON file
+
+        Returns:  The timings in the baseline
+        """
+        with fileName.open() as fd:
+            baseline: Dict[str, Any] = jsonLoad(fd)
+
+        return BenchmarkResults([BenchmarkResult(**result) for result in baseline['results']])
+
+    @classmethod
+    def compare(cls, results: BenchmarkResults, baseline: BenchmarkResults, threshold: float = DEFAULT_THRESHOLD) -> BenchmarkComparisons:
+        """
+        Args:
+            results:    The current timings
+            baseline:   The timings to compare against
+            threshold:  A benchmark regressed if its median is more than this fraction slower
+
+        Returns:  The benchmarks found in both
+        """
+        baselineResults: Dict[str, BenchmarkResult] = {result.name: result for result in baseline}
+
+        comparisons: BenchmarkComparisons = BenchmarkComparisons([])
+        for result in results:
+            baselineResult: BenchmarkResult = baselineResults.get(result.name, cast(BenchmarkResult, None))
+            if baselineResult is None:
+                continue
+            ratio: float = result.median / baselineResult.median
+            comparisons.append(BenchmarkComparison(name=result.name,
+                                                   baselineMedian=baselineResult.median,
+                                                   currentMedian=result.median,
+                                                   ratio=ratio,
+                                                   regressed=ratio > 1.0 + threshold))
+        return comparisons
+
+    def _newGame(self) -> HeadlessSimulation:
+        return HeadlessSimulation(seed=self._seed)
+
+    def _setupGalaxyConstruction(self) -> TimedCall:
+
+        self._newGame()
+
+        def constructGalaxy():
+            Galaxy._instances = {}
+            Galaxy()
+
+        return constructGalaxy
+
+    def _setupQuadrantConstruction(self) -> TimedCall:
+
+        self._newGame()
+        coordinates: Coordinates = Coordinates(x=4, y=5)
+
+        return lambda: Quadrant(coordinates=coordinates)
+
+    def _setupQuadrantDistance(self) -> TimedCall:
+
+        self._newGame()
+        computer: Computer    = Computer()
+        start:    Coordinates = Coordinates(x=1, y=2)
+        end:      Coordinates = Coordinates(x=8, y=6)
+
+        return lambda: computer.computeQuadrantDistance(startSector=start, endSector=end)
+
+    def _setupCourse(self) -> TimedCall:
+
+        self._newGame()
+        computer: Computer    = Computer()
+        start:    Coordinates = Coordinates(x=1, y=2)
+        end:      Coordinates = Coordinates(x=8, y=6)
+
+        return lambda: computer.computeCourse(startCoordinates=start, endCoordinates=end)
+
+    def _setupComputeHit(self) -> TimedCall:
+
+        self._newGame()
+        gameEngine: GameEngine  = GameEngine()
+        shooter:    Coordinates = Coordinates(x=7, y=7)
+        target:     Coordinates = Coordinates(x=3, y=7)
+
+        return lambda: gameEngine.computeHit(shooterPosition=shooter, targetPosition=target, klingonPower=400.0)
+
+    def _setupLineOfSight(self) -> TimedCall:
+
+        simulation: HeadlessSimulation        = self._newGame()
+        quadrant:   Quadrant                  = simulation.galaxy.currentQuadrant
+        mediator:   EnterpriseTorpedoMediator = EnterpriseTorpedoMediator()
+        start:      Coordinates               = Coordinates(x=0, y=0)
+        end:        Coordinates               = Coordinates(x=9, y=7)
+
+        # noinspection PyProtectedMember
+        return lambda: mediator._hasLineOfSight(quadrant=quadrant, startSector=start, endSector=end, obstacleTypes=ENTERPRISE_TORPEDO_OBSTACLES)
+
+    def _setupCheckEvents(self) -> TimedCall:
+
+        simulation: HeadlessSimulation = self._newGame()
+        starDate:   float              = simulation.gameState.starDate
+
+        # noinspection PyProtectedMember
+        return lambda: simulation.eventEngine._checkEvents(currentStarDate=starDate)
+
+    def _setupParseCommand(self) -> TimedCall:
+
+        commandParser: CommandParser = CommandParser()
+
+        return lambda: commandParser.parseCommand(commandStr='move automatic 3 7 5 8')
+
+    def _quadrantUpdateSetup(self, enemyCount: int) -> BenchmarkSetup:
+
+        def setupQuadrantUpdate() -> TimedCall:
+
+            simulation: HeadlessSimulation = self._newGame()
+            quadrant:   Quadrant           = simulation.galaxy.currentQuadrant
+            gameEngine: GameEngine         = GameEngine()
+
+            while len(quadrant.klingons) + len(quadrant.commanders) + len(quadrant.superCommanders) < enemyCount:
+                quadrant.addKlingon()
+
+            quadrantMediator: QuadrantMediator = QuadrantMediator()
+            quadrantMediator.enterQuadrant(quadrant=quadrant, enterprise=simulation.gameState.enterprise)
+
+            def updateFrames():
+                for frame in range(FRAMES_PER_CALL):
+                    gameEngine.updateRealTimeClock(deltaTime=FRAME_TIME)
+                    quadrantMediator.update(quadrant=quadrant)
+
+            return updateFrames
+
+        return setupQuadrantUpdate
+
+
+def main():
+    """
+    python -m pytrek.simulation.BenchmarkSuite --save baseline.json
+    python -m pytrek.simulation.BenchmarkSuite --compare baseline.json --threshold 0.15
+    """
+    parser: ArgumentParser = ArgumentParser(description='Time the game hot spots;  Save a baseline or compare against one')
+
+    parser.add_argument('--save',      type=Path,  default=None, help='Write the timings to this baseline file')
+    parser.add_argument('--compare',   type=Path,  default=None, help='Compare the timings against this baseline file')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Fraction slower than the baseline that is a regression')
+    parser.add_argument('--filter',    type=str,   default='',   help='Only run the benchmarks whose name contains this')
+    parser.add_argument('--repeats',   type=int,   default=BenchmarkSuite.DEFAULT_REPEATS, help='Repeats per benchmark')
+    parser.add_argument('--seed',      type=int,   default=0, help='Game seed')
+
+    args:           Namespace        = parser.parse_args()
+    benchmarkSuite: BenchmarkSuite   = BenchmarkSuite(repeats=args.repeats, seed=args.seed)
+    results:        BenchmarkResults = benchmarkSuite.run(nameFilter=args.filter)
+
+    print(f'{"benchmark":<45} {"median us":>12} {"min us":>12} {"loops":>8}')
+    for result in results:
+        print(f'{result.name:<45} {result.median:>12.2f} {result.minimum:>12.2f} {result.loops:>8}')
+
+    if args.save is not None:
+        BenchmarkSuite.saveBaseline(results=results, fileName=args.save)
+
+    if args.compare is not None:
+        comparisons: BenchmarkComparisons = BenchmarkSuite.compare(results=results, baseline=BenchmarkSuite.loadBaseline(fileName=args.compare), threshold=args.threshold)
+
+        print(f'\n{"benchmark":<45} {"baseline us":>12} {"current us":>12} {"ratio":>7}')
+        for comparison in comparisons:
+            flag: str = '  REGRESSED' if comparison.regressed is True else ''
+            print(f'{comparison.name:<45} {comparison.baselineMedian:>12.2f} {comparison.currentMedian:>12.2f} {comparison.ratio:>7.2f}{flag}')
+
+        if any(comparison.regressed for comparison in comparisons):
+            sysExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import dataclass
+
+from time import perf_counter
+
+from pytrek.simulation.HeadlessSimulation import HeadlessSimulation
+from pytrek.simulation.HeadlessSimulation import SettingsOverrides
+from pytrek.simulation.SimulationOutcome import SimulationOutcome
+
+DEFAULT_GALAXY_SIZES: List[int] = [10, 50, 100, 200]
+
+
+@dataclass
+class GalaxySizeTiming:
+    """
+    How long a galaxy of a given size takes to create and to step
+    """
+    galaxySize:     int   = 0
+    creationTime:   float = 0.0     # milliseconds
+    meanStepTime:   float = 0.0     # microseconds
+    steps:          int   = 0
+
+
+class GalaxySizeBenchmark:
+    """
+    Times the creation and the per step cost of square galaxies of increasing size.  Both should
+    stay roughly flat since quadrants and their sectors are created on first use
+    """
+    DEFAULT_STEPS: int = 500
+
+    def __init__(self, steps: int = DEFAULT_STEPS, seed: int = 0):
+        """
+
+        Args:
+            steps:  How many simulation steps to time for each galaxy size
+            seed:   Each galaxy size plays the same seeded game
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._steps: int = steps
+        self._seed:  int = seed
+
+    def run(self, galaxySizes: List[int]) -> List[GalaxySizeTiming]:
+        """
+        Args:
+            galaxySizes:  The number of rows (and columns) of each galaxy to time
+
+        Returns:  The timing for each galaxy size
+        """
+        self.timeGalaxySize(galaxySize=min(galaxySizes))     # Warm up;  Loads the textures, fonts, etc.
+
+        return [self.timeGalaxySize(galaxySize=galaxySize) for galaxySize in galaxySizes]
+
+    def timeGalaxySize(self, galaxySize: int) -> GalaxySizeTiming:
+
+        overrides: SettingsOverrides = SettingsOverrides({'galaxyRows': str(galaxySize), 'galaxyColumns': str(galaxySize)})
+
+        startTime:  float              = perf_counter()
+        simulation: HeadlessSimulation = HeadlessSimulation(seed=self._seed, settingsOverrides=overrides)
+        creationTime: float = perf_counter() - startTime
+
+        steps: int = 0
+        startTime = perf_counter()
+        while steps < self._steps and simulation.outcome == SimulationOutcome.InProgress:
+            simulation.step()
+            steps += 1
+        stepTime: float = perf_counter() - startTime
+
+        timing: GalaxySizeTiming = GalaxySizeTiming(galaxySize=galaxySize,
+                                                    creationTime=creationTime * 1000.0,
+                                                    meanStepTime=(stepTime / max(steps, 1)) * 1000000.0,
+                                                    steps=steps)
+        self.logger.info(f'{timing}')
+
+        return timing
+
+
+def main():
+    """
+    python -m pytrek.simulation.GalaxySizeBenchmark --sizes 10,100,200 --steps 1000
+    """
+    parser: ArgumentParser = ArgumentParser(description='Time galaxy creation and per step cost as the galaxy grows')
+
+    parser.add_argument('--sizes', type=str, default=','.join(str(size) for size in DEFAULT_GALAXY_SIZES), help='Galaxy rows (and columns) to time')
+    parser.add_argument('--steps', type=int, default=GalaxySizeBenchmark.DEFAULT_STEPS, help='Simulation steps to time per size')
+    parser.add_argument('--seed',  type=int, default=0, help='Game seed')
+
+    args:      Namespace           = parser.parse_args()
+    benchmark: GalaxySizeBenchmark = GalaxySizeBenchmark(steps=args.steps, seed=args.seed)
+
+    timings: List[GalaxySizeTiming] = benchmark.run(galaxySizes=[int(size) for size in args.sizes.split(',')])
+
+    print(f'{"galaxy":>10} {"create ms":>10} {"step us":>10} {"steps":>6}')
+    for timing in timings:
+        print(f'{timing.galaxySize:>4}x{timing.galaxySize:<5} {timing.creationTime:>10.1f} {timing.meanStepTime:>10.1f} {timing.steps:>6}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+
+from pytrek.GameState import GameState
+from pytrek.SoundMachine import SoundMachine
+
+from pytrek.engine.AutoSave import AutoSave
+from pytrek.engine.Computer import Computer
+from pytrek.engine.FrameProfiler import FrameProfiler
+from pytrek.engine.GameEngine import GameEngine
+from pytrek.engine.GameSnapshot import GameSnapshot
+from pytrek.engine.Intelligence import Intelligence
+from pytrek.engine.LineOfSight import LineOfSight
+from pytrek.engine.SaveFileWriter import SaveFileWriter
+
+from pytrek.engine.devices.DeviceManager import DeviceManager
+
+from pytrek.engine.futures.EventEngine import EventEngine
+
+from pytrek.gui.MessageConsoleProxy import MessageConsoleProxy
+from pytrek.gui.TextureRegistry import TextureRegistry
+
+from pytrek.mediators.GalaxyMediator import GalaxyMediator
+from pytrek.mediators.GalaxyViewMediator import GalaxyViewMediator
+from pytrek.mediators.LongRangeSensorScanMediator import LongRangeSensorScanMediator
+from pytrek.mediators.QuadrantMediator import QuadrantMediator
+
+from pytrek.model.Galaxy import Galaxy
+
+from pytrek.settings.GameSettings import GameSettings
+
+
+class GameSingletons:
+    """
+    Every game singleton in one place;  So that a new game in the same process (another
+    simulation or another unit test) does not pick up a singleton that still points at the
+    previous game.  Add new singletons here
+    """
+    @classmethod
+    def reset(cls):
+        """
+        Force the singletons to re-initialize the next time they are asked for
+        """
+        GameSettings._instances                = {}
+        GameState._instances                   = {}
+        GalaxyMediator._instances              = {}
+        QuadrantMediator._instances            = {}
+        GalaxyViewMediator._instances          = {}
+        LongRangeSensorScanMediator._instances = {}
+        EventEngine._instances                 = {}
+        Galaxy._instances                      = {}
+        Intelligence._instances                = {}
+        GameEngine._instances                  = {}
+        DeviceManager._instances               = {}
+        Computer._instances                    = {}
+        LineOfSight._instances                 = {}
+        GameSnapshot._instances                = {}
+        SaveFileWriter._instances              = {}
+        AutoSave._instances                    = {}
+        TextureRegistry._instances             = {}
+        FrameProfiler._instances               = {}
+        SoundMachine._instances                = {}
+        MessageConsoleProxy._instances         = {}
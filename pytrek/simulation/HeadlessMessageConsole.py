@@ -0,0 +1,37 @@
+
+from typing import Deque
+
+from logging import Logger
+from logging import getLogger
+
+from collections import deque
+
+from pytrek.gui.ConsoleMessageType import ConsoleMessageType
+
+
+class HeadlessMessageConsole:
+    """
+    Stands in for the MessageConsoleSection when there is no window.  Injected into the
+    MessageConsoleProxy so the engine, mediators and event handlers can report as usual.
+    Only the most recent messages are kept.
+    """
+    MAX_MESSAGES: int = 64
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._messages: Deque[str] = deque(maxlen=HeadlessMessageConsole.MAX_MESSAGES)
+
+    @property
+    def messages(self) -> Deque[str]:
+        return self._messages
+
+    def displayMessage(self, message: str, messageType: ConsoleMessageType = ConsoleMessageType.Normal):
+        """
+        Args:
+            message:     The message to record
+            messageType: Ignored other than for logging
+        """
+        self._messages.append(message)
+        self.logger.debug(f'{messageType.name}: {message}')
@@ -0,0 +1,432 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from math import ceil
+from math import sqrt
+
+from pytrek.GameState import GameState
+
+from pytrek.engine.Computer import Computer
+from pytrek.engine.GameEngine import CombatValues
+from pytrek.engine.GameEngine import GameEngine
+from pytrek.engine.Intelligence import Intelligence
+from pytrek.engine.ShieldHitData import ShieldHitData
+from pytrek.engine.ShipCondition import ShipCondition
+
+from pytrek.engine.futures.EventEngine import EventEngine
+
+from pytrek.gui.MessageConsoleProxy import MessageConsoleProxy
+from pytrek.gui.MessageConsoleSection import MessageConsoleSection
+
+from pytrek.gui.gamepieces.GamePieceTypes import Enemies
+from pytrek.gui.gamepieces.GamePieceTypes import Enemy
+
+from pytrek.mediators.GalaxyMediator import GalaxyMediator
+
+from pytrek.model.Coordinates import Coordinates
+from pytrek.model.Galaxy import Galaxy
+from pytrek.model.Quadrant import Quadrant
+
+from pytrek.settings.GameSettings import GameSettings
+
+from pytrek.simulation.GameSingletons import GameSingletons
+from pytrek.simulation.HeadlessMessageConsole import HeadlessMessageConsole
+from pytrek.simulation.SimulationOutcome import SimulationOutcome
+from pytrek.simulation.SimulationResult import EnergyCurve
+from pytrek.simulation.SimulationResult import SimulationResult
+
+SettingsOverrides = NewType('SettingsOverrides', Dict[str, str])
+
+
+class HeadlessSimulation:
+    """
+    Runs a complete game without a window, sections, UI mediators or sound.
+
+    The simulation steps a virtual clock as fast as the CPU allows.  On every tick the
+    enemies in the current quadrant get a chance to shoot, the auto captain takes a turn
+    and the event engine fires any events that came due.  The auto captain is deliberately
+    simple;  It hunts the closest enemies with phasers and heads for a StarBase when low on
+    energy.  Subclasses may override `_captainsTurn` to model other strategies.
+
+    Creating a simulation resets the game singletons so that each instance is a new game.
+    A seeded simulation is reproducible;  Settings overrides are applied in memory only.
+    """
+    DEFAULT_TICK_TIME:      float = 0.5         # Virtual seconds per tick
+    DEFAULT_MAX_TICKS:      int   = 100000
+    ENERGY_SAMPLE_INTERVAL: int   = 10          # Ticks between energy curve samples
+
+    PHASER_POWER:         float = 300.0
+    PHASER_RECHARGE_TIME: float = 5.0
+    LOW_ENERGY_LEVEL:     float = 1000.0
+
+    def __init__(self, tickTime: float = DEFAULT_TICK_TIME, maxTicks: int = DEFAULT_MAX_TICKS,
+                 seed: int = cast(int, None), settingsOverrides: SettingsOverrides = cast(SettingsOverrides, None)):
+        """
+
+        Args:
+            tickTime:           How many virtual seconds elapse per tick
+            maxTicks:           Abort the game if it has not ended after this many ticks
+            seed:               If set, seed the random number generator so the game is reproducible
+            settingsOverrides:  Game settings to change for this game only
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._tickTime: float = tickTime
+        self._maxTicks: int   = maxTicks
+        self._seed:     int   = seed
+
+        self._settingsOverrides: SettingsOverrides = settingsOverrides
+
+        self._ticks:           int               = 0
+        self._lastPhaserTime:  float             = 0.0
+        self._galaxyCleared:   bool              = False
+        self._outcome:         SimulationOutcome = SimulationOutcome.InProgress
+        self._energyCurve:     EnergyCurve       = EnergyCurve([])
+
+        self._messageConsole: HeadlessMessageConsole = HeadlessMessageConsole()
+
+        self._gameSettings:   GameSettings   = cast(GameSettings, None)
+        self._gameState:      GameState      = cast(GameState, None)
+        self._gameEngine:     GameEngine     = cast(GameEngine, None)
+        self._intelligence:   Intelligence   = cast(Intelligence, None)
+        self._computer:       Computer       = cast(Computer, None)
+        self._galaxy:         Galaxy         = cast(Galaxy, None)
+        self._galaxyMediator: GalaxyMediator = cast(GalaxyMediator, None)
+        self._eventEngine:    EventEngine    = cast(EventEngine, None)
+
+        self._setupGame()
+
+    @property
+    def outcome(self) -> SimulationOutcome:
+        return self._outcome
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def messageConsole(self) -> HeadlessMessageConsole:
+        return self._messageConsole
+
+    @property
+    def gameState(self) -> GameState:
+        return self._gameState
+
+    @property
+    def galaxy(self) -> Galaxy:
+        return self._galaxy
+
+    @property
+    def eventEngine(self) -> EventEngine:
+        return self._eventEngine
+
+    def run(self) -> SimulationResult:
+        """
+        Play until the game ends or we run out of ticks
+
+        Returns:  The final game tally
+        """
+        while self._outcome == SimulationOutcome.InProgress:
+            self.step()
+
+        return self.result()
+
+    def step(self) -> SimulationOutcome:
+        """
+        Advance the simulation a single tick
+
+        Returns:  The outcome after this tick;  `SimulationOutcome.InProgress` if the game continues
+        """
+        if self._outcome != SimulationOutcome.InProgress:
+            return self._outcome
+
+        self._ticks += 1
+        self._gameEngine.updateRealTimeClock(deltaTime=self._tickTime)
+
+        quadrant: Quadrant = self._galaxy.currentQuadrant
+        enemies:  Enemies  = self._liveEnemies(quadrant=quadrant)
+
+        self._enemiesFire(quadrant=quadrant, enemies=enemies)
+        self._captainsTurn(quadrant=quadrant, enemies=enemies)
+
+        self._eventEngine.checkEvents()
+
+        if self._ticks % HeadlessSimulation.ENERGY_SAMPLE_INTERVAL == 0:
+            self._energyCurve.append(self._gameState.energy)
+
+        self._outcome = self._determineOutcome()
+
+        return self._outcome
+
+    def result(self) -> SimulationResult:
+
+        gameState: GameState = self._gameState
+
+        return SimulationResult(outcome=self._outcome,
+                                starDate=gameState.starDate,
+                                remainingGameTime=gameState.remainingGameTime,
+                                remainingKlingons=gameState.remainingKlingons,
+                                remainingCommanders=gameState.remainingCommanders,
+                                remainingSuperCommanders=gameState.remainingSuperCommanders,
+                                energy=gameState.energy,
+                                ticks=self._ticks,
+                                energyCurve=self._energyCurve
+                                )
+
+    def _captainsTurn(self, quadrant: Quadrant, enemies: Enemies):
+        """
+        Refuel when low on energy, even if that means leaving a fight;  Otherwise, fight if
+        there is anyone to fight or go find the enemy
+
+        Args:
+            quadrant:   The quadrant the Enterprise is in
+            enemies:    The live enemies in that quadrant
+        """
+        if self._needsToRefuel() is True:
+            self._dockAtStarBase()
+        elif len(enemies) > 0:
+            if self._gameEngine.gameClock - self._lastPhaserTime >= HeadlessSimulation.PHASER_RECHARGE_TIME:
+                self._firePhasers(quadrant=quadrant, enemies=enemies)
+        else:
+            targetCoordinates: Coordinates = self._findClosestEnemyQuadrant(startCoordinates=quadrant.coordinates)
+            if targetCoordinates is None:
+                self._galaxyCleared = True
+            else:
+                self._warpTo(destinationCoordinates=targetCoordinates)
+
+    def _enemiesFire(self, quadrant: Quadrant, enemies: Enemies):
+        """
+        Enemies whose firing interval has elapsed hit the Enterprise immediately;  There
+        are no torpedo sprites so there is no travel time and no line of sight check
+
+        Args:
+            quadrant:   The quadrant the Enterprise is in
+            enemies:    The live enemies in that quadrant
+        """
+        currentTime: float   = self._gameEngine.gameClock
+        shooters:    Enemies = Enemies([])
+        for enemy in enemies:
+            if currentTime - enemy.lastTimeCheck > enemy.firingInterval:
+                enemy.lastTimeCheck = round(currentTime)
+                shooters.append(enemy)
+
+        if len(shooters) == 0 or self._gameState.shipCondition == ShipCondition.Docked:
+            return
+
+        hitValues: CombatValues = self._gameEngine.computeHitBatch(shooterPositions=GameEngine.sectorPositions([shooter.gameCoordinates for shooter in shooters]),
+                                                                   targetPositions=GameEngine.sectorPositions([quadrant.enterpriseCoordinates]),
+                                                                   klingonPowers=[shooter.power for shooter in shooters])
+        for hitValue in hitValues:
+            # The shields weaken with each hit;  So these are applied one at a time
+            shieldHitData: ShieldHitData = self._gameEngine.computeShieldHit(torpedoHit=float(hitValue), currentShieldPower=self._gameState.shieldEnergy)
+
+            self._gameEngine.degradeShields(shieldHitData.shieldAbsorptionValue)
+            self._gameEngine.degradeEnergyLevel(shieldHitData.degradedTorpedoHitValue)
+
+    def _firePhasers(self, quadrant: Quadrant, enemies: Enemies):
+        """
+        Mirrors EnterprisePhaserMediator.firePhasers without the phaser bolts and sounds
+        """
+        self._lastPhaserTime   = self._gameEngine.gameClock
+        self._gameState.energy -= HeadlessSimulation.PHASER_POWER
+
+        distances:   List[float] = [self._computer.computeQuadrantDistance(startSector=quadrant.enterpriseCoordinates, endSector=enemy.gameCoordinates) for enemy in enemies]
+        enemyPowers: List[float] = [enemy.power for enemy in enemies]
+
+        hits:        CombatValues = self._gameEngine.doPhasersBatch(distances=distances, enemyPowers=enemyPowers, powerAmount=HeadlessSimulation.PHASER_POWER)
+        enemyDrains: CombatValues = self._gameEngine.hitThemBatch(distances=distances, hits=hits, enemyPowers=enemyPowers)
+
+        for enemy, enemyDrain in zip(enemies, enemyDrains):
+            enemy.power -= float(enemyDrain)
+            if enemy.power <= 0.0:
+                self._messageConsole.displayMessage(f'Enemy at {enemy.gameCoordinates} destroyed')
+                self._gameEngine.decrementEnemyCount(enemy=enemy)
+                quadrant.decrementEnemyCount(enemy=enemy)
+
+    def _needsToRefuel(self) -> bool:
+        if self._gameState.energy < HeadlessSimulation.LOW_ENERGY_LEVEL and self._gameState.starBaseCount > 0:
+            return self._gameState.shipCondition != ShipCondition.Docked
+        return False
+
+    def _dockAtStarBase(self):
+        """
+        Warp to a StarBase and top off;  We do not bother to maneuver adjacent to it
+        """
+        starBaseCoordinates: Coordinates = self._galaxy.getStarBaseCoordinates()
+        if starBaseCoordinates is None:
+            self._gameState.starBaseCount = 0
+        else:
+            if starBaseCoordinates != self._galaxy.currentQuadrant.coordinates:
+                self._warpTo(destinationCoordinates=starBaseCoordinates)
+            self._gameEngine.resetEnergyLevels()
+            self._gameState.shipCondition = ShipCondition.Docked
+
+    def _warpTo(self, destinationCoordinates: Coordinates):
+
+        currentCoordinates: Coordinates = self._galaxy.currentQuadrant.coordinates
+
+        self._gameState.shipCondition = ShipCondition.Green
+        self._galaxyMediator.doWarp(currentCoordinates=currentCoordinates, destinationCoordinates=destinationCoordinates)
+        self._enterQuadrant(quadrant=self._galaxy.currentQuadrant)
+        self._gameEngine.fireDueEvents()
+
+    def _enterQuadrant(self, quadrant: Quadrant):
+        """
+        The model only part of QuadrantMediator.enterQuadrant;  The enemies start their
+        firing intervals when we arrive
+
+        Args:
+            quadrant:   The quadrant the Enterprise just arrived in
+        """
+        quadrant.materialize()
+
+        sectorCoordinates: Coordinates = quadrant.getRandomEmptySector().coordinates
+
+        for enemy in self._liveEnemies(quadrant=quadrant):
+            enemy.lastTimeCheck = round(self._gameEngine.gameClock)
+
+        self._gameState.currentQuadrantCoordinates = quadrant.coordinates
+        self._gameState.currentSectorCoordinates   = sectorCoordinates
+
+        quadrant.placeEnterprise(enterprise=self._gameState.enterprise, coordinates=sectorCoordinates)
+
+    def _findClosestEnemyQuadrant(self, startCoordinates: Coordinates) -> Coordinates:
+        """
+        Searches square rings of quadrants outward from where we are;  So the cost depends on
+        how far away the enemies are rather than on the galaxy size.  A quadrant on ring `r`
+        may be as far away as one on ring `r * sqrt(2)`;  So after the first find keep looking
+        that far out.  Uses the summary counts since most quadrants are not materialized
+
+        Args:
+            startCoordinates: Where we are
+
+        Returns:  The coordinates of the closest quadrant with live enemies;  `None` if there are none
+        """
+        closestCoordinates: Coordinates = cast(Coordinates, None)
+        closestDistance:    float       = 0.0
+
+        lastRing: int = max(self._galaxy.rows, self._galaxy.columns)
+        ring:     int = 0
+        while ring <= lastRing:
+            for coordinates in self._ringCoordinates(centerCoordinates=startCoordinates, ring=ring):
+                quadrant: Quadrant = self._galaxy.getQuadrant(quadrantCoordinates=coordinates)
+                if self._hasEnemies(quadrant=quadrant) is True:
+                    distance: float = self._computer.computeGalacticDistance(startQuadrantCoordinates=startCoordinates,
+                                                                            endQuadrantCoordinates=coordinates)
+                    if closestCoordinates is None:
+                        lastRing = min(lastRing, ceil(ring * sqrt(2)))
+                    if closestCoordinates is None or distance < closestDistance:
+                        closestCoordinates = coordinates
+                        closestDistance    = distance
+            ring += 1
+
+        return closestCoordinates
+
+    def _ringCoordinates(self, centerCoordinates: Coordinates, ring: int) -> List[Coordinates]:
+        """
+        Args:
+            centerCoordinates:  The center of the ring
+            ring:               How many quadrants out from the center
+
+        Returns:  The coordinates in the galaxy that are exactly `ring` quadrants out
+        """
+        if ring == 0:
+            return [Coordinates(x=centerCoordinates.x, y=centerCoordinates.y)]
+
+        minX: int = centerCoordinates.x - ring
+        maxX: int = centerCoordinates.x + ring
+        minY: int = centerCoordinates.y - ring
+        maxY: int = centerCoordinates.y + ring
+
+        ringCoordinates: List[Coordinates] = []
+        for x in range(minX, maxX + 1):
+            ringCoordinates.append(Coordinates(x=x, y=minY))
+            ringCoordinates.append(Coordinates(x=x, y=maxY))
+        for y in range(minY + 1, maxY):
+            ringCoordinates.append(Coordinates(x=minX, y=y))
+            ringCoordinates.append(Coordinates(x=maxX, y=y))
+
+        columns: int = self._galaxy.columns
+        rows:    int = self._galaxy.rows
+
+        return [coordinates for coordinates in ringCoordinates if coordinates.valid(columns=columns, rows=rows) is True]
+
+    def _hasEnemies(self, quadrant: Quadrant) -> bool:
+
+        if quadrant.hasSuperNova is True:
+            return False
+
+        return quadrant.klingonCount + quadrant.commanderCount + quadrant.superCommanderCount > 0
+
+    def _liveEnemies(self, quadrant: Quadrant) -> Enemies:
+        """
+        The super nova handler updates the counts but leaves the sprites in place;  So ignore those
+
+        Args:
+            quadrant:  The quadrant to inspect
+
+        Returns: The enemies in the quadrant that still have power
+        """
+        enemies: Enemies = Enemies([])
+        if quadrant.hasSuperNova is False:
+            for enemy in quadrant.klingons + quadrant.commanders + quadrant.superCommanders:
+                if cast(Enemy, enemy).power > 0.0:
+                    enemies.append(enemy)
+
+        return enemies
+
+    def _determineOutcome(self) -> SimulationOutcome:
+
+        gameState: GameState = self._gameState
+
+        remainingEnemies: int = gameState.remainingKlingons + gameState.remainingCommanders + gameState.remainingSuperCommanders
+        if gameState.energy <= 0:
+            outcome: SimulationOutcome = SimulationOutcome.Destroyed
+        elif remainingEnemies <= 0 or self._galaxyCleared is True:
+            outcome = SimulationOutcome.Won
+        elif gameState.remainingGameTime <= 0:
+            outcome = SimulationOutcome.OutOfTime
+        elif self._ticks >= self._maxTicks:
+            outcome = SimulationOutcome.Aborted
+        else:
+            outcome = SimulationOutcome.InProgress
+
+        return outcome
+
+    def _setupGame(self):
+        """
+        Set up the game singletons in the same order as PyTrekV2._setupGame, but inject a
+        headless console and do not hook the event engine into the arcade scheduler
+        """
+        self._resetSingletons()
+
+        self._gameSettings   = GameSettings()
+        if self._settingsOverrides is not None:
+            self._gameSettings.overrideValues(overrides=self._settingsOverrides)
+        self._intelligence   = Intelligence()
+        if self._seed is not None:
+            self._intelligence.reseed(seed=self._seed)
+        self._gameState      = GameState()
+        self._gameEngine     = GameEngine()
+        self._computer       = Computer()
+        self._galaxy         = Galaxy()
+
+        messageConsoleProxy: MessageConsoleProxy = MessageConsoleProxy()
+        messageConsoleProxy.console = cast(MessageConsoleSection, self._messageConsole)
+
+        self._enterQuadrant(quadrant=self._galaxy.currentQuadrant)
+
+        self._galaxyMediator = GalaxyMediator()
+        self._eventEngine    = EventEngine(messageConsoleProxy, headless=True)
+
+    def _resetSingletons(self):
+        """
+        Force the stateful singletons to re-initialize so that we get a brand-new game
+        """
+        GameSingletons.reset()
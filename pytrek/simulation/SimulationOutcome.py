@@ -0,0 +1,16 @@
+
+from enum import Enum
+
+
+class SimulationOutcome(Enum):
+    """
+    How a headless game ended
+    """
+    InProgress = 'InProgress'
+    Won        = 'Won'
+    Destroyed  = 'Destroyed'
+    OutOfTime  = 'OutOfTime'
+    Aborted    = 'Aborted'
+
+    def __str__(self):
+        return self.name
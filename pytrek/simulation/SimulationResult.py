@@ -0,0 +1,30 @@
+
+from typing import List
+from typing import NewType
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pytrek.simulation.SimulationOutcome import SimulationOutcome
+
+EnergyCurve = NewType('EnergyCurve', List[float])
+
+
+def energyCurveFactory() -> EnergyCurve:
+    return EnergyCurve([])
+
+
+@dataclass
+class SimulationResult:
+    """
+    The final tally of a headless game
+    """
+    outcome:                  SimulationOutcome = SimulationOutcome.InProgress
+    starDate:                 float             = 0.0
+    remainingGameTime:        float             = 0.0
+    remainingKlingons:        int               = 0
+    remainingCommanders:      int               = 0
+    remainingSuperCommanders: int               = 0
+    energy:                   float             = 0.0
+    ticks:                    int               = 0
+    energyCurve:              EnergyCurve       = field(default_factory=energyCurveFactory)
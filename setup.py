@@ -119,7 +119,8 @@ setup(
         'pytrek.model',
         'pytrek.resources',
         'pytrek.resources.fonts', 'pytrek.resources.images', 'pytrek.resources.sounds',
-        'pytrek.settings'
+        'pytrek.settings',
+        'pytrek.simulation',
     ],
     include_package_data=True,
 
@@ -134,7 +135,7 @@ setup(
     setup_requires=['py2app'],
     install_requires=[
         'arcade>=2.6.17',
-        'shapely>=2.0.4',
         'codeallybasic>=1.7.0',
+        'numpy>=1.24.0',
     ]
 )
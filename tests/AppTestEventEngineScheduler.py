@@ -204,12 +204,14 @@ class AppTestEventScheduler(View):
             arcadeExit()
         elif releasedKey == arcadeKey.U:
             self._gameEngine.updateTime(elapsedTime=1.0)
+            self._gameEngine.fireDueEvents()
         elif releasedKey == arcadeKey.A:
             self.setup()
         elif releasedKey == arcadeKey.C:
             self._gameState.remainingCommanders = 0
         elif self._wasNumberPressed(releasedKey=releasedKey) is True:
             self._gameEngine.updateTime(elapsedTime=self._keyToValue(releasedKey))
+            self._gameEngine.fireDueEvents()
 
     # def _createInitialEvents(self):
     #
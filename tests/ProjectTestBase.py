@@ -1,19 +1,7 @@
 
 from codeallybasic.UnitTestBase import UnitTestBase
 
-from pytrek.GameState import GameState
-
-from pytrek.engine.GameEngine import GameEngine
-from pytrek.engine.Intelligence import Intelligence
-from pytrek.engine.devices.DeviceManager import DeviceManager
-from pytrek.engine.futures.EventEngine import EventEngine
-
-from pytrek.mediators.GalaxyMediator import GalaxyMediator
-from pytrek.mediators.QuadrantMediator import QuadrantMediator
-
-from pytrek.model.Galaxy import Galaxy
-
-from pytrek.settings.GameSettings import GameSettings
+from pytrek.simulation.GameSingletons import GameSingletons
 
 
 class ProjectTestBase(UnitTestBase):
@@ -38,12 +26,4 @@ class ProjectTestBase(UnitTestBase):
         """
         Force stateful singletons to re-initialize
         """
-        GameSettings._instances     = {}
-        GameState._instances        = {}
-        GalaxyMediator._instances   = {}
-        QuadrantMediator._instances = {}
-        EventEngine._instances      = {}
-        Galaxy._instances           = {}
-        Intelligence._instances     = {}
-        GameEngine._instances       = {}
-        DeviceManager._instances    = {}
+        GameSingletons.reset()
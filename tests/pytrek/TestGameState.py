@@ -1,3 +1,5 @@
+from typing import List
+
 from pathlib import Path
 from unittest import TestSuite
 from unittest import main as unitTestMain
@@ -11,6 +13,7 @@ from pytrek.model.Coordinates import Coordinates
 from tests.ProjectTestBase import ProjectTestBase
 
 from pytrek.GameState import GameState
+from pytrek.GameStateField import GameStateField
 
 import json
 
@@ -148,6 +151,73 @@ class TestGameState(ProjectTestBase):
 
         gState.saveState()
 
+    def testChangeMarksFieldDirty(self):
+
+        gState: GameState = GameState()
+        gState.energy = gState.energy + 100
+
+        self.assertEqual(GameStateField.ENERGY, gState.dirtyFields, 'Only energy changed')
+
+    def testSameValueIsNotAChange(self):
+
+        gState: GameState = GameState()
+        gState.torpedoCount = gState.torpedoCount
+
+        self.assertEqual(GameStateField.NONE, gState.dirtyFields, 'Nothing actually changed')
+
+    def testSameCoordinatesAreNotAChange(self):
+
+        gState: GameState = GameState()
+        gState.currentQuadrantCoordinates = Coordinates(3, 4)
+        gState.currentSectorCoordinates   = Coordinates(5, 6)
+        gState.publishChanges()
+
+        gState.currentQuadrantCoordinates = Coordinates(3, 4)
+        gState.currentSectorCoordinates   = Coordinates(5, 6)
+
+        self.assertEqual(GameStateField.NONE, gState.dirtyFields, 'Same coordinates are not a change')
+
+    def testPublishCoalescesChanges(self):
+
+        gState:        GameState            = GameState()
+        notifications: List[GameStateField] = []
+
+        gState.subscribe(fields=GameStateField.ENERGY | GameStateField.SHIELD_ENERGY, listener=notifications.append)
+
+        for x in range(10):
+            gState.energy       = gState.energy - 1
+            gState.shieldEnergy = gState.shieldEnergy - 1
+        gState.torpedoCount = gState.torpedoCount - 1
+
+        changedFields: GameStateField = gState.publishChanges()
+
+        self.assertEqual([GameStateField.ENERGY | GameStateField.SHIELD_ENERGY], notifications, 'Should be told once about its fields')
+        self.assertTrue(GameStateField.TORPEDO_COUNT in changedFields, 'Should report all the changes')
+        self.assertEqual(GameStateField.NONE, gState.dirtyFields, 'Publishing should clear the dirty fields')
+
+    def testUninterestedSubscriberNotCalled(self):
+
+        gState:        GameState            = GameState()
+        notifications: List[GameStateField] = []
+
+        gState.subscribe(fields=GameStateField.STAR_DATE, listener=notifications.append)
+        gState.energy = gState.energy + 1
+        gState.publishChanges()
+
+        self.assertEqual([], notifications, 'Star date did not change')
+
+    def testUnsubscribe(self):
+
+        gState:        GameState            = GameState()
+        notifications: List[GameStateField] = []
+
+        gState.subscribe(fields=GameStateField.ENERGY, listener=notifications.append)
+        gState.unsubscribe(listener=notifications.append)
+        gState.energy = gState.energy + 1
+        gState.publishChanges()
+
+        self.assertEqual([], notifications, 'Should no longer be told')
+
 
 def suite() -> TestSuite:
     import unittest
@@ -0,0 +1,76 @@
+
+from io import StringIO
+
+from logging import Logger
+from logging import StreamHandler
+from logging import getLogger
+
+from logging.handlers import QueueHandler
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.LocateResources import LocateResources
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestLocateResources(ProjectTestBase):
+    """
+    """
+    LOGGER_NAME: str = 'tests.pytrek.TestLocateResources.queued'
+
+    def setUp(self):
+        super().setUp()
+
+        self._stream:  StringIO      = StringIO()
+        self._handler: StreamHandler = StreamHandler(self._stream)
+
+        self._queuedLogger: Logger = getLogger(TestLocateResources.LOGGER_NAME)
+        self._queuedLogger.handlers  = [self._handler]
+        self._queuedLogger.propagate = False
+
+    def tearDown(self):
+        super().tearDown()
+
+        LocateResources.stopSystemLogging()
+        self._queuedLogger.handlers = []
+
+    def testHandlersAreQueued(self):
+
+        # noinspection PyProtectedMember
+        LocateResources._queueLogging()
+
+        self.assertEqual(1, len(self._queuedLogger.handlers), 'Should have a single handler')
+        self.assertIsInstance(self._queuedLogger.handlers[0], QueueHandler, 'Handler should be behind a queue')
+
+    def testStopRestoresHandlers(self):
+
+        # noinspection PyProtectedMember
+        LocateResources._queueLogging()
+        LocateResources.stopSystemLogging()
+
+        self.assertEqual([self._handler], self._queuedLogger.handlers, 'Original handler not restored')
+
+    def testRecordsReachTheHandler(self):
+
+        # noinspection PyProtectedMember
+        LocateResources._queueLogging()
+
+        self._queuedLogger.warning('Shields up')
+        LocateResources.stopSystemLogging()
+
+        self.assertIn('Shields up', self._stream.getvalue(), 'Queued record was not written')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestLocateResources))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,88 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.SoundPriority import SoundPriority
+from pytrek.SoundType import SoundType
+from pytrek.VoiceManager import Voice
+from pytrek.VoiceManager import VoiceManager
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class RecordingSound:
+    """
+    Stands in for an arcade Sound;  Its players are plain integers
+    """
+    def __init__(self):
+        self.finishedPlayers: List[int] = []
+        self.stoppedPlayers:  List[int] = []
+
+    def is_playing(self, player: int) -> bool:
+        return player not in self.finishedPlayers and player not in self.stoppedPlayers
+
+    def stop(self, player: int):
+        self.stoppedPlayers.append(player)
+
+
+class TestVoiceManager(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._sound:        RecordingSound = RecordingSound()
+        self._voiceManager: VoiceManager   = VoiceManager(maxVoices=2, cooldown=0.1)
+
+    def testCooldown(self):
+
+        self._play(SoundType.KlingonTorpedo, SoundPriority.Medium, player=1, currentTime=10.0)
+
+        self.assertFalse(self._voiceManager.requestVoice(SoundType.KlingonTorpedo, SoundPriority.Medium, currentTime=10.05), 'Same sound within the cooldown')
+        self.assertTrue(self._voiceManager.requestVoice(SoundType.CommanderTorpedo, SoundPriority.Medium, currentTime=10.05), 'Other sounds are not affected')
+        self.assertTrue(self._voiceManager.requestVoice(SoundType.KlingonTorpedo, SoundPriority.Medium, currentTime=10.2), 'Cooldown is over')
+
+    def testFinishedVoicesAreFreed(self):
+
+        self._play(SoundType.KlingonMove, SoundPriority.Low, player=1, currentTime=1.0)
+        self._play(SoundType.CommanderMove, SoundPriority.Low, player=2, currentTime=2.0)
+        self._sound.finishedPlayers.append(1)
+
+        self.assertTrue(self._voiceManager.requestVoice(SoundType.Docked, SoundPriority.High, currentTime=3.0), 'A voice finished')
+        self.assertEqual(1, self._voiceManager.voiceCount, 'Should forget the finished voice')
+        self.assertEqual([], self._sound.stoppedPlayers, 'Should not need to steal a voice')
+
+    def testStealsLowestPriorityOldestVoice(self):
+
+        self._play(SoundType.KlingonMove, SoundPriority.Low, player=1, currentTime=1.0)
+        self._play(SoundType.CommanderMove, SoundPriority.Low, player=2, currentTime=2.0)
+
+        self.assertTrue(self._voiceManager.requestVoice(SoundType.ShieldHit, SoundPriority.High, currentTime=3.0), 'Should steal a voice')
+        self.assertEqual([1], self._sound.stoppedPlayers, 'Should stop the oldest low priority sound')
+
+    def testDoesNotStealHigherPriority(self):
+
+        self._play(SoundType.Docked, SoundPriority.High, player=1, currentTime=1.0)
+        self._play(SoundType.Warp, SoundPriority.High, player=2, currentTime=2.0)
+
+        self.assertFalse(self._voiceManager.requestVoice(SoundType.KlingonMove, SoundPriority.Low, currentTime=3.0), 'Low priority sound is dropped')
+        self.assertEqual([], self._sound.stoppedPlayers, 'Nothing should be stopped')
+
+    def _play(self, soundType: SoundType, priority: SoundPriority, player: int, currentTime: float):
+
+        self.assertTrue(self._voiceManager.requestVoice(soundType=soundType, priority=priority, currentTime=currentTime), f'{soundType.name} should play')
+        self._voiceManager.addVoice(Voice(soundType=soundType, priority=priority, sound=self._sound, player=player, startTime=currentTime))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestVoiceManager))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
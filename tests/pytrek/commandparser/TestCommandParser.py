@@ -60,6 +60,11 @@ class TestCommandParser(UnitTestBase):
 
         self.assertEqual(CommandType.LongRangeScan, parseCommand.commandType, 'Invalid long range scan command')
 
+    def testLoadCommand(self):
+        parseCommand: ParsedCommand = self._processCommand('load')
+
+        self.assertEqual(CommandType.Load, parseCommand.commandType, 'Invalid load command')
+
     def testDamagesCommand(self):
         parseCommand: ParsedCommand = self._processCommand('da')
 
@@ -0,0 +1,118 @@
+
+from typing import List
+
+from pathlib import Path
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.GameState import GameState
+
+from pytrek.engine.AutoSave import AutoSave
+from pytrek.engine.ShipCondition import ShipCondition
+
+from pytrek.settings.GameSettings import GameSettings
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestAutoSave(ProjectTestBase):
+    """
+    The snapshot is not written;  We only record when the auto save would have written it
+    """
+    def setUp(self):
+        super().setUp()
+        self.resetSingletons()
+
+        self._gameState: GameState  = GameState()
+        self._saves:     List[Path] = []
+
+    def tearDown(self):
+        super().tearDown()
+        self.resetSingletons()
+
+    def testNotableFieldSavesImmediately(self):
+
+        self._createAutoSave(interval='3600.0', changeThreshold='100')
+
+        self._gameState.shipCondition = ShipCondition.Docked
+        self._gameState.publishChanges()
+
+        self.assertEqual(1, len(self._saves), 'Docking should save right away')
+
+    def testBelowChangeThreshold(self):
+
+        self._createAutoSave(interval='0.0', changeThreshold='3')
+
+        self._changeEnergy(frames=2)
+
+        self.assertEqual(0, len(self._saves), 'Not enough changes to save')
+
+    def testChangeThresholdReached(self):
+
+        self._createAutoSave(interval='0.0', changeThreshold='3')
+
+        self._changeEnergy(frames=3)
+
+        self.assertEqual(1, len(self._saves), 'Enough changes should save')
+
+    def testIntervalNotPassed(self):
+
+        self._createAutoSave(interval='3600.0', changeThreshold='3')
+
+        self._changeEnergy(frames=10)
+
+        self.assertEqual(0, len(self._saves), 'Should wait for the interval')
+
+    def testSaveResetsChangeCount(self):
+
+        self._createAutoSave(interval='0.0', changeThreshold='3')
+
+        self._changeEnergy(frames=5)
+
+        self.assertEqual(1, len(self._saves), 'Should start counting again after a save')
+
+    def testAutoSaveOff(self):
+
+        autoSave: AutoSave = self._createAutoSave(interval='0.0', changeThreshold='1', enabled='False')
+
+        self._gameState.shipCondition = ShipCondition.Docked
+        self._changeEnergy(frames=5)
+
+        self.assertEqual(0, len(self._saves), 'Turned off auto save should never save')
+        # noinspection PyProtectedMember
+        subscribers = [subscription[1] for subscription in self._gameState._subscribers]
+        # noinspection PyProtectedMember
+        self.assertNotIn(autoSave._gameStateChanged, subscribers, 'Should not even listen')
+
+    def _createAutoSave(self, interval: str, changeThreshold: str, enabled: str = 'True') -> AutoSave:
+
+        GameSettings().overrideValues(overrides={'autoSave': enabled, 'autoSaveInterval': interval, 'autoSaveChangeThreshold': changeThreshold})
+
+        autoSave: AutoSave = AutoSave()
+        # noinspection PyProtectedMember
+        autoSave._gameSnapshot.saveGame = self._recordSave     # type: ignore
+
+        return autoSave
+
+    def _changeEnergy(self, frames: int):
+
+        for x in range(frames):
+            self._gameState.energy = self._gameState.energy + 1.0
+            self._gameState.publishChanges()
+
+    def _recordSave(self, fileName: Path):
+        self._saves.append(fileName)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestAutoSave))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
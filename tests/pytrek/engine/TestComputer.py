@@ -11,6 +11,7 @@ from pytrek.Constants import MAX_SECTOR_Y_COORDINATE
 from pytrek.Constants import MIN_QUADRANT_X_COORDINATE
 from pytrek.Constants import MIN_SECTOR_X_COORDINATE
 from pytrek.Constants import MIN_SECTOR_Y_COORDINATE
+from pytrek.Constants import QUADRANT_COLUMNS
 from pytrek.Constants import QUADRANT_GRID_WIDTH
 from pytrek.Constants import SCREEN_HEIGHT
 
@@ -213,6 +214,20 @@ class TestComputer(ProjectTestBase):
 
         self.assertEqual(distance, 50.0, "Incorrect West/East distance")
 
+    def testComputeGalacticDistanceLargeGalaxy(self):
+
+        startCoordinates = Coordinates(x=0,   y=0)
+        endCoordinates   = Coordinates(x=300, y=400)
+
+        distance = self.smarty.computeGalacticDistance(startQuadrantCoordinates=startCoordinates, endQuadrantCoordinates=endCoordinates)
+
+        self.assertEqual(5000.0, distance, 'Incorrect distance across a large galaxy')
+
+    def testDeltaTablesOnlyCoverAQuadrant(self):
+
+        # noinspection PyProtectedMember
+        self.assertEqual(QUADRANT_COLUMNS - 1, self.smarty.deltaTables._maxDeltaX, 'Tables should not grow with the galaxy')
+
     def testValueStringEmptyQuadrant(self):
 
         strValue = self.smarty.createValueString(klingonCount=0, commanderCount=0, hasStarBase=False)
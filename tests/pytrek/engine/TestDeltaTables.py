@@ -0,0 +1,58 @@
+
+from math import atan2
+from math import pi
+from math import sqrt
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.engine.DeltaTables import DeltaTables
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestDeltaTables(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._deltaTables: DeltaTables = DeltaTables.forGrid(columns=10, rows=10)
+
+    def testSharedPerGridSize(self):
+
+        self.assertIs(self._deltaTables, DeltaTables.forGrid(columns=10, rows=10), 'Should only build the tables once')
+        self.assertIsNot(self._deltaTables, DeltaTables.forGrid(columns=12, rows=10), 'Each grid size has its own tables')
+
+    def testDistance(self):
+
+        for deltaX in range(-9, 10):
+            for deltaY in range(-9, 10):
+                self.assertEqual(sqrt((deltaX * deltaX) + (deltaY * deltaY)), self._deltaTables.distance(deltaX, deltaY), f'Bad distance at {deltaX=} {deltaY=}')
+
+    def testCourse(self):
+
+        for deltaX in range(-9, 10):
+            for deltaY in range(-9, 10):
+                self.assertEqual(atan2(deltaY, deltaX), self._deltaTables.course(deltaX, deltaY), f'Bad course at {deltaX=} {deltaY=}')
+
+    def testDirection(self):
+
+        self.assertEqual(atan2(3, -4) * 6 / pi, self._deltaTables.direction(3, -4), 'Bad direction')
+
+    def testOutsideTheGrid(self):
+
+        self.assertEqual(sqrt(400 + 9), self._deltaTables.distance(20, -3), 'Should compute deltas the tables do not hold')
+        self.assertEqual(atan2(-3, 20), self._deltaTables.course(20, -3), 'Should compute deltas the tables do not hold')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDeltaTables))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,79 @@
+
+from typing import List
+from typing import cast
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.engine.EnemyScheduler import EnemyScheduler
+
+from pytrek.gui.gamepieces.GamePieceTypes import Enemies
+from pytrek.gui.gamepieces.GamePieceTypes import Enemy
+from pytrek.gui.gamepieces.klingon.Klingon import Klingon
+
+from pytrek.model.Coordinates import Coordinates
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestEnemyScheduler(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._scheduler: EnemyScheduler = EnemyScheduler(dueTime=lambda enemy: enemy.lastTimeCheck + enemy.firingInterval)
+        self._enemies:   Enemies        = Enemies([self._createKlingon(x=x, firingInterval=(x + 1) * 10) for x in range(3)])
+
+    def testNothingDue(self):
+
+        self.assertEqual([], self._scheduler.dueEnemies(enemies=self._enemies, currentTime=5.0), 'No one should be awake yet')
+
+    def testOnlyDueEnemiesWake(self):
+
+        dueEnemies: List[Enemy] = self._scheduler.dueEnemies(enemies=self._enemies, currentTime=25.0)
+
+        self.assertEqual([self._enemies[0], self._enemies[1]], dueEnemies, 'Should wake the enemies in due order')
+
+    def testWokenEnemiesAreRescheduled(self):
+
+        for enemy in self._scheduler.dueEnemies(enemies=self._enemies, currentTime=15.0):
+            enemy.lastTimeCheck = 15
+
+        self.assertEqual([], self._scheduler.dueEnemies(enemies=self._enemies, currentTime=20.0), 'Should wait for the next interval')
+        self.assertEqual([self._enemies[1], self._enemies[0]], self._scheduler.dueEnemies(enemies=self._enemies, currentTime=26.0), 'Should wake again')
+
+    def testStaysAwakeUntilHandled(self):
+
+        self._scheduler.dueEnemies(enemies=self._enemies, currentTime=15.0)
+
+        self.assertEqual([self._enemies[0]], self._scheduler.dueEnemies(enemies=self._enemies, currentTime=16.0), 'Unhandled enemy is still due')
+
+    def testNewEnemyScheduled(self):
+
+        self._scheduler.dueEnemies(enemies=self._enemies, currentTime=5.0)
+        newKlingon: Enemy = self._createKlingon(x=5, firingInterval=1)
+        self._enemies.append(newKlingon)
+
+        self.assertEqual([newKlingon], self._scheduler.dueEnemies(enemies=self._enemies, currentTime=5.0), 'Should notice the new enemy')
+
+    def _createKlingon(self, x: int, firingInterval: int) -> Enemy:
+
+        klingon: Klingon = Klingon(coordinates=Coordinates(x=x, y=0))
+        klingon.firingInterval = firingInterval
+        klingon.lastTimeCheck  = 0
+
+        return cast(Enemy, klingon)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestEnemyScheduler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
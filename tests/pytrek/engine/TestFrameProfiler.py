@@ -0,0 +1,120 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from json import load as jsonLoad
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.engine.FrameProfiler import FrameProfiler
+from pytrek.engine.FrameProfiler import Percentiles
+from pytrek.engine.FrameProfiler import PercentilesList
+from pytrek.engine.FrameProfiler import ProfileName
+
+from pytrek.settings.GameSettings import GameSettings
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class Drawer:
+    def __init__(self):
+        self.drawCount: int = 0
+
+    def draw(self) -> int:
+        self.drawCount += 1
+        return self.drawCount
+
+
+class TestFrameProfiler(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self.resetSingletons()
+        GameSettings().overrideValues({'profileFrames': 'True', 'frameProfileWindow': '100'})
+
+        self._frameProfiler: FrameProfiler = FrameProfiler()
+
+    def tearDown(self):
+        super().tearDown()
+        self.resetSingletons()
+
+    def testPercentiles(self):
+
+        name: ProfileName = ProfileName('Test.on_draw')
+        for milliseconds in range(1, 101):
+            self._frameProfiler.record(name=name, start=0, end=milliseconds * 1_000_000)
+
+        percentiles: Percentiles = self._frameProfiler.percentiles()[0]
+
+        self.assertEqual(51.0,  percentiles.p50, 'Bad median')
+        self.assertEqual(96.0,  percentiles.p95, 'Bad 95th percentile')
+        self.assertEqual(100.0, percentiles.p99, 'Bad 99th percentile')
+        self.assertEqual(100,   percentiles.sampleCount, 'Wrong sample count')
+
+    def testRollingWindow(self):
+
+        name: ProfileName = ProfileName('Test.on_update')
+        for milliseconds in range(1, 201):
+            self._frameProfiler.record(name=name, start=0, end=milliseconds * 1_000_000)
+
+        percentiles: Percentiles = self._frameProfiler.percentiles()[0]
+
+        self.assertEqual(100, percentiles.sampleCount, 'Should only keep the window')
+        self.assertEqual(151.0, percentiles.p50, 'Old samples should have rolled off')
+
+    def testInstrument(self):
+
+        drawer: Drawer = Drawer()
+        self._frameProfiler.instrument(target=drawer, methodNames=['draw'])
+        self._frameProfiler.instrument(target=drawer, methodNames=['draw'])
+
+        self.assertEqual(1, drawer.draw(), 'Timed method should still return its value')
+
+        percentilesList: PercentilesList = self._frameProfiler.percentiles()
+        self.assertEqual(1, len(percentilesList), 'Should time the method once')
+        self.assertEqual('Drawer.draw', percentilesList[0].name, 'Wrong name')
+
+    def testInstrumentDisabled(self):
+
+        self.resetSingletons()
+        frameProfiler: FrameProfiler = FrameProfiler()
+        drawer:        Drawer        = Drawer()
+        frameProfiler.instrument(target=drawer, methodNames=['draw'])
+
+        self.assertNotIn('draw', vars(drawer), 'Should not wrap anything when profiling is off')
+
+    def testExportTrace(self):
+
+        with self._frameProfiler.measure(name=ProfileName('Test.block')):
+            pass
+
+        with TemporaryDirectory() as directory:
+            fileName: Path = Path(directory) / 'Test.trace.json'
+            self._frameProfiler.exportTrace(fileName=fileName)
+            with fileName.open() as fd:
+                trace: Dict[str, Any] = jsonLoad(fd)
+
+        traceEvents: List[Dict[str, Any]] = trace['traceEvents']
+        self.assertEqual(1, len(traceEvents), 'Should export every timing')
+        self.assertEqual('Test.block', traceEvents[0]['name'], 'Wrong event name')
+        self.assertEqual('X', traceEvents[0]['ph'], 'Should be a complete event')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestFrameProfiler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
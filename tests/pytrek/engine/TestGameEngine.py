@@ -1,5 +1,6 @@
 
 from typing import Dict
+from typing import List
 from typing import NewType
 
 from math import degrees
@@ -9,7 +10,9 @@ from pytrek.engine.Direction import Direction
 from pytrek.engine.DirectionData import DirectionData
 from pytrek.engine.PlayerType import PlayerType
 from pytrek.engine.ShieldHitData import ShieldHitData
+from pytrek.engine.GameEngine import CombatValues
 from pytrek.engine.GameEngine import GameEngine
+from pytrek.engine.Intelligence import Intelligence
 from pytrek.engine.devices.DeviceStatus import DeviceStatus
 from pytrek.engine.devices.DeviceType import DeviceType
 from pytrek.engine.devices.DeviceManager import DeviceManager
@@ -293,6 +296,63 @@ class TestGameEngine(ProjectTestBase):
 
         self.logger.info(f'{powerDrain=}')
 
+    def testComputeHitBatchMatchesSingleShot(self):
+
+        shooterPosition: Coordinates = Coordinates(x=7, y=7)
+        targetPosition:  Coordinates = Coordinates(x=3, y=7)
+
+        Intelligence().reseed(seed=1701)
+        singleHit: float = self._gameEngine.computeHit(shooterPosition=shooterPosition, targetPosition=targetPosition, klingonPower=348.0)
+
+        Intelligence().reseed(seed=1701)
+        hits: CombatValues = self._gameEngine.computeHitBatch(shooterPositions=GameEngine.sectorPositions([shooterPosition]),
+                                                              targetPositions=GameEngine.sectorPositions([targetPosition]),
+                                                              klingonPowers=[348.0])
+        self.assertAlmostEqual(singleHit, hits[0], places=6, msg='The scalar version should wrap the batch version')
+
+    def testComputeHitBatchVolley(self):
+
+        shooterPositions = GameEngine.sectorPositions([Coordinates(x=7, y=7), Coordinates(x=0, y=0), Coordinates(x=9, y=2)])
+        targetPositions  = GameEngine.sectorPositions([Coordinates(x=3, y=7)])
+
+        hits: CombatValues = self._gameEngine.computeHitBatch(shooterPositions=shooterPositions, targetPositions=targetPositions, klingonPowers=[348.0, 400.0, 500.0])
+
+        self.assertEqual(3, len(hits), 'Should get a hit for every shooter')
+
+    def testDoPhasersBatch(self):
+
+        distances: List[float] = [
+            self._computer.computeQuadrantDistance(startSector=Coordinates(0, 4), endSector=Coordinates(4, 4)),
+            self._computer.computeQuadrantDistance(startSector=Coordinates(0, 4), endSector=Coordinates(4, 4)),
+        ]
+        hits: CombatValues = self._gameEngine.doPhasersBatch(distances=distances, enemyPowers=[500.0, 500.0], powerAmount=500.0)
+
+        self.assertAlmostEqual(239.68, hits[0], places=1)
+        self.assertAlmostEqual(239.68, hits[1], places=1)
+
+    def testDoPhasersBatchBurstTerminatedDrawsNoRandom(self):
+
+        intelligence: Intelligence = Intelligence()
+
+        intelligence.reseed(seed=1701)
+        self._gameEngine.doPhasersBatch(distances=[1.0], enemyPowers=[500.0], powerAmount=500.0)
+        expectedNext: float = float(intelligence.randomArray(1)[0])
+
+        intelligence.reseed(seed=1701)
+        hits: CombatValues = self._gameEngine.doPhasersBatch(distances=[1.0, 1.0], enemyPowers=[5.0, 500.0], powerAmount=500.0)
+
+        self.assertEqual(self._gameSettings.phaserBurstToTerminate, hits[0], 'Weak enemy should be terminated')
+        self.assertEqual(expectedNext, float(intelligence.randomArray(1)[0]), 'Terminated enemy should not use a random number')
+
+    def testHitThemBatch(self):
+
+        distance: float = self._computer.computeQuadrantDistance(startSector=Coordinates(0, 0), endSector=Coordinates(9, 9))
+
+        powerDrains: CombatValues = self._gameEngine.hitThemBatch(distances=[distance, distance], hits=[218.6, 218.6], enemyPowers=[500.0, 10.0])
+
+        self.assertGreater(powerDrains[0], 329, 'Did not calculate the minimum power drain')
+        self.assertEqual(10.0, powerDrains[1], 'Cannot drain more than the enemy has')
+
     def testComputeShieldHitShieldsFull(self):
 
         shieldHitData:  ShieldHitData = self._gameEngine.computeShieldHit(torpedoHit=1000,
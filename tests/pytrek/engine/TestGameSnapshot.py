@@ -0,0 +1,248 @@
+
+from typing import List
+from typing import Tuple
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.GameState import GameState
+
+from pytrek.engine.GameEngine import GameEngine
+from pytrek.engine.GameSnapshot import GameSnapshot
+from pytrek.engine.GameSnapshot import HEADER
+from pytrek.engine.Intelligence import Intelligence
+
+from pytrek.engine.devices.DeviceManager import DeviceManager
+from pytrek.engine.devices.DeviceStatus import DeviceStatus
+from pytrek.engine.devices.DeviceType import DeviceType
+
+from pytrek.engine.futures.EventEngine import EventEngine
+from pytrek.engine.futures.FutureEvent import FutureEvent
+from pytrek.engine.futures.FutureEventType import FutureEventType
+
+from pytrek.exceptions.InvalidSnapshotException import InvalidSnapshotException
+
+from pytrek.gui.MessageConsoleProxy import MessageConsoleProxy
+from pytrek.gui.MessageConsoleSection import MessageConsoleSection
+
+from pytrek.model.Coordinates import Coordinates
+from pytrek.model.Galaxy import Galaxy
+from pytrek.model.Quadrant import Quadrant
+
+from pytrek.settings.GameSettings import GameSettings
+
+from pytrek.simulation.HeadlessSimulation import HeadlessSimulation
+from pytrek.simulation.HeadlessSimulation import SettingsOverrides
+
+from tests.ProjectTestBase import ProjectTestBase
+
+EnemyImage = Tuple[int, int, float]
+
+SHIP_CONDITION_OFFSET: int = (5 * 8) + (7 * 4)     # Past the game state floats and counts
+
+
+class TestGameSnapshot(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self.resetSingletons()
+
+        GameSettings()
+        intelligence: Intelligence = Intelligence()
+
+        self._gameState: GameState = GameState()
+        self._gameState.currentQuadrantCoordinates = intelligence.generateQuadrantCoordinates()
+
+        self._gameEngine:    GameEngine    = GameEngine()
+        self._deviceManager: DeviceManager = DeviceManager()
+        self._galaxy:        Galaxy        = Galaxy()
+
+        messageConsoleProxy: MessageConsoleProxy = MessageConsoleProxy()
+        messageConsoleProxy.console = MessageConsoleSection(left=0, bottom=0, width=100, height=100)
+
+        self._eventEngine:   EventEngine   = EventEngine(messageConsoleProxy, headless=True)
+        self._gameSnapshot:  GameSnapshot  = GameSnapshot()
+
+        quadrant: Quadrant = self._galaxy.currentQuadrant
+        quadrant.addKlingon()
+        quadrant.addCommander()
+        self._gameState.currentSectorCoordinates = quadrant.getRandomEmptySector().coordinates
+
+    def testRestoreGameState(self):
+
+        self._gameState.energy = 1234.5
+        snapshot: bytes = self._gameSnapshot.takeSnapshot()
+
+        self._gameState.energy = 10.0
+        self._gameState.currentSectorCoordinates = Coordinates(x=0, y=0)
+        self._gameSnapshot.restoreSnapshot(snapshot=snapshot)
+
+        self.assertEqual(1234.5, self._gameState.energy, 'Energy not restored')
+        self.assertNotEqual(Coordinates(x=0, y=0), self._gameState.currentSectorCoordinates, 'Sector coordinates not restored')
+
+    def testRestoreDevices(self):
+
+        self._deviceManager.setDeviceDamage(DeviceType.WarpEngines, 3.5)
+        self._deviceManager.setDeviceStatus(DeviceType.WarpEngines, DeviceStatus.Damaged)
+        snapshot: bytes = self._gameSnapshot.takeSnapshot()
+
+        self._deviceManager.setDeviceDamage(DeviceType.WarpEngines, 0.0)
+        self._deviceManager.setDeviceStatus(DeviceType.WarpEngines, DeviceStatus.Up)
+        self._gameSnapshot.restoreSnapshot(snapshot=snapshot)
+
+        self.assertEqual(3.5, self._deviceManager.getDeviceDamage(DeviceType.WarpEngines), 'Damage not restored')
+        self.assertEqual(DeviceStatus.Damaged, self._deviceManager.getDeviceStatus(DeviceType.WarpEngines), 'Status not restored')
+
+    def testRestoreEvents(self):
+
+        savedEvents: List[FutureEvent] = self._eventEngine.allPendingEvents()
+        snapshot:    bytes             = self._gameSnapshot.takeSnapshot()
+
+        self._eventEngine.makeUnSchedulable(FutureEventType.SUPER_NOVA)
+        self._gameSnapshot.restoreSnapshot(snapshot=snapshot)
+
+        restoredEvents: List[FutureEvent] = self._eventEngine.allPendingEvents()
+        self.assertTrue(self._eventEngine.isSchedulable(FutureEventType.SUPER_NOVA), 'Should be schedulable again')
+        self.assertEqual([(e.type, e.starDate) for e in savedEvents], [(e.type, e.starDate) for e in restoredEvents], 'Timeline not restored')
+        for futureEvent in restoredEvents:
+            self.assertIsNotNone(futureEvent.callback, f'{futureEvent.type} lost its handler')
+
+    def testRestoreVisitedQuadrant(self):
+
+        savedEnemies: List[EnemyImage] = self._enemyImages(self._galaxy.currentQuadrant)
+        snapshot:     bytes            = self._gameSnapshot.takeSnapshot()
+
+        for enemy in self._galaxy.currentQuadrant.klingons:
+            enemy.power = 0.0
+        self._gameSnapshot.restoreSnapshot(snapshot=snapshot)
+
+        quadrant: Quadrant = self._galaxy.currentQuadrant
+        self.assertTrue(quadrant.materialized, 'Visited quadrant should come back materialized')
+        self.assertEqual(savedEnemies, self._enemyImages(quadrant), 'Enemies not restored')
+
+    def testRegenerateUnvisitedQuadrant(self):
+
+        snapshot: bytes    = self._gameSnapshot.takeSnapshot()
+        quadrant: Quadrant = self._findUnvisitedQuadrant()
+        quadrant.materialize()
+        generatedEnemies: List[EnemyImage] = self._enemyImages(quadrant)
+
+        self._gameSnapshot.restoreSnapshot(snapshot=snapshot)
+
+        restoredQuadrant: Quadrant = self._galaxy.getQuadrant(quadrant.coordinates)
+        self.assertFalse(restoredQuadrant.materialized, 'Should only have its counts')
+        restoredQuadrant.materialize()
+        self.assertEqual(generatedEnemies, self._enemyImages(restoredQuadrant), 'Should regenerate from the galaxy seed')
+
+    def testRestoreGameSeed(self):
+
+        intelligence: Intelligence = Intelligence()
+        intelligence.reseed(seed=1701)
+        snapshot: bytes = self._gameSnapshot.takeSnapshot()
+
+        self._gameSnapshot.restoreSnapshot(snapshot=snapshot)
+        firstRolls: List[float] = [intelligence.rand() for x in range(5)]
+
+        intelligence.reseed(seed=42)
+        self._gameSnapshot.restoreSnapshot(snapshot=snapshot)
+        secondRolls: List[float] = [intelligence.rand() for x in range(5)]
+
+        self.assertEqual(1701, self._gameState.gameSeed, 'Game seed not restored')
+        self.assertEqual(firstRolls, secondRolls, 'Every restore should roll the same numbers')
+
+    def testSnapshotIsCompact(self):
+
+        snapshot: bytes = self._gameSnapshot.takeSnapshot()
+
+        self.assertLess(len(snapshot), 4096, 'Snapshot is too big')
+
+    def testLargeGalaxyRoundTrip(self):
+        """
+        Quadrant coordinates and indices past what a byte holds
+        """
+        self.resetSingletons()
+        overrides:  SettingsOverrides  = SettingsOverrides({'galaxyRows': '200', 'galaxyColumns': '200'})
+        simulation: HeadlessSimulation = HeadlessSimulation(seed=7, settingsOverrides=overrides)
+
+        galaxy:         Galaxy      = simulation.galaxy
+        farCoordinates: Coordinates = Coordinates(x=190, y=150)
+
+        galaxy.currentQuadrant = galaxy.getQuadrant(quadrantCoordinates=farCoordinates)
+        galaxy.currentQuadrant.addKlingon()
+        simulation.gameState.currentQuadrantCoordinates = farCoordinates
+
+        savedEnemies: List[EnemyImage] = self._enemyImages(galaxy.currentQuadrant)
+        gameSnapshot: GameSnapshot     = GameSnapshot()
+        snapshot:     bytes            = gameSnapshot.takeSnapshot()
+
+        galaxy.currentQuadrant = galaxy.getQuadrant(quadrantCoordinates=Coordinates(x=0, y=0))
+        gameSnapshot.restoreSnapshot(snapshot=snapshot)
+
+        self.assertEqual(farCoordinates, galaxy.currentQuadrant.coordinates, 'Current quadrant not restored')
+        self.assertEqual(farCoordinates, simulation.gameState.currentQuadrantCoordinates, 'Quadrant coordinates not restored')
+        self.assertEqual(savedEnemies, self._enemyImages(galaxy.currentQuadrant), 'Enemies not restored')
+
+    def testNotASnapshot(self):
+
+        self.assertRaises(InvalidSnapshotException, lambda: self._gameSnapshot.restoreSnapshot(snapshot=b'JUNK' + bytes(64)))
+
+    def testTruncatedSnapshot(self):
+
+        snapshot: bytes = self._gameSnapshot.takeSnapshot()
+
+        self.assertRaises(InvalidSnapshotException, lambda: self._gameSnapshot.restoreSnapshot(snapshot=snapshot[:len(snapshot) // 2]))
+
+    def testDamagedSnapshotLeavesGameAlone(self):
+        """
+        The end of the snapshot is the galaxy;  Everything before it used to be restored already
+        """
+        snapshot: bytes = self._gameSnapshot.takeSnapshot()
+
+        self._gameState.energy = 10.0
+        self._deviceManager.setDeviceDamage(DeviceType.WarpEngines, 3.5)
+        savedEvents:  List[FutureEvent] = self._eventEngine.allPendingEvents()
+        savedEnemies: List[EnemyImage]  = self._enemyImages(self._galaxy.currentQuadrant)
+
+        self.assertRaises(InvalidSnapshotException, lambda: self._gameSnapshot.restoreSnapshot(snapshot=snapshot[:-1]))
+
+        self.assertEqual(10.0, self._gameState.energy, 'Game state should not change')
+        self.assertEqual(3.5, self._deviceManager.getDeviceDamage(DeviceType.WarpEngines), 'Devices should not change')
+        self.assertEqual(savedEvents, self._eventEngine.allPendingEvents(), 'Timeline should not change')
+        self.assertEqual(savedEnemies, self._enemyImages(self._galaxy.currentQuadrant), 'Galaxy should not change')
+
+    def testBadEnumerationIndex(self):
+
+        snapshot: bytearray = bytearray(self._gameSnapshot.takeSnapshot())
+        snapshot[HEADER.size + SHIP_CONDITION_OFFSET] = 99
+
+        self.assertRaises(InvalidSnapshotException, lambda: self._gameSnapshot.restoreSnapshot(snapshot=bytes(snapshot)))
+
+    def _enemyImages(self, quadrant: Quadrant) -> List[EnemyImage]:
+
+        enemies = quadrant.klingons + quadrant.commanders + quadrant.superCommanders
+
+        return [(enemy.gameCoordinates.x, enemy.gameCoordinates.y, enemy.power) for enemy in enemies]
+
+    def _findUnvisitedQuadrant(self) -> Quadrant:
+
+        for y in range(self._galaxy.rows):
+            for x in range(self._galaxy.columns):
+                quadrant: Quadrant = self._galaxy.getQuadrant(Coordinates(x=x, y=y))
+                if quadrant.materialized is False and quadrant.klingonCount > 0:
+                    return quadrant
+
+        self.fail('No unvisited quadrant with Klingons')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestGameSnapshot))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -18,6 +18,7 @@ from pytrek.engine.GameType import GameType
 from pytrek.engine.Intelligence import Intelligence
 from pytrek.engine.Intelligence import TractorBeamComputation
 from pytrek.engine.PlayerType import PlayerType
+from pytrek.engine.RandomStream import RandomStream
 from pytrek.gui.gamepieces.PlanetType import PlanetType
 
 from pytrek.model.Coordinates import Coordinates
@@ -573,6 +574,43 @@ class TestIntelligence(ProjectTestBase):
 
         self.assertTrue(6.0 <= factors.warpFactor <= 8.0, msg='The answer is not close enough')
 
+    def testSameSeedSameGame(self):
+
+        self.smarty.reseed(seed=1701)
+        firstRun: List[float] = [self.smarty.rand(stream) for stream in RandomStream]
+
+        self.smarty.reseed(seed=1701)
+        secondRun: List[float] = [self.smarty.rand(stream) for stream in RandomStream]
+
+        self.assertEqual(firstRun, secondRun, 'The same seed should replay the same numbers')
+        self.assertEqual(1701, self.smarty.seed, 'Seed not recorded')
+
+    def testStreamsAreIndependent(self):
+
+        self.smarty.reseed(seed=1701)
+        expectedCoordinates: Coordinates = self.smarty.generateQuadrantCoordinates()
+
+        self.smarty.reseed(seed=1701)
+        for x in range(10):
+            self.smarty.rand(RandomStream.Combat)
+            self.smarty.randomDirection()
+        actualCoordinates: Coordinates = self.smarty.generateQuadrantCoordinates()
+
+        self.assertEqual(expectedCoordinates, actualCoordinates, 'Combat and movement should not change galaxy generation')
+
+    def testSeededRandomnessKeepsGameStreams(self):
+
+        self.smarty.reseed(seed=1701)
+        expectedRoll: float = self.smarty.rand()
+
+        self.smarty.reseed(seed=1701)
+        with self.smarty.seededRandomness(seed=42):
+            self.smarty.rand()
+            self.smarty.generateSectorCoordinates()
+        actualRoll: float = self.smarty.rand()
+
+        self.assertEqual(expectedRoll, actualRoll, 'Seeded code changed the game streams')
+
     def _runKlingonCountTest(self, gameType: GameType, playerType: PlayerType) -> float:
 
         gameState:    GameState    = self._gameState
@@ -0,0 +1,93 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.engine.LineOfSight import ENEMY_TORPEDO_OBSTACLES
+from pytrek.engine.LineOfSight import ENTERPRISE_TORPEDO_OBSTACLES
+from pytrek.engine.LineOfSight import LineOfSight
+from pytrek.engine.LineOfSight import LineOfSightResponse
+from pytrek.engine.LineOfSight import MOVEMENT_OBSTACLES
+
+from pytrek.gui.gamepieces.StarBase import StarBase
+
+from pytrek.model.Coordinates import Coordinates
+from pytrek.model.Quadrant import Quadrant
+from pytrek.model.Sector import Sector
+from pytrek.model.SectorType import SectorType
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestLineOfSight(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._lineOfSight: LineOfSight = LineOfSight()
+        self._quadrant:    Quadrant    = Quadrant(coordinates=Coordinates(0, 0))
+        self._starBase:    StarBase    = StarBase(sectorCoordinates=Coordinates(4, 4))
+
+        sector: Sector = self._quadrant.getSector(Coordinates(4, 4))
+        sector.type   = SectorType.STARBASE
+        sector.sprite = self._starBase
+
+    def testClearLine(self):
+
+        response: LineOfSightResponse = self._lineOfSight.hasLineOfSight(self._quadrant, Coordinates(0, 0), Coordinates(9, 0), ENTERPRISE_TORPEDO_OBSTACLES)
+
+        self.assertTrue(response.answer, 'Nothing is in the way')
+        self.assertIsNone(response.obstacle, 'There is no obstacle')
+
+    def testBlockedDiagonal(self):
+
+        response: LineOfSightResponse = self._lineOfSight.hasLineOfSight(self._quadrant, Coordinates(0, 0), Coordinates(9, 9), ENTERPRISE_TORPEDO_OBSTACLES)
+
+        self.assertFalse(response.answer, 'The StarBase is in the way')
+        self.assertIs(self._starBase, response.obstacle, 'Should report the blocking piece')
+
+    def testObstacleTypes(self):
+
+        response: LineOfSightResponse = self._lineOfSight.hasLineOfSight(self._quadrant, Coordinates(0, 0), Coordinates(9, 9), MOVEMENT_OBSTACLES)
+
+        self.assertTrue(response.answer, 'A StarBase does not block movement')
+
+    def testStartSectorNeverBlocks(self):
+
+        response: LineOfSightResponse = self._lineOfSight.hasLineOfSight(self._quadrant, Coordinates(4, 4), Coordinates(9, 9), ENEMY_TORPEDO_OBSTACLES)
+
+        self.assertTrue(response.answer, 'Should see past our own sector')
+
+    def testEndSectorBlocks(self):
+
+        response: LineOfSightResponse = self._lineOfSight.hasLineOfSight(self._quadrant, Coordinates(0, 4), Coordinates(4, 4), ENTERPRISE_TORPEDO_OBSTACLES)
+
+        self.assertFalse(response.answer, 'Cannot move into the StarBase')
+
+    def testMaskFollowsMoves(self):
+
+        self.assertFalse(self._lineOfSight.hasLineOfSight(self._quadrant, Coordinates(0, 0), Coordinates(9, 9), ENTERPRISE_TORPEDO_OBSTACLES).answer, 'Should start blocked')
+
+        oldSector: Sector = self._quadrant.getSector(Coordinates(4, 4))
+        oldSector.type   = SectorType.EMPTY
+        oldSector.sprite = None
+
+        newSector: Sector = self._quadrant.getSector(Coordinates(4, 5))
+        newSector.type   = SectorType.STARBASE
+        newSector.sprite = self._starBase
+
+        self.assertTrue(self._lineOfSight.hasLineOfSight(self._quadrant, Coordinates(0, 0), Coordinates(9, 9), ENTERPRISE_TORPEDO_OBSTACLES).answer, 'Stale obstacle mask')
+        self.assertFalse(self._lineOfSight.hasLineOfSight(self._quadrant, Coordinates(4, 0), Coordinates(4, 9), ENTERPRISE_TORPEDO_OBSTACLES).answer, 'Moved piece not seen')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestLineOfSight))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,67 @@
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.Constants import TEMPORARY_SUFFIX
+
+from pytrek.engine.SaveFileWriter import SaveFileWriter
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestSaveFileWriter(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._saveFileWriter: SaveFileWriter     = SaveFileWriter()
+        self._directory:      TemporaryDirectory = TemporaryDirectory()
+        self._fileName:       Path               = Path(self._directory.name) / 'Test.snapshot'
+
+    def tearDown(self):
+        super().tearDown()
+        self._directory.cleanup()
+
+    def testWrite(self):
+
+        self._saveFileWriter.write(fileName=self._fileName, saveBytes=b'first')
+
+        self.assertTrue(self._saveFileWriter.flush(timeout=5.0), 'Write never finished')
+        self.assertEqual(b'first', self._fileName.read_bytes(), 'Wrong contents')
+
+    def testNoTemporaryFileLeftBehind(self):
+
+        self._saveFileWriter.write(fileName=self._fileName, saveBytes=b'first')
+        self._saveFileWriter.flush(timeout=5.0)
+
+        temporaryFileName: Path = self._fileName.with_name(f'{self._fileName.name}{TEMPORARY_SUFFIX}')
+        self.assertFalse(temporaryFileName.exists(), 'Temporary file should have replaced the save file')
+
+    def testBackupsRotate(self):
+
+        for saveBytes in [b'1', b'2', b'3', b'4', b'5']:
+            self._saveFileWriter.write(fileName=self._fileName, saveBytes=saveBytes)
+            self._saveFileWriter.flush(timeout=5.0)
+
+        self.assertEqual(b'5', self._fileName.read_bytes(), 'Save file should be the newest')
+        self.assertEqual(b'4', self._saveFileWriter.backupFileName(self._fileName, 1).read_bytes(), 'Newest backup is wrong')
+        self.assertEqual(b'2', self._saveFileWriter.backupFileName(self._fileName, 3).read_bytes(), 'Oldest backup is wrong')
+        self.assertFalse(self._saveFileWriter.backupFileName(self._fileName, 4).exists(), 'Kept too many backups')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSaveFileWriter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
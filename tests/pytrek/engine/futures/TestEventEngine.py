@@ -1,4 +1,5 @@
 
+from typing import List
 from typing import cast
 
 from unittest import TestSuite
@@ -10,11 +11,17 @@ from pytrek.engine.Intelligence import Intelligence
 from pytrek.engine.devices.DeviceManager import DeviceManager
 
 from pytrek.engine.futures.EventEngine import EventEngine
+from pytrek.engine.futures.EventEngine import EventToken
+from pytrek.engine.futures.FutureEvent import EventCallback
 from pytrek.engine.futures.FutureEvent import FutureEvent
 from pytrek.engine.futures.FutureEventType import FutureEventType
 from pytrek.gui.MessageConsoleProxy import MessageConsoleProxy
 from pytrek.gui.MessageConsoleSection import MessageConsoleSection
 
+from pytrek.mediators.GalaxyMediator import GalaxyMediator
+
+from pytrek.model.Coordinates import Coordinates
+
 from pytrek.model.Galaxy import Galaxy
 
 from pytrek.settings.GameSettings import GameSettings
@@ -116,6 +123,169 @@ class TestEventEngine(ProjectTestBase):
             self.logger.error(f'{self._eventEngine=}')
         self.assertTrue(newFireDate > fireDate, 'It was supposed to be rescheduled')
 
+    def testMultiplePendingEventsPerType(self):
+
+        firedEvents: List[FutureEvent] = []
+        self._turnOffRecurringEvents()
+
+        starDate: float = self._gameState.starDate
+        for offset in [3.0, 1.0, 2.0]:
+            self._eventEngine.scheduleEvent(self._createDestroysBaseEvent(starDate=starDate + offset, firedEvents=firedEvents))
+
+        self.assertEqual(starDate + 1.0, self._eventEngine.getEvent(FutureEventType.COMMANDER_DESTROYS_BASE).starDate, 'Should report the earliest event')
+
+        self._eventEngine._checkEvents(currentStarDate=starDate + 2.0)
+
+        self.assertEqual([starDate + 1.0, starDate + 2.0], [futureEvent.starDate for futureEvent in firedEvents], 'Due events should fire in star date order')
+        self.assertEqual(1, len(self._eventEngine.pendingEvents(FutureEventType.COMMANDER_DESTROYS_BASE)), 'Later event should still be pending')
+
+    def testCancelEvent(self):
+
+        firedEvents: List[FutureEvent] = []
+        self._turnOffRecurringEvents()
+
+        starDate: float = self._gameState.starDate
+
+        keptToken:      EventToken = self._eventEngine.scheduleEvent(self._createDestroysBaseEvent(starDate=starDate + 1.0, firedEvents=firedEvents))
+        cancelledToken: EventToken = self._eventEngine.scheduleEvent(self._createDestroysBaseEvent(starDate=starDate + 2.0, firedEvents=firedEvents))
+
+        self.assertTrue(self._eventEngine.cancelEvent(cancelledToken), 'Event was pending')
+        self.assertFalse(self._eventEngine.cancelEvent(cancelledToken), 'Event already cancelled')
+
+        self._eventEngine._checkEvents(currentStarDate=starDate + 3.0)
+
+        self.assertEqual(1, len(firedEvents), 'Cancelled event should not fire')
+        self.assertFalse(self._eventEngine.cancelEvent(keptToken), 'Fired events are no longer pending')
+
+    def testUnSchedulableTypeRefusesEvents(self):
+
+        self._eventEngine.makeUnSchedulable(FutureEventType.COMMANDER_DESTROYS_BASE)
+
+        token: EventToken = self._eventEngine.scheduleEvent(self._createDestroysBaseEvent(starDate=self._gameState.starDate + 1.0, firedEvents=[]))
+
+        self.assertEqual(EventEngine.NO_EVENT, token, 'Should not schedule')
+        self.assertEqual(0, len(self._eventEngine.pendingEvents(FutureEventType.COMMANDER_DESTROYS_BASE)), 'Nothing should be pending')
+
+    def testFastForwardFiresDueEventsInOrder(self):
+
+        firedDates: List[float] = []
+        self._turnOffRecurringEvents()
+
+        starDate:      float = self._gameState.starDate
+        remainingTime: float = self._gameState.remainingGameTime
+        for offset in [2.0, 5.0, 1.0]:
+            futureEvent: FutureEvent = FutureEvent(type=FutureEventType.COMMANDER_DESTROYS_BASE, starDate=starDate + offset)
+            futureEvent.callback = EventCallback(lambda firedEvent: firedDates.append(self._gameState.starDate))
+            self._eventEngine.scheduleEvent(futureEvent)
+
+        self._eventEngine.fastForward(elapsedTime=3.0)
+
+        self.assertEqual([starDate + 1.0, starDate + 2.0], firedDates, 'Clock should stop at each due event')
+        self.assertAlmostEqual(starDate + 3.0, self._gameState.starDate, msg='Clock should end at the requested star date')
+        self.assertAlmostEqual(remainingTime - 3.0, self._gameState.remainingGameTime, msg='Remaining time not updated')
+
+    def testUpdateTimeWaitsForTheMoveToComplete(self):
+
+        firedDates: List[float] = []
+        self._turnOffRecurringEvents()
+
+        starDate: float = self._gameState.starDate
+
+        futureEvent: FutureEvent = FutureEvent(type=FutureEventType.COMMANDER_DESTROYS_BASE, starDate=starDate + 1.0)
+        futureEvent.callback = EventCallback(lambda firedEvent: firedDates.append(self._gameState.starDate))
+        self._eventEngine.scheduleEvent(futureEvent)
+
+        self._gameEngine.updateTime(elapsedTime=3.0)
+
+        self.assertEqual([], firedDates, 'Nothing should fire in the middle of a move')
+        self.assertAlmostEqual(starDate + 3.0, self._gameState.starDate, msg='Clock not advanced')
+
+        self._gameEngine.fireDueEvents()
+
+        self.assertEqual([starDate + 1.0], firedDates, 'Due event should fire at its star date once the move is complete')
+        self.assertAlmostEqual(starDate + 3.0, self._gameState.starDate, msg='Clock should end where the move did')
+
+    def testWarpFastForwardsThroughDueEvents(self):
+
+        firedDates: List[float] = []
+        self._turnOffRecurringEvents()
+
+        starDate:      float = self._gameState.starDate
+        remainingTime: float = self._gameState.remainingGameTime
+
+        futureEvent: FutureEvent = FutureEvent(type=FutureEventType.COMMANDER_DESTROYS_BASE, starDate=starDate + 0.01)
+        futureEvent.callback = EventCallback(lambda firedEvent: firedDates.append(self._gameState.starDate))
+        self._eventEngine.scheduleEvent(futureEvent)
+
+        currentCoordinates:     Coordinates = self._galaxy.currentQuadrant.coordinates
+        destinationCoordinates: Coordinates = Coordinates(x=(currentCoordinates.x + 3) % self._galaxy.columns, y=currentCoordinates.y)
+
+        GalaxyMediator().doWarp(currentCoordinates=currentCoordinates, destinationCoordinates=destinationCoordinates)
+        self._gameEngine.fireDueEvents()
+
+        elapsedTime: float = self._gameState.opTime
+        self.assertEqual([starDate + 0.01], firedDates, 'Event should see the star date it was due')
+        self.assertAlmostEqual(starDate + elapsedTime, self._gameState.starDate, msg='Clock should end where the warp did')
+        self.assertAlmostEqual(remainingTime - elapsedTime, self._gameState.remainingGameTime, msg='Remaining time not updated')
+
+    def testFastForwardReschedulesRecurringEvents(self):
+
+        self._eventEngine.makeUnSchedulable(FutureEventType.SUPER_NOVA)
+        self._eventEngine.makeUnSchedulable(FutureEventType.TRACTOR_BEAM)
+
+        fEvent: FutureEvent = self._eventEngine.getEvent(FutureEventType.COMMANDER_ATTACKS_BASE)
+        fEvent.callback = EventCallback(lambda firedEvent: None)
+
+        fireDate: float = fEvent.starDate
+        firedCount: int = self._eventEngine.fastForward(elapsedTime=fireDate - self._gameState.starDate + 0.01)
+
+        self.assertGreaterEqual(firedCount, 1, 'Due event did not fire')
+        self.assertGreater(self._eventEngine.getEvent(FutureEventType.COMMANDER_ATTACKS_BASE).starDate, fireDate, 'Recurring event not rescheduled')
+
+    def testRecurringEventsNotScheduledIntoThePast(self):
+
+        self._eventEngine.makeUnSchedulable(FutureEventType.SUPER_NOVA)
+        self._eventEngine.makeUnSchedulable(FutureEventType.TRACTOR_BEAM)
+        self._eventEngine.unScheduleEvent(FutureEventType.COMMANDER_ATTACKS_BASE)
+
+        self._gameState.remainingGameTime = -50.0      # Jumped past the end of the game
+
+        # noinspection PyProtectedMember
+        self._eventEngine._scheduleRecurringEvents(eventType=FutureEventType.COMMANDER_ATTACKS_BASE)
+
+        self.assertGreaterEqual(self._eventEngine.getEvent(FutureEventType.COMMANDER_ATTACKS_BASE).starDate, self._gameState.starDate, 'Rescheduled into the past')
+
+    def testFastForwardDefersEventsScheduledInThePast(self):
+
+        firedEvents: List[FutureEvent] = []
+        self._turnOffRecurringEvents()
+
+        def scheduleAnother(firedEvent: FutureEvent):
+            firedEvents.append(firedEvent)
+            self._eventEngine.scheduleEvent(self._createDestroysBaseEvent(starDate=self._gameState.starDate, firedEvents=firedEvents))
+
+        futureEvent: FutureEvent = FutureEvent(type=FutureEventType.COMMANDER_DESTROYS_BASE, starDate=self._gameState.starDate + 1.0)
+        futureEvent.callback = EventCallback(scheduleAnother)
+        self._eventEngine.scheduleEvent(futureEvent)
+
+        firedCount: int = self._eventEngine.fastForward(elapsedTime=2.0)
+
+        self.assertEqual(1, firedCount, 'Event scheduled for a reached star date should wait for the next check')
+        self.assertEqual(1, len(self._eventEngine.pendingEvents(FutureEventType.COMMANDER_DESTROYS_BASE)), 'Deferred event lost')
+
+    def _turnOffRecurringEvents(self):
+
+        self._eventEngine.makeUnSchedulable(FutureEventType.SUPER_NOVA)
+        self._eventEngine.makeUnSchedulable(FutureEventType.TRACTOR_BEAM)
+        self._eventEngine.makeUnSchedulable(FutureEventType.COMMANDER_ATTACKS_BASE)
+
+    def _createDestroysBaseEvent(self, starDate: float, firedEvents: List[FutureEvent]) -> FutureEvent:
+
+        futureEvent: FutureEvent = FutureEvent(type=FutureEventType.COMMANDER_DESTROYS_BASE, starDate=starDate)
+        futureEvent.callback = EventCallback(firedEvents.append)
+
+        return futureEvent
+
     @classmethod
     def _setupGame(cls):
         """
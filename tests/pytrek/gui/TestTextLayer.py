@@ -0,0 +1,55 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from arcade.color import RED
+from arcade.color import WHITE
+
+from pytrek.gui.TextLayer import TextLayer
+from pytrek.gui.TextLayer import TextName
+
+from tests.ProjectTestBase import ProjectTestBase
+
+ENERGY: TextName = TextName('energy')
+
+
+class TestTextLayer(ProjectTestBase):
+    """
+    The arcade Text objects need an OpenGL context;  So these tests never draw
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._textLayer: TextLayer = TextLayer()
+        self._textLayer.addText(ENERGY, '5000', x=10, y=10)
+
+    def testInitialValue(self):
+
+        self.assertEqual('5000', self._textLayer.getText(ENERGY), 'Should keep the initial text')
+
+    def testSetText(self):
+
+        self._textLayer.setText(ENERGY, '4500')
+
+        self.assertEqual('4500', self._textLayer.getText(ENERGY), 'Should have changed')
+
+    def testColorKeptWhenNotGiven(self):
+
+        self._textLayer.setText(ENERGY, '4500', color=RED)
+        self._textLayer.setText(ENERGY, '4000')
+
+        self.assertEqual(RED, self._textLayer._entries[ENERGY].color, 'Should keep the last color')
+        self.assertNotEqual(WHITE, self._textLayer._entries[ENERGY].color, 'Should not revert to the default')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTextLayer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,56 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from arcade import Texture
+
+from pytrek.gui.TextureRegistry import TextureRegistry
+from pytrek.gui.UITypes import TextureList
+
+from pytrek.gui.gamepieces.klingon.Klingon import Klingon
+
+from pytrek.model.Coordinates import Coordinates
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestTextureRegistry(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self.resetSingletons()
+        self._textureRegistry: TextureRegistry = TextureRegistry()
+
+    def testTextureShared(self):
+
+        texture: Texture = self._textureRegistry.texture(bareFileName='KlingonD7.png')
+
+        self.assertIs(texture, self._textureRegistry.texture(bareFileName='KlingonD7.png'), 'Should only load the image once')
+
+    def testGamePiecesShareTexture(self):
+
+        klingon1: Klingon = Klingon(coordinates=Coordinates(x=1, y=1))
+        klingon2: Klingon = Klingon(coordinates=Coordinates(x=2, y=2))
+
+        self.assertIs(klingon1.texture, klingon2.texture, 'Sprites made from the same image should share its texture')
+
+    def testSpriteSheetShared(self):
+
+        textureList: TextureList = self._textureRegistry.spriteSheet('WarpEffectSpriteSheet.png', 32, 32, 4, 4)
+
+        self.assertEqual(4, len(textureList), 'Should cut every tile')
+        self.assertIs(textureList, self._textureRegistry.spriteSheet('WarpEffectSpriteSheet.png', 32, 32, 4, 4), 'Should only cut the sheet once')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTextureRegistry))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,76 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from arcade import SpriteList
+
+from pytrek.gui.gamepieces.base.SpritePool import SpritePool
+
+from pytrek.gui.gamepieces.klingon.KlingonTorpedo import KlingonTorpedo
+from pytrek.gui.gamepieces.klingon.KlingonTorpedoFollower import KlingonTorpedoFollower
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestBaseEnemyTorpedo(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self.resetSingletons()
+
+        self._followers:    SpriteList = SpriteList(use_spatial_hash=False)
+        self._followerPool: SpritePool = SpritePool(factory=KlingonTorpedoFollower)
+
+    def testFollowersKeptPerTorpedo(self):
+
+        torpedo1: KlingonTorpedo = self._makeTorpedo()
+        torpedo2: KlingonTorpedo = self._makeTorpedo()
+
+        # noinspection PyProtectedMember
+        torpedo1._placeTorpedoFollower(x=10, y=10)
+        # noinspection PyProtectedMember
+        torpedo1._placeTorpedoFollower(x=20, y=20)
+        # noinspection PyProtectedMember
+        torpedo2._placeTorpedoFollower(x=30, y=30)
+
+        self.assertEqual(3, len(self._followers), 'All followers should be drawn')
+        self.assertEqual(2, len(torpedo1.ownFollowers), 'First torpedo placed two')
+        self.assertEqual(1, len(torpedo2.ownFollowers), 'Second torpedo placed one')
+
+        for follower in torpedo1.ownFollowers:
+            self.assertEqual(torpedo1.id, follower.following, 'Follower should know its torpedo')
+
+    def testRemovedFollowersReturnToPool(self):
+
+        torpedo: KlingonTorpedo = self._makeTorpedo()
+
+        # noinspection PyProtectedMember
+        torpedo._placeTorpedoFollower(x=10, y=10)
+        for follower in torpedo.ownFollowers:
+            follower.remove_from_sprite_lists()
+
+        self.assertEqual(0, len(self._followers), 'Follower should be off the board')
+        self.assertEqual(1, self._followerPool.freeCount, 'Follower should be back in the pool')
+
+    def _makeTorpedo(self) -> KlingonTorpedo:
+
+        torpedo: KlingonTorpedo = KlingonTorpedo()
+
+        torpedo.followers    = self._followers
+        torpedo.followerPool = self._followerPool
+
+        return torpedo
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBaseEnemyTorpedo))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,94 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from arcade import SpriteList
+
+from pytrek.gui.gamepieces.base.SpritePool import SpritePool
+
+from pytrek.gui.gamepieces.klingon.KlingonTorpedo import KlingonTorpedo
+from pytrek.gui.gamepieces.klingon.KlingonTorpedoFollower import KlingonTorpedoFollower
+from pytrek.gui.gamepieces.klingon.KlingonTorpedoMiss import KlingonTorpedoMiss
+
+from pytrek.model.Coordinates import Coordinates
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestSpritePool(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self.resetSingletons()
+
+    def testRemovalReturnsToPool(self):
+
+        spritePool: SpritePool = SpritePool(factory=KlingonTorpedoFollower)
+        spriteList: SpriteList = SpriteList()
+
+        follower: KlingonTorpedoFollower = spritePool.acquire()     # type: ignore
+        spriteList.append(follower)
+        follower.remove_from_sprite_lists()
+
+        self.assertEqual(0, len(spriteList), 'Should be off the board')
+        self.assertEqual(1, spritePool.freeCount, 'Should be back in the pool')
+        self.assertIs(follower, spritePool.acquire(), 'Free sprite should be reused')
+        self.assertEqual(1, spritePool.createdCount, 'Should only construct once')
+
+    def testReleasedOnlyOnce(self):
+
+        spritePool: SpritePool = SpritePool(factory=KlingonTorpedoFollower)
+
+        follower: KlingonTorpedoFollower = spritePool.acquire()     # type: ignore
+        follower.remove_from_sprite_lists()
+        follower.remove_from_sprite_lists()
+
+        self.assertEqual(1, spritePool.freeCount, 'A second removal should not release again')
+
+    def testMaximumSize(self):
+
+        spritePool: SpritePool = SpritePool(factory=KlingonTorpedoFollower, maximumSize=1)
+
+        followers = [spritePool.acquire(), spritePool.acquire()]
+        for follower in followers:
+            follower.remove_from_sprite_lists()
+
+        self.assertEqual(1, spritePool.freeCount, 'Pool should not grow past its maximum')
+
+    def testTorpedoResetGetsNewId(self):
+
+        torpedo: KlingonTorpedo = KlingonTorpedo(speed=3.0)
+        torpedo.firedFromPosition = Coordinates(x=1, y=1)
+        torpedo.inMotion          = True
+        oldId = torpedo.id
+
+        torpedo.reset(speed=5.0)
+
+        self.assertNotEqual(oldId, torpedo.id, 'Reused torpedo needs a new id')
+        self.assertFalse(torpedo.inMotion, 'Reused torpedo should be stopped')
+        self.assertIsNone(torpedo.firedFromPosition, 'Reused torpedo should forget where it was fired')
+        self.assertEqual(5.0, torpedo.speed, 'Speed not reset')
+
+    def testMissReset(self):
+
+        miss: KlingonTorpedoMiss = KlingonTorpedoMiss(placedTime=1.0)
+        miss.gameCoordinates = Coordinates(x=2, y=3)
+
+        miss.reset(placedTime=9.0)
+
+        self.assertEqual(9.0, miss.placedTime, 'Placed time not reset')
+        self.assertIsNone(miss.gameCoordinates, 'Reused miss should not have a sector')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSpritePool))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
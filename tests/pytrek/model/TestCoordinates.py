@@ -1,4 +1,9 @@
 
+from copy import deepcopy
+
+from pickle import dumps
+from pickle import loads
+
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
@@ -123,6 +128,11 @@ class TestCoordinates(ProjectTestBase):
         coordinate = Coordinates(0, 9)
         self.assertTrue(coordinate.valid())
 
+    def testValidInLargerGrid(self):
+        coordinate = Coordinates(99, 49)
+        self.assertFalse(coordinate.valid(), 'Not a valid sector')
+        self.assertTrue(coordinate.valid(columns=100, rows=50), 'Valid in a 100x50 galaxy')
+
     def testToCoordinatesNotNone(self):
         values: str = '5,5'
         coordinates: Coordinates = Coordinates.toCoordinates(values=values)
@@ -154,6 +164,44 @@ class TestCoordinates(ProjectTestBase):
 
         self.assertEqual(expectedCoordinates, actualCoordinates, 'Did not detect invalid Y')
 
+    def testGridPointsAreShared(self):
+
+        self.assertIs(Coordinates(3, 7), Coordinates(x=3, y=7), 'Grid coordinates should be interned')
+        self.assertIs(Coordinates(-1, -1), Coordinates(0, 0).newCoordinates(Direction.NorthWest), 'The ring around the grid should be interned')
+
+    def testOffGridPointsAreEqual(self):
+
+        self.assertEqual(Coordinates(500, 500), Coordinates(500, 500), 'Should compare by value')
+        self.assertEqual(hash(Coordinates(500, 500)), hash(Coordinates(500, 500)), 'Equal coordinates should hash the same')
+
+    def testIntern(self):
+
+        Coordinates.intern(columns=30, rows=20)
+        self.assertIs(Coordinates(29, 19), Coordinates(29, 19), 'Interned grid coordinates should be shared')
+
+    def testImmutable(self):
+
+        coordinates: Coordinates = Coordinates(2, 2)
+
+        with self.assertRaises(AttributeError):
+            setattr(coordinates, 'x', 3)
+        self.assertEqual(2, Coordinates(2, 2).x, 'The shared instance should not change')
+
+    def testUsableAsKey(self):
+
+        visited = {Coordinates(1, 1): 'StarBase', Coordinates(500, 1): 'Far away'}
+
+        self.assertEqual('StarBase', visited[Coordinates(1, 1)], 'Should find interned coordinates')
+        self.assertEqual('Far away', visited[Coordinates(500, 1)], 'Should find non-interned coordinates')
+
+    def testCopiesAreShared(self):
+
+        coordinates: Coordinates = Coordinates(5, 6)
+
+        self.assertIs(coordinates, deepcopy(coordinates), 'Copies of immutable coordinates are the same coordinates')
+        self.assertIs(coordinates, loads(dumps(coordinates)), 'Unpickling should intern')
+
+
 
 def suite() -> TestSuite:
     import unittest
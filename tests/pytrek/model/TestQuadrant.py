@@ -1,7 +1,14 @@
 
+from typing import List
+
+from random import random
+
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
+from pytrek.Constants import QUADRANT_COLUMNS
+from pytrek.Constants import QUADRANT_ROWS
+
 from pytrek.model.Coordinates import Coordinates
 from pytrek.model.Sector import Sector
 from pytrek.model.SectorType import SectorType
@@ -32,6 +39,51 @@ class TestQuadrant(ProjectTestBase):
 
         self.logger.info(f'retrieved sector: {sector}')
 
+    def testSeededQuadrantNotMaterialized(self):
+
+        quadrant: Quadrant = self._createSeededQuadrant(seed=7)
+
+        self.assertFalse(quadrant.materialized, 'Should only have summary counts')
+        self.assertEqual(2, quadrant.klingonCount, 'Summary count is wrong')
+        self.assertEqual(0, len(quadrant.klingons), 'Should not have created sprites')
+        self.assertEqual(quadrant.emptySectorCount, QUADRANT_ROWS * QUADRANT_COLUMNS, 'Sectors should be empty')
+
+    def testMaterialize(self):
+
+        quadrant: Quadrant = self._createSeededQuadrant(seed=7)
+        quadrant.materialize()
+
+        self.assertTrue(quadrant.materialized, 'Should be materialized')
+        self.assertEqual(2, len(quadrant.klingons), 'Klingons not created')
+        self.assertEqual(1, len(quadrant.commanders), 'Commander not created')
+        self.assertIsNotNone(quadrant.starBase, 'StarBase not created')
+        self.assertEqual(2, quadrant.klingonCount, 'Materializing should not change the counts')
+
+    def testMaterializeIsRepeatable(self):
+
+        firstQuadrant:  Quadrant = self._createSeededQuadrant(seed=42)
+        secondQuadrant: Quadrant = self._createSeededQuadrant(seed=42)
+
+        firstQuadrant.materialize()
+        random()                    # Materializing should not depend on the game's random sequence
+        secondQuadrant.materialize()
+
+        firstPositions:  List[Coordinates] = [klingon.gameCoordinates for klingon in firstQuadrant.klingons]
+        secondPositions: List[Coordinates] = [klingon.gameCoordinates for klingon in secondQuadrant.klingons]
+
+        self.assertEqual(firstPositions, secondPositions, 'Same seed should give the same quadrant')
+        self.assertEqual(firstQuadrant.starBase.gameCoordinates, secondQuadrant.starBase.gameCoordinates, 'Same seed should give the same quadrant')
+
+    def _createSeededQuadrant(self, seed: int) -> Quadrant:
+
+        quadrant: Quadrant = Quadrant(coordinates=Coordinates(1, 1), seed=seed)
+
+        quadrant.klingonCount   = 2
+        quadrant.commanderCount = 1
+        quadrant.hasStarBase    = True
+
+        return quadrant
+
 
 def suite() -> TestSuite:
     import unittest
@@ -0,0 +1,107 @@
+
+from typing import cast
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.gui.gamepieces.StarBase import StarBase
+from pytrek.gui.gamepieces.base.BaseGamePiece import BaseGamePiece
+
+from pytrek.model.Coordinates import Coordinates
+from pytrek.model.Quadrant import Quadrant
+from pytrek.model.Sector import Sector
+from pytrek.model.SectorStore import SectorStore
+from pytrek.model.SectorType import SectorType
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestSectorStore(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._sectorStore: SectorStore = SectorStore(quadrantCount=2)
+
+    def testInitiallyEmpty(self):
+
+        for quadrantIndex in range(self._sectorStore.quadrantCount):
+            self.assertEqual(self._sectorStore.sectorsPerQuadrant, self._sectorStore.emptyCount(quadrantIndex), 'All sectors should start empty')
+
+    def testSectorIndex(self):
+
+        self.assertEqual(0, self._sectorStore.sectorIndex(0, 0, 0), 'First sector is wrong')
+        self.assertEqual(self._sectorStore.sectorsPerQuadrant + 13, self._sectorStore.sectorIndex(1, 3, 1), 'Sectors should be row major within a quadrant')
+
+    def testSectorsAllocatedOnFirstUse(self):
+
+        sectorStore: SectorStore = SectorStore(quadrantCount=10000)
+
+        self.assertEqual(0, sectorStore.allocatedQuadrantCount(), 'Should not allocate up front')
+        self.assertEqual(sectorStore.sectorsPerQuadrant, sectorStore.emptyCount(9999), 'Unallocated quadrants are empty')
+
+        sectorIndex: int = sectorStore.sectorIndex(9999, 0, 0)
+
+        self.assertEqual(0, sectorIndex, 'The first quadrant used gets the first block')
+        self.assertEqual(1, sectorStore.allocatedQuadrantCount(), 'Should allocate a single quadrant')
+
+    def testEmptyCountMaintained(self):
+
+        sectorIndex: int = self._sectorStore.sectorIndex(1, 4, 4)
+
+        self._sectorStore.setSectorType(sectorIndex, SectorType.STAR)
+        self._sectorStore.setSectorType(sectorIndex, SectorType.PLANET)
+        self.assertEqual(self._sectorStore.sectorsPerQuadrant - 1, self._sectorStore.emptyCount(1), 'Occupied sector not counted')
+        self.assertEqual(self._sectorStore.sectorsPerQuadrant, self._sectorStore.emptyCount(0), 'Wrong quadrant counted')
+
+        self._sectorStore.setSectorType(sectorIndex, SectorType.EMPTY)
+        self.assertEqual(self._sectorStore.sectorsPerQuadrant, self._sectorStore.emptyCount(1), 'Vacated sector not counted')
+
+    def testOccupantSlotReused(self):
+
+        gamePiece:   StarBase = StarBase(sectorCoordinates=Coordinates(5, 0))
+        firstIndex:  int      = self._sectorStore.sectorIndex(0, 5, 0)
+        secondIndex: int      = self._sectorStore.sectorIndex(0, 7, 0)
+
+        self._sectorStore.setOccupant(firstIndex, gamePiece)
+        self.assertIs(gamePiece, self._sectorStore.getOccupant(firstIndex), 'Occupant not stored')
+
+        self._sectorStore.setOccupant(firstIndex, cast(BaseGamePiece, None))
+        self.assertIsNone(self._sectorStore.getOccupant(firstIndex), 'Occupant not removed')
+
+        self._sectorStore.setOccupant(secondIndex, gamePiece)
+        self.assertEqual(1, len(self._sectorStore._gamePieces), 'Free slot should be reused')
+
+    def testSectorViewWritesThrough(self):
+
+        quadrant: Quadrant = Quadrant(coordinates=Coordinates(0, 0), sectorStore=self._sectorStore, quadrantIndex=1)
+        sector:   Sector   = quadrant.getSector(Coordinates(2, 3))
+
+        sector.type = SectorType.STAR
+
+        self.assertEqual(SectorType.STAR, quadrant.getSector(Coordinates(2, 3)).type, 'View should write through to the store')
+        self.assertFalse(quadrant.isSectorEmpty(Coordinates(2, 3)), 'Store should see the star')
+        self.assertEqual(sector, quadrant.getSector(Coordinates(2, 3)), 'Views of the same sector should be equal')
+
+    def testEnemyCountsPerQuadrant(self):
+
+        firstQuadrant:  Quadrant = Quadrant(coordinates=Coordinates(0, 0), sectorStore=self._sectorStore, quadrantIndex=0)
+        secondQuadrant: Quadrant = Quadrant(coordinates=Coordinates(1, 0), sectorStore=self._sectorStore, quadrantIndex=1)
+
+        secondQuadrant.klingonCount = 3
+
+        self.assertEqual(0, firstQuadrant.klingonCount, 'Counts leaked across quadrants')
+        self.assertEqual(3, self._sectorStore.getEnemyCount(1, SectorType.KLINGON), 'Count not stored')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSectorStore))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
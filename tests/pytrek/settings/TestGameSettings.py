@@ -351,6 +351,20 @@ class TestGameSettings(ProjectTestBase):
 
         gameSettings.debugEvents = saveDebugEvents
 
+    def testOverrideValuesNotPersisted(self):
+
+        gameSettings: GameSettings = GameSettings()
+        saveValue:    float        = gameSettings.damageAdjuster
+
+        gameSettings.overrideValues({'damageAdjuster': '0.33'})
+        overriddenValue: float = gameSettings.damageAdjuster
+
+        GameSettings._instances = {}
+        reloadedSettings: GameSettings = GameSettings()
+
+        self.assertEqual(0.33, overriddenValue, 'Override not applied')
+        self.assertEqual(saveValue, reloadedSettings.damageAdjuster, 'Override should not be written to the settings file')
+
 
 def suite() -> TestSuite:
     """You need to change the name of the test class here also."""
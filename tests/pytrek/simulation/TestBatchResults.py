@@ -0,0 +1,68 @@
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.simulation.BatchResults import BatchResults
+from pytrek.simulation.SimulationOutcome import SimulationOutcome
+from pytrek.simulation.SimulationResult import EnergyCurve
+from pytrek.simulation.SimulationResult import SimulationResult
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestBatchResults(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._batchResults: BatchResults = BatchResults()
+
+    def testAddResult(self):
+
+        result: SimulationResult = SimulationResult(outcome=SimulationOutcome.Won, starDate=2001.5, energyCurve=EnergyCurve([5000.0, 4500.0]))
+
+        self._batchResults.addResult(seed=3, settingsOverrides={}, result=result)
+
+        self.assertEqual(1, len(self._batchResults), 'Should have a single game')
+        self.assertEqual([True], self._batchResults.column('won'), 'Outcome should be flattened')
+        self.assertEqual(['Won'], self._batchResults.column('outcome'), 'Outcomes stored by name')
+        self.assertEqual([[5000.0, 4500.0]], self._batchResults.column('energyCurve'), 'Curve not stored')
+
+    def testLateSettingColumnIsPadded(self):
+
+        self._batchResults.addResult(seed=1, settingsOverrides={}, result=SimulationResult())
+        self._batchResults.addResult(seed=2, settingsOverrides={'damageAdjuster': '0.75'}, result=SimulationResult())
+        self._batchResults.addResult(seed=3, settingsOverrides={}, result=SimulationResult())
+
+        self.assertEqual([None, '0.75', None], self._batchResults.column('damageAdjuster'), 'Setting column not aligned with games')
+
+    def testSaveLoad(self):
+
+        self._batchResults.addResult(seed=7, settingsOverrides={'photonTorpedoMisfireRate': '0.3'}, result=SimulationResult(outcome=SimulationOutcome.Destroyed))
+
+        with TemporaryDirectory() as tempDirectory:
+            fqFileName: Path = Path(tempDirectory) / 'results.json'
+            self._batchResults.save(fqFileName=fqFileName)
+
+            loadedResults: BatchResults = BatchResults.load(fqFileName=fqFileName)
+
+        self.assertEqual(1, len(loadedResults), 'Game count not restored')
+        self.assertEqual(self._batchResults.columnNames, loadedResults.columnNames, 'Columns not restored')
+        self.assertEqual(['Destroyed'], loadedResults.column('outcome'), 'Values not restored')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBatchResults))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,61 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.simulation.BatchResults import BatchResults
+from pytrek.simulation.BatchRunner import BatchRunner
+from pytrek.simulation.SimulationOutcome import SimulationOutcome
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestBatchRunner(ProjectTestBase):
+    """
+    """
+    MAX_TICKS: int = 200
+
+    def setUp(self):
+        super().setUp()
+        self._batchRunner: BatchRunner = BatchRunner(workers=2, maxTicks=TestBatchRunner.MAX_TICKS)
+
+    def tearDown(self):
+        super().tearDown()
+        ProjectTestBase.resetSingletons()
+
+    def testRun(self):
+
+        batchResults: BatchResults = self._batchRunner.run(gameCount=4, baseSeed=10)
+
+        self.assertEqual(4, len(batchResults), 'Every game should be reported')
+        self.assertEqual([10, 11, 12, 13], batchResults.column('seed'), 'Seeds should be sequential')
+
+        for outcome in batchResults.column('outcome'):
+            self.assertNotEqual(SimulationOutcome.InProgress.name, outcome, 'Games should finish')
+
+    def testSameSeedSameOutcome(self):
+
+        firstResults:  BatchResults = self._batchRunner.run(gameCount=2, baseSeed=42)
+        secondResults: BatchResults = self._batchRunner.run(gameCount=2, baseSeed=42)
+
+        self.assertEqual(firstResults.column('starDate'), secondResults.column('starDate'), 'Seeded games should be reproducible')
+        self.assertEqual(firstResults.column('energyCurve'), secondResults.column('energyCurve'), 'Seeded games should be reproducible')
+
+    def testSweep(self):
+
+        batchResults: BatchResults = self._batchRunner.sweep(settingName='damageAdjuster', values=['0.25', '1.0'], gamesPerValue=2)
+
+        self.assertEqual(4, len(batchResults), 'Two games per value')
+        self.assertEqual(['0.25', '0.25', '1.0', '1.0'], batchResults.column('damageAdjuster'), 'Swept setting should be a column')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBatchRunner))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
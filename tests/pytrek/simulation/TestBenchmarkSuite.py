@@ -0,0 +1,95 @@
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.simulation.BenchmarkSuite import BenchmarkComparisons
+from pytrek.simulation.BenchmarkSuite import BenchmarkResult
+from pytrek.simulation.BenchmarkSuite import BenchmarkResults
+from pytrek.simulation.BenchmarkSuite import BenchmarkSuite
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestBenchmarkSuite(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._benchmarkSuite: BenchmarkSuite = BenchmarkSuite(repeats=2, minimumTime=0.01)
+
+    def tearDown(self):
+        super().tearDown()
+        ProjectTestBase.resetSingletons()
+
+    def testBenchmarkNames(self):
+
+        names = list(self._benchmarkSuite.benchmarks().keys())
+
+        self.assertIn('Galaxy()', names, 'Galaxy construction not benchmarked')
+        self.assertIn('QuadrantMediator.update[10 enemies]', names, 'Quadrant update not benchmarked')
+
+    def testRunFiltered(self):
+
+        results: BenchmarkResults = self._benchmarkSuite.run(nameFilter='CommandParser')
+
+        self.assertEqual(1, len(results), 'Only the filtered benchmark should run')
+        self.assertEqual(2, results[0].repeats, 'Wrong repeat count')
+        self.assertGreater(results[0].median, 0.0, 'Should have taken some time')
+        self.assertLessEqual(results[0].minimum, results[0].median, 'Best repeat cannot be slower than the median')
+
+    def testRunAll(self):
+        """
+        Every benchmark should finish;  The crowded quadrant update used to hang
+        """
+        benchmarkSuite: BenchmarkSuite   = BenchmarkSuite(repeats=1, minimumTime=0.0)
+        results:        BenchmarkResults = benchmarkSuite.run()
+
+        self.assertEqual(list(benchmarkSuite.benchmarks().keys()), [result.name for result in results], 'Every benchmark should run once')
+
+    def testBaselineRoundTrip(self):
+
+        results: BenchmarkResults = BenchmarkResults([BenchmarkResult(name='a', median=2.0, minimum=1.5, loops=100, repeats=5)])
+
+        with TemporaryDirectory() as directoryName:
+            fileName: Path = Path(directoryName) / 'baseline.json'
+
+            BenchmarkSuite.saveBaseline(results=results, fileName=fileName)
+            baseline: BenchmarkResults = BenchmarkSuite.loadBaseline(fileName=fileName)
+
+        self.assertEqual(results, baseline, 'Baseline did not round trip')
+
+    def testCompare(self):
+
+        baseline: BenchmarkResults = BenchmarkResults([
+            BenchmarkResult(name='same',   median=10.0),
+            BenchmarkResult(name='slower', median=10.0),
+            BenchmarkResult(name='gone',   median=10.0),
+        ])
+        results: BenchmarkResults = BenchmarkResults([
+            BenchmarkResult(name='same',   median=10.5),
+            BenchmarkResult(name='slower', median=12.0),
+            BenchmarkResult(name='new',    median=10.0),
+        ])
+        comparisons: BenchmarkComparisons = BenchmarkSuite.compare(results=results, baseline=baseline, threshold=0.10)
+
+        self.assertEqual(['same', 'slower'], [comparison.name for comparison in comparisons], 'Only compare benchmarks in both')
+        self.assertFalse(comparisons[0].regressed, 'Within the threshold')
+        self.assertTrue(comparisons[1].regressed, 'Beyond the threshold')
+        self.assertAlmostEqual(1.2, comparisons[1].ratio, msg='Wrong ratio')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBenchmarkSuite))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
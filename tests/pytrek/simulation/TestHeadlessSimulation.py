@@ -0,0 +1,94 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pytrek.engine.GameEngine import GameEngine
+
+from pytrek.simulation.HeadlessSimulation import HeadlessSimulation
+from pytrek.simulation.HeadlessSimulation import SettingsOverrides
+from pytrek.simulation.SimulationOutcome import SimulationOutcome
+from pytrek.simulation.SimulationResult import SimulationResult
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestHeadlessSimulation(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        ProjectTestBase.resetSingletons()
+
+    def testEventEngineIsHeadless(self):
+
+        simulation: HeadlessSimulation = HeadlessSimulation()
+
+        self.assertTrue(simulation.eventEngine.headless, 'Should not be hooked into arcade')
+
+    def testEnterprisePlaced(self):
+
+        simulation: HeadlessSimulation = HeadlessSimulation()
+
+        self.assertIsNotNone(simulation.galaxy.currentQuadrant.enterpriseCoordinates, 'Enterprise should be in the starting quadrant')
+        self.assertEqual(simulation.galaxy.currentQuadrant.coordinates, simulation.gameState.currentQuadrantCoordinates, 'Game state out of sync')
+
+    def testStepAdvancesVirtualClock(self):
+
+        simulation: HeadlessSimulation = HeadlessSimulation(tickTime=0.5)
+
+        for x in range(10):
+            simulation.step()
+
+        self.assertEqual(10, simulation.ticks, 'Every step should be a tick')
+        self.assertGreater(GameEngine().gameClock, 0.0, 'Virtual clock did not advance')
+
+    def testRunEndsGame(self):
+
+        simulation: HeadlessSimulation = HeadlessSimulation()
+        result:     SimulationResult   = simulation.run()
+
+        self.assertNotEqual(SimulationOutcome.InProgress, result.outcome, 'Game should have ended')
+        self.assertEqual(simulation.ticks, result.ticks, 'Result should reflect the simulation')
+
+    def testMaximumTicksAborts(self):
+
+        simulation: HeadlessSimulation = HeadlessSimulation(maxTicks=1)
+        result:     SimulationResult   = simulation.run()
+
+        self.assertIn(result.outcome, [SimulationOutcome.Aborted, SimulationOutcome.Won, SimulationOutcome.Destroyed], 'Should stop after the first tick')
+        self.assertEqual(1, result.ticks, 'Only a single tick allowed')
+
+    def testEachSimulationIsANewGame(self):
+
+        firstSimulation:  HeadlessSimulation = HeadlessSimulation()
+        secondSimulation: HeadlessSimulation = HeadlessSimulation()
+
+        self.assertIsNot(firstSimulation.gameState, secondSimulation.gameState, 'Singletons should have been reset')
+
+    def testLargeGalaxy(self):
+
+        overrides:  SettingsOverrides  = SettingsOverrides({'galaxyRows': '100', 'galaxyColumns': '120'})
+        simulation: HeadlessSimulation = HeadlessSimulation(seed=3, maxTicks=50, settingsOverrides=overrides)
+
+        self.assertEqual(100, simulation.galaxy.rows,    'Galaxy rows should come from the settings')
+        self.assertEqual(120, simulation.galaxy.columns, 'Galaxy columns should come from the settings')
+
+        simulation.run()
+
+        self.assertLess(simulation.galaxy._sectorStore.allocatedQuadrantCount(), 100 * 120, 'Sectors should only exist for the quadrants in use')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestHeadlessSimulation))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()